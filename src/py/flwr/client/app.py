@@ -18,9 +18,11 @@
 import argparse
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from logging import INFO, WARN
 from pathlib import Path
-from typing import Callable, ContextManager, Optional, Tuple, Union
+from typing import Callable, ContextManager, Iterator, List, Optional, Tuple, Union
 
 from flwr.client.client import Client
 from flwr.client.flower import Flower
@@ -29,6 +31,7 @@ from flwr.common import GRPC_MAX_MESSAGE_LENGTH, EventType, event
 from flwr.common.address import parse_address
 from flwr.common.constant import (
     MISSING_EXTRA_REST,
+    PULL_INTERVAL,
     TRANSPORT_TYPE_GRPC_BIDI,
     TRANSPORT_TYPE_GRPC_RERE,
     TRANSPORT_TYPE_REST,
@@ -43,6 +46,7 @@ from .grpc_rere_client.connection import grpc_request_response
 from .message_handler.message_handler import handle_control_message
 from .numpy_client import NumPyClient
 from .workload_state import WorkloadState
+from .workload_state_store import WorkloadStateStore
 
 
 def run_client() -> None:
@@ -89,6 +93,7 @@ def run_client() -> None:
         transport="grpc-rere",  # Only
         root_certificates=root_certificates,
         insecure=args.insecure,
+        max_concurrent_tasks=args.max_concurrent_tasks,
     )
 
 
@@ -126,6 +131,12 @@ def _parse_args_client() -> argparse.ArgumentParser:
         help="Add specified directory to the PYTHONPATH and load callable from there."
         " Default: current working directory.",
     )
+    parser.add_argument(
+        "--max-concurrent-tasks",
+        default=1,
+        type=int,
+        help="Maximum number of tasks the client executes concurrently. Default: 1",
+    )
 
     return parser
 
@@ -156,6 +167,8 @@ def start_client(
     root_certificates: Optional[Union[bytes, str]] = None,
     insecure: Optional[bool] = None,
     transport: Optional[str] = None,
+    max_concurrent_tasks: int = 1,
+    state_store: Optional[WorkloadStateStore] = None,
 ) -> None:
     """Start a Flower client node which connects to a Flower server.
 
@@ -191,6 +204,16 @@ def start_client(
         - 'grpc-bidi': gRPC, bidirectional streaming
         - 'grpc-rere': gRPC, request-response (experimental)
         - 'rest': HTTP (experimental)
+    max_concurrent_tasks : int (default: 1)
+        The maximum number of tasks the client pulls at once and executes
+        concurrently on a thread pool, e.g., on a node with several GPUs. The results
+        are sent in a single request once all tasks are done. Values greater than 1
+        require the 'grpc-rere' or 'rest' transport, and a `client_fn` or `client`
+        that can be used from several threads at the same time.
+    state_store : Optional[WorkloadStateStore] (default: None)
+        A store keeping the `WorkloadState` of each workload between tasks, e.g.,
+        `InMemoryWorkloadStateStore` or `DiskWorkloadStateStore`. If `None`, each
+        task starts with an empty state.
 
     Examples
     --------
@@ -254,7 +277,12 @@ def start_client(
     # Both `client` and `client_fn` must not be used directly
 
     # Initialize connection context manager
-    connection, address = _init_connection(transport, server_address)
+    connection, address = _init_connection(
+        transport, server_address, max_concurrent_tasks
+    )
+    executor: Optional[ThreadPoolExecutor] = None
+    if max_concurrent_tasks > 1:
+        executor = ThreadPoolExecutor(max_workers=max_concurrent_tasks)
 
     while True:
         sleep_duration: int = 0
@@ -263,6 +291,7 @@ def start_client(
             insecure,
             grpc_max_message_length,
             root_certificates,
+            max_concurrent_tasks,
         ) as conn:
             receive, send, create_node, delete_node = conn
 
@@ -271,30 +300,51 @@ def start_client(
                 create_node()  # pylint: disable=not-callable
 
             while True:
-                # Receive
-                task_ins = receive()
-                if task_ins is None:
-                    time.sleep(3)  # Wait for 3s before asking again
+                # Receive up to `max_concurrent_tasks` TaskIns
+                start_time = time.monotonic()
+                task_ins_list: List[TaskIns] = []
+                while len(task_ins_list) < max_concurrent_tasks:
+                    task_ins = receive()
+                    if task_ins is None:
+                        break
+                    task_ins_list.append(task_ins)
+                if not task_ins_list:
+                    # Servers supporting long polling already waited, others did not
+                    elapsed = time.monotonic() - start_time
+                    time.sleep(max(0.0, PULL_INTERVAL - elapsed))
                     continue
 
-                # Handle control message
-                task_res, sleep_duration = handle_control_message(task_ins=task_ins)
-                if task_res:
-                    send(task_res)
-                    break
-
-                # Load app
-                app: Flower = load_callable_fn()
-
-                # Handle task message
-                fwd_msg: Fwd = Fwd(
-                    task_ins=task_ins,
-                    state=WorkloadState(state={}),
+                # Handle control messages
+                control_results = [
+                    handle_control_message(task_ins=task_ins)
+                    for task_ins in task_ins_list
+                ]
+
+                # Handle task messages
+                task_res_iterator = _handle_tasks(
+                    load_callable_fn=load_callable_fn,
+                    task_ins_list=[
+                        task_ins
+                        for task_ins, (task_res, _) in zip(
+                            task_ins_list, control_results
+                        )
+                        if task_res is None
+                    ],
+                    executor=executor,
+                    state_store=state_store,
                 )
-                bwd_msg: Bwd = app(fwd=fwd_msg)
 
-                # Send
-                send(bwd_msg.task_res)
+                # Send in the order in which the TaskIns were received
+                disconnect = False
+                for task_res, control_sleep_duration in control_results:
+                    if task_res is None:
+                        task_res = next(task_res_iterator)
+                    else:
+                        disconnect = True
+                        sleep_duration = control_sleep_duration
+                    send(task_res)
+                if disconnect:
+                    break
 
             # Unregister node
             if delete_node is not None:
@@ -311,9 +361,54 @@ def start_client(
         )
         time.sleep(sleep_duration)
 
+    if executor is not None:
+        executor.shutdown()
     event(EventType.START_CLIENT_LEAVE)
 
 
+def _handle_tasks(
+    load_callable_fn: Callable[[], Flower],
+    task_ins_list: List[TaskIns],
+    executor: Optional[ThreadPoolExecutor],
+    state_store: Optional[WorkloadStateStore] = None,
+) -> Iterator[TaskRes]:
+    """Execute tasks, concurrently if an executor is given, and yield their results.
+
+    Results are yielded in the order of `task_ins_list`.
+    """
+    handle_fn = partial(_handle_task, load_callable_fn, state_store)
+    if executor is None:
+        return map(handle_fn, task_ins_list)
+    return executor.map(handle_fn, task_ins_list)
+
+
+def _handle_task(
+    load_callable_fn: Callable[[], Flower],
+    state_store: Optional[WorkloadStateStore],
+    task_ins: TaskIns,
+) -> TaskRes:
+    # Load app
+    app: Flower = load_callable_fn()
+
+    # Load the state of the workload
+    state_key = str(task_ins.workload_id)
+    state = (
+        WorkloadState(state={}) if state_store is None else state_store.get(state_key)
+    )
+
+    # Handle task message
+    fwd_msg: Fwd = Fwd(
+        task_ins=task_ins,
+        state=state,
+    )
+    bwd_msg: Bwd = app(fwd=fwd_msg)
+
+    # Keep the (potentially updated) state for the next task of the workload
+    if state_store is not None:
+        state_store.put(state_key, bwd_msg.state)
+    return bwd_msg.task_res
+
+
 def start_numpy_client(
     *,
     server_address: str,
@@ -409,10 +504,10 @@ def start_numpy_client(
 
 
 def _init_connection(
-    transport: Optional[str], server_address: str
+    transport: Optional[str], server_address: str, max_tasks: int = 1
 ) -> Tuple[
     Callable[
-        [str, bool, int, Union[bytes, str, None]],
+        [str, bool, int, Union[bytes, str, None], int],
         ContextManager[
             Tuple[
                 Callable[[], Optional[TaskIns]],
@@ -456,4 +551,9 @@ def _init_connection(
             f"Unknown transport type: {transport} (possible: {TRANSPORT_TYPES})"
         )
 
+    # Pull several tasks at once
+    if max_tasks < 1:
+        raise ValueError("`max_concurrent_tasks` must be >= 1")
+    if max_tasks > 1 and transport == TRANSPORT_TYPE_GRPC_BIDI:
+        raise ValueError(f"Transport type {transport} supports only one task at a time")
     return connection, address
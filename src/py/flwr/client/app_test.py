@@ -15,7 +15,12 @@
 """Flower Client app tests."""
 
 
-from typing import Dict, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+from unittest.mock import MagicMock
+
+import pytest
 
 from flwr.common import (
     Config,
@@ -30,10 +35,13 @@ from flwr.common import (
     NDArrays,
     Scalar,
 )
+from flwr.proto.task_pb2 import TaskIns, TaskRes
 
-from .app import start_client, start_numpy_client
+from .app import _handle_tasks, start_client, start_numpy_client
 from .client import Client
 from .numpy_client import NumPyClient
+from .typing import Bwd, Fwd
+from .workload_state_store import InMemoryWorkloadStateStore
 
 
 class PlainClient(Client):
@@ -126,3 +134,70 @@ def test_start_numpy_client_transport_invalid() -> None:
         raise AssertionError()  # Fail the test if no exception was raised
     except ValueError:
         pass
+
+
+def test_start_client_max_concurrent_tasks_grpc_bidi() -> None:
+    """Test that grpc-bidi does not support concurrent tasks."""
+    with pytest.raises(ValueError):
+        start_client(
+            server_address="0.0.0.0:8080",
+            client=PlainClient(),
+            transport="grpc-bidi",
+            max_concurrent_tasks=2,
+        )
+
+
+def test_handle_tasks_concurrently_in_order() -> None:
+    """Test that concurrently executed tasks yield results in order."""
+    # Prepare
+    num_tasks = 4
+    barrier = threading.Barrier(num_tasks, timeout=5)
+
+    def app(fwd: Fwd) -> Bwd:
+        # Only passes if all tasks run at the same time
+        barrier.wait()
+        return Bwd(task_res=TaskRes(task_id=fwd.task_ins.task_id), state=fwd.state)
+
+    task_ins_list: List[TaskIns] = [
+        TaskIns(task_id=str(idx)) for idx in range(num_tasks)
+    ]
+
+    # Execute
+    with ThreadPoolExecutor(max_workers=num_tasks) as executor:
+        task_res_list = list(
+            _handle_tasks(
+                load_callable_fn=lambda: MagicMock(side_effect=app),
+                task_ins_list=task_ins_list,
+                executor=executor,
+            )
+        )
+
+    # Assert
+    assert [task_res.task_id for task_res in task_res_list] == ["0", "1", "2", "3"]
+
+
+def test_handle_tasks_state_store() -> None:
+    """Test that the state of a workload is kept between its tasks."""
+
+    # Prepare
+    def app(fwd: Fwd) -> Bwd:
+        count = int(fwd.state.state.get("count", "0")) + 1
+        fwd.state.state["count"] = str(count)
+        return Bwd(task_res=TaskRes(task_id=str(count)), state=fwd.state)
+
+    store = InMemoryWorkloadStateStore()
+    task_ins_list = [TaskIns(workload_id=workload_id) for workload_id in [1, 1, 2]]
+
+    # Execute
+    task_res_list = list(
+        _handle_tasks(
+            load_callable_fn=lambda: MagicMock(side_effect=app),
+            task_ins_list=task_ins_list,
+            executor=None,
+            state_store=store,
+        )
+    )
+
+    # Assert
+    assert [task_res.task_id for task_res in task_res_list] == ["1", "2", "1"]
+    assert store.get("1").state == {"count": "2"}
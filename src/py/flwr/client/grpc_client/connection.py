@@ -23,6 +23,7 @@ from queue import Queue
 from typing import Callable, Iterator, Optional, Tuple, Union
 
 from flwr.common import GRPC_MAX_MESSAGE_LENGTH
+from flwr.common.chunk import chunk_messages, dechunk_messages, max_chunk_size
 from flwr.common.grpc import create_channel
 from flwr.common.logger import log
 from flwr.proto.node_pb2 import Node
@@ -48,6 +49,7 @@ def grpc_connection(
     insecure: bool,
     max_message_length: int = GRPC_MAX_MESSAGE_LENGTH,
     root_certificates: Optional[Union[bytes, str]] = None,
+    max_tasks: int = 1,  # pylint: disable=unused-argument
 ) -> Iterator[
     Tuple[
         Callable[[], Optional[TaskIns]],
@@ -70,12 +72,17 @@ def grpc_connection(
         very large models might need to increase this value. Note that the Flower
         server needs to be started with the same value
         (see `flwr.server.start_server`), otherwise it will not know about the
-        increased limit and block larger messages.
+        increased limit and block larger messages. Larger messages are streamed in
+        chunks of at most this length, so lowering it on both sides bounds the size
+        of the buffers gRPC allocates per message.
         (default: 536_870_912, this equals 512MB)
     root_certificates : Optional[bytes] (default: None)
         The PEM-encoded root certificates as a byte string or a path string.
         If provided, a secure connection using the certificates will be
         established to an SSL-enabled Flower server.
+    max_tasks : int (default: 1)
+        Ignored, only present to preserve API-compatibility. The server sends one
+        message at a time.
 
     Returns
     -------
@@ -112,7 +119,13 @@ def grpc_connection(
     )
     stub = FlowerServiceStub(channel)
 
-    server_message_iterator: Iterator[ServerMessage] = stub.Join(iter(queue.get, None))
+    chunk_size = max_chunk_size(max_message_length)
+    client_message_iterator = chunk_messages(
+        iter(queue.get, None), chunk_size, lambda chunk: ClientMessage(chunk=chunk)
+    )
+    server_message_iterator: Iterator[ServerMessage] = dechunk_messages(
+        stub.Join(client_message_iterator), ServerMessage
+    )
 
     def receive() -> TaskIns:
         server_message = next(server_message_iterator)
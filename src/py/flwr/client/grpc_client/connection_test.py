@@ -17,12 +17,14 @@
 
 import concurrent.futures
 import socket
+import threading
 from contextlib import closing
 from typing import Iterator, cast
 from unittest.mock import patch
 
 import grpc
 
+from flwr.common import FitIns, Parameters
 from flwr.proto.task_pb2 import Task, TaskRes
 from flwr.proto.transport_pb2 import ClientMessage, ServerMessage
 from flwr.server.client_manager import SimpleClientManager
@@ -143,3 +145,53 @@ def test_integration_connection() -> None:
 
     # Teardown
     server.stop(1)
+
+
+def test_integration_connection_chunked_messages() -> None:
+    """Exchange messages exceeding the maximum message length in chunks."""
+    # Prepare
+    port = unused_tcp_port()
+    max_message_length = 4096
+    client_manager = SimpleClientManager()
+    server = start_grpc_server(
+        client_manager=client_manager,
+        server_address=f"[::]:{port}",
+        max_message_length=max_message_length,
+    )
+    parameters = Parameters(tensors=[bytes(range(256)) * 64] * 2, tensor_type="")
+    received = threading.Event()
+
+    def run_client() -> None:
+        with grpc_connection(
+            server_address=f"[::]:{port}",
+            insecure=True,
+            max_message_length=max_message_length,
+        ) as conn:
+            receive, send, _, _ = conn
+
+            # Echo the received parameters
+            task_ins = receive()
+            assert task_ins is not None
+            fit_ins = task_ins.task.legacy_server_message.fit_ins
+            fit_res = ClientMessage.FitRes(parameters=fit_ins.parameters)
+            send(
+                TaskRes(task=Task(legacy_client_message=ClientMessage(fit_res=fit_res)))
+            )
+
+            # Keep the connection open until the server received the result
+            received.wait(timeout=10)
+
+    # Execute
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        future = executor.submit(run_client)
+        assert client_manager.wait_for(1, timeout=10)
+        client_proxy = next(iter(client_manager.all().values()))
+        fit_res = client_proxy.fit(FitIns(parameters, {}), timeout=10)
+        received.set()
+        future.result()
+
+    # Assert
+    assert fit_res.parameters == parameters
+
+    # Teardown
+    server.stop(1)
@@ -15,24 +15,29 @@
 """Contextmanager for a gRPC request-response channel to the Flower server."""
 
 
+from collections import deque
 from contextlib import contextmanager
 from logging import DEBUG, ERROR
 from pathlib import Path
-from typing import Callable, Dict, Iterator, Optional, Tuple, Union, cast
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union, cast
+
+import grpc
 
 from flwr.client.message_handler.task_handler import (
     configure_task_res,
-    get_task_ins,
-    validate_task_ins,
+    get_task_ins_list,
     validate_task_res,
 )
 from flwr.common import GRPC_MAX_MESSAGE_LENGTH
+from flwr.common.chunk import max_chunk_size, parse_chunks, split_message
+from flwr.common.constant import PULL_INTERVAL
 from flwr.common.grpc import create_channel
 from flwr.common.logger import log, warn_experimental_feature
 from flwr.proto.fleet_pb2 import (
     CreateNodeRequest,
     DeleteNodeRequest,
     PullTaskInsRequest,
+    PullTaskInsResponse,
     PushTaskResRequest,
 )
 from flwr.proto.fleet_pb2_grpc import FleetStub
@@ -41,6 +46,8 @@ from flwr.proto.task_pb2 import TaskIns, TaskRes
 
 KEY_NODE = "node"
 KEY_TASK_INS = "current_task_ins"
+KEY_TASK_RES = "task_res"
+KEY_STREAMING = "streaming"
 
 
 def on_channel_state_change(channel_connectivity: str) -> None:
@@ -52,8 +59,9 @@ def on_channel_state_change(channel_connectivity: str) -> None:
 def grpc_request_response(
     server_address: str,
     insecure: bool,
-    max_message_length: int = GRPC_MAX_MESSAGE_LENGTH,  # pylint: disable=W0613
+    max_message_length: int = GRPC_MAX_MESSAGE_LENGTH,
     root_certificates: Optional[Union[bytes, str]] = None,
+    max_tasks: int = 1,
 ) -> Iterator[
     Tuple[
         Callable[[], Optional[TaskIns]],
@@ -74,11 +82,16 @@ def grpc_request_response(
         If the Flower server runs on the same machine
         on port 8080, then `server_address` would be `"http://[::]:8080"`.
     max_message_length : int
-        Ignored, only present to preserve API-compatibility.
+        The maximum length of gRPC messages that can be exchanged with the Flower
+        server. Larger task instructions and results are streamed in chunks.
     root_certificates : Optional[Union[bytes, str]] (default: None)
         Path of the root certificate. If provided, a secure
         connection using the certificates will be established to an SSL-enabled
         Flower server. Bytes won't work for the REST API.
+    max_tasks : int (default: 1)
+        The maximum number of TaskIns pulled at once. `receive` returns them one
+        after the other, and returns `None` once all of them were received until a
+        TaskRes was sent for each. The TaskRes are then pushed in a single request.
 
     Returns
     -------
@@ -101,12 +114,20 @@ def grpc_request_response(
     channel.subscribe(on_channel_state_change)
     stub = FleetStub(channel)
 
-    # Necessary state to link TaskRes to TaskIns
-    state: Dict[str, Optional[TaskIns]] = {KEY_TASK_INS: None}
+    # TaskIns pulled from the server but not yet returned by `receive`
+    task_ins_buffer: Deque[TaskIns] = deque()
+    # Necessary state to link TaskRes to TaskIns, in the order they were received
+    state: Dict[str, Deque[TaskIns]] = {KEY_TASK_INS: deque()}
+    # TaskRes to push once all received TaskIns are answered
+    task_res_buffer: Dict[str, List[TaskRes]] = {KEY_TASK_RES: []}
 
     # Enable create_node and delete_node to store node
     node_store: Dict[str, Optional[Node]] = {KEY_NODE: None}
 
+    # Whether the server supports streaming messages in chunks
+    chunk_size = max_chunk_size(max_message_length)
+    streaming: Dict[str, bool] = {KEY_STREAMING: True}
+
     ###########################################################################
     # receive/send functions
     ###########################################################################
@@ -132,6 +153,31 @@ def grpc_request_response(
 
         del node_store[KEY_NODE]
 
+    def pull_task_ins(request: PullTaskInsRequest) -> PullTaskInsResponse:
+        """Pull TaskIns, streamed in chunks if the server supports it."""
+        if streaming[KEY_STREAMING]:
+            try:
+                return parse_chunks(
+                    stub.PullTaskInsStream(request=request), PullTaskInsResponse
+                )
+            except grpc.RpcError as err:
+                if err.code() != grpc.StatusCode.UNIMPLEMENTED:
+                    raise
+                streaming[KEY_STREAMING] = False
+        response: PullTaskInsResponse = stub.PullTaskIns(request=request)
+        return response
+
+    def push_task_res(request: PushTaskResRequest) -> None:
+        """Push TaskRes, streamed in chunks if it exceeds the message length."""
+        if (
+            streaming[KEY_STREAMING]
+            and chunk_size is not None
+            and request.ByteSize() > chunk_size
+        ):
+            stub.PushTaskResStream(split_message(request, chunk_size))
+        else:
+            stub.PushTaskRes(request)
+
     def receive() -> Optional[TaskIns]:
         """Receive next task from server."""
         # Get Node
@@ -140,23 +186,27 @@ def grpc_request_response(
             return None
         node: Node = cast(Node, node_store[KEY_NODE])
 
-        # Request instructions (task) from server
-        request = PullTaskInsRequest(node=node)
-        response = stub.PullTaskIns(request=request)
+        if not task_ins_buffer:
+            # Send the results of the current batch before pulling the next one
+            if state[KEY_TASK_INS]:
+                return None
 
-        # Get the current TaskIns
-        task_ins: Optional[TaskIns] = get_task_ins(response)
+            # Request instructions (task) from server, which may wait for one
+            request = PullTaskInsRequest(
+                node=node, timeout=PULL_INTERVAL, max_tasks=max_tasks
+            )
+            response = pull_task_ins(request)
 
-        # Discard the current TaskIns if not valid
-        if task_ins is not None and not validate_task_ins(
-            task_ins, discard_reconnect_ins=True
-        ):
-            task_ins = None
+            # Keep all valid TaskIns
+            task_ins_buffer.extend(get_task_ins_list(response))
+            if not task_ins_buffer:
+                return None
 
         # Remember `task_ins` until `task_res` is available
-        state[KEY_TASK_INS] = task_ins
+        task_ins = task_ins_buffer.popleft()
+        state[KEY_TASK_INS].append(task_ins)
 
-        # Return the TaskIns if available
+        # Return the TaskIns
         return task_ins
 
     def send(task_res: TaskRes) -> None:
@@ -168,24 +218,25 @@ def grpc_request_response(
         node: Node = cast(Node, node_store[KEY_NODE])
 
         # Get incoming TaskIns
-        if state[KEY_TASK_INS] is None:
+        if not state[KEY_TASK_INS]:
             log(ERROR, "No current TaskIns")
             return
-        task_ins: TaskIns = cast(TaskIns, state[KEY_TASK_INS])
+        task_ins: TaskIns = state[KEY_TASK_INS].popleft()
 
         # Check if fields to be set are not initialized
         if not validate_task_res(task_res):
-            state[KEY_TASK_INS] = None
             log(ERROR, "TaskRes has been initialized accidentally")
 
         # Configure TaskRes
-        task_res = configure_task_res(task_res, task_ins, node)
-
-        # Serialize ProtoBuf to bytes
-        request = PushTaskResRequest(task_res_list=[task_res])
-        _ = stub.PushTaskRes(request)
+        task_res_buffer[KEY_TASK_RES].append(
+            configure_task_res(task_res, task_ins, node)
+        )
 
-        state[KEY_TASK_INS] = None
+        # Push all TaskRes once each received TaskIns is answered
+        if not state[KEY_TASK_INS]:
+            request = PushTaskResRequest(task_res_list=task_res_buffer[KEY_TASK_RES])
+            task_res_buffer[KEY_TASK_RES] = []
+            push_task_res(request)
 
     try:
         # Yield methods
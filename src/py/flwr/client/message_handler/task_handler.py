@@ -15,7 +15,7 @@
 """Task handling."""
 
 
-from typing import Optional
+from typing import List, Optional
 
 from flwr.proto.fleet_pb2 import PullTaskInsResponse
 from flwr.proto.node_pb2 import Node
@@ -108,6 +108,17 @@ def get_task_ins(
     return task_ins
 
 
+def get_task_ins_list(
+    pull_task_ins_response: PullTaskInsResponse,
+) -> List[TaskIns]:
+    """Get all valid TaskIns, discarding ReconnectIns."""
+    return [
+        task_ins
+        for task_ins in pull_task_ins_response.task_ins_list
+        if validate_task_ins(task_ins, discard_reconnect_ins=True)
+    ]
+
+
 def get_server_message_from_task_ins(
     task_ins: TaskIns, exclude_reconnect_ins: bool
 ) -> Optional[ServerMessage]:
@@ -18,6 +18,7 @@
 from flwr.client.message_handler.task_handler import (
     get_server_message_from_task_ins,
     get_task_ins,
+    get_task_ins_list,
     validate_task_ins,
     validate_task_res,
     wrap_client_message_in_task_res,
@@ -136,6 +137,30 @@ def test_get_task_ins_multiple_ins() -> None:
     assert actual_task_ins == expected_task_ins
 
 
+def test_get_task_ins_list_discards_invalid() -> None:
+    """Test get_task_ins_list."""
+    valid_task_ins = TaskIns(
+        task_id="123",
+        task=Task(
+            legacy_server_message=ServerMessage(
+                get_properties_ins=ServerMessage.GetPropertiesIns()
+            )
+        ),
+    )
+    reconnect_task_ins = TaskIns(
+        task_id="456",
+        task=Task(
+            legacy_server_message=ServerMessage(
+                reconnect_ins=ServerMessage.ReconnectIns()
+            )
+        ),
+    )
+    res = PullTaskInsResponse(
+        task_ins_list=[TaskIns(), valid_task_ins, reconnect_task_ins, valid_task_ins]
+    )
+    assert get_task_ins_list(res) == [valid_task_ins, valid_task_ins]
+
+
 def test_get_server_message_from_task_ins_invalid() -> None:
     """Test get_server_message_from_task_ins."""
     task_ins = TaskIns(task=Task(legacy_server_message=None))
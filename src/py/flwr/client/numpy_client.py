@@ -16,7 +16,7 @@
 
 
 from abc import ABC
-from typing import Callable, Dict, Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 from flwr.client.client import Client
 from flwr.client.workload_state import WorkloadState
@@ -27,6 +27,16 @@ from flwr.common import (
     ndarrays_to_parameters,
     parameters_to_ndarrays,
 )
+from flwr.common.delta import (
+    DELTA_CONFIG_KEY,
+    DELTA_RESIDUAL_STATE_KEY,
+    DELTA_THRESHOLD_CONFIG_KEY,
+    DELTA_TOP_K_CONFIG_KEY,
+    compute_delta,
+    delta_tensor_type,
+    sparsify,
+)
+from flwr.common.parameter import TENSOR_TYPE_CONFIG_KEY, TENSOR_TYPE_NUMPY
 from flwr.common.typing import (
     Code,
     EvaluateIns,
@@ -220,10 +230,17 @@ def _get_properties(self: Client, ins: GetPropertiesIns) -> GetPropertiesRes:
     )
 
 
+def _requested_tensor_type(config: Config) -> str:
+    """Return the tensor type the server requested for returned parameters."""
+    return str(config.get(TENSOR_TYPE_CONFIG_KEY, TENSOR_TYPE_NUMPY))
+
+
 def _get_parameters(self: Client, ins: GetParametersIns) -> GetParametersRes:
     """Return the current local model parameters."""
     parameters = self.numpy_client.get_parameters(config=ins.config)  # type: ignore
-    parameters_proto = ndarrays_to_parameters(parameters)
+    parameters_proto = ndarrays_to_parameters(
+        parameters, tensor_type=_requested_tensor_type(ins.config)
+    )
     return GetParametersRes(
         status=Status(code=Code.OK, message="Success"), parameters=parameters_proto
     )
@@ -246,7 +263,13 @@ def _fit(self: Client, ins: FitIns) -> FitRes:
 
     # Return FitRes
     parameters_prime, num_examples, metrics = results
-    parameters_prime_proto = ndarrays_to_parameters(parameters_prime)
+    tensor_type = _requested_tensor_type(ins.config)
+    if ins.config.get(DELTA_CONFIG_KEY, False):
+        parameters_prime = _compute_update(self, ins, parameters_prime)
+        tensor_type = delta_tensor_type(tensor_type)
+    parameters_prime_proto = ndarrays_to_parameters(
+        parameters_prime, tensor_type=tensor_type
+    )
     return FitRes(
         status=Status(code=Code.OK, message="Success"),
         parameters=parameters_prime_proto,
@@ -255,6 +278,33 @@ def _fit(self: Client, ins: FitIns) -> FitRes:
     )
 
 
+def _compute_update(self: Client, ins: FitIns, parameters_prime: NDArrays) -> NDArrays:
+    """Compute the (sparsified) update to send instead of `parameters_prime`."""
+    # Decode the received parameters again as `fit` might have modified them
+    update = compute_delta(parameters_prime, parameters_to_ndarrays(ins.parameters))
+    top_k = ins.config.get(DELTA_TOP_K_CONFIG_KEY)
+    threshold = ins.config.get(DELTA_THRESHOLD_CONFIG_KEY)
+    if top_k is None and threshold is None:
+        return update
+
+    # Keep the values dropped by sparsification for the next round
+    state: Optional[WorkloadState] = getattr(
+        self.numpy_client, "state", None  # type: ignore
+    )
+    residual = None
+    if state is not None:
+        residual = state.ndarrays.get(DELTA_RESIDUAL_STATE_KEY)
+    update, residual = sparsify(
+        update,
+        residual,
+        top_k=None if top_k is None else float(top_k),
+        threshold=None if threshold is None else float(threshold),
+    )
+    if state is not None:
+        state.ndarrays[DELTA_RESIDUAL_STATE_KEY] = residual
+    return update
+
+
 def _evaluate(self: Client, ins: EvaluateIns) -> EvaluateRes:
     """Evaluate the provided parameters using the locally held dataset."""
     parameters: NDArrays = parameters_to_ndarrays(ins.parameters)
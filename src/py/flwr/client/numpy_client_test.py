@@ -17,7 +17,17 @@
 
 from typing import Dict, Tuple
 
-from flwr.common import Config, NDArrays, Properties, Scalar
+import numpy as np
+
+from flwr.common import (
+    Config,
+    FitIns,
+    NDArrays,
+    Properties,
+    Scalar,
+    ndarrays_to_parameters,
+    parameters_to_ndarrays,
+)
 
 from .numpy_client import (
     NumPyClient,
@@ -26,6 +36,7 @@ from .numpy_client import (
     has_get_parameters,
     has_get_properties,
 )
+from .workload_state import WorkloadState
 
 
 class OverridingClient(NumPyClient):
@@ -158,3 +169,58 @@ def test_has_evaluate_false() -> None:
 
     # Assert
     assert actual == expected
+
+
+def test_fit_uses_requested_tensor_type() -> None:
+    """Test that `fit` encodes parameters with the tensor type in the config."""
+    # Prepare
+    client = OverridingClient().to_client()
+    ins = FitIns(
+        parameters=ndarrays_to_parameters([np.ones(3)]),
+        config={"tensor_type": "numpy.ndarray+zlib"},
+    )
+
+    # Execute
+    res = client.fit(ins)
+
+    # Assert
+    assert res.parameters.tensor_type == "numpy.ndarray+zlib"
+    assert parameters_to_ndarrays(res.parameters) == []
+
+
+class AddOneClient(NumPyClient):
+    """Client adding one to the received parameters (in place)."""
+
+    def fit(
+        self, parameters: NDArrays, config: Dict[str, Scalar]
+    ) -> Tuple[NDArrays, int, Dict[str, Scalar]]:
+        """Simulate training by adding one to all parameters."""
+        for layer in parameters:
+            layer += 1.0
+        return parameters, 1, {}
+
+
+def test_fit_returns_sparse_update_with_error_feedback() -> None:
+    """Test that `fit` returns sparsified updates and keeps the residual."""
+    # Prepare
+    numpy_client = AddOneClient()
+    numpy_client.set_state(WorkloadState(state={}))
+    client = numpy_client.to_client()
+    ins = FitIns(
+        parameters=ndarrays_to_parameters([np.array([0.0, 0.5, 1.0, 1.5])]),
+        config={"delta": True, "delta_top_k": 0.5},
+    )
+
+    # Execute
+    first = client.fit(ins)
+    second = client.fit(ins)
+
+    # Assert
+    assert first.parameters.tensor_type == "numpy.ndarray+delta"
+    first_update = parameters_to_ndarrays(first.parameters)[0]
+    second_update = parameters_to_ndarrays(second.parameters)[0]
+    assert np.count_nonzero(first_update) == 2
+    # No part of the two updates is lost, dropped values are kept as residual
+    residual = numpy_client.get_state().ndarrays["delta_residual"][0]
+    np.testing.assert_equal(first_update + second_update + residual, [2.0] * 4)
+    np.testing.assert_equal(second_update, [2.0, 2.0, 0.0, 0.0])
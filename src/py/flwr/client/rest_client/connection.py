@@ -16,18 +16,18 @@
 
 
 import sys
+from collections import deque
 from contextlib import contextmanager
 from logging import ERROR, INFO, WARN
-from typing import Callable, Dict, Iterator, Optional, Tuple, Union, cast
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union, cast
 
 from flwr.client.message_handler.task_handler import (
     configure_task_res,
-    get_task_ins,
-    validate_task_ins,
+    get_task_ins_list,
     validate_task_res,
 )
 from flwr.common import GRPC_MAX_MESSAGE_LENGTH
-from flwr.common.constant import MISSING_EXTRA_REST
+from flwr.common.constant import MISSING_EXTRA_REST, PULL_INTERVAL
 from flwr.common.logger import log
 from flwr.proto.fleet_pb2 import (
     CreateNodeRequest,
@@ -49,6 +49,7 @@ except ModuleNotFoundError:
 
 KEY_NODE = "node"
 KEY_TASK_INS = "current_task_ins"
+KEY_TASK_RES = "task_res"
 
 
 PATH_CREATE_NODE: str = "api/v0/fleet/create-node"
@@ -66,6 +67,7 @@ def http_request_response(
     root_certificates: Optional[
         Union[bytes, str]
     ] = None,  # pylint: disable=unused-argument
+    max_tasks: int = 1,
 ) -> Iterator[
     Tuple[
         Callable[[], Optional[TaskIns]],
@@ -91,6 +93,10 @@ def http_request_response(
         Path of the root certificate. If provided, a secure
         connection using the certificates will be established to an SSL-enabled
         Flower server. Bytes won't work for the REST API.
+    max_tasks : int (default: 1)
+        The maximum number of TaskIns pulled at once. `receive` returns them one
+        after the other, and returns `None` once all of them were received until a
+        TaskRes was sent for each. The TaskRes are then pushed in a single request.
 
     Returns
     -------
@@ -120,8 +126,12 @@ def http_request_response(
             "must be provided as a string path to the client.",
         )
 
-    # Necessary state to link TaskRes to TaskIns
-    state: Dict[str, Optional[TaskIns]] = {KEY_TASK_INS: None}
+    # TaskIns pulled from the server but not yet returned by `receive`
+    task_ins_buffer: Deque[TaskIns] = deque()
+    # Necessary state to link TaskRes to TaskIns, in the order they were received
+    state: Dict[str, Deque[TaskIns]] = {KEY_TASK_INS: deque()}
+    # TaskRes to push once all received TaskIns are answered
+    task_res_buffer: Dict[str, List[TaskRes]] = {KEY_TASK_RES: []}
 
     # Enable create_node and delete_node to store node
     node_store: Dict[str, Optional[Node]] = {KEY_NODE: None}
@@ -204,16 +214,12 @@ def http_request_response(
                 PATH_PULL_TASK_INS,
             )
 
-    def receive() -> Optional[TaskIns]:
-        """Receive next task from server."""
-        # Get Node
-        if node_store[KEY_NODE] is None:
-            log(ERROR, "Node instance missing")
-            return None
-        node: Node = cast(Node, node_store[KEY_NODE])
-
-        # Request instructions (task) from server
-        pull_task_ins_req_proto = PullTaskInsRequest(node=node)
+    def pull_task_ins(node: Node) -> List[TaskIns]:
+        """Pull up to `max_tasks` TaskIns from the server."""
+        # Request instructions (task) from server, which may wait for one
+        pull_task_ins_req_proto = PullTaskInsRequest(
+            node=node, timeout=PULL_INTERVAL, max_tasks=max_tasks
+        )
         pull_task_ins_req_bytes: bytes = pull_task_ins_req_proto.SerializeToString()
 
         # Request instructions (task) from server
@@ -229,41 +235,53 @@ def http_request_response(
 
         # Check status code and headers
         if res.status_code != 200:
-            return None
+            return []
         if "content-type" not in res.headers:
             log(
                 WARN,
                 "[Node] POST /%s: missing header `Content-Type`",
                 PATH_PULL_TASK_INS,
             )
-            return None
+            return []
         if res.headers["content-type"] != "application/protobuf":
             log(
                 WARN,
                 "[Node] POST /%s: header `Content-Type` has wrong value",
                 PATH_PULL_TASK_INS,
             )
-            return None
+            return []
 
         # Deserialize ProtoBuf from bytes
         pull_task_ins_response_proto = PullTaskInsResponse()
         pull_task_ins_response_proto.ParseFromString(res.content)
 
-        # Get the current TaskIns
-        task_ins: Optional[TaskIns] = get_task_ins(pull_task_ins_response_proto)
+        # Keep all valid TaskIns
+        task_ins_list = get_task_ins_list(pull_task_ins_response_proto)
+        if task_ins_list:
+            log(INFO, "[Node] POST /%s: success", PATH_PULL_TASK_INS)
+        return task_ins_list
+
+    def receive() -> Optional[TaskIns]:
+        """Receive next task from server."""
+        # Get Node
+        if node_store[KEY_NODE] is None:
+            log(ERROR, "Node instance missing")
+            return None
+        node: Node = cast(Node, node_store[KEY_NODE])
 
-        # Discard the current TaskIns if not valid
-        if task_ins is not None and not validate_task_ins(
-            task_ins, discard_reconnect_ins=True
-        ):
-            task_ins = None
+        if not task_ins_buffer:
+            # Send the results of the current batch before pulling the next one
+            if state[KEY_TASK_INS]:
+                return None
+            task_ins_buffer.extend(pull_task_ins(node))
+            if not task_ins_buffer:
+                return None
 
         # Remember `task_ins` until `task_res` is available
-        state[KEY_TASK_INS] = task_ins
+        task_ins = task_ins_buffer.popleft()
+        state[KEY_TASK_INS].append(task_ins)
 
-        # Return the TaskIns if available
-        if task_ins is not None:
-            log(INFO, "[Node] POST /%s: success", PATH_PULL_TASK_INS)
+        # Return the TaskIns
         return task_ins
 
     def send(task_res: TaskRes) -> None:
@@ -274,22 +292,30 @@ def http_request_response(
             return
         node: Node = cast(Node, node_store[KEY_NODE])
 
-        if state[KEY_TASK_INS] is None:
+        if not state[KEY_TASK_INS]:
             log(ERROR, "No current TaskIns")
             return
 
-        task_ins: TaskIns = cast(TaskIns, state[KEY_TASK_INS])
+        task_ins: TaskIns = state[KEY_TASK_INS].popleft()
 
         # Check if fields to be set are not initialized
         if not validate_task_res(task_res):
-            state[KEY_TASK_INS] = None
             log(ERROR, "TaskRes has been initialized accidentally")
 
         # Configure TaskRes
-        task_res = configure_task_res(task_res, task_ins, node)
+        task_res_buffer[KEY_TASK_RES].append(
+            configure_task_res(task_res, task_ins, node)
+        )
+
+        # Push all TaskRes once each received TaskIns is answered
+        if state[KEY_TASK_INS]:
+            return
 
         # Serialize ProtoBuf to bytes
-        push_task_res_request_proto = PushTaskResRequest(task_res_list=[task_res])
+        push_task_res_request_proto = PushTaskResRequest(
+            task_res_list=task_res_buffer[KEY_TASK_RES]
+        )
+        task_res_buffer[KEY_TASK_RES] = []
         push_task_res_request_bytes: bytes = (
             push_task_res_request_proto.SerializeToString()
         )
@@ -305,8 +331,6 @@ def http_request_response(
             verify=verify,
         )
 
-        state[KEY_TASK_INS] = None
-
         # Check status code and headers
         if res.status_code != 200:
             return
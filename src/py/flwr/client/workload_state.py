@@ -14,12 +14,15 @@
 # ==============================================================================
 """Workload state."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict
 
+from flwr.common.typing import NDArrays
+
 
 @dataclass
 class WorkloadState:
     """State of a workload executed by a client node."""
 
     state: Dict[str, str]
+    ndarrays: Dict[str, NDArrays] = field(default_factory=dict)
@@ -0,0 +1,186 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Stores keeping workload states between the tasks of a client."""
+
+
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Union
+from urllib.parse import quote, unquote
+
+import numpy as np
+
+from flwr.common.typing import NDArray
+
+from .workload_state import WorkloadState
+
+_META_KEY = "__meta__"
+
+
+class WorkloadStateStore(ABC):
+    """Abstract base class for stores of workload states.
+
+    Before a client executes a task, its state is read from the store using a key
+    identifying the client (e.g., the `cid` of a virtual client). The state the client
+    returns afterwards is written back under the same key.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> WorkloadState:
+        """Return the state stored under `key`, or an empty state if there is none."""
+
+    @abstractmethod
+    def put(self, key: str, state: WorkloadState) -> None:
+        """Store `state` under `key`, replacing the previous state."""
+
+
+class InMemoryWorkloadStateStore(WorkloadStateStore):
+    """Keep all workload states in memory."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._states: Dict[str, WorkloadState] = {}
+
+    def get(self, key: str) -> WorkloadState:
+        """Return the state stored under `key`, or an empty state if there is none."""
+        with self._lock:
+            state = self._states.get(key)
+        return state if state is not None else WorkloadState(state={})
+
+    def put(self, key: str, state: WorkloadState) -> None:
+        """Store `state` under `key`, replacing the previous state."""
+        with self._lock:
+            self._states[key] = state
+
+
+class DiskWorkloadStateStore(WorkloadStateStore):
+    """Write workload states to disk and cache the most recently used ones.
+
+    Each state is written to its own `.npz` file in `directory` as soon as it is
+    stored, so states survive restarts. Up to `max_cached_states` states are also kept
+    in memory, such that clients taking part in consecutive rounds do not read their
+    state from disk again. The least recently used states are evicted first.
+
+    By default, there is one file per key that was ever stored, so the directory grows
+    with the number of clients. If `max_states` is set, the files of the least
+    recently used states beyond that number are deleted, and those clients start from
+    an empty state again.
+
+    Parameters
+    ----------
+    directory : Union[str, Path]
+        The directory to write the states to. It is created if it does not exist.
+    max_cached_states : int (default: 128)
+        The maximum number of states kept in memory.
+    max_states : Optional[int] (default: None)
+        The maximum number of states kept on disk, including states written to
+        `directory` before. If `None`, states are never deleted.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_cached_states: int = 128,
+        max_states: Optional[int] = None,
+    ) -> None:
+        if max_states is not None and max_states < 1:
+            raise ValueError("`max_states` must be at least 1.")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_cached_states = max_cached_states
+        self.max_states = max_states
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[str, WorkloadState]" = OrderedDict()
+        # Keys of the states on disk, least recently used first
+        self._stored: "OrderedDict[str, None]" = OrderedDict(
+            (unquote(path.stem), None)
+            for path in sorted(
+                self.directory.glob("*.npz"), key=lambda path: path.stat().st_mtime
+            )
+        )
+        self._evict_stored()
+
+    def get(self, key: str) -> WorkloadState:
+        """Return the state stored under `key`, or an empty state if there is none."""
+        with self._lock:
+            if key in self._stored:
+                self._stored.move_to_end(key)
+            state = self._cache.get(key)
+            if state is not None:
+                self._cache.move_to_end(key)
+                return state
+        path = self._path(key)
+        state = _read(path) if path.exists() else WorkloadState(state={})
+        self._cache_state(key, state)
+        return state
+
+    def put(self, key: str, state: WorkloadState) -> None:
+        """Store `state` under `key`, replacing the previous state."""
+        _write(self._path(key), state)
+        self._cache_state(key, state)
+        with self._lock:
+            self._stored[key] = None
+            self._stored.move_to_end(key)
+            self._evict_stored()
+
+    def _cache_state(self, key: str, state: WorkloadState) -> None:
+        with self._lock:
+            self._cache[key] = state
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_cached_states:
+                self._cache.popitem(last=False)
+
+    def _evict_stored(self) -> None:
+        """Delete the least recently used states beyond `max_states`."""
+        if self.max_states is None:
+            return
+        while len(self._stored) > self.max_states:
+            key, _ = self._stored.popitem(last=False)
+            self._cache.pop(key, None)
+            self._path(key).unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{quote(key, safe='')}.npz"
+
+
+def _write(path: Path, state: WorkloadState) -> None:
+    """Write a state to a `.npz` file, replacing the file atomically."""
+    arrays: Dict[str, NDArray] = {}
+    lengths: Dict[str, int] = {}
+    for name, ndarrays in state.ndarrays.items():
+        lengths[name] = len(ndarrays)
+        for ndarray in ndarrays:
+            arrays[f"{len(arrays)}"] = ndarray
+    meta = json.dumps({"state": state.state, "ndarrays": lengths})
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as file:
+        np.savez(file, **{_META_KEY: np.array(meta)}, **arrays)
+    os.replace(tmp_path, path)
+
+
+def _read(path: Path) -> WorkloadState:
+    """Read a state written by `_write`."""
+    with np.load(path, allow_pickle=False) as npz:
+        meta = json.loads(str(npz[_META_KEY]))
+        ndarrays = {}
+        offset = 0
+        for name, length in meta["ndarrays"].items():
+            ndarrays[name] = [npz[f"{offset + idx}"] for idx in range(length)]
+            offset += length
+    return WorkloadState(state=meta["state"], ndarrays=ndarrays)
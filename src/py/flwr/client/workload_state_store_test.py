@@ -0,0 +1,109 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for workload state stores."""
+
+
+import os
+from pathlib import Path
+
+import numpy as np
+
+from .workload_state import WorkloadState
+from .workload_state_store import DiskWorkloadStateStore, InMemoryWorkloadStateStore
+
+
+def _state() -> WorkloadState:
+    return WorkloadState(
+        state={"round": "3"},
+        ndarrays={
+            "residual": [np.arange(6.0).reshape(2, 3), np.ones(4, dtype=np.int32)],
+            "control_variate": [np.zeros(2)],
+        },
+    )
+
+
+def test_in_memory_store() -> None:
+    """Test that states are returned until replaced."""
+    # Prepare
+    store = InMemoryWorkloadStateStore()
+    state = _state()
+
+    # Execute
+    empty = store.get("0")
+    store.put("0", state)
+
+    # Assert
+    assert empty == WorkloadState(state={})
+    assert store.get("0") is state
+    assert store.get("1") == WorkloadState(state={})
+
+
+def test_disk_store_persists_states(tmp_path: Path) -> None:
+    """Test that states written by one store are read by another one."""
+    # Prepare
+    state = _state()
+    DiskWorkloadStateStore(tmp_path).put("client/0", state)
+
+    # Execute
+    loaded = DiskWorkloadStateStore(tmp_path).get("client/0")
+
+    # Assert
+    assert loaded.state == state.state
+    assert list(loaded.ndarrays) == list(state.ndarrays)
+    for name, ndarrays in state.ndarrays.items():
+        np.testing.assert_equal(loaded.ndarrays[name], ndarrays)
+        assert [arr.dtype for arr in loaded.ndarrays[name]] == [
+            arr.dtype for arr in ndarrays
+        ]
+
+
+def test_disk_store_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Test that only the most recently used states are kept in memory."""
+    # Prepare
+    store = DiskWorkloadStateStore(tmp_path, max_cached_states=2)
+    states = {key: WorkloadState(state={"key": key}) for key in ["0", "1", "2"]}
+    store.put("0", states["0"])
+    store.put("1", states["1"])
+
+    # Execute
+    cached = store.get("0")
+    store.put("2", states["2"])  # Evicts "1"
+
+    # Assert
+    assert cached is states["0"]
+    assert store.get("0") is states["0"]
+    reloaded = store.get("1")
+    assert reloaded is not states["1"]
+    assert reloaded == states["1"]
+
+
+def test_disk_store_deletes_least_recently_used(tmp_path: Path) -> None:
+    """Test that only the most recently used states are kept on disk."""
+    # Prepare
+    store = DiskWorkloadStateStore(tmp_path, max_states=2)
+    states = {key: WorkloadState(state={"key": key}) for key in ["0", "1", "2"]}
+    store.put("0", states["0"])
+    store.put("1", states["1"])
+
+    # Execute
+    store.get("0")
+    store.put("2", states["2"])  # Deletes "1"
+    os.utime(tmp_path / "0.npz", (0, 0))
+    reopened = DiskWorkloadStateStore(tmp_path, max_states=1)  # Deletes "0"
+
+    # Assert
+    assert store.get("1") == WorkloadState(state={})
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["2.npz"]
+    assert reopened.get("2") == states["2"]
@@ -0,0 +1,199 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Streaming of messages that exceed the maximum gRPC message length.
+
+A message that is too large to be sent as a single gRPC message is serialized and
+split into `MessageChunk`s. The receiver reassembles the chunks into a buffer that
+is allocated once, based on the total size sent with the first chunk.
+
+Chunks only lift the gRPC message length limit. The message is still reassembled
+and parsed as a whole, so the receiver needs about twice its size in memory, and
+protobuf cannot parse serialized messages of 2 GB or more. Receivers reject messages
+announcing a larger total size than they accept before allocating a buffer.
+"""
+
+
+from typing import Callable, Iterable, Iterator, Optional, Type, TypeVar, Union
+
+from google.protobuf.message import Message
+
+from flwr.proto.transport_pb2 import ClientMessage, MessageChunk, ServerMessage
+
+# Room for the fields wrapping a chunk, e.g., `ServerMessage.chunk`
+CHUNK_OVERHEAD = 1024
+# Protobuf cannot parse larger messages
+MAX_CHUNKED_MESSAGE_LENGTH = 2**31 - 1
+
+T = TypeVar("T", bound=Message)
+WrapperMessage = TypeVar("WrapperMessage", ServerMessage, ClientMessage)
+
+
+def max_chunk_size(max_message_length: int) -> Optional[int]:
+    """Return the size of chunks fitting in messages of `max_message_length`.
+
+    Returns None if the message length is unlimited (i.e., negative).
+    """
+    if max_message_length < 0:
+        return None
+    return max(max_message_length - CHUNK_OVERHEAD, 1)
+
+
+def split_message(
+    message: Message, chunk_size: Optional[int]
+) -> Iterator[MessageChunk]:
+    """Serialize a message and split it into chunks of at most `chunk_size` bytes.
+
+    At least one chunk is returned, even for empty messages. If `chunk_size` is
+    None, the message is returned as a single chunk.
+    """
+    data = memoryview(message.SerializeToString())
+    if chunk_size is None:
+        chunk_size = max(len(data), 1)
+    for start in range(0, max(len(data), 1), chunk_size):
+        yield MessageChunk(
+            total_size=len(data) if start == 0 else 0,
+            data=bytes(data[start : start + chunk_size]),  # noqa: E203
+        )
+
+
+class ChunkBuffer:
+    """Buffer a serialized message is reassembled into from its chunks.
+
+    The buffer is allocated once, based on the total size sent with the first chunk.
+    A `ValueError` is raised before allocating it if the total size exceeds
+    `max_total_size`, as the size is announced by the peer.
+    """
+
+    def __init__(
+        self,
+        first: MessageChunk,
+        max_total_size: int = MAX_CHUNKED_MESSAGE_LENGTH,
+    ) -> None:
+        if first.total_size > max_total_size:
+            raise ValueError(
+                f"Chunked message of {first.total_size} bytes exceeds the maximum "
+                f"of {max_total_size} bytes"
+            )
+        self.buffer = bytearray(first.total_size)
+        self._view = memoryview(self.buffer)
+        self._offset = 0
+        self.add(first)
+
+    @property
+    def complete(self) -> bool:
+        """Return whether all chunks of the message have been added."""
+        return self._offset == len(self.buffer)
+
+    def add(self, chunk: MessageChunk) -> None:
+        """Copy the data of the next chunk into the buffer."""
+        end = self._offset + len(chunk.data)
+        if end > len(self.buffer):
+            raise ValueError("Message chunks exceed the announced total size")
+        self._view[self._offset : end] = chunk.data  # noqa: E203
+        self._offset = end
+
+
+def join_chunks(
+    chunks: Iterable[MessageChunk],
+    first: Optional[MessageChunk] = None,
+    max_total_size: int = MAX_CHUNKED_MESSAGE_LENGTH,
+) -> bytearray:
+    """Reassemble a serialized message from its chunks.
+
+    The whole serialized message is held in the returned buffer. Parsing it creates a
+    second copy of its contents, so the peak memory use of receiving a message is
+    about twice its size.
+
+    Parameters
+    ----------
+    chunks : Iterable[MessageChunk]
+        The chunks of the message. Only the chunks of a single message are
+        consumed.
+    first : Optional[MessageChunk] (default: None)
+        The first chunk, if it has already been taken from `chunks`.
+    max_total_size : int (default: MAX_CHUNKED_MESSAGE_LENGTH)
+        The maximum size of the message. Larger messages are rejected with a
+        `ValueError` before their buffer is allocated.
+
+    Returns
+    -------
+    buffer : bytearray
+        The serialized message.
+    """
+    iterator = iter(chunks)
+    chunk_buffer = ChunkBuffer(
+        next(iterator) if first is None else first, max_total_size
+    )
+    while not chunk_buffer.complete:
+        try:
+            chunk_buffer.add(next(iterator))
+        except StopIteration as err:
+            raise ValueError("Message stream ended before the last chunk") from err
+    return chunk_buffer.buffer
+
+
+def parse_chunks(
+    chunks: Iterable[MessageChunk],
+    message_type: Type[T],
+    first: Optional[MessageChunk] = None,
+    max_total_size: int = MAX_CHUNKED_MESSAGE_LENGTH,
+) -> T:
+    """Reassemble and parse a message from its chunks."""
+    message = message_type()
+    message.ParseFromString(join_chunks(chunks, first, max_total_size))
+    return message
+
+
+def chunk_messages(
+    messages: Iterable[WrapperMessage],
+    chunk_size: Optional[int],
+    wrap_fn: Callable[[MessageChunk], WrapperMessage],
+) -> Iterator[WrapperMessage]:
+    """Split messages larger than `chunk_size` into chunks.
+
+    Smaller messages are passed through unchanged, so peers that do not support chunks
+    can still receive them.
+    """
+    for message in messages:
+        if chunk_size is None or message.ByteSize() <= chunk_size:
+            yield message
+            continue
+        for chunk in split_message(message, chunk_size):
+            yield wrap_fn(chunk)
+
+
+def dechunk_messages(
+    messages: Iterable[WrapperMessage],
+    message_type: Type[WrapperMessage],
+    max_total_size: int = MAX_CHUNKED_MESSAGE_LENGTH,
+) -> Iterator[WrapperMessage]:
+    """Reassemble chunked messages, passing through all other messages."""
+    iterator = iter(messages)
+    for message in iterator:
+        if message.WhichOneof("msg") != "chunk":
+            yield message
+            continue
+        yield parse_chunks(
+            _unwrap_chunks(iterator), message_type, message.chunk, max_total_size
+        )
+
+
+def _unwrap_chunks(
+    messages: Iterator[Union[ServerMessage, ClientMessage]]
+) -> Iterator[MessageChunk]:
+    for message in messages:
+        if message.WhichOneof("msg") != "chunk":
+            raise ValueError("Expected a message chunk")
+        yield message.chunk
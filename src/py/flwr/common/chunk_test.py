@@ -0,0 +1,85 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for streaming messages in chunks."""
+
+
+import pytest
+
+from flwr.proto.transport_pb2 import MessageChunk, Parameters, ServerMessage
+
+from .chunk import chunk_messages, dechunk_messages, parse_chunks, split_message
+
+FIT_INS = ServerMessage(
+    fit_ins=ServerMessage.FitIns(
+        parameters=Parameters(tensors=[bytes(range(256)) * 4], tensor_type="test")
+    )
+)
+RECONNECT_INS = ServerMessage(reconnect_ins=ServerMessage.ReconnectIns(seconds=1))
+
+
+def test_split_and_parse_message() -> None:
+    """Test that a message is restored from its chunks."""
+    chunks = list(split_message(FIT_INS, chunk_size=100))
+
+    assert len(chunks) == FIT_INS.ByteSize() // 100 + 1
+    assert all(len(chunk.data) <= 100 for chunk in chunks)
+    assert parse_chunks(chunks, ServerMessage) == FIT_INS
+
+
+def test_split_empty_message() -> None:
+    """Test that empty messages are sent as a single chunk."""
+    chunks = list(split_message(ServerMessage(), chunk_size=100))
+
+    assert len(chunks) == 1
+    assert parse_chunks(chunks, ServerMessage) == ServerMessage()
+
+
+def test_parse_incomplete_message() -> None:
+    """Test that a stream ending before the last chunk raises an error."""
+    chunks = list(split_message(FIT_INS, chunk_size=100))
+
+    with pytest.raises(ValueError):
+        parse_chunks(chunks[:-1], ServerMessage)
+
+
+def test_parse_message_exceeding_max_total_size() -> None:
+    """Test that messages larger than `max_total_size` are rejected."""
+    chunks = list(split_message(FIT_INS, chunk_size=100))
+
+    with pytest.raises(ValueError):
+        parse_chunks(chunks, ServerMessage, max_total_size=FIT_INS.ByteSize() - 1)
+
+
+def test_parse_message_announcing_huge_total_size() -> None:
+    """Test that a huge announced total size is rejected without allocating it."""
+    chunks = [MessageChunk(total_size=2**62, data=b"x")]
+
+    with pytest.raises(ValueError):
+        parse_chunks(chunks, ServerMessage)
+
+
+def test_chunk_and_dechunk_messages() -> None:
+    """Test that only large messages are chunked and all are restored in order."""
+    messages = [RECONNECT_INS, FIT_INS, RECONNECT_INS]
+
+    chunked = list(
+        chunk_messages(messages, 100, lambda chunk: ServerMessage(chunk=chunk))
+    )
+    restored = list(dechunk_messages(chunked, ServerMessage))
+
+    assert chunked[0] == RECONNECT_INS
+    assert chunked[-1] == RECONNECT_INS
+    assert all(msg.HasField("chunk") for msg in chunked[1:-1])
+    assert restored == messages
@@ -31,3 +31,9 @@ TRANSPORT_TYPES = [
     TRANSPORT_TYPE_GRPC_RERE,
     TRANSPORT_TYPE_REST,
 ]
+
+# Seconds a client waits between two requests for new tasks. Servers that support
+# long polling hold the request open for up to this long until a task is available.
+PULL_INTERVAL = 3.0
+# Maximum number of seconds a server holds a pull request open
+PULL_MAX_TIMEOUT = 30.0
@@ -0,0 +1,145 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Transmission of model updates (deltas) instead of full models."""
+
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .parameter import DELTA_TENSOR_TYPE_TAG, TENSOR_TYPE_SEPARATOR
+from .typing import NDArray, NDArrays, Parameters, Scalar
+
+# Config keys used by the server to request updates instead of full models
+DELTA_CONFIG_KEY = "delta"
+DELTA_TOP_K_CONFIG_KEY = "delta_top_k"
+DELTA_THRESHOLD_CONFIG_KEY = "delta_threshold"
+# Key of the error feedback residual in `WorkloadState.ndarrays`
+DELTA_RESIDUAL_STATE_KEY = "delta_residual"
+
+
+def delta_config(
+    top_k: Optional[float] = None, threshold: Optional[float] = None
+) -> Dict[str, Scalar]:
+    """Create the config entries requesting (sparsified) updates from clients.
+
+    Parameters
+    ----------
+    top_k : Optional[float]
+        Fraction of the values of each layer the client sends, choosing the
+        values with the largest magnitude. Defaults to None.
+    threshold : Optional[float]
+        Only values with a magnitude of at least `threshold` are sent. Ignored if
+        `top_k` is set. Defaults to None.
+
+    Returns
+    -------
+    config : Dict[str, Scalar]
+        The config entries to add to `FitIns.config`.
+    """
+    config: Dict[str, Scalar] = {DELTA_CONFIG_KEY: True}
+    if top_k is not None:
+        if not 0.0 < top_k <= 1.0:
+            raise ValueError("`top_k` must be in (0, 1].")
+        config[DELTA_TOP_K_CONFIG_KEY] = top_k
+    elif threshold is not None:
+        config[DELTA_THRESHOLD_CONFIG_KEY] = threshold
+    return config
+
+
+def delta_tensor_type(tensor_type: str) -> str:
+    """Mark a tensor type as containing updates instead of full models."""
+    if is_delta_tensor_type(tensor_type):
+        return tensor_type
+    return f"{tensor_type}{TENSOR_TYPE_SEPARATOR}{DELTA_TENSOR_TYPE_TAG}"
+
+
+def is_delta_tensor_type(tensor_type: str) -> bool:
+    """Check if a tensor type is marked as containing updates."""
+    return DELTA_TENSOR_TYPE_TAG in tensor_type.split(TENSOR_TYPE_SEPARATOR)[1:]
+
+
+def is_delta(parameters: Parameters) -> bool:
+    """Check if parameters contain updates instead of full models."""
+    return is_delta_tensor_type(parameters.tensor_type)
+
+
+def compute_delta(ndarrays: NDArrays, reference: NDArrays) -> NDArrays:
+    """Compute the update `ndarrays - reference` layer by layer."""
+    return [np.subtract(layer, ref) for layer, ref in zip(ndarrays, reference)]
+
+
+def sparsify(
+    update: NDArrays,
+    residual: Optional[NDArrays] = None,
+    top_k: Optional[float] = None,
+    threshold: Optional[float] = None,
+) -> Tuple[NDArrays, NDArrays]:
+    """Sparsify an update in place, keeping the dropped values as residual.
+
+    The residual of the previous round, if any, is added to the update before it
+    is sparsified (error feedback). Only floating point layers are sparsified.
+
+    Parameters
+    ----------
+    update : NDArrays
+        The update to sparsify. Its layers may be modified in place.
+    residual : Optional[NDArrays]
+        The values dropped from previous updates. Ignored if it does not match the
+        shapes of `update`. Defaults to None.
+    top_k : Optional[float]
+        Fraction of the values of each layer to keep, choosing the values with the
+        largest magnitude. Defaults to None.
+    threshold : Optional[float]
+        Keep values with a magnitude of at least `threshold`. Ignored if `top_k` is
+        set. Defaults to None.
+
+    Returns
+    -------
+    update : NDArrays
+        The sparsified update.
+    residual : NDArrays
+        The values dropped from the update.
+    """
+    if residual is not None and [layer.shape for layer in residual] != [
+        layer.shape for layer in update
+    ]:
+        residual = None
+    sparse_update: List[NDArray] = []
+    new_residual: List[NDArray] = []
+    for idx, layer in enumerate(update):
+        if layer.dtype.kind != "f":
+            sparse_update.append(layer)
+            new_residual.append(np.zeros_like(layer))
+            continue
+        if residual is not None:
+            layer += residual[idx]
+        flat = layer.reshape(-1)
+        magnitude = np.abs(flat)
+        if top_k is not None:
+            num_dropped = flat.size - math.ceil(top_k * flat.size)
+            keep = np.ones(flat.size, dtype=bool)
+            if num_dropped > 0:
+                keep[np.argpartition(magnitude, num_dropped - 1)[:num_dropped]] = False
+        elif threshold is not None:
+            keep = magnitude >= threshold
+        else:
+            keep = np.ones(flat.size, dtype=bool)
+        del magnitude
+        new_residual.append(np.where(keep, 0, flat).reshape(layer.shape))
+        flat[~keep] = 0
+        sparse_update.append(flat.reshape(layer.shape))
+    return sparse_update, new_residual
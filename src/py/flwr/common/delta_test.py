@@ -0,0 +1,72 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for the transmission of model updates."""
+
+
+import numpy as np
+
+from .delta import delta_tensor_type, is_delta_tensor_type, sparsify
+
+
+def test_delta_tensor_type() -> None:
+    """Test that tensor types are marked as updates exactly once."""
+    tensor_type = delta_tensor_type("numpy.ndarray.sparse+zlib")
+
+    assert tensor_type == "numpy.ndarray.sparse+zlib+delta"
+    assert delta_tensor_type(tensor_type) == tensor_type
+    assert is_delta_tensor_type(tensor_type)
+    assert not is_delta_tensor_type("delta")
+
+
+def test_sparsify_top_k() -> None:
+    """Test that top-k sparsification keeps the largest values."""
+    # Prepare
+    update = [np.array([0.1, -4.0, 0.3, 2.0, -0.2]), np.arange(3)]
+
+    # Execute
+    sparse, residual = sparsify(update, top_k=0.4)
+
+    # Assert
+    np.testing.assert_equal(sparse[0], [0.0, -4.0, 0.0, 2.0, 0.0])
+    np.testing.assert_equal(residual[0], [0.1, 0.0, 0.3, 0.0, -0.2])
+    # Non-floating point layers are not sparsified
+    np.testing.assert_equal(sparse[1], np.arange(3))
+
+
+def test_sparsify_threshold() -> None:
+    """Test that threshold sparsification keeps large values."""
+    # Prepare
+    update = [np.array([[0.1, -4.0], [0.5, 2.0]])]
+
+    # Execute
+    sparse, residual = sparsify(update, threshold=0.5)
+
+    # Assert
+    np.testing.assert_equal(sparse[0], [[0.0, -4.0], [0.5, 2.0]])
+    np.testing.assert_equal(residual[0], [[0.1, 0.0], [0.0, 0.0]])
+
+
+def test_sparsify_error_feedback() -> None:
+    """Test that dropped values are added to the next update."""
+    # Prepare
+    residual = [np.array([0.0, 0.0, 0.9])]
+    update = [np.array([1.0, 0.5, 0.2])]
+
+    # Execute
+    sparse, new_residual = sparsify(update, residual, top_k=0.5)
+
+    # Assert
+    np.testing.assert_allclose(sparse[0], [1.0, 0.0, 1.1])
+    np.testing.assert_allclose(new_residual[0], [0.0, 0.5, 0.0])
@@ -0,0 +1,47 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Utilities for `concurrent.futures.Future`."""
+
+
+from concurrent.futures import Future
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+def map_future(future: "Future[T]", convert_fn: Callable[[T], U]) -> "Future[U]":
+    """Return a future for the result of `future` converted by `convert_fn`.
+
+    Exceptions of `future` and `convert_fn` are passed on. Cancelling the returned
+    future also cancels `future`.
+    """
+    converted: "Future[U]" = Future()
+
+    def on_done(_: "Future[T]") -> None:
+        if not converted.set_running_or_notify_cancel():
+            return
+        try:
+            converted.set_result(convert_fn(future.result()))
+        except BaseException as ex:  # pylint: disable=broad-except
+            converted.set_exception(ex)
+
+    def on_converted_done(_: "Future[U]") -> None:
+        if converted.cancelled():
+            future.cancel()
+
+    future.add_done_callback(on_done)
+    converted.add_done_callback(on_converted_done)
+    return converted
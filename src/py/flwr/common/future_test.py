@@ -0,0 +1,61 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Future utility tests."""
+
+
+from concurrent.futures import Future
+
+from .future import map_future
+
+
+def test_map_future_result() -> None:
+    """Test that the result is converted once available."""
+    # Prepare
+    future: "Future[int]" = Future()
+    converted = map_future(future, str)
+
+    # Execute
+    pending = not converted.done()
+    future.set_result(1)
+
+    # Assert
+    assert pending
+    assert converted.result(timeout=1) == "1"
+
+
+def test_map_future_exception() -> None:
+    """Test that exceptions are passed on."""
+    # Prepare
+    future: "Future[int]" = Future()
+    converted = map_future(future, str)
+
+    # Execute
+    future.set_exception(ValueError())
+
+    # Assert
+    assert isinstance(converted.exception(timeout=1), ValueError)
+
+
+def test_map_future_cancel() -> None:
+    """Test that cancelling the converted future cancels the original one."""
+    # Prepare
+    future: "Future[int]" = Future()
+    converted = map_future(future, str)
+
+    # Execute
+    converted.cancel()
+
+    # Assert
+    assert future.cancelled()
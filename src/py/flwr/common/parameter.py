@@ -15,23 +15,115 @@
 """Parameter conversion."""
 
 
+import importlib
+import math
+import struct
+import zlib
 from io import BytesIO
-from typing import cast
+from typing import Any, Callable, Dict, Optional, Tuple, cast
 
 import numpy as np
 
 from .typing import NDArray, NDArrays, Parameters
 
+TENSOR_TYPE_NUMPY = "numpy.ndarray"
+TENSOR_TYPE_COMPACT = "numpy.ndarray.compact"
+TENSOR_TYPE_SPARSE = "numpy.ndarray.sparse"
+# Separates a tensor type from the codecs applied on top of it, e.g.,
+# `numpy.ndarray.compact+fp16+zstd`
+TENSOR_TYPE_SEPARATOR = "+"
+# Config key used by the server to select the tensor type clients respond with
+TENSOR_TYPE_CONFIG_KEY = "tensor_type"
+# Marks tensors as updates relative to the parameters sent to the client, e.g.,
+# `numpy.ndarray.sparse+delta`. Does not change how tensors are encoded.
+DELTA_TENSOR_TYPE_TAG = "delta"
 
-def ndarrays_to_parameters(ndarrays: NDArrays) -> Parameters:
+# Header of the compact format: magic, version, length of the dtype string, ndim
+_COMPACT_MAGIC = b"\x93FLWR"
+_COMPACT_VERSION = 1
+_COMPACT_HEADER = struct.Struct("<5sBBB")
+_COMPACT_ALIGNMENT = 16
+# Data types that can be reconstructed from their `dtype.str` alone
+_COMPACT_DTYPE_KINDS = "biufc"
+# Header of the sparse format: magic, version, length of the dtype string, ndim,
+# size of an index in bytes, number of stored values
+_SPARSE_MAGIC = b"\x93FLWS"
+_SPARSE_VERSION = 1
+_SPARSE_HEADER = struct.Struct("<5sBBBBQ")
+
+# Header of cast codecs: original data type and two codec-specific parameters
+_CAST_HEADER = struct.Struct("<8sdd")
+
+COMPRESSION_IMPORT_ERROR = """Unable to import module `{}`.
+
+To install the necessary dependencies, install `flwr` with the `compression` extra:
+
+    pip install -U flwr["compression"]
+"""
+
+TensorEncoder = Callable[[NDArray], bytes]
+TensorDecoder = Callable[[bytes], NDArray]
+TensorCodec = Tuple[TensorEncoder, TensorDecoder]
+TensorCodecWrapper = Callable[[TensorEncoder, TensorDecoder], TensorCodec]
+
+_tensor_codecs: Dict[str, TensorCodec] = {}
+_tensor_codec_wrappers: Dict[str, TensorCodecWrapper] = {}
+
+
+def register_tensor_codec(
+    tensor_type: str, encode_fn: TensorEncoder, decode_fn: TensorDecoder
+) -> None:
+    """Register functions to (de-)serialize tensors of a given `tensor_type`.
+
+    `ndarrays_to_parameters` and `parameters_to_ndarrays` use the codec registered
+    for `Parameters.tensor_type`. Registering an existing `tensor_type` replaces
+    its codec.
+    """
+    _tensor_codecs[tensor_type] = (encode_fn, decode_fn)
+
+
+def register_compressor(
+    name: str,
+    compress_fn: Callable[[bytes], bytes],
+    decompress_fn: Callable[[bytes], bytes],
+) -> None:
+    """Register a lossless compressor that can be applied to any tensor type.
+
+    The compressor is selected by appending its name to a tensor type, e.g.,
+    `numpy.ndarray+zlib` compresses the output of the `numpy.ndarray` codec with
+    `compress_fn`.
+    """
+    if TENSOR_TYPE_SEPARATOR in name:
+        raise ValueError(f"Compressor name must not contain `{TENSOR_TYPE_SEPARATOR}`")
+
+    def wrap(encode_fn: TensorEncoder, decode_fn: TensorDecoder) -> TensorCodec:
+        return (
+            lambda ndarray: compress_fn(encode_fn(ndarray)),
+            lambda tensor: decode_fn(decompress_fn(tensor)),
+        )
+
+    _tensor_codec_wrappers[name] = wrap
+
+
+def ndarrays_to_parameters(
+    ndarrays: NDArrays, tensor_type: str = TENSOR_TYPE_NUMPY
+) -> Parameters:
     """Convert NumPy ndarrays to parameters object."""
-    tensors = [ndarray_to_bytes(ndarray) for ndarray in ndarrays]
-    return Parameters(tensors=tensors, tensor_type="numpy.ndarray")
+    encode_fn, _ = _get_tensor_codec(tensor_type)
+    tensors = [encode_fn(ndarray) for ndarray in ndarrays]
+    return Parameters(tensors=tensors, tensor_type=tensor_type)
 
 
 def parameters_to_ndarrays(parameters: Parameters) -> NDArrays:
-    """Convert parameters object to NumPy ndarrays."""
-    return [bytes_to_ndarray(tensor) for tensor in parameters.tensors]
+    """Convert parameters object to NumPy ndarrays.
+
+    Tensors of a tensor type without a registered codec (e.g., `ndarray` or an empty
+    tensor type from clients which do not use the codecs) are decoded with
+    `bytes_to_ndarray`.
+    """
+    codec = _find_tensor_codec(parameters.tensor_type)
+    decode_fn = bytes_to_ndarray if codec is None else codec[1]
+    return [decode_fn(tensor) for tensor in parameters.tensors]
 
 
 def ndarray_to_bytes(ndarray: NDArray) -> bytes:
@@ -45,10 +137,271 @@ def ndarray_to_bytes(ndarray: NDArray) -> bytes:
 
 
 def bytes_to_ndarray(tensor: bytes) -> NDArray:
-    """Deserialize NumPy ndarray from bytes."""
+    """Deserialize NumPy ndarray from bytes.
+
+    The `.npy` format written by `ndarray_to_bytes`, the compact format written by
+    `ndarray_to_compact_bytes` and the sparse format written by
+    `ndarray_to_sparse_bytes` are supported.
+    """
+    if tensor[: len(_COMPACT_MAGIC)] == _COMPACT_MAGIC:
+        return compact_bytes_to_ndarray(tensor)
+    if tensor[: len(_SPARSE_MAGIC)] == _SPARSE_MAGIC:
+        return sparse_bytes_to_ndarray(tensor)
     bytes_io = BytesIO(tensor)
     # WARNING: NEVER set allow_pickle to true.
     # Reason: loading pickled data can execute arbitrary code
     # Source: https://numpy.org/doc/stable/reference/generated/numpy.load.html
     ndarray_deserialized = np.load(bytes_io, allow_pickle=False)
     return cast(NDArray, ndarray_deserialized)
+
+
+def ndarray_to_compact_bytes(ndarray: NDArray) -> bytes:
+    """Serialize NumPy ndarray to bytes using a compact header.
+
+    The header only contains the data type and the shape of the array and is padded
+    such that the array data is aligned. Data types that cannot be represented this
+    way (e.g., structured data types) are serialized using `ndarray_to_bytes`.
+    """
+    if ndarray.dtype.kind not in _COMPACT_DTYPE_KINDS:
+        return ndarray_to_bytes(ndarray)
+    dtype_str = ndarray.dtype.str.encode("ascii")
+    header = _COMPACT_HEADER.pack(
+        _COMPACT_MAGIC, _COMPACT_VERSION, len(dtype_str), ndarray.ndim
+    )
+    header += dtype_str + struct.pack(f"<{ndarray.ndim}Q", *ndarray.shape)
+    header += b"\x00" * (-len(header) % _COMPACT_ALIGNMENT)
+    data = np.ascontiguousarray(ndarray).reshape(-1).view(np.uint8)
+    return b"".join((header, data.data))
+
+
+def compact_bytes_to_ndarray(tensor: bytes) -> NDArray:
+    """Deserialize NumPy ndarray from bytes in the compact format.
+
+    The returned array is a read-only view of `tensor`, the data is not copied.
+    """
+    magic, version, dtype_len, ndim = _COMPACT_HEADER.unpack_from(tensor)
+    if magic != _COMPACT_MAGIC or version != _COMPACT_VERSION:
+        raise ValueError("Tensor is not in the compact format.")
+    offset = _COMPACT_HEADER.size
+    dtype = np.dtype(str(tensor[offset : offset + dtype_len], "ascii"))  # noqa: E203
+    if dtype.kind not in _COMPACT_DTYPE_KINDS:
+        raise ValueError(f"Unsupported data type: {dtype}")
+    offset += dtype_len
+    shape = struct.unpack_from(f"<{ndim}Q", tensor, offset)
+    offset += 8 * ndim
+    offset += -offset % _COMPACT_ALIGNMENT
+    count = int(np.prod(shape, dtype=np.int64))
+    ndarray = np.frombuffer(tensor, dtype=dtype, count=count, offset=offset)
+    return ndarray.reshape(shape)
+
+
+def ndarray_to_sparse_bytes(ndarray: NDArray) -> bytes:
+    """Serialize NumPy ndarray to bytes, storing only its non-zero values.
+
+    The array is stored as the flat indices of its non-zero values followed by the
+    values themselves. Data types that cannot be represented this way are
+    serialized using `ndarray_to_bytes`.
+    """
+    if ndarray.dtype.kind not in _COMPACT_DTYPE_KINDS:
+        return ndarray_to_bytes(ndarray)
+    flat = ndarray.reshape(-1)
+    indices = np.flatnonzero(flat)
+    index_dtype = np.uint32 if flat.size <= np.iinfo(np.uint32).max else np.uint64
+    indices = indices.astype(index_dtype)
+    values = np.ascontiguousarray(flat[indices])
+    dtype_str = ndarray.dtype.str.encode("ascii")
+    header = _SPARSE_HEADER.pack(
+        _SPARSE_MAGIC,
+        _SPARSE_VERSION,
+        len(dtype_str),
+        ndarray.ndim,
+        indices.itemsize,
+        indices.size,
+    )
+    header += dtype_str + struct.pack(f"<{ndarray.ndim}Q", *ndarray.shape)
+    header += b"\x00" * (-len(header) % _COMPACT_ALIGNMENT)
+    padding = b"\x00" * (-indices.nbytes % _COMPACT_ALIGNMENT)
+    return b"".join(
+        (header, indices.view(np.uint8).data, padding, values.view(np.uint8).data)
+    )
+
+
+def sparse_bytes_to_ndarray(tensor: bytes) -> NDArray:
+    """Deserialize NumPy ndarray from bytes in the sparse format."""
+    magic, version, dtype_len, ndim, index_size, nnz = _SPARSE_HEADER.unpack_from(
+        tensor
+    )
+    if magic != _SPARSE_MAGIC or version != _SPARSE_VERSION:
+        raise ValueError("Tensor is not in the sparse format.")
+    offset = _SPARSE_HEADER.size
+    dtype = np.dtype(str(tensor[offset : offset + dtype_len], "ascii"))  # noqa: E203
+    if dtype.kind not in _COMPACT_DTYPE_KINDS:
+        raise ValueError(f"Unsupported data type: {dtype}")
+    offset += dtype_len
+    shape = struct.unpack_from(f"<{ndim}Q", tensor, offset)
+    offset += 8 * ndim
+    offset += -offset % _COMPACT_ALIGNMENT
+    index_dtype = np.dtype(f"<u{index_size}")
+    indices = np.frombuffer(tensor, dtype=index_dtype, count=nnz, offset=offset)
+    offset += nnz * index_size
+    offset += -offset % _COMPACT_ALIGNMENT
+    values = np.frombuffer(tensor, dtype=dtype, count=nnz, offset=offset)
+    ndarray = np.zeros(int(np.prod(shape, dtype=np.int64)), dtype=dtype)
+    ndarray[indices] = values
+    return ndarray.reshape(shape)
+
+
+def _find_tensor_codec(tensor_type: str) -> Optional[TensorCodec]:
+    if tensor_type in _tensor_codecs:
+        return _tensor_codecs[tensor_type]
+    base_type, *names = tensor_type.split(TENSOR_TYPE_SEPARATOR)
+    if not names or base_type not in _tensor_codecs:
+        return None
+    if any(name not in _tensor_codec_wrappers for name in names):
+        return None
+    encode_fn, decode_fn = _tensor_codecs[base_type]
+    for name in names:
+        encode_fn, decode_fn = _tensor_codec_wrappers[name](encode_fn, decode_fn)
+    return encode_fn, decode_fn
+
+
+def _get_tensor_codec(tensor_type: str) -> TensorCodec:
+    codec = _find_tensor_codec(tensor_type)
+    if codec is None:
+        raise ValueError(
+            f"No codec registered for tensor type `{tensor_type}`. Register one with "
+            "`register_tensor_codec` or `register_compressor`."
+        )
+    return codec
+
+
+def _register_cast(
+    name: str,
+    cast_fn: Callable[[NDArray], Tuple[NDArray, float, float]],
+    restore_fn: Callable[[NDArray, np.dtype[Any], float, float], NDArray],
+) -> None:
+    """Register a lossy codec that casts floating point tensors before encoding.
+
+    Tensors of other data types are passed through unchanged. Decoding restores the
+    original data type.
+    """
+
+    def wrap(encode_fn: TensorEncoder, decode_fn: TensorDecoder) -> TensorCodec:
+        def encode(ndarray: NDArray) -> bytes:
+            data, param0, param1 = ndarray, 0.0, 0.0
+            if ndarray.dtype.kind == "f":
+                data, param0, param1 = cast_fn(ndarray)
+            dtype_str = ndarray.dtype.str.encode("ascii")
+            header = _CAST_HEADER.pack(dtype_str, param0, param1)
+            return b"".join((header, encode_fn(data)))
+
+        def decode(tensor: bytes) -> NDArray:
+            dtype_str, param0, param1 = _CAST_HEADER.unpack_from(tensor)
+            dtype = np.dtype(dtype_str.rstrip(b"\x00").decode("ascii"))
+            data = decode_fn(tensor[_CAST_HEADER.size :])  # noqa: E203
+            if dtype.kind != "f" or data.dtype == dtype:
+                return data
+            return restore_fn(data, dtype, param0, param1)
+
+        return encode, decode
+
+    _tensor_codec_wrappers[name] = wrap
+
+
+def _to_float16(ndarray: NDArray) -> Tuple[NDArray, float, float]:
+    return ndarray.astype(np.float16), 0.0, 0.0
+
+
+def _from_float16(
+    ndarray: NDArray, dtype: np.dtype[Any], _: float, __: float
+) -> NDArray:
+    return ndarray.astype(dtype)
+
+
+def _to_bfloat16(ndarray: NDArray) -> Tuple[NDArray, float, float]:
+    """Keep the upper 16 bits of float32 values, rounding to nearest even."""
+    bits = np.array(ndarray, dtype=np.float32).view(np.uint32)
+    bits += (bits >> np.uint32(16)) & np.uint32(1)
+    bits += np.uint32(0x7FFF)
+    bits[np.isnan(ndarray)] = 0x7FC00000
+    return (bits >> 16).astype(np.uint16), 0.0, 0.0
+
+
+def _from_bfloat16(
+    ndarray: NDArray, dtype: np.dtype[Any], _: float, __: float
+) -> NDArray:
+    bits = ndarray.astype(np.uint32)
+    bits <<= 16
+    return bits.view(np.float32).astype(dtype, copy=False)
+
+
+def _to_int8(ndarray: NDArray) -> Tuple[NDArray, float, float]:
+    """Quantize finite values to 256 evenly spaced levels between min and max."""
+    if ndarray.size == 0:
+        return ndarray.astype(np.int8), 1.0, 0.0
+    low, high = float(ndarray.min()), float(ndarray.max())
+    scale = (high - low) / 255 or 1.0
+    # NaN and infinite values (or a range too large for the data type) would turn
+    # the whole tensor into garbage
+    if not math.isfinite(scale):
+        raise ValueError(
+            "Tensors with NaN or infinite values cannot be quantized to int8."
+        )
+    quantized = np.subtract(ndarray, low, dtype=np.result_type(ndarray, np.float32))
+    quantized /= scale
+    np.rint(quantized, out=quantized)
+    quantized -= 128
+    np.clip(quantized, -128, 127, out=quantized)
+    return quantized.astype(np.int8), scale, low
+
+
+def _from_int8(
+    ndarray: NDArray, dtype: np.dtype[Any], scale: float, low: float
+) -> NDArray:
+    restored = ndarray.astype(dtype)
+    restored += 128
+    restored *= scale
+    restored += low
+    return restored
+
+
+def _import_compression_module(name: str) -> Any:
+    try:
+        return importlib.import_module(name)
+    except ImportError as err:
+        raise ImportError(COMPRESSION_IMPORT_ERROR.format(name)) from err
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    zstandard = _import_compression_module("zstandard")
+    return cast(bytes, zstandard.ZstdCompressor().compress(data))
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    zstandard = _import_compression_module("zstandard")
+    return cast(bytes, zstandard.ZstdDecompressor().decompress(data))
+
+
+def _lz4_compress(data: bytes) -> bytes:
+    lz4_frame = _import_compression_module("lz4.frame")
+    return cast(bytes, lz4_frame.compress(data))
+
+
+def _lz4_decompress(data: bytes) -> bytes:
+    lz4_frame = _import_compression_module("lz4.frame")
+    return cast(bytes, lz4_frame.decompress(data))
+
+
+register_tensor_codec(TENSOR_TYPE_NUMPY, ndarray_to_bytes, bytes_to_ndarray)
+register_tensor_codec(TENSOR_TYPE_COMPACT, ndarray_to_compact_bytes, bytes_to_ndarray)
+register_tensor_codec(TENSOR_TYPE_SPARSE, ndarray_to_sparse_bytes, bytes_to_ndarray)
+_tensor_codec_wrappers[DELTA_TENSOR_TYPE_TAG] = lambda encode_fn, decode_fn: (
+    encode_fn,
+    decode_fn,
+)
+_register_cast("fp16", _to_float16, _from_float16)
+_register_cast("bf16", _to_bfloat16, _from_bfloat16)
+_register_cast("int8", _to_int8, _from_int8)
+register_compressor("zlib", zlib.compress, zlib.decompress)
+register_compressor("zstd", _zstd_compress, _zstd_decompress)
+register_compressor("lz4", _lz4_compress, _lz4_decompress)
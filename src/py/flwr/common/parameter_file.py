@@ -0,0 +1,161 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Memory-mapped parameter files.
+
+Parameters are written to a file tensor by tensor and mapped into memory when they
+are loaded. The tensors of loaded parameters are read-only views of the mapped file,
+such that large models are paged in by the operating system on access instead of
+being held in memory. Decoding tensors in the compact format does not copy them.
+
+The file contains the tensors, each aligned to `ALIGNMENT` bytes, followed by an
+index of their offsets and lengths, the tensor type, and a fixed-size trailer.
+"""
+
+
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, List, Optional, Tuple, Union, cast
+
+import numpy as np
+
+from .parameter import TENSOR_TYPE_COMPACT, _find_tensor_codec, _get_tensor_codec
+from .typing import NDArrays, Parameters
+
+ALIGNMENT = 64
+
+_MAGIC = b"\x93FLWP"
+_VERSION = 1
+# Trailer: offset of the index, number of tensors, length of the tensor type,
+# magic, version
+_TRAILER = struct.Struct("<QQQ5sB")
+
+
+class MappedTensors(List[memoryview]):
+    """Tensors backed by a memory-mapped file.
+
+    The tensors are read-only memory views of the mapping, not `bytes`. They support
+    the buffer protocol, which is all the tensor codecs rely on.
+
+    When pickled (e.g., to be sent to another process), the tensors are copied into a
+    regular list of bytes, as the mapping cannot be shared.
+    """
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the tensors as a list of bytes."""
+        return (list, ([bytes(tensor) for tensor in self],))
+
+
+def save_parameters(
+    parameters: Parameters,
+    path: Union[str, Path],
+    tensor_type: Optional[str] = TENSOR_TYPE_COMPACT,
+) -> Parameters:
+    """Write parameters to a file and return them mapped from that file.
+
+    Tensors are converted to `tensor_type` one at a time, by default to the compact
+    format, which can be decoded from the mapping without copying. Tensors of a
+    tensor type without a registered codec, or if `tensor_type` is `None`, are
+    written as they are.
+
+    The file is replaced atomically, so it is safe to overwrite a file that is currently
+    mapped.
+    """
+    source_codec = _find_tensor_codec(parameters.tensor_type)
+    if (
+        tensor_type is None
+        or tensor_type == parameters.tensor_type
+        or source_codec is None
+    ):
+        _write(path, parameters.tensors, parameters.tensor_type)
+    else:
+        _, decode_fn = source_codec
+        encode_fn, _ = _get_tensor_codec(tensor_type)
+        tensors = (encode_fn(decode_fn(tensor)) for tensor in parameters.tensors)
+        _write(path, tensors, tensor_type)
+    return load_parameters(path)
+
+
+def ndarrays_to_parameters_file(
+    ndarrays: NDArrays,
+    path: Union[str, Path],
+    tensor_type: str = TENSOR_TYPE_COMPACT,
+) -> Parameters:
+    """Serialize NumPy ndarrays to a file and return them mapped from that file.
+
+    Unlike `save_parameters(ndarrays_to_parameters(...))`, only one serialized
+    tensor is held in memory at a time.
+    """
+    encode_fn, _ = _get_tensor_codec(tensor_type)
+    tensors = (encode_fn(ndarray) for ndarray in ndarrays)
+    _write(path, tensors, tensor_type)
+    return load_parameters(path)
+
+
+def load_parameters(path: Union[str, Path]) -> Parameters:
+    """Map parameters written by `save_parameters` into memory.
+
+    The file is unmapped once the returned tensors are no longer referenced.
+    """
+    with open(path, "rb") as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(buffer) < _TRAILER.size:
+        raise ValueError(f"File `{path}` is not a parameter file.")
+    index_offset, num_tensors, tensor_type_len, magic, version = _TRAILER.unpack_from(
+        buffer, len(buffer) - _TRAILER.size
+    )
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError(f"File `{path}` is not a parameter file.")
+    index = np.frombuffer(
+        buffer, dtype="<u8", count=2 * num_tensors, offset=index_offset
+    ).reshape(-1, 2)
+    tensor_type_offset = index_offset + index.nbytes
+    tensor_type = str(
+        buffer[tensor_type_offset : tensor_type_offset + tensor_type_len],  # noqa: E203
+        "utf-8",
+    )
+    view = memoryview(buffer)
+    tensors = MappedTensors(
+        view[offset : offset + length]
+        for offset, length in index.tolist()  # noqa: E203
+    )
+    # `Parameters.tensors` is typed as `bytes`, any buffer works in its place
+    return Parameters(tensors=cast(List[bytes], tensors), tensor_type=tensor_type)
+
+
+def _write(path: Union[str, Path], tensors: Iterable[bytes], tensor_type: str) -> None:
+    tmp_path = f"{path}.tmp"
+    index: List[Tuple[int, int]] = []
+    with open(tmp_path, "wb") as file:
+        offset = 0
+        for tensor in tensors:
+            offset += _pad(file, offset)
+            index.append((offset, len(tensor)))
+            offset += file.write(tensor)
+        offset += _pad(file, offset)
+        tensor_type_bytes = tensor_type.encode("utf-8")
+        file.write(np.array(index, dtype="<u8").reshape(-1).tobytes())
+        file.write(tensor_type_bytes)
+        file.write(
+            _TRAILER.pack(offset, len(index), len(tensor_type_bytes), _MAGIC, _VERSION)
+        )
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+
+def _pad(file: BinaryIO, offset: int) -> int:
+    return file.write(b"\x00" * (-offset % ALIGNMENT))
@@ -0,0 +1,156 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for memory-mapped parameter files."""
+
+
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from .parameter import (
+    TENSOR_TYPE_COMPACT,
+    TENSOR_TYPE_NUMPY,
+    ndarrays_to_parameters,
+    parameters_to_ndarrays,
+)
+from .parameter_file import (
+    ALIGNMENT,
+    MappedTensors,
+    load_parameters,
+    ndarrays_to_parameters_file,
+    save_parameters,
+)
+from .serde import parameters_from_proto, parameters_to_proto
+from .typing import NDArrays, Parameters
+
+NDARRAYS: NDArrays = [
+    np.arange(12, dtype=np.float32).reshape(3, 4),
+    np.array([1, 2, 3], dtype=np.int64),
+    np.array(7.0),
+]
+
+
+@pytest.mark.parametrize("tensor_type", [TENSOR_TYPE_NUMPY, TENSOR_TYPE_COMPACT])
+def test_save_load_round_trip(tmp_path: Path, tensor_type: str) -> None:
+    """Test that saved parameters are loaded unchanged."""
+    # Prepare
+    parameters = ndarrays_to_parameters(NDARRAYS, tensor_type=tensor_type)
+
+    # Execute
+    mapped = save_parameters(parameters, tmp_path / "parameters.bin", tensor_type=None)
+    loaded = load_parameters(tmp_path / "parameters.bin")
+
+    # Assert
+    for actual in [mapped, loaded]:
+        assert isinstance(actual.tensors, MappedTensors)
+        assert actual.tensor_type == tensor_type
+        assert [bytes(tensor) for tensor in actual.tensors] == parameters.tensors
+        np.testing.assert_equal(parameters_to_ndarrays(actual), NDARRAYS)
+
+
+def test_ndarrays_to_parameters_file(tmp_path: Path) -> None:
+    """Test that compact tensors are aligned and decoded without copies."""
+    # Execute
+    parameters = ndarrays_to_parameters_file(NDARRAYS, tmp_path / "parameters.bin")
+    ndarrays = parameters_to_ndarrays(parameters)
+
+    # Assert
+    assert parameters.tensor_type == TENSOR_TYPE_COMPACT
+    np.testing.assert_equal(ndarrays, NDARRAYS)
+    for tensor, ndarray in zip(parameters.tensors, ndarrays):
+        assert np.frombuffer(tensor, dtype=np.uint8).ctypes.data % ALIGNMENT == 0
+        assert not ndarray.flags.owndata
+        assert not ndarray.flags.writeable
+
+
+def test_save_parameters_converts_to_compact(tmp_path: Path) -> None:
+    """Test that `.npy` tensors are written in the compact format by default."""
+    # Prepare
+    parameters = ndarrays_to_parameters(NDARRAYS, tensor_type=TENSOR_TYPE_NUMPY)
+
+    # Execute
+    mapped = save_parameters(parameters, tmp_path / "parameters.bin")
+    ndarrays = parameters_to_ndarrays(mapped)
+
+    # Assert
+    assert mapped.tensor_type == TENSOR_TYPE_COMPACT
+    np.testing.assert_equal(ndarrays, NDARRAYS)
+    assert all(not ndarray.flags.owndata for ndarray in ndarrays)
+
+
+def test_save_parameters_unknown_tensor_type(tmp_path: Path) -> None:
+    """Test that tensors without a registered codec are written as they are."""
+    # Prepare
+    parameters = Parameters([b"abc", b"de"], "unknown")
+
+    # Execute
+    mapped = save_parameters(parameters, tmp_path / "parameters.bin")
+
+    # Assert
+    assert mapped.tensor_type == "unknown"
+    assert [bytes(tensor) for tensor in mapped.tensors] == parameters.tensors
+
+
+def test_save_parameters_empty(tmp_path: Path) -> None:
+    """Test parameters without tensors."""
+    # Execute
+    parameters = save_parameters(Parameters([], ""), tmp_path / "parameters.bin")
+
+    # Assert
+    assert parameters == Parameters([], "")
+
+
+def test_save_parameters_overwrite_mapped(tmp_path: Path) -> None:
+    """Test that a mapped file can be replaced while its tensors are in use."""
+    # Prepare
+    path = tmp_path / "parameters.bin"
+    old = ndarrays_to_parameters_file(NDARRAYS, path)
+
+    # Execute
+    new = ndarrays_to_parameters_file([np.ones(2)], path)
+
+    # Assert
+    np.testing.assert_equal(parameters_to_ndarrays(old), NDARRAYS)
+    np.testing.assert_equal(parameters_to_ndarrays(new), [np.ones(2)])
+
+
+def test_mapped_parameters_pickle_and_serde(tmp_path: Path) -> None:
+    """Test that mapped tensors are copied into bytes when they leave the process."""
+    # Prepare
+    parameters = ndarrays_to_parameters_file(NDARRAYS, tmp_path / "parameters.bin")
+    expected = [bytes(tensor) for tensor in parameters.tensors]
+
+    # Execute
+    pickled: Parameters = pickle.loads(pickle.dumps(parameters))
+    deserialized = parameters_from_proto(parameters_to_proto(parameters))
+
+    # Assert
+    for actual in [pickled, deserialized]:
+        assert not isinstance(actual.tensors, MappedTensors)
+        assert actual.tensors == expected
+        assert actual.tensor_type == TENSOR_TYPE_COMPACT
+
+
+def test_load_parameters_invalid_file(tmp_path: Path) -> None:
+    """Test that files in other formats are rejected."""
+    # Prepare
+    path = tmp_path / "parameters.bin"
+    path.write_bytes(b"\x00" * 64)
+
+    # Execute & Assert
+    with pytest.raises(ValueError):
+        load_parameters(path)
@@ -18,10 +18,26 @@ tests.
 """
 
 
+import tracemalloc
+
 import numpy as np
 import pytest
 
-from .parameter import bytes_to_ndarray, ndarray_to_bytes
+from .parameter import (
+    TENSOR_TYPE_COMPACT,
+    TENSOR_TYPE_NUMPY,
+    TENSOR_TYPE_SPARSE,
+    bytes_to_ndarray,
+    compact_bytes_to_ndarray,
+    ndarray_to_bytes,
+    ndarray_to_compact_bytes,
+    ndarray_to_sparse_bytes,
+    ndarrays_to_parameters,
+    parameters_to_ndarrays,
+    register_compressor,
+    register_tensor_codec,
+)
+from .typing import NDArrays, Parameters
 
 
 def test_serialisation_deserialisation() -> None:
@@ -37,3 +53,190 @@ def test_serialisation_deserialisation() -> None:
     # Test false positive
     with pytest.raises(AssertionError, match="Arrays are not equal"):
         np.testing.assert_equal(arr_deserialized, np.ones((3, 2)))
+
+
+@pytest.mark.parametrize(
+    "arr",
+    [
+        np.array([[1, 2], [3, 4], [5, 6]]),
+        np.arange(24, dtype=">f8").reshape(2, 3, 4),
+        np.array(3.5, dtype=np.float32),
+        np.zeros((0, 3), dtype=np.int8),
+        np.array([True, False]),
+        np.array([1 + 2j]),
+        np.arange(12, dtype=np.float16).reshape(3, 4).T,
+    ],
+)
+def test_compact_serialisation_deserialisation(arr: np.ndarray) -> None:  # type: ignore
+    """Test if the np.ndarray is identical after compact (de-)serialization."""
+    arr_serialized = ndarray_to_compact_bytes(arr)
+    arr_deserialized = bytes_to_ndarray(arr_serialized)
+
+    # Assert deserialized array is equal to original
+    assert arr_deserialized.dtype == arr.dtype
+    assert arr_deserialized.shape == arr.shape
+    np.testing.assert_equal(arr_deserialized, arr)
+
+
+def test_compact_deserialisation_does_not_copy() -> None:
+    """Test that compact deserialization returns a view of the bytes."""
+    # Prepare
+    arr = np.ones((1024, 1024), dtype=np.float32)
+    arr_serialized = ndarray_to_compact_bytes(arr)
+
+    # Execute
+    tracemalloc.start()
+    arr_deserialized = compact_bytes_to_ndarray(arr_serialized)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Assert
+    assert peak < arr.nbytes // 100
+    assert not arr_deserialized.flags.writeable
+    np.testing.assert_equal(arr_deserialized, arr)
+
+
+def test_compact_serialisation_falls_back_to_npy() -> None:
+    """Test that unsupported data types are serialized as `.npy`."""
+    arr = np.zeros(2, dtype=[("a", np.int32), ("b", np.float64)])
+
+    arr_serialized = ndarray_to_compact_bytes(arr)
+
+    assert arr_serialized == ndarray_to_bytes(arr)
+    np.testing.assert_equal(bytes_to_ndarray(arr_serialized), arr)
+
+
+def test_parameters_tensor_type() -> None:
+    """Test that parameters are (de-)serialized according to their tensor type."""
+    ndarrays = [np.array([[1, 2], [3, 4]]), np.array([0.5])]
+
+    for tensor_type in [TENSOR_TYPE_NUMPY, TENSOR_TYPE_COMPACT]:
+        parameters = ndarrays_to_parameters(ndarrays, tensor_type=tensor_type)
+        assert parameters.tensor_type == tensor_type
+        np.testing.assert_equal(parameters_to_ndarrays(parameters), ndarrays)
+
+
+def test_parameters_custom_tensor_codec() -> None:
+    """Test that custom codecs can be registered."""
+    register_tensor_codec(
+        "test.int64",
+        lambda ndarray: ndarray.tobytes(),
+        lambda tensor: np.frombuffer(tensor, dtype=np.int64),
+    )
+    ndarrays = [np.array([1, 2, 3], dtype=np.int64)]
+
+    parameters = ndarrays_to_parameters(ndarrays, tensor_type="test.int64")
+
+    assert parameters.tensors == [ndarrays[0].tobytes()]
+    np.testing.assert_equal(parameters_to_ndarrays(parameters), ndarrays)
+
+
+def test_parameters_unknown_tensor_type() -> None:
+    """Test that encoding with an unknown tensor type raises an error."""
+    with pytest.raises(ValueError):
+        ndarrays_to_parameters([np.array([1])], tensor_type="unknown")
+
+
+def test_parameters_decode_unknown_tensor_type() -> None:
+    """Test that tensors of an unknown tensor type are decoded from `.npy` bytes."""
+    tensors = ndarrays_to_parameters([np.array([1])]).tensors
+    ndarrays = parameters_to_ndarrays(
+        Parameters(tensors=tensors, tensor_type="ndarray")
+    )
+    np.testing.assert_equal(ndarrays, [np.array([1])])
+
+
+def test_parameters_decode_without_tensor_type() -> None:
+    """Test that tensors without a tensor type are decoded from `.npy` bytes."""
+    tensors = ndarrays_to_parameters([np.array([1])]).tensors
+    ndarrays = parameters_to_ndarrays(Parameters(tensors=tensors, tensor_type=""))
+    np.testing.assert_equal(ndarrays, [np.array([1])])
+
+
+@pytest.mark.parametrize(
+    "tensor_type, atol",
+    [
+        ("numpy.ndarray+zlib", 0.0),
+        ("numpy.ndarray.compact+fp16", 1e-3),
+        ("numpy.ndarray.compact+bf16+zlib", 1e-2),
+        ("numpy.ndarray+int8", 2.0 / 255),
+    ],
+)
+def test_parameters_compression(tensor_type: str, atol: float) -> None:
+    """Test that compressed tensors are restored to their original dtype."""
+    rng = np.random.default_rng(seed=0)
+    ndarrays: NDArrays = [
+        rng.uniform(-1.0, 1.0, (8, 16)).astype(np.float32),
+        rng.uniform(-1.0, 1.0, 5),
+        np.arange(6).reshape(2, 3),
+    ]
+
+    parameters = ndarrays_to_parameters(ndarrays, tensor_type=tensor_type)
+    actual = parameters_to_ndarrays(parameters)
+
+    assert parameters.tensor_type == tensor_type
+    for expected_layer, actual_layer in zip(ndarrays, actual):
+        assert actual_layer.dtype == expected_layer.dtype
+        assert actual_layer.shape == expected_layer.shape
+        np.testing.assert_allclose(actual_layer, expected_layer, rtol=0, atol=atol)
+    # Integer tensors are never cast
+    np.testing.assert_equal(actual[2], ndarrays[2])
+
+
+@pytest.mark.parametrize("value", [np.nan, np.inf, -np.inf])
+def test_parameters_int8_non_finite_values(value: float) -> None:
+    """Test that tensors with non-finite values are not quantized to int8."""
+    ndarrays = [np.array([0.0, 1.0, value])]
+
+    with pytest.raises(ValueError, match="NaN or infinite"):
+        ndarrays_to_parameters(ndarrays, tensor_type="numpy.ndarray+int8")
+
+
+def test_parameters_lossy_compression_reduces_size() -> None:
+    """Test that casts reduce the number of bytes on the wire."""
+    ndarrays = [np.ones((64, 64), dtype=np.float32)]
+    num_bytes = {
+        tensor_type: len(ndarrays_to_parameters(ndarrays, tensor_type).tensors[0])
+        for tensor_type in ["numpy.ndarray.compact", "numpy.ndarray.compact+fp16"]
+    }
+
+    assert num_bytes["numpy.ndarray.compact+fp16"] < num_bytes["numpy.ndarray.compact"]
+
+
+def test_parameters_custom_compressor() -> None:
+    """Test that custom compressors can be combined with any tensor type."""
+    register_compressor(
+        "test.reverse", lambda data: data[::-1], lambda data: data[::-1]
+    )
+    ndarrays = [np.array([1.0, 2.0])]
+
+    parameters = ndarrays_to_parameters(
+        ndarrays, tensor_type="numpy.ndarray+test.reverse"
+    )
+
+    assert parameters.tensors == [ndarray_to_bytes(ndarrays[0])[::-1]]
+    np.testing.assert_equal(parameters_to_ndarrays(parameters), ndarrays)
+
+
+def test_parameters_unknown_compressor() -> None:
+    """Test that encoding with an unknown compressor raises an error."""
+    with pytest.raises(ValueError):
+        ndarrays_to_parameters([np.array([1])], tensor_type="numpy.ndarray+unknown")
+
+
+def test_sparse_serialisation_deserialisation() -> None:
+    """Test that the sparse format only stores non-zero values."""
+    arr = np.zeros((64, 32), dtype=np.float32)
+    arr[3, 7] = 1.5
+    arr[63, 31] = -2.0
+
+    arr_serialized = ndarray_to_sparse_bytes(arr)
+    arr_deserialized = bytes_to_ndarray(arr_serialized)
+
+    assert len(arr_serialized) < 100
+    assert arr_deserialized.dtype == arr.dtype
+    np.testing.assert_equal(arr_deserialized, arr)
+    np.testing.assert_equal(
+        parameters_to_ndarrays(ndarrays_to_parameters([arr], TENSOR_TYPE_SPARSE)),
+        [arr],
+    )
@@ -167,7 +167,19 @@ def client_message_from_proto(
 
 def parameters_to_proto(parameters: typing.Parameters) -> Parameters:
     """Serialize `Parameters` to ProtoBuf."""
-    return Parameters(tensors=parameters.tensors, tensor_type=parameters.tensor_type)
+    # Tensors mapped from a file (see `flwr.common.parameter_file`) are passed to
+    # ProtoBuf as memory views, which avoids a copy where buffer objects are accepted
+    # for `bytes` fields. Other ProtoBuf implementations require `bytes`, in which
+    # case the memory views are copied
+    try:
+        return Parameters(
+            tensors=parameters.tensors, tensor_type=parameters.tensor_type
+        )
+    except TypeError:
+        return Parameters(
+            tensors=[bytes(tensor) for tensor in parameters.tensors],
+            tensor_type=parameters.tensor_type,
+        )
 
 
 def parameters_from_proto(msg: Parameters) -> typing.Parameters:
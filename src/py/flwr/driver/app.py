@@ -34,6 +34,7 @@ from flwr.server.strategy import Strategy
 
 from .driver_client_proxy import DriverClientProxy
 from .grpc_driver import GrpcDriver
+from .task_scheduler import TaskScheduler
 
 DEFAULT_SERVER_ADDRESS_DRIVER = "[::]:9091"
 
@@ -173,6 +174,9 @@ def update_client_manager(
     # Request for workload_id
     workload_id = driver.create_workload(driver_pb2.CreateWorkloadRequest()).workload_id
 
+    # All client proxies push and pull their tasks in batches
+    scheduler = TaskScheduler(driver)
+
     # Loop until the driver is disconnected
     registered_nodes: Dict[int, DriverClientProxy] = {}
     while True:
@@ -200,6 +204,7 @@ def update_client_manager(
                 driver=driver,
                 anonymous=False,
                 workload_id=workload_id,
+                scheduler=scheduler,
             )
             if client_manager.register(client_proxy):
                 registered_nodes[node_id] = client_proxy
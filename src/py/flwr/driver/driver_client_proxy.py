@@ -15,30 +15,41 @@
 """Flower ClientProxy implementation for Driver API."""
 
 
-import time
-from typing import List, Optional, cast
+from concurrent.futures import Future
+from typing import Optional, cast
 
 from flwr import common
 from flwr.common import serde
-from flwr.proto import driver_pb2, node_pb2, task_pb2, transport_pb2
+from flwr.common.future import map_future
+from flwr.proto import node_pb2, task_pb2, transport_pb2
+from flwr.server.broadcast_cache import get_or_create
 from flwr.server.client_proxy import ClientProxy
 
 from .grpc_driver import GrpcDriver
-
-SLEEP_TIME = 1
+from .task_scheduler import TaskScheduler
 
 
 class DriverClientProxy(ClientProxy):
-    """Flower client proxy which delegates work using the Driver API."""
-
-    def __init__(
-        self, node_id: int, driver: GrpcDriver, anonymous: bool, workload_id: int
+    """Flower client proxy which delegates work using the Driver API.
+
+    Proxies sharing a `TaskScheduler` push their TaskIns and pull their TaskRes in
+    batches. Without a shared scheduler, each proxy uses its own.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        node_id: int,
+        driver: GrpcDriver,
+        anonymous: bool,
+        workload_id: int,
+        scheduler: Optional[TaskScheduler] = None,
     ):
         super().__init__(str(node_id))
         self.node_id = node_id
         self.driver = driver
         self.workload_id = workload_id
         self.anonymous = anonymous
+        self.scheduler = scheduler if scheduler is not None else TaskScheduler(driver)
 
     def get_properties(
         self, ins: common.GetPropertiesIns, timeout: Optional[float]
@@ -70,28 +81,44 @@ class DriverClientProxy(ClientProxy):
 
     def fit(self, ins: common.FitIns, timeout: Optional[float]) -> common.FitRes:
         """Train model parameters on the locally held dataset."""
-        server_message_proto: transport_pb2.ServerMessage = (
-            serde.server_message_to_proto(
-                server_message=common.ServerMessage(fit_ins=ins)
-            )
-        )
-        return cast(
-            common.FitRes,
-            self._send_receive_msg(server_message_proto, timeout).fit_res,
-        )
+        return self.submit_fit(ins, timeout).result()
 
     def evaluate(
         self, ins: common.EvaluateIns, timeout: Optional[float]
     ) -> common.EvaluateRes:
         """Evaluate model parameters on the locally held dataset."""
-        server_message_proto: transport_pb2.ServerMessage = (
-            serde.server_message_to_proto(
+        return self.submit_evaluate(ins, timeout).result()
+
+    def submit_fit(
+        self, ins: common.FitIns, timeout: Optional[float]
+    ) -> "Future[common.FitRes]":
+        """Schedule training and return a future for the result."""
+        server_message_proto: transport_pb2.ServerMessage = get_or_create(
+            ins,
+            lambda: serde.server_message_to_proto(
+                server_message=common.ServerMessage(fit_ins=ins)
+            ),
+        )
+        return map_future(
+            self._submit_msg(server_message_proto, timeout),
+            lambda client_message: cast(common.FitRes, client_message.fit_res),
+        )
+
+    def submit_evaluate(
+        self, ins: common.EvaluateIns, timeout: Optional[float]
+    ) -> "Future[common.EvaluateRes]":
+        """Schedule evaluation and return a future for the result."""
+        server_message_proto: transport_pb2.ServerMessage = get_or_create(
+            ins,
+            lambda: serde.server_message_to_proto(
                 server_message=common.ServerMessage(evaluate_ins=ins)
-            )
+            ),
         )
-        return cast(
-            common.EvaluateRes,
-            self._send_receive_msg(server_message_proto, timeout).evaluate_res,
+        return map_future(
+            self._submit_msg(server_message_proto, timeout),
+            lambda client_message: cast(
+                common.EvaluateRes, client_message.evaluate_res
+            ),
         )
 
     def reconnect(
@@ -102,7 +129,12 @@ class DriverClientProxy(ClientProxy):
 
     def _send_receive_msg(
         self, server_message: transport_pb2.ServerMessage, timeout: Optional[float]
-    ) -> transport_pb2.ClientMessage:
+    ) -> common.ClientMessage:
+        return self._submit_msg(server_message, timeout).result()
+
+    def _submit_msg(
+        self, server_message: transport_pb2.ServerMessage, timeout: Optional[float]
+    ) -> "Future[common.ClientMessage]":
         task_ins = task_pb2.TaskIns(
             task_id="",
             group_id="",
@@ -119,39 +151,19 @@ class DriverClientProxy(ClientProxy):
                 legacy_server_message=server_message,
             ),
         )
-        push_task_ins_req = driver_pb2.PushTaskInsRequest(task_ins_list=[task_ins])
-
-        # Send TaskIns to Driver API
-        push_task_ins_res = self.driver.push_task_ins(req=push_task_ins_req)
 
-        if len(push_task_ins_res.task_ids) != 1:
-            raise ValueError("Unexpected number of task_ids")
+        # Send TaskIns to Driver API, the scheduler fails the future after `timeout`
+        future = self.scheduler.submit(task_ins, timeout=timeout)
 
-        task_id = push_task_ins_res.task_ids[0]
-        if task_id == "":
-            raise ValueError(f"Failed to schedule task for node {self.node_id}")
+        def on_done(_: "Future[task_pb2.TaskRes]") -> None:
+            # Stop pulling the result if the caller is no longer interested
+            if future.cancelled():
+                self.scheduler.cancel(future)
 
-        if timeout:
-            start_time = time.time()
-
-        while True:
-            pull_task_res_req = driver_pb2.PullTaskResRequest(
-                node=node_pb2.Node(node_id=0, anonymous=True),
-                task_ids=[task_id],
-            )
-
-            # Ask Driver API for TaskRes
-            pull_task_res_res = self.driver.pull_task_res(req=pull_task_res_req)
-
-            task_res_list: List[task_pb2.TaskRes] = list(
-                pull_task_res_res.task_res_list
-            )
-            if len(task_res_list) == 1:
-                task_res = task_res_list[0]
-                return serde.client_message_from_proto(  # type: ignore
-                    task_res.task.legacy_client_message
-                )
-
-            if timeout is not None and time.time() > start_time + timeout:
-                raise RuntimeError("Timeout reached")
-            time.sleep(SLEEP_TIME)
+        future.add_done_callback(on_done)
+        return map_future(
+            future,
+            lambda task_res: serde.client_message_from_proto(
+                task_res.task.legacy_client_message
+            ),
+        )
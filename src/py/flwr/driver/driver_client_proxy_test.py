@@ -54,11 +54,12 @@ class DriverClientProxyTestCase(unittest.TestCase):
                     group_id="",
                     workload_id=0,
                     task=task_pb2.Task(
+                        ancestry=["19341fd7-62e1-4eb4-beb4-9876d3acda32"],
                         legacy_client_message=ClientMessage(
                             get_properties_res=ClientMessage.GetPropertiesRes(
                                 properties=CLIENT_PROPERTIES
                             )
-                        )
+                        ),
                     ),
                 )
             ]
@@ -90,11 +91,12 @@ class DriverClientProxyTestCase(unittest.TestCase):
                     group_id="",
                     workload_id=0,
                     task=task_pb2.Task(
+                        ancestry=["19341fd7-62e1-4eb4-beb4-9876d3acda32"],
                         legacy_client_message=ClientMessage(
                             get_parameters_res=ClientMessage.GetParametersRes(
                                 parameters=MESSAGE_PARAMETERS,
                             )
-                        )
+                        ),
                     ),
                 )
             ]
@@ -125,12 +127,13 @@ class DriverClientProxyTestCase(unittest.TestCase):
                     group_id="",
                     workload_id=0,
                     task=task_pb2.Task(
+                        ancestry=["19341fd7-62e1-4eb4-beb4-9876d3acda32"],
                         legacy_client_message=ClientMessage(
                             fit_res=ClientMessage.FitRes(
                                 parameters=MESSAGE_PARAMETERS,
                                 num_examples=10,
                             )
-                        )
+                        ),
                     ),
                 )
             ]
@@ -162,11 +165,12 @@ class DriverClientProxyTestCase(unittest.TestCase):
                     group_id="",
                     workload_id=0,
                     task=task_pb2.Task(
+                        ancestry=["19341fd7-62e1-4eb4-beb4-9876d3acda32"],
                         legacy_client_message=ClientMessage(
                             evaluate_res=ClientMessage.EvaluateRes(
                                 loss=0.0, num_examples=0
                             )
-                        )
+                        ),
                     ),
                 )
             ]
@@ -0,0 +1,209 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Batched scheduling of tasks through the Driver API."""
+
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+from flwr.proto import driver_pb2, node_pb2, task_pb2
+
+from .grpc_driver import GrpcDriver
+
+SLEEP_TIME = 1
+
+
+class TaskScheduler:
+    """Push TaskIns and pull TaskRes in batches on behalf of many client proxies.
+
+    TaskIns submitted while a request is in flight are pushed together in the next
+    `PushTaskInsRequest`. Results for all outstanding tasks are pulled with a single
+    `PullTaskResRequest`, which the Driver API holds open for up to `poll_interval`
+    seconds until results are available, and handed to the futures returned by
+    `submit`. The number of requests per round therefore does not depend on the number
+    of clients.
+
+    The scheduler pushes and pulls on two background threads while tasks are pending,
+    which exit once all results have been delivered. Tasks submitted with a timeout
+    fail with a `RuntimeError` if no result arrived in time, so callers do not need
+    a thread to wait for them.
+
+    Parameters
+    ----------
+    driver : GrpcDriver
+        The driver connected to the Driver API.
+    poll_interval : float (default: 1)
+        Seconds the Driver API may wait for results, and the minimum number of seconds
+        between two requests that returned no results.
+    """
+
+    def __init__(self, driver: GrpcDriver, poll_interval: float = SLEEP_TIME) -> None:
+        self.driver = driver
+        self.poll_interval = poll_interval
+        self._condition = threading.Condition()
+        self._pending: List[Tuple[task_pb2.TaskIns, "Future[task_pb2.TaskRes]"]] = []
+        self._outstanding: Dict[str, "Future[task_pb2.TaskRes]"] = {}
+        self._deadlines: Dict["Future[task_pb2.TaskRes]", float] = {}
+        self._push_thread: Optional[threading.Thread] = None
+        self._pull_thread: Optional[threading.Thread] = None
+
+    def submit(
+        self, task_ins: task_pb2.TaskIns, timeout: Optional[float] = None
+    ) -> "Future[task_pb2.TaskRes]":
+        """Schedule a TaskIns and return a future for its TaskRes.
+
+        If `timeout` is not None, the future fails once no TaskRes arrived within
+        `timeout` seconds.
+        """
+        future: "Future[task_pb2.TaskRes]" = Future()
+        with self._condition:
+            self._pending.append((task_ins, future))
+            if timeout is not None:
+                self._deadlines[future] = time.monotonic() + timeout
+            if self._push_thread is None:
+                self._push_thread = threading.Thread(target=self._run_push, daemon=True)
+                self._push_thread.start()
+        return future
+
+    def cancel(self, future: "Future[task_pb2.TaskRes]") -> None:
+        """Stop waiting for the result of a task, e.g., after a timeout."""
+        with self._condition:
+            self._pending = [item for item in self._pending if item[1] is not future]
+            self._outstanding = {
+                task_id: other
+                for task_id, other in self._outstanding.items()
+                if other is not future
+            }
+            self._deadlines.pop(future, None)
+            self._condition.notify_all()
+        future.cancel()
+
+    def _run_push(self) -> None:
+        while True:
+            with self._condition:
+                pending, self._pending = self._pending, []
+                if not pending:
+                    self._push_thread = None
+                    return
+            self._push(pending)
+            with self._condition:
+                if self._outstanding and self._pull_thread is None:
+                    self._pull_thread = threading.Thread(
+                        target=self._run_pull, daemon=True
+                    )
+                    self._pull_thread.start()
+
+    def _run_pull(self) -> None:
+        while True:
+            start_time = time.monotonic()
+            if not self._pull():
+                # Driver APIs without long polling return immediately
+                deadline = start_time + self.poll_interval
+                with self._condition:
+                    while self._outstanding and time.monotonic() < deadline:
+                        self._condition.wait(deadline - time.monotonic())
+            self._expire()
+            with self._condition:
+                if not self._outstanding:
+                    self._pull_thread = None
+                    return
+
+    def _push(
+        self, pending: List[Tuple[task_pb2.TaskIns, "Future[task_pb2.TaskRes]"]]
+    ) -> None:
+        """Push all pending TaskIns in a single request."""
+        req = driver_pb2.PushTaskInsRequest(
+            task_ins_list=[task_ins for task_ins, _ in pending]
+        )
+        try:
+            res = self.driver.push_task_ins(req=req)
+            if len(res.task_ids) != len(pending):
+                raise ValueError("Unexpected number of task_ids")
+        except Exception as ex:  # pylint: disable=broad-except
+            for _, future in pending:
+                _set_exception(future, ex)
+            return
+
+        with self._condition:
+            for (task_ins, future), task_id in zip(pending, res.task_ids):
+                if task_id == "":
+                    node_id = task_ins.task.consumer.node_id
+                    _set_exception(
+                        future,
+                        ValueError(f"Failed to schedule task for node {node_id}"),
+                    )
+                elif not future.done():
+                    self._outstanding[task_id] = future
+
+    def _pull(self) -> bool:
+        """Pull the results of all outstanding tasks in a single request.
+
+        Returns whether any result was received.
+        """
+        with self._condition:
+            task_ids = list(self._outstanding)
+        if not task_ids:
+            return True
+        req = driver_pb2.PullTaskResRequest(
+            node=node_pb2.Node(node_id=0, anonymous=True),
+            task_ids=task_ids,
+            timeout=self.poll_interval,
+        )
+        try:
+            res = self.driver.pull_task_res(req=req)
+        except Exception as ex:  # pylint: disable=broad-except
+            with self._condition:
+                futures = [self._outstanding.pop(task_id, None) for task_id in task_ids]
+            for future in futures:
+                if future is not None:
+                    _set_exception(future, ex)
+            return True
+
+        for task_res in res.task_res_list:
+            if not task_res.task.ancestry:
+                continue
+            with self._condition:
+                future = self._outstanding.pop(task_res.task.ancestry[0], None)
+            if future is not None and future.set_running_or_notify_cancel():
+                future.set_result(task_res)
+        return len(res.task_res_list) > 0
+
+    def _expire(self) -> None:
+        """Fail outstanding tasks whose timeout has expired."""
+        now = time.monotonic()
+        with self._condition:
+            expired = {
+                task_id: future
+                for task_id, future in self._outstanding.items()
+                if self._deadlines.get(future, now) < now
+            }
+            for task_id in expired:
+                del self._outstanding[task_id]
+            # Forget deadlines of expired tasks and of tasks which completed otherwise
+            expired_futures = set(expired.values())
+            self._deadlines = {
+                future: deadline
+                for future, deadline in self._deadlines.items()
+                if not future.done() and future not in expired_futures
+            }
+        for future in expired.values():
+            _set_exception(future, RuntimeError("Timeout reached"))
+
+
+def _set_exception(future: "Future[task_pb2.TaskRes]", ex: BaseException) -> None:
+    if future.set_running_or_notify_cancel():
+        future.set_exception(ex)
@@ -0,0 +1,145 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""TaskScheduler tests."""
+
+
+import concurrent.futures
+import time
+import unittest
+from typing import List
+from unittest.mock import MagicMock
+
+from flwr.proto import driver_pb2, node_pb2, task_pb2
+
+from .task_scheduler import TaskScheduler
+
+
+def _task_ins(node_id: int) -> task_pb2.TaskIns:
+    return task_pb2.TaskIns(
+        task=task_pb2.Task(consumer=node_pb2.Node(node_id=node_id, anonymous=False))
+    )
+
+
+def _push_task_ins(
+    req: driver_pb2.PushTaskInsRequest,
+) -> driver_pb2.PushTaskInsResponse:
+    return driver_pb2.PushTaskInsResponse(
+        task_ids=[
+            f"task-{task_ins.task.consumer.node_id}" for task_ins in req.task_ins_list
+        ]
+    )
+
+
+def _pull_task_res(
+    req: driver_pb2.PullTaskResRequest,
+) -> driver_pb2.PullTaskResResponse:
+    return driver_pb2.PullTaskResResponse(
+        task_res_list=[
+            task_pb2.TaskRes(
+                task_id=f"res-{task_id}", task=task_pb2.Task(ancestry=[task_id])
+            )
+            for task_id in req.task_ids
+        ]
+    )
+
+
+class TaskSchedulerTestCase(unittest.TestCase):
+    """Tests for TaskScheduler."""
+
+    def setUp(self) -> None:
+        """Set up a mocked driver."""
+        self.driver = MagicMock()
+        self.driver.push_task_ins.side_effect = _push_task_ins
+        self.driver.pull_task_res.side_effect = _pull_task_res
+        self.scheduler = TaskScheduler(self.driver, poll_interval=0.01)
+
+    def test_submit_batches_requests(self) -> None:
+        """Test that concurrently submitted tasks share push and pull requests."""
+        # Execute
+        # Hold the lock so the scheduler sees all tasks at once
+        # pylint: disable-next=protected-access
+        with self.scheduler._condition:
+            futures = [
+                self.scheduler.submit(_task_ins(node_id)) for node_id in [1, 2, 3]
+            ]
+        results: List[task_pb2.TaskRes] = [
+            future.result(timeout=5) for future in futures
+        ]
+
+        # Assert
+        assert [task_res.task_id for task_res in results] == [
+            "res-task-1",
+            "res-task-2",
+            "res-task-3",
+        ]
+        assert self.driver.push_task_ins.call_count == 1
+        assert self.driver.pull_task_res.call_count == 1
+        pull_req = self.driver.pull_task_res.call_args.kwargs["req"]
+        assert sorted(pull_req.task_ids) == ["task-1", "task-2", "task-3"]
+        assert pull_req.timeout == 0.01
+
+    def test_submit_failed_scheduling(self) -> None:
+        """Test that tasks the Driver API did not accept fail."""
+        # Prepare
+        self.driver.push_task_ins.side_effect = lambda req: (
+            driver_pb2.PushTaskInsResponse(task_ids=[""])
+        )
+
+        # Execute
+        future = self.scheduler.submit(_task_ins(1))
+
+        # Assert
+        with self.assertRaises(ValueError):
+            future.result(timeout=5)
+
+    def test_cancel(self) -> None:
+        """Test that the scheduler stops pulling results of cancelled tasks."""
+        # Prepare
+        self.driver.pull_task_res.side_effect = lambda req: (
+            driver_pb2.PullTaskResResponse()
+        )
+        future = self.scheduler.submit(_task_ins(1))
+        with self.assertRaises(concurrent.futures.TimeoutError):
+            future.result(timeout=0.05)
+
+        # Execute
+        self.scheduler.cancel(future)
+
+        # Assert
+        deadline = time.monotonic() + 5
+        # pylint: disable-next=protected-access
+        while self.scheduler._pull_thread is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert self.scheduler._pull_thread is None  # pylint: disable=protected-access
+        assert future.cancelled()
+
+    def test_submit_timeout(self) -> None:
+        """Test that tasks without a result fail once their timeout expires."""
+        # Prepare
+        self.driver.pull_task_res.side_effect = lambda req: (
+            driver_pb2.PullTaskResResponse()
+        )
+
+        # Execute
+        future = self.scheduler.submit(_task_ins(1), timeout=0.05)
+
+        # Assert
+        with self.assertRaises(RuntimeError):
+            future.result(timeout=5)
+        deadline = time.monotonic() + 5
+        # pylint: disable-next=protected-access
+        while self.scheduler._pull_thread is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not self.scheduler._deadlines  # pylint: disable=protected-access
@@ -14,9 +14,10 @@ _sym_db = _symbol_database.Default()
 
 from flwr.proto import node_pb2 as flwr_dot_proto_dot_node__pb2
 from flwr.proto import task_pb2 as flwr_dot_proto_dot_task__pb2
+from flwr.proto import transport_pb2 as flwr_dot_proto_dot_transport__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x16\x66lwr/proto/fleet.proto\x12\nflwr.proto\x1a\x15\x66lwr/proto/node.proto\x1a\x15\x66lwr/proto/task.proto\"\x13\n\x11\x43reateNodeRequest\"4\n\x12\x43reateNodeResponse\x12\x1e\n\x04node\x18\x01 \x01(\x0b\x32\x10.flwr.proto.Node\"3\n\x11\x44\x65leteNodeRequest\x12\x1e\n\x04node\x18\x01 \x01(\x0b\x32\x10.flwr.proto.Node\"\x14\n\x12\x44\x65leteNodeResponse\"F\n\x12PullTaskInsRequest\x12\x1e\n\x04node\x18\x01 \x01(\x0b\x32\x10.flwr.proto.Node\x12\x10\n\x08task_ids\x18\x02 \x03(\t\"k\n\x13PullTaskInsResponse\x12(\n\treconnect\x18\x01 \x01(\x0b\x32\x15.flwr.proto.Reconnect\x12*\n\rtask_ins_list\x18\x02 \x03(\x0b\x32\x13.flwr.proto.TaskIns\"@\n\x12PushTaskResRequest\x12*\n\rtask_res_list\x18\x01 \x03(\x0b\x32\x13.flwr.proto.TaskRes\"\xae\x01\n\x13PushTaskResResponse\x12(\n\treconnect\x18\x01 \x01(\x0b\x32\x15.flwr.proto.Reconnect\x12=\n\x07results\x18\x02 \x03(\x0b\x32,.flwr.proto.PushTaskResResponse.ResultsEntry\x1a.\n\x0cResultsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\r:\x02\x38\x01\"\x1e\n\tReconnect\x12\x11\n\treconnect\x18\x01 \x01(\x04\x32\xc9\x02\n\x05\x46leet\x12M\n\nCreateNode\x12\x1d.flwr.proto.CreateNodeRequest\x1a\x1e.flwr.proto.CreateNodeResponse\"\x00\x12M\n\nDeleteNode\x12\x1d.flwr.proto.DeleteNodeRequest\x1a\x1e.flwr.proto.DeleteNodeResponse\"\x00\x12P\n\x0bPullTaskIns\x12\x1e.flwr.proto.PullTaskInsRequest\x1a\x1f.flwr.proto.PullTaskInsResponse\"\x00\x12P\n\x0bPushTaskRes\x12\x1e.flwr.proto.PushTaskResRequest\x1a\x1f.flwr.proto.PushTaskResResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x16\x66lwr/proto/fleet.proto\x12\nflwr.proto\x1a\x15\x66lwr/proto/node.proto\x1a\x15\x66lwr/proto/task.proto\x1a\x1a\x66lwr/proto/transport.proto\"\x13\n\x11\x43reateNodeRequest\"4\n\x12\x43reateNodeResponse\x12\x1e\n\x04node\x18\x01 \x01(\x0b\x32\x10.flwr.proto.Node\"3\n\x11\x44\x65leteNodeRequest\x12\x1e\n\x04node\x18\x01 \x01(\x0b\x32\x10.flwr.proto.Node\"\x14\n\x12\x44\x65leteNodeResponse\"j\n\x12PullTaskInsRequest\x12\x1e\n\x04node\x18\x01 \x01(\x0b\x32\x10.flwr.proto.Node\x12\x10\n\x08task_ids\x18\x02 \x03(\t\x12\x0f\n\x07timeout\x18\x03 \x01(\x01\x12\x11\n\tmax_tasks\x18\x04 \x01(\r\"k\n\x13PullTaskInsResponse\x12(\n\treconnect\x18\x01 \x01(\x0b\x32\x15.flwr.proto.Reconnect\x12*\n\rtask_ins_list\x18\x02 \x03(\x0b\x32\x13.flwr.proto.TaskIns\"@\n\x12PushTaskResRequest\x12*\n\rtask_res_list\x18\x01 \x03(\x0b\x32\x13.flwr.proto.TaskRes\"\xae\x01\n\x13PushTaskResResponse\x12(\n\treconnect\x18\x01 \x01(\x0b\x32\x15.flwr.proto.Reconnect\x12=\n\x07results\x18\x02 \x03(\x0b\x32,.flwr.proto.PushTaskResResponse.ResultsEntry\x1a.\n\x0cResultsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\r:\x02\x38\x01\"\x1e\n\tReconnect\x12\x11\n\treconnect\x18\x01 \x01(\x04\x32\xf0\x03\n\x05\x46leet\x12M\n\nCreateNode\x12\x1d.flwr.proto.CreateNodeRequest\x1a\x1e.flwr.proto.CreateNodeResponse\"\x00\x12M\n\nDeleteNode\x12\x1d.flwr.proto.DeleteNodeRequest\x1a\x1e.flwr.proto.DeleteNodeResponse\"\x00\x12P\n\x0bPullTaskIns\x12\x1e.flwr.proto.PullTaskInsRequest\x1a\x1f.flwr.proto.PullTaskInsResponse\"\x00\x12P\n\x0bPushTaskRes\x12\x1e.flwr.proto.PushTaskResRequest\x1a\x1f.flwr.proto.PushTaskResResponse\"\x00\x12Q\n\x11PullTaskInsStream\x12\x1e.flwr.proto.PullTaskInsRequest\x1a\x18.flwr.proto.MessageChunk\"\x00\x30\x01\x12R\n\x11PushTaskResStream\x12\x18.flwr.proto.MessageChunk\x1a\x1f.flwr.proto.PushTaskResResponse\"\x00(\x01\x62\x06proto3')
 
 
 
@@ -107,26 +108,26 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   DESCRIPTOR._options = None
   _PUSHTASKRESRESPONSE_RESULTSENTRY._options = None
   _PUSHTASKRESRESPONSE_RESULTSENTRY._serialized_options = b'8\001'
-  _CREATENODEREQUEST._serialized_start=84
-  _CREATENODEREQUEST._serialized_end=103
-  _CREATENODERESPONSE._serialized_start=105
-  _CREATENODERESPONSE._serialized_end=157
-  _DELETENODEREQUEST._serialized_start=159
-  _DELETENODEREQUEST._serialized_end=210
-  _DELETENODERESPONSE._serialized_start=212
-  _DELETENODERESPONSE._serialized_end=232
-  _PULLTASKINSREQUEST._serialized_start=234
-  _PULLTASKINSREQUEST._serialized_end=304
-  _PULLTASKINSRESPONSE._serialized_start=306
-  _PULLTASKINSRESPONSE._serialized_end=413
-  _PUSHTASKRESREQUEST._serialized_start=415
-  _PUSHTASKRESREQUEST._serialized_end=479
-  _PUSHTASKRESRESPONSE._serialized_start=482
-  _PUSHTASKRESRESPONSE._serialized_end=656
-  _PUSHTASKRESRESPONSE_RESULTSENTRY._serialized_start=610
-  _PUSHTASKRESRESPONSE_RESULTSENTRY._serialized_end=656
-  _RECONNECT._serialized_start=658
-  _RECONNECT._serialized_end=688
-  _FLEET._serialized_start=691
-  _FLEET._serialized_end=1020
+  _CREATENODEREQUEST._serialized_start=112
+  _CREATENODEREQUEST._serialized_end=131
+  _CREATENODERESPONSE._serialized_start=133
+  _CREATENODERESPONSE._serialized_end=185
+  _DELETENODEREQUEST._serialized_start=187
+  _DELETENODEREQUEST._serialized_end=238
+  _DELETENODERESPONSE._serialized_start=240
+  _DELETENODERESPONSE._serialized_end=260
+  _PULLTASKINSREQUEST._serialized_start=262
+  _PULLTASKINSREQUEST._serialized_end=368
+  _PULLTASKINSRESPONSE._serialized_start=370
+  _PULLTASKINSRESPONSE._serialized_end=477
+  _PUSHTASKRESREQUEST._serialized_start=479
+  _PUSHTASKRESREQUEST._serialized_end=543
+  _PUSHTASKRESRESPONSE._serialized_start=546
+  _PUSHTASKRESRESPONSE._serialized_end=720
+  _PUSHTASKRESRESPONSE_RESULTSENTRY._serialized_start=674
+  _PUSHTASKRESRESPONSE_RESULTSENTRY._serialized_end=720
+  _RECONNECT._serialized_start=722
+  _RECONNECT._serialized_end=752
+  _FLEET._serialized_start=755
+  _FLEET._serialized_end=1251
 # @@protoc_insertion_point(module_scope)
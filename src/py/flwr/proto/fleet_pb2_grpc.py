@@ -3,6 +3,7 @@
 import grpc
 
 from flwr.proto import fleet_pb2 as flwr_dot_proto_dot_fleet__pb2
+from flwr.proto import transport_pb2 as flwr_dot_proto_dot_transport__pb2
 
 
 class FleetStub(object):
@@ -34,6 +35,16 @@ class FleetStub(object):
                 request_serializer=flwr_dot_proto_dot_fleet__pb2.PushTaskResRequest.SerializeToString,
                 response_deserializer=flwr_dot_proto_dot_fleet__pb2.PushTaskResResponse.FromString,
                 )
+        self.PullTaskInsStream = channel.unary_stream(
+                '/flwr.proto.Fleet/PullTaskInsStream',
+                request_serializer=flwr_dot_proto_dot_fleet__pb2.PullTaskInsRequest.SerializeToString,
+                response_deserializer=flwr_dot_proto_dot_transport__pb2.MessageChunk.FromString,
+                )
+        self.PushTaskResStream = channel.stream_unary(
+                '/flwr.proto.Fleet/PushTaskResStream',
+                request_serializer=flwr_dot_proto_dot_transport__pb2.MessageChunk.SerializeToString,
+                response_deserializer=flwr_dot_proto_dot_fleet__pb2.PushTaskResResponse.FromString,
+                )
 
 
 class FleetServicer(object):
@@ -69,6 +80,20 @@ class FleetServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def PullTaskInsStream(self, request, context):
+        """Like PullTaskIns, but the serialized response is streamed in chunks
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def PushTaskResStream(self, request_iterator, context):
+        """Like PushTaskRes, but the serialized request is streamed in chunks
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_FleetServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -92,6 +117,16 @@ def add_FleetServicer_to_server(servicer, server):
                     request_deserializer=flwr_dot_proto_dot_fleet__pb2.PushTaskResRequest.FromString,
                     response_serializer=flwr_dot_proto_dot_fleet__pb2.PushTaskResResponse.SerializeToString,
             ),
+            'PullTaskInsStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.PullTaskInsStream,
+                    request_deserializer=flwr_dot_proto_dot_fleet__pb2.PullTaskInsRequest.FromString,
+                    response_serializer=flwr_dot_proto_dot_transport__pb2.MessageChunk.SerializeToString,
+            ),
+            'PushTaskResStream': grpc.stream_unary_rpc_method_handler(
+                    servicer.PushTaskResStream,
+                    request_deserializer=flwr_dot_proto_dot_transport__pb2.MessageChunk.FromString,
+                    response_serializer=flwr_dot_proto_dot_fleet__pb2.PushTaskResResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'flwr.proto.Fleet', rpc_method_handlers)
@@ -169,3 +204,37 @@ class Fleet(object):
             flwr_dot_proto_dot_fleet__pb2.PushTaskResResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def PullTaskInsStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/flwr.proto.Fleet/PullTaskInsStream',
+            flwr_dot_proto_dot_fleet__pb2.PullTaskInsRequest.SerializeToString,
+            flwr_dot_proto_dot_transport__pb2.MessageChunk.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def PushTaskResStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(request_iterator, target, '/flwr.proto.Fleet/PushTaskResStream',
+            flwr_dot_proto_dot_transport__pb2.MessageChunk.SerializeToString,
+            flwr_dot_proto_dot_fleet__pb2.PushTaskResResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
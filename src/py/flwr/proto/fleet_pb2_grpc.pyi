@@ -4,7 +4,9 @@ isort:skip_file
 """
 import abc
 import flwr.proto.fleet_pb2
+import flwr.proto.transport_pb2
 import grpc
+import typing
 
 class FleetStub:
     def __init__(self, channel: grpc.Channel) -> None: ...
@@ -32,6 +34,16 @@ class FleetStub:
     HTTP API path: /api/v1/fleet/push-task-res
     """
 
+    PullTaskInsStream: grpc.UnaryStreamMultiCallable[
+        flwr.proto.fleet_pb2.PullTaskInsRequest,
+        flwr.proto.transport_pb2.MessageChunk]
+    """Like PullTaskIns, but the serialized response is streamed in chunks"""
+
+    PushTaskResStream: grpc.StreamUnaryMultiCallable[
+        flwr.proto.transport_pb2.MessageChunk,
+        flwr.proto.fleet_pb2.PushTaskResResponse]
+    """Like PushTaskRes, but the serialized request is streamed in chunks"""
+
 
 class FleetServicer(metaclass=abc.ABCMeta):
     @abc.abstractmethod
@@ -68,5 +80,21 @@ class FleetServicer(metaclass=abc.ABCMeta):
         """
         pass
 
+    @abc.abstractmethod
+    def PullTaskInsStream(self,
+        request: flwr.proto.fleet_pb2.PullTaskInsRequest,
+        context: grpc.ServicerContext,
+    ) -> typing.Iterator[flwr.proto.transport_pb2.MessageChunk]:
+        """Like PullTaskIns, but the serialized response is streamed in chunks"""
+        pass
+
+    @abc.abstractmethod
+    def PushTaskResStream(self,
+        request_iterator: typing.Iterator[flwr.proto.transport_pb2.MessageChunk],
+        context: grpc.ServicerContext,
+    ) -> flwr.proto.fleet_pb2.PushTaskResResponse:
+        """Like PushTaskRes, but the serialized request is streamed in chunks"""
+        pass
+
 
 def add_FleetServicer_to_server(servicer: FleetServicer, server: grpc.Server) -> None: ...
@@ -15,7 +15,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1a\x66lwr/proto/transport.proto\x12\nflwr.proto\"9\n\x06Status\x12\x1e\n\x04\x63ode\x18\x01 \x01(\x0e\x32\x10.flwr.proto.Code\x12\x0f\n\x07message\x18\x02 \x01(\t\"2\n\nParameters\x12\x0f\n\x07tensors\x18\x01 \x03(\x0c\x12\x13\n\x0btensor_type\x18\x02 \x01(\t\"\xba\x08\n\rServerMessage\x12?\n\rreconnect_ins\x18\x01 \x01(\x0b\x32&.flwr.proto.ServerMessage.ReconnectInsH\x00\x12H\n\x12get_properties_ins\x18\x02 \x01(\x0b\x32*.flwr.proto.ServerMessage.GetPropertiesInsH\x00\x12H\n\x12get_parameters_ins\x18\x03 \x01(\x0b\x32*.flwr.proto.ServerMessage.GetParametersInsH\x00\x12\x33\n\x07\x66it_ins\x18\x04 \x01(\x0b\x32 .flwr.proto.ServerMessage.FitInsH\x00\x12=\n\x0c\x65valuate_ins\x18\x05 \x01(\x0b\x32%.flwr.proto.ServerMessage.EvaluateInsH\x00\x1a\x1f\n\x0cReconnectIns\x12\x0f\n\x07seconds\x18\x01 \x01(\x03\x1a\x9d\x01\n\x10GetPropertiesIns\x12\x46\n\x06\x63onfig\x18\x01 \x03(\x0b\x32\x36.flwr.proto.ServerMessage.GetPropertiesIns.ConfigEntry\x1a\x41\n\x0b\x43onfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.flwr.proto.Scalar:\x02\x38\x01\x1a\x9d\x01\n\x10GetParametersIns\x12\x46\n\x06\x63onfig\x18\x01 \x03(\x0b\x32\x36.flwr.proto.ServerMessage.GetParametersIns.ConfigEntry\x1a\x41\n\x0b\x43onfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.flwr.proto.Scalar:\x02\x38\x01\x1a\xb5\x01\n\x06\x46itIns\x12*\n\nparameters\x18\x01 \x01(\x0b\x32\x16.flwr.proto.Parameters\x12<\n\x06\x63onfig\x18\x02 \x03(\x0b\x32,.flwr.proto.ServerMessage.FitIns.ConfigEntry\x1a\x41\n\x0b\x43onfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.flwr.proto.Scalar:\x02\x38\x01\x1a\xbf\x01\n\x0b\x45valuateIns\x12*\n\nparameters\x18\x01 \x01(\x0b\x32\x16.flwr.proto.Parameters\x12\x41\n\x06\x63onfig\x18\x02 \x03(\x0b\x32\x31.flwr.proto.ServerMessage.EvaluateIns.ConfigEntry\x1a\x41\n\x0b\x43onfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.flwr.proto.Scalar:\x02\x38\x01\x42\x05\n\x03msg\"\xa0\t\n\rClientMessage\x12\x41\n\x0e\x64isconnect_res\x18\x01 \x01(\x0b\x32\'.flwr.proto.ClientMessage.DisconnectResH\x00\x12H\n\x12get_properties_res\x18\x02 \x01(\x0b\x32*.flwr.proto.ClientMessage.GetPropertiesResH\x00\x12H\n\x12get_parameters_res\x18\x03 \x01(\x0b\x32*.flwr.proto.ClientMessage.GetParametersResH\x00\x12\x33\n\x07\x66it_res\x18\x04 \x01(\x0b\x32 .flwr.proto.ClientMessage.FitResH\x00\x12=\n\x0c\x65valuate_res\x18\x05 \x01(\x0b\x32%.flwr.proto.ClientMessage.EvaluateResH\x00\x1a\x33\n\rDisconnectRes\x12\"\n\x06reason\x18\x01 \x01(\x0e\x32\x12.flwr.proto.Reason\x1a\xcd\x01\n\x10GetPropertiesRes\x12\"\n\x06status\x18\x01 \x01(\x0b\x32\x12.flwr.proto.Status\x12N\n\nproperties\x18\x02 \x03(\x0b\x32:.flwr.proto.ClientMessage.GetPropertiesRes.PropertiesEntry\x1a\x45\n\x0fPropertiesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.flwr.proto.Scalar:\x02\x38\x01\x1a\x62\n\x10GetParametersRes\x12\"\n\x06status\x18\x01 \x01(\x0b\x32\x12.flwr.proto.Status\x12*\n\nparameters\x18\x02 \x01(\x0b\x32\x16.flwr.proto.Parameters\x1a\xf2\x01\n\x06\x46itRes\x12\"\n\x06status\x18\x01 \x01(\x0b\x32\x12.flwr.proto.Status\x12*\n\nparameters\x18\x02 \x01(\x0b\x32\x16.flwr.proto.Parameters\x12\x14\n\x0cnum_examples\x18\x03 \x01(\x03\x12>\n\x07metrics\x18\x04 \x03(\x0b\x32-.flwr.proto.ClientMessage.FitRes.MetricsEntry\x1a\x42\n\x0cMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.flwr.proto.Scalar:\x02\x38\x01\x1a\xde\x01\n\x0b\x45valuateRes\x12\"\n\x06status\x18\x01 \x01(\x0b\x32\x12.flwr.proto.Status\x12\x0c\n\x04loss\x18\x02 \x01(\x02\x12\x14\n\x0cnum_examples\x18\x03 \x01(\x03\x12\x43\n\x07metrics\x18\x04 \x03(\x0b\x32\x32.flwr.proto.ClientMessage.EvaluateRes.MetricsEntry\x1a\x42\n\x0cMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.flwr.proto.Scalar:\x02\x38\x01\x42\x05\n\x03msg\"i\n\x06Scalar\x12\x10\n\x06\x64ouble\x18\x01 \x01(\x01H\x00\x12\x10\n\x06sint64\x18\x08 \x01(\x12H\x00\x12\x0e\n\x04\x62ool\x18\r \x01(\x08H\x00\x12\x10\n\x06string\x18\x0e \x01(\tH\x00\x12\x0f\n\x05\x62ytes\x18\x0f \x01(\x0cH\x00\x42\x08\n\x06scalar*\x8d\x01\n\x04\x43ode\x12\x06\n\x02OK\x10\x00\x12\"\n\x1eGET_PROPERTIES_NOT_IMPLEMENTED\x10\x01\x12\"\n\x1eGET_PARAMETERS_NOT_IMPLEMENTED\x10\x02\x12\x17\n\x13\x46IT_NOT_IMPLEMENTED\x10\x03\x12\x1c\n\x18\x45VALUATE_NOT_IMPLEMENTED\x10\x04*[\n\x06Reason\x12\x0b\n\x07UNKNOWN\x10\x00\x12\r\n\tRECONNECT\x10\x01\x12\x16\n\x12POWER_DISCONNECTED\x10\x02\x12\x14\n\x10WIFI_UNAVAILABLE\x10\x03\x12\x07\n\x03\x41\x43K\x10\x04\x32S\n\rFlowerService\x12\x42\n\x04Join\x12\x19.flwr.proto.ClientMessage\x1a\x19.flwr.proto.ServerMessage\"\x00(\x01\x30\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1a\x66lwr/proto/transport.proto\x12\nflwr.proto\"9\n\x06Status\x12\x1e\n\x04\x63ode\x18\x01 \x01(\x0e\x32\x10.flwr.proto.Code\x12\x0f\n\x07message\x18\x02 \x01(\t\"2\n\nParameters\x12\x0f\n\x07tensors\x18\x01 \x03(\x0c\x12\x13\n\x0btensor_type\x18\x02 \x01(\t\"\xe5\x08\n\rServerMessage\x12?\n\rreconnect_ins\x18\x01 \x01(\x0b\x32&.flwr.proto.ServerMessage.ReconnectInsH\x00\x12H\n\x12get_properties_ins\x18\x02 \x01(\x0b\x32*.flwr.proto.ServerMessage.GetPropertiesInsH\x00\x12H\n\x12get_parameters_ins\x18\x03 \x01(\x0b\x32*.flwr.proto.ServerMessage.GetParametersInsH\x00\x12\x33\n\x07\x66it_ins\x18\x04 \x01(\x0b\x32 .flwr.proto.ServerMessage.FitInsH\x00\x12=\n\x0c\x65valuate_ins\x18\x05 \x01(\x0b\x32%.flwr.proto.ServerMessage.EvaluateInsH\x00\x12)\n\x05\x63hunk\x18\x06 \x01(\x0b\x32\x18.flwr.proto.MessageChunkH\x00\x1a\x1f\n\x0cReconnectIns\x12\x0f\n\x07seconds\x18\x01 \x01(\x03\x1a\x9d\x01\n\x10GetPropertiesIns\x12\x46\n\x06\x63onfig\x18\x01 \x03(\x0b\x32\x36.flwr.proto.ServerMessage.GetPropertiesIns.ConfigEntry\x1a\x41\n\x0b\x43onfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.flwr.proto.Scalar:\x02\x38\x01\x1a\x9d\x01\n\x10GetParametersIns\x12\x46\n\x06\x63onfig\x18\x01 \x03(\x0b\x32\x36.flwr.proto.ServerMessage.GetParametersIns.ConfigEntry\x1a\x41\n\x0b\x43onfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.flwr.proto.Scalar:\x02\x38\x01\x1a\xb5\x01\n\x06\x46itIns\x12*\n\nparameters\x18\x01 \x01(\x0b\x32\x16.flwr.proto.Parameters\x12<\n\x06\x63onfig\x18\x02 \x03(\x0b\x32,.flwr.proto.ServerMessage.FitIns.ConfigEntry\x1a\x41\n\x0b\x43onfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.flwr.proto.Scalar:\x02\x38\x01\x1a\xbf\x01\n\x0b\x45valuateIns\x12*\n\nparameters\x18\x01 \x01(\x0b\x32\x16.flwr.proto.Parameters\x12\x41\n\x06\x63onfig\x18\x02 \x03(\x0b\x32\x31.flwr.proto.ServerMessage.EvaluateIns.ConfigEntry\x1a\x41\n\x0b\x43onfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.flwr.proto.Scalar:\x02\x38\x01\x42\x05\n\x03msg\"\xcb\t\n\rClientMessage\x12\x41\n\x0e\x64isconnect_res\x18\x01 \x01(\x0b\x32\'.flwr.proto.ClientMessage.DisconnectResH\x00\x12H\n\x12get_properties_res\x18\x02 \x01(\x0b\x32*.flwr.proto.ClientMessage.GetPropertiesResH\x00\x12H\n\x12get_parameters_res\x18\x03 \x01(\x0b\x32*.flwr.proto.ClientMessage.GetParametersResH\x00\x12\x33\n\x07\x66it_res\x18\x04 \x01(\x0b\x32 .flwr.proto.ClientMessage.FitResH\x00\x12=\n\x0c\x65valuate_res\x18\x05 \x01(\x0b\x32%.flwr.proto.ClientMessage.EvaluateResH\x00\x12)\n\x05\x63hunk\x18\x06 \x01(\x0b\x32\x18.flwr.proto.MessageChunkH\x00\x1a\x33\n\rDisconnectRes\x12\"\n\x06reason\x18\x01 \x01(\x0e\x32\x12.flwr.proto.Reason\x1a\xcd\x01\n\x10GetPropertiesRes\x12\"\n\x06status\x18\x01 \x01(\x0b\x32\x12.flwr.proto.Status\x12N\n\nproperties\x18\x02 \x03(\x0b\x32:.flwr.proto.ClientMessage.GetPropertiesRes.PropertiesEntry\x1a\x45\n\x0fPropertiesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.flwr.proto.Scalar:\x02\x38\x01\x1a\x62\n\x10GetParametersRes\x12\"\n\x06status\x18\x01 \x01(\x0b\x32\x12.flwr.proto.Status\x12*\n\nparameters\x18\x02 \x01(\x0b\x32\x16.flwr.proto.Parameters\x1a\xf2\x01\n\x06\x46itRes\x12\"\n\x06status\x18\x01 \x01(\x0b\x32\x12.flwr.proto.Status\x12*\n\nparameters\x18\x02 \x01(\x0b\x32\x16.flwr.proto.Parameters\x12\x14\n\x0cnum_examples\x18\x03 \x01(\x03\x12>\n\x07metrics\x18\x04 \x03(\x0b\x32-.flwr.proto.ClientMessage.FitRes.MetricsEntry\x1a\x42\n\x0cMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.flwr.proto.Scalar:\x02\x38\x01\x1a\xde\x01\n\x0b\x45valuateRes\x12\"\n\x06status\x18\x01 \x01(\x0b\x32\x12.flwr.proto.Status\x12\x0c\n\x04loss\x18\x02 \x01(\x02\x12\x14\n\x0cnum_examples\x18\x03 \x01(\x03\x12\x43\n\x07metrics\x18\x04 \x03(\x0b\x32\x32.flwr.proto.ClientMessage.EvaluateRes.MetricsEntry\x1a\x42\n\x0cMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.flwr.proto.Scalar:\x02\x38\x01\x42\x05\n\x03msg\"0\n\x0cMessageChunk\x12\x12\n\ntotal_size\x18\x01 \x01(\x04\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"i\n\x06Scalar\x12\x10\n\x06\x64ouble\x18\x01 \x01(\x01H\x00\x12\x10\n\x06sint64\x18\x08 \x01(\x12H\x00\x12\x0e\n\x04\x62ool\x18\r \x01(\x08H\x00\x12\x10\n\x06string\x18\x0e \x01(\tH\x00\x12\x0f\n\x05\x62ytes\x18\x0f \x01(\x0cH\x00\x42\x08\n\x06scalar*\x8d\x01\n\x04\x43ode\x12\x06\n\x02OK\x10\x00\x12\"\n\x1eGET_PROPERTIES_NOT_IMPLEMENTED\x10\x01\x12\"\n\x1eGET_PARAMETERS_NOT_IMPLEMENTED\x10\x02\x12\x17\n\x13\x46IT_NOT_IMPLEMENTED\x10\x03\x12\x1c\n\x18\x45VALUATE_NOT_IMPLEMENTED\x10\x04*[\n\x06Reason\x12\x0b\n\x07UNKNOWN\x10\x00\x12\r\n\tRECONNECT\x10\x01\x12\x16\n\x12POWER_DISCONNECTED\x10\x02\x12\x14\n\x10WIFI_UNAVAILABLE\x10\x03\x12\x07\n\x03\x41\x43K\x10\x04\x32S\n\rFlowerService\x12\x42\n\x04Join\x12\x19.flwr.proto.ClientMessage\x1a\x19.flwr.proto.ServerMessage\"\x00(\x01\x30\x01\x62\x06proto3')
 
 _CODE = DESCRIPTOR.enum_types_by_name['Code']
 Code = enum_type_wrapper.EnumTypeWrapper(_CODE)
@@ -54,6 +54,7 @@ _CLIENTMESSAGE_FITRES = _CLIENTMESSAGE.nested_types_by_name['FitRes']
 _CLIENTMESSAGE_FITRES_METRICSENTRY = _CLIENTMESSAGE_FITRES.nested_types_by_name['MetricsEntry']
 _CLIENTMESSAGE_EVALUATERES = _CLIENTMESSAGE.nested_types_by_name['EvaluateRes']
 _CLIENTMESSAGE_EVALUATERES_METRICSENTRY = _CLIENTMESSAGE_EVALUATERES.nested_types_by_name['MetricsEntry']
+_MESSAGECHUNK = DESCRIPTOR.message_types_by_name['MessageChunk']
 _SCALAR = DESCRIPTOR.message_types_by_name['Scalar']
 Status = _reflection.GeneratedProtocolMessageType('Status', (_message.Message,), {
   'DESCRIPTOR' : _STATUS,
@@ -219,6 +220,13 @@ _sym_db.RegisterMessage(ClientMessage.FitRes.MetricsEntry)
 _sym_db.RegisterMessage(ClientMessage.EvaluateRes)
 _sym_db.RegisterMessage(ClientMessage.EvaluateRes.MetricsEntry)
 
+MessageChunk = _reflection.GeneratedProtocolMessageType('MessageChunk', (_message.Message,), {
+  'DESCRIPTOR' : _MESSAGECHUNK,
+  '__module__' : 'flwr.proto.transport_pb2'
+  # @@protoc_insertion_point(class_scope:flwr.proto.MessageChunk)
+  })
+_sym_db.RegisterMessage(MessageChunk)
+
 Scalar = _reflection.GeneratedProtocolMessageType('Scalar', (_message.Message,), {
   'DESCRIPTOR' : _SCALAR,
   '__module__' : 'flwr.proto.transport_pb2'
@@ -244,54 +252,56 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _CLIENTMESSAGE_FITRES_METRICSENTRY._serialized_options = b'8\001'
   _CLIENTMESSAGE_EVALUATERES_METRICSENTRY._options = None
   _CLIENTMESSAGE_EVALUATERES_METRICSENTRY._serialized_options = b'8\001'
-  _CODE._serialized_start=2533
-  _CODE._serialized_end=2674
-  _REASON._serialized_start=2676
-  _REASON._serialized_end=2767
+  _CODE._serialized_start=2669
+  _CODE._serialized_end=2810
+  _REASON._serialized_start=2812
+  _REASON._serialized_end=2903
   _STATUS._serialized_start=42
   _STATUS._serialized_end=99
   _PARAMETERS._serialized_start=101
   _PARAMETERS._serialized_end=151
   _SERVERMESSAGE._serialized_start=154
-  _SERVERMESSAGE._serialized_end=1236
-  _SERVERMESSAGE_RECONNECTINS._serialized_start=500
-  _SERVERMESSAGE_RECONNECTINS._serialized_end=531
-  _SERVERMESSAGE_GETPROPERTIESINS._serialized_start=534
-  _SERVERMESSAGE_GETPROPERTIESINS._serialized_end=691
-  _SERVERMESSAGE_GETPROPERTIESINS_CONFIGENTRY._serialized_start=626
-  _SERVERMESSAGE_GETPROPERTIESINS_CONFIGENTRY._serialized_end=691
-  _SERVERMESSAGE_GETPARAMETERSINS._serialized_start=694
-  _SERVERMESSAGE_GETPARAMETERSINS._serialized_end=851
-  _SERVERMESSAGE_GETPARAMETERSINS_CONFIGENTRY._serialized_start=626
-  _SERVERMESSAGE_GETPARAMETERSINS_CONFIGENTRY._serialized_end=691
-  _SERVERMESSAGE_FITINS._serialized_start=854
-  _SERVERMESSAGE_FITINS._serialized_end=1035
-  _SERVERMESSAGE_FITINS_CONFIGENTRY._serialized_start=626
-  _SERVERMESSAGE_FITINS_CONFIGENTRY._serialized_end=691
-  _SERVERMESSAGE_EVALUATEINS._serialized_start=1038
-  _SERVERMESSAGE_EVALUATEINS._serialized_end=1229
-  _SERVERMESSAGE_EVALUATEINS_CONFIGENTRY._serialized_start=626
-  _SERVERMESSAGE_EVALUATEINS_CONFIGENTRY._serialized_end=691
-  _CLIENTMESSAGE._serialized_start=1239
-  _CLIENTMESSAGE._serialized_end=2423
-  _CLIENTMESSAGE_DISCONNECTRES._serialized_start=1587
-  _CLIENTMESSAGE_DISCONNECTRES._serialized_end=1638
-  _CLIENTMESSAGE_GETPROPERTIESRES._serialized_start=1641
-  _CLIENTMESSAGE_GETPROPERTIESRES._serialized_end=1846
-  _CLIENTMESSAGE_GETPROPERTIESRES_PROPERTIESENTRY._serialized_start=1777
-  _CLIENTMESSAGE_GETPROPERTIESRES_PROPERTIESENTRY._serialized_end=1846
-  _CLIENTMESSAGE_GETPARAMETERSRES._serialized_start=1848
-  _CLIENTMESSAGE_GETPARAMETERSRES._serialized_end=1946
-  _CLIENTMESSAGE_FITRES._serialized_start=1949
-  _CLIENTMESSAGE_FITRES._serialized_end=2191
-  _CLIENTMESSAGE_FITRES_METRICSENTRY._serialized_start=2125
-  _CLIENTMESSAGE_FITRES_METRICSENTRY._serialized_end=2191
-  _CLIENTMESSAGE_EVALUATERES._serialized_start=2194
-  _CLIENTMESSAGE_EVALUATERES._serialized_end=2416
-  _CLIENTMESSAGE_EVALUATERES_METRICSENTRY._serialized_start=2125
-  _CLIENTMESSAGE_EVALUATERES_METRICSENTRY._serialized_end=2191
-  _SCALAR._serialized_start=2425
-  _SCALAR._serialized_end=2530
-  _FLOWERSERVICE._serialized_start=2769
-  _FLOWERSERVICE._serialized_end=2852
+  _SERVERMESSAGE._serialized_end=1279
+  _SERVERMESSAGE_RECONNECTINS._serialized_start=543
+  _SERVERMESSAGE_RECONNECTINS._serialized_end=574
+  _SERVERMESSAGE_GETPROPERTIESINS._serialized_start=577
+  _SERVERMESSAGE_GETPROPERTIESINS._serialized_end=734
+  _SERVERMESSAGE_GETPROPERTIESINS_CONFIGENTRY._serialized_start=669
+  _SERVERMESSAGE_GETPROPERTIESINS_CONFIGENTRY._serialized_end=734
+  _SERVERMESSAGE_GETPARAMETERSINS._serialized_start=737
+  _SERVERMESSAGE_GETPARAMETERSINS._serialized_end=894
+  _SERVERMESSAGE_GETPARAMETERSINS_CONFIGENTRY._serialized_start=669
+  _SERVERMESSAGE_GETPARAMETERSINS_CONFIGENTRY._serialized_end=734
+  _SERVERMESSAGE_FITINS._serialized_start=897
+  _SERVERMESSAGE_FITINS._serialized_end=1078
+  _SERVERMESSAGE_FITINS_CONFIGENTRY._serialized_start=669
+  _SERVERMESSAGE_FITINS_CONFIGENTRY._serialized_end=734
+  _SERVERMESSAGE_EVALUATEINS._serialized_start=1081
+  _SERVERMESSAGE_EVALUATEINS._serialized_end=1272
+  _SERVERMESSAGE_EVALUATEINS_CONFIGENTRY._serialized_start=669
+  _SERVERMESSAGE_EVALUATEINS_CONFIGENTRY._serialized_end=734
+  _CLIENTMESSAGE._serialized_start=1282
+  _CLIENTMESSAGE._serialized_end=2509
+  _CLIENTMESSAGE_DISCONNECTRES._serialized_start=1673
+  _CLIENTMESSAGE_DISCONNECTRES._serialized_end=1724
+  _CLIENTMESSAGE_GETPROPERTIESRES._serialized_start=1727
+  _CLIENTMESSAGE_GETPROPERTIESRES._serialized_end=1932
+  _CLIENTMESSAGE_GETPROPERTIESRES_PROPERTIESENTRY._serialized_start=1863
+  _CLIENTMESSAGE_GETPROPERTIESRES_PROPERTIESENTRY._serialized_end=1932
+  _CLIENTMESSAGE_GETPARAMETERSRES._serialized_start=1934
+  _CLIENTMESSAGE_GETPARAMETERSRES._serialized_end=2032
+  _CLIENTMESSAGE_FITRES._serialized_start=2035
+  _CLIENTMESSAGE_FITRES._serialized_end=2277
+  _CLIENTMESSAGE_FITRES_METRICSENTRY._serialized_start=2211
+  _CLIENTMESSAGE_FITRES_METRICSENTRY._serialized_end=2277
+  _CLIENTMESSAGE_EVALUATERES._serialized_start=2280
+  _CLIENTMESSAGE_EVALUATERES._serialized_end=2502
+  _CLIENTMESSAGE_EVALUATERES_METRICSENTRY._serialized_start=2211
+  _CLIENTMESSAGE_EVALUATERES_METRICSENTRY._serialized_end=2277
+  _MESSAGECHUNK._serialized_start=2511
+  _MESSAGECHUNK._serialized_end=2559
+  _SCALAR._serialized_start=2561
+  _SCALAR._serialized_end=2666
+  _FLOWERSERVICE._serialized_start=2905
+  _FLOWERSERVICE._serialized_end=2988
 # @@protoc_insertion_point(module_scope)
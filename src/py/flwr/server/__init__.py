@@ -24,9 +24,11 @@ from .app import start_server as start_server
 from .client_manager import ClientManager as ClientManager
 from .client_manager import SimpleClientManager as SimpleClientManager
 from .history import History as History
+from .server import AsyncServer as AsyncServer
 from .server import Server as Server
 
 __all__ = [
+    "AsyncServer",
     "ClientManager",
     "History",
     "run_driver_api",
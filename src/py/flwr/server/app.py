@@ -42,13 +42,16 @@ from flwr.proto.driver_pb2_grpc import add_DriverServicer_to_server
 from flwr.proto.fleet_pb2_grpc import add_FleetServicer_to_server
 from flwr.proto.transport_pb2_grpc import add_FlowerServiceServicer_to_server
 from flwr.server.client_manager import ClientManager, SimpleClientManager
+from flwr.server.driver.async_driver_servicer import AsyncDriverServicer
 from flwr.server.driver.driver_servicer import DriverServicer
 from flwr.server.fleet.grpc_bidi.driver_client_manager import DriverClientManager
 from flwr.server.fleet.grpc_bidi.flower_service_servicer import FlowerServiceServicer
 from flwr.server.fleet.grpc_bidi.grpc_server import (
+    generic_create_async_grpc_server,
     generic_create_grpc_server,
     start_grpc_server,
 )
+from flwr.server.fleet.grpc_rere.async_fleet_servicer import AsyncFleetServicer
 from flwr.server.fleet.grpc_rere.fleet_servicer import FleetServicer
 from flwr.server.history import History
 from flwr.server.server import Server
@@ -69,10 +72,18 @@ class ServerConfig:
 
     All attributes have default values which allows users to configure just the ones
     they care about.
+
+    `round_min_results` and `round_deadline` finish a round before all sampled
+    clients responded: after the first `round_min_results` successful results, or
+    `round_deadline` seconds after the instructions were sent. Clients which did not
+    respond by then count as failures, so the strategy has to accept failures (e.g.,
+    `FedAvg(accept_failures=True)`).
     """
 
     num_rounds: int = 1
     round_timeout: Optional[float] = None
+    round_min_results: Optional[int] = None
+    round_deadline: Optional[float] = None
 
 
 def start_server(  # pylint: disable=too-many-arguments,too-many-locals
@@ -96,8 +107,10 @@ def start_server(  # pylint: disable=too-many-arguments,too-many-locals
         thereof. If no instance is provided, then `start_server` will create
         one.
     config : Optional[ServerConfig] (default: None)
-        Currently supported values are `num_rounds` (int, default: 1) and
-        `round_timeout` in seconds (float, default: None).
+        Currently supported values are `num_rounds` (int, default: 1),
+        `round_timeout` in seconds (float, default: None), `round_min_results`
+        (int, default: None), and `round_deadline` in seconds (float, default:
+        None).
     strategy : Optional[flwr.server.Strategy] (default: None).
         An implementation of the abstract base class
         `flwr.server.strategy.Strategy`. If no strategy is provided, then
@@ -222,6 +235,9 @@ def run_fl(
     config: ServerConfig,
 ) -> History:
     """Train a model on the given server and return the History object."""
+    server.set_partial_rounds(
+        min_results=config.round_min_results, deadline=config.round_deadline
+    )
     hist = server.fit(num_rounds=config.num_rounds, timeout=config.round_timeout)
     log(INFO, "app_fit: losses_distributed %s", str(hist.losses_distributed))
     log(INFO, "app_fit: metrics_distributed_fit %s", str(hist.metrics_distributed_fit))
@@ -259,6 +275,7 @@ def run_driver_api() -> None:
         address=address,
         state_factory=state_factory,
         certificates=certificates,
+        use_aio=args.grpc_aio,
     )
 
     # Graceful shutdown
@@ -314,6 +331,8 @@ def run_fleet_api() -> None:
         fleet_thread.start()
         bckg_threads.append(fleet_thread)
     elif args.fleet_api_type == TRANSPORT_TYPE_GRPC_BIDI:
+        if args.grpc_aio:
+            sys.exit("The Fleet API (gRPC-bidi) does not support `--grpc-aio`.")
         address_arg = args.grpc_fleet_api_address
         parsed_address = parse_address(address_arg)
         if not parsed_address:
@@ -337,6 +356,7 @@ def run_fleet_api() -> None:
             address=address,
             state_factory=state_factory,
             certificates=certificates,
+            use_aio=args.grpc_aio,
         )
         grpc_servers.append(fleet_server)
     else:
@@ -381,6 +401,7 @@ def run_server() -> None:
         address=address,
         state_factory=state_factory,
         certificates=certificates,
+        use_aio=args.grpc_aio,
     )
 
     grpc_servers = [driver_server]
@@ -413,6 +434,8 @@ def run_server() -> None:
         fleet_thread.start()
         bckg_threads.append(fleet_thread)
     elif args.fleet_api_type == TRANSPORT_TYPE_GRPC_BIDI:
+        if args.grpc_aio:
+            sys.exit("The Fleet API (gRPC-bidi) does not support `--grpc-aio`.")
         address_arg = args.grpc_bidi_fleet_api_address
         parsed_address = parse_address(address_arg)
         if not parsed_address:
@@ -436,6 +459,7 @@ def run_server() -> None:
             address=address,
             state_factory=state_factory,
             certificates=certificates,
+            use_aio=args.grpc_aio,
         )
         grpc_servers.append(fleet_server)
     else:
@@ -530,19 +554,31 @@ def _run_driver_api_grpc(
     address: str,
     state_factory: StateFactory,
     certificates: Optional[Tuple[bytes, bytes, bytes]],
+    use_aio: bool = False,
 ) -> grpc.Server:
     """Run Driver API (gRPC, request-response)."""
     # Create Driver API gRPC server
-    driver_servicer: grpc.Server = DriverServicer(
-        state_factory=state_factory,
-    )
     driver_add_servicer_to_server_fn = add_DriverServicer_to_server
-    driver_grpc_server = generic_create_grpc_server(
-        servicer_and_add_fn=(driver_servicer, driver_add_servicer_to_server_fn),
-        server_address=address,
-        max_message_length=GRPC_MAX_MESSAGE_LENGTH,
-        certificates=certificates,
-    )
+    if use_aio:
+        driver_grpc_server = generic_create_async_grpc_server(
+            servicer_and_add_fn=(
+                AsyncDriverServicer(state_factory=state_factory),
+                driver_add_servicer_to_server_fn,
+            ),
+            server_address=address,
+            max_message_length=GRPC_MAX_MESSAGE_LENGTH,
+            certificates=certificates,
+        )
+    else:
+        driver_grpc_server = generic_create_grpc_server(
+            servicer_and_add_fn=(
+                DriverServicer(state_factory=state_factory),
+                driver_add_servicer_to_server_fn,
+            ),
+            server_address=address,
+            max_message_length=GRPC_MAX_MESSAGE_LENGTH,
+            certificates=certificates,
+        )
 
     log(INFO, "Flower ECE: Starting Driver API (gRPC-rere) on %s", address)
     driver_grpc_server.start()
@@ -583,19 +619,31 @@ def _run_fleet_api_grpc_rere(
     address: str,
     state_factory: StateFactory,
     certificates: Optional[Tuple[bytes, bytes, bytes]],
+    use_aio: bool = False,
 ) -> grpc.Server:
     """Run Fleet API (gRPC, request-response)."""
     # Create Fleet API gRPC server
-    fleet_servicer = FleetServicer(
-        state=state_factory.state(),
-    )
     fleet_add_servicer_to_server_fn = add_FleetServicer_to_server
-    fleet_grpc_server = generic_create_grpc_server(
-        servicer_and_add_fn=(fleet_servicer, fleet_add_servicer_to_server_fn),
-        server_address=address,
-        max_message_length=GRPC_MAX_MESSAGE_LENGTH,
-        certificates=certificates,
-    )
+    if use_aio:
+        fleet_grpc_server = generic_create_async_grpc_server(
+            servicer_and_add_fn=(
+                AsyncFleetServicer(state=state_factory.state()),
+                fleet_add_servicer_to_server_fn,
+            ),
+            server_address=address,
+            max_message_length=GRPC_MAX_MESSAGE_LENGTH,
+            certificates=certificates,
+        )
+    else:
+        fleet_grpc_server = generic_create_grpc_server(
+            servicer_and_add_fn=(
+                FleetServicer(state=state_factory.state()),
+                fleet_add_servicer_to_server_fn,
+            ),
+            server_address=address,
+            max_message_length=GRPC_MAX_MESSAGE_LENGTH,
+            certificates=certificates,
+        )
 
     log(INFO, "Flower ECE: Starting Fleet API (gRPC-rere) on %s", address)
     fleet_grpc_server.start()
@@ -751,6 +799,14 @@ def _add_args_common(parser: argparse.ArgumentParser) -> None:
         "Flower will just create a state in memory.",
         default=DATABASE,
     )
+    parser.add_argument(
+        "--grpc-aio",
+        action="store_true",
+        help="Serve the Driver API and the Fleet API (gRPC-rere) from an asyncio "
+        "event loop (grpc.aio) instead of a thread pool, such that idle connections "
+        "and waiting requests do not occupy a thread. Not supported by the Fleet "
+        "API (gRPC-bidi).",
+    )
 
 
 def _add_args_driver_api(parser: argparse.ArgumentParser) -> None:
@@ -0,0 +1,111 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Awaitable interface of Flower client proxies."""
+
+
+import asyncio
+from concurrent.futures import Executor, Future
+from functools import partial
+from typing import Callable, Optional, TypeVar
+
+from flwr.common import (
+    DisconnectRes,
+    EvaluateIns,
+    EvaluateRes,
+    FitIns,
+    FitRes,
+    GetParametersIns,
+    GetParametersRes,
+    GetPropertiesIns,
+    GetPropertiesRes,
+    ReconnectIns,
+)
+
+from .client_proxy import ClientProxy
+
+T = TypeVar("T")
+
+
+class AsyncClientProxy:
+    """Awaitable interface of a `ClientProxy`.
+
+    Instructions are sent with the non-blocking methods of the proxy (e.g.,
+    `ClientProxy.submit_fit`), such that awaiting the result does not occupy a
+    thread. Proxies which do not support them, e.g., custom proxies, are called on
+    `executor` instead.
+
+    Parameters
+    ----------
+    client : ClientProxy
+        The proxy to send instructions with.
+    executor : Optional[Executor] (default: None)
+        The executor to call blocking proxy methods on. If `None`, the default
+        executor of the event loop is used.
+    """
+
+    def __init__(self, client: ClientProxy, executor: Optional[Executor] = None):
+        self.client = client
+        self.executor = executor
+
+    async def get_properties(
+        self, ins: GetPropertiesIns, timeout: Optional[float]
+    ) -> GetPropertiesRes:
+        """Return the client's properties."""
+        return await self._call(
+            lambda: None, partial(self.client.get_properties, ins, timeout)
+        )
+
+    async def get_parameters(
+        self, ins: GetParametersIns, timeout: Optional[float]
+    ) -> GetParametersRes:
+        """Return the current local model parameters."""
+        return await self._call(
+            lambda: None, partial(self.client.get_parameters, ins, timeout)
+        )
+
+    async def fit(self, ins: FitIns, timeout: Optional[float]) -> FitRes:
+        """Refine the provided parameters using the locally held dataset."""
+        return await self._call(
+            partial(self.client.submit_fit, ins, timeout),
+            partial(self.client.fit, ins, timeout),
+        )
+
+    async def evaluate(self, ins: EvaluateIns, timeout: Optional[float]) -> EvaluateRes:
+        """Evaluate the provided parameters using the locally held dataset."""
+        return await self._call(
+            partial(self.client.submit_evaluate, ins, timeout),
+            partial(self.client.evaluate, ins, timeout),
+        )
+
+    async def reconnect(
+        self, ins: ReconnectIns, timeout: Optional[float]
+    ) -> DisconnectRes:
+        """Disconnect and (optionally) reconnect later."""
+        return await self._call(
+            partial(self.client.submit_reconnect, ins, timeout),
+            partial(self.client.reconnect, ins, timeout),
+        )
+
+    async def _call(
+        self,
+        submit_fn: Callable[[], "Optional[Future[T]]"],
+        call_fn: Callable[[], T],
+    ) -> T:
+        """Await the future of `submit_fn`, or run `call_fn` if there is none."""
+        future = submit_fn()
+        if future is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, call_fn)
+        return await asyncio.wrap_future(future)
@@ -0,0 +1,101 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Round-scoped cache for instructions broadcast to many clients.
+
+Strategies usually send the same `FitIns`/`EvaluateIns` (i.e., the same global model
+parameters and config) to all clients sampled in a round. Transport-specific client
+proxies use this cache to convert such instructions into their wire format (e.g., a
+`ServerMessage` protobuf) once per round instead of once per client.
+"""
+
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple, TypeVar, Union
+
+from flwr.common import EvaluateIns, FitIns
+
+from .client_proxy import ClientProxy
+
+T = TypeVar("T")
+
+BroadcastIns = Union[FitIns, EvaluateIns]
+CacheKey = Tuple[type, int, int]
+
+
+class _CacheEntry:
+    """Value shared by all clients receiving instructions with the same key."""
+
+    def __init__(self, ins: BroadcastIns) -> None:
+        # Keep a reference to the instructions so that the ids in the key stay valid
+        self.ins = ins
+        self.lock = threading.Lock()
+        self.value: Any = None
+        self.created = False
+
+
+_lock = threading.Lock()
+_entries: Dict[CacheKey, _CacheEntry] = {}
+
+
+def _cache_key(ins: BroadcastIns) -> CacheKey:
+    return type(ins), id(ins.parameters), id(ins.config)
+
+
+@contextmanager
+def broadcast_cache(
+    client_instructions: Sequence[Tuple[ClientProxy, BroadcastIns]]
+) -> Iterator[None]:
+    """Share converted instructions between clients for the duration of a round.
+
+    Only instructions whose `Parameters` and config objects are shared by more than
+    one client are cached. All cached values are released on exit.
+    """
+    counts: Dict[CacheKey, int] = {}
+    for _, ins in client_instructions:
+        key = _cache_key(ins)
+        counts[key] = counts.get(key, 0) + 1
+    registered: List[CacheKey] = []
+    with _lock:
+        for _, ins in client_instructions:
+            key = _cache_key(ins)
+            if counts[key] > 1 and key not in _entries:
+                _entries[key] = _CacheEntry(ins)
+                registered.append(key)
+    try:
+        yield
+    finally:
+        with _lock:
+            for key in registered:
+                del _entries[key]
+
+
+def get_or_create(ins: BroadcastIns, create_fn: Callable[[], T]) -> T:
+    """Return the value cached for `ins`, calling `create_fn` to create it once.
+
+    If `ins` is not broadcast to several clients in the current round, the value is
+    created without being cached. Cached values are shared between threads and must
+    be treated as read-only.
+    """
+    with _lock:
+        entry = _entries.get(_cache_key(ins))
+    if entry is None:
+        return create_fn()
+    with entry.lock:
+        if not entry.created:
+            entry.value = create_fn()
+            entry.created = True
+        value: T = entry.value
+        return value
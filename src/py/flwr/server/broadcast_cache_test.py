@@ -0,0 +1,72 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for the round-scoped broadcast cache."""
+
+
+from unittest.mock import MagicMock
+
+from flwr.common import FitIns, Parameters
+
+from .broadcast_cache import broadcast_cache, get_or_create
+
+
+def _fit_ins() -> FitIns:
+    return FitIns(parameters=Parameters(tensors=[b"abc"], tensor_type=""), config={})
+
+
+def test_shared_ins_created_once() -> None:
+    """Test that instructions sent to several clients are converted once."""
+    # Prepare
+    ins = _fit_ins()
+    create_fn = MagicMock(return_value="msg")
+
+    # Execute
+    with broadcast_cache([(MagicMock(), ins), (MagicMock(), ins)]):
+        first = get_or_create(ins, create_fn)
+        second = get_or_create(ins, create_fn)
+
+    # Assert
+    assert first == second == "msg"
+    assert create_fn.call_count == 1
+
+
+def test_unshared_ins_not_cached() -> None:
+    """Test that instructions sent to a single client are not cached."""
+    # Prepare
+    ins = _fit_ins()
+    create_fn = MagicMock(return_value="msg")
+
+    # Execute
+    with broadcast_cache([(MagicMock(), ins), (MagicMock(), _fit_ins())]):
+        get_or_create(ins, create_fn)
+        get_or_create(ins, create_fn)
+
+    # Assert
+    assert create_fn.call_count == 2
+
+
+def test_entries_released_on_exit() -> None:
+    """Test that cached values do not outlive the round."""
+    # Prepare
+    ins = _fit_ins()
+    create_fn = MagicMock(return_value="msg")
+    with broadcast_cache([(MagicMock(), ins), (MagicMock(), ins)]):
+        get_or_create(ins, create_fn)
+
+    # Execute
+    get_or_create(ins, create_fn)
+
+    # Assert
+    assert create_fn.call_count == 2
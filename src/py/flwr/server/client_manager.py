@@ -19,7 +19,7 @@ import random
 import threading
 from abc import ABC, abstractmethod
 from logging import INFO
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from flwr.common.logger import log
 
@@ -83,12 +83,37 @@ class ClientManager(ABC):
     ) -> List[ClientProxy]:
         """Sample a number of Flower ClientProxy instances."""
 
+    def mark_slow(self, client: ClientProxy) -> None:
+        """Mark a client which did not respond before its round finished.
+
+        The default implementation ignores it.
+
+        Parameters
+        ----------
+        client : flwr.server.client_proxy.ClientProxy
+        """
+
+    def mark_timely(self, client: ClientProxy) -> None:
+        """Mark a client which responded before its round finished.
+
+        The default implementation ignores it.
+
+        Parameters
+        ----------
+        client : flwr.server.client_proxy.ClientProxy
+        """
+
 
 class SimpleClientManager(ClientManager):
-    """Provides a pool of available clients."""
+    """Provides a pool of available clients.
+
+    Clients marked as slow are only sampled if there are not enough other clients
+    available, until they respond in time again or reconnect.
+    """
 
     def __init__(self) -> None:
         self.clients: Dict[str, ClientProxy] = {}
+        self.slow_cids: Set[str] = set()
         self._cv = threading.Condition()
 
     def __len__(self) -> int:
@@ -164,16 +189,37 @@ class SimpleClientManager(ClientManager):
         ----------
         client : flwr.server.client_proxy.ClientProxy
         """
-        if client.cid in self.clients:
-            del self.clients[client.cid]
-
-            with self._cv:
+        with self._cv:
+            self.slow_cids.discard(client.cid)
+            if client.cid in self.clients:
+                del self.clients[client.cid]
                 self._cv.notify_all()
 
     def all(self) -> Dict[str, ClientProxy]:
         """Return all available clients."""
         return self.clients
 
+    def mark_slow(self, client: ClientProxy) -> None:
+        """Add the ID of a client to `slow_cids`.
+
+        Parameters
+        ----------
+        client : flwr.server.client_proxy.ClientProxy
+        """
+        with self._cv:
+            if client.cid in self.clients:
+                self.slow_cids.add(client.cid)
+
+    def mark_timely(self, client: ClientProxy) -> None:
+        """Remove the ID of a client from `slow_cids`.
+
+        Parameters
+        ----------
+        client : flwr.server.client_proxy.ClientProxy
+        """
+        with self._cv:
+            self.slow_cids.discard(client.cid)
+
     def sample(
         self,
         num_clients: int,
@@ -202,5 +248,10 @@ class SimpleClientManager(ClientManager):
             )
             return []
 
-        sampled_cids = random.sample(available_cids, num_clients)
+        # Prefer clients which responded in time, fill up with slow ones
+        with self._cv:
+            timely_cids = [cid for cid in available_cids if cid not in self.slow_cids]
+            slow_cids = [cid for cid in available_cids if cid in self.slow_cids]
+        sampled_cids = random.sample(timely_cids, min(num_clients, len(timely_cids)))
+        sampled_cids += random.sample(slow_cids, num_clients - len(sampled_cids))
         return [self.clients[cid] for cid in sampled_cids]
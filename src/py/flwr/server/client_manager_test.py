@@ -53,3 +53,42 @@ def test_simple_client_manager_unregister() -> None:
 
     # Assert
     assert len(client_manager) == 0
+
+
+def test_simple_client_manager_mark_slow() -> None:
+    """Tests if slow clients are tracked until they unregister."""
+    # Prepare
+    client = GrpcClientProxy(cid="1", bridge=MagicMock())
+    unknown_client = GrpcClientProxy(cid="2", bridge=MagicMock())
+    client_manager = SimpleClientManager()
+    client_manager.register(client)
+
+    # Execute
+    client_manager.mark_slow(client)
+    client_manager.mark_slow(unknown_client)
+    slow_cids = set(client_manager.slow_cids)
+    client_manager.unregister(client)
+
+    # Assert
+    assert slow_cids == {"1"}
+    assert not client_manager.slow_cids
+
+
+def test_simple_client_manager_sample_prefers_timely_clients() -> None:
+    """Tests if slow clients are only sampled when needed until they are timely."""
+    # Prepare
+    clients = [GrpcClientProxy(cid=str(cid), bridge=MagicMock()) for cid in range(3)]
+    client_manager = SimpleClientManager()
+    for client in clients:
+        client_manager.register(client)
+    client_manager.mark_slow(clients[0])
+
+    # Execute
+    sampled_two = client_manager.sample(num_clients=2)
+    sampled_three = client_manager.sample(num_clients=3)
+    client_manager.mark_timely(clients[0])
+
+    # Assert
+    assert {client.cid for client in sampled_two} == {"1", "2"}
+    assert {client.cid for client in sampled_three} == {"0", "1", "2"}
+    assert not client_manager.slow_cids
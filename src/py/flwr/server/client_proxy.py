@@ -16,6 +16,7 @@
 
 
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from typing import Optional
 
 from flwr.common import (
@@ -81,3 +82,49 @@ class ClientProxy(ABC):
         timeout: Optional[float],
     ) -> DisconnectRes:
         """Disconnect and (optionally) reconnect later."""
+
+    def cancel(self) -> None:
+        """Cancel the instructions the client did not respond to in time.
+
+        Called for clients which were too late to be included in a round, such that they
+        can stop waiting for the result. Does nothing by default.
+        """
+
+    # pylint: disable-next=unused-argument
+    def submit_fit(
+        self,
+        ins: FitIns,
+        timeout: Optional[float],
+    ) -> "Optional[Future[FitRes]]":
+        """Start `fit` without blocking and return a future for its result.
+
+        Returns `None` if the proxy can only wait for the result in `fit`, in which
+        case the caller has to call `fit` on a separate thread.
+        """
+        return None
+
+    # pylint: disable-next=unused-argument
+    def submit_evaluate(
+        self,
+        ins: EvaluateIns,
+        timeout: Optional[float],
+    ) -> "Optional[Future[EvaluateRes]]":
+        """Start `evaluate` without blocking and return a future for its result.
+
+        Returns `None` if the proxy can only wait for the result in `evaluate`, in
+        which case the caller has to call `evaluate` on a separate thread.
+        """
+        return None
+
+    # pylint: disable-next=unused-argument
+    def submit_reconnect(
+        self,
+        ins: ReconnectIns,
+        timeout: Optional[float],
+    ) -> "Optional[Future[DisconnectRes]]":
+        """Start `reconnect` without blocking and return a future for its result.
+
+        Returns `None` if the proxy can only wait for the result in `reconnect`, in
+        which case the caller has to call `reconnect` on a separate thread.
+        """
+        return None
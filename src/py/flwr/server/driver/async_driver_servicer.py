@@ -0,0 +1,138 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Driver API servicer (asyncio)."""
+
+
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from logging import INFO
+from typing import Callable, List, Optional, Set, TypeVar
+from uuid import UUID
+
+import grpc
+
+from flwr.common.constant import PULL_MAX_TIMEOUT
+from flwr.common.logger import log
+from flwr.proto.driver_pb2 import (
+    CreateWorkloadRequest,
+    CreateWorkloadResponse,
+    GetNodesRequest,
+    GetNodesResponse,
+    PullTaskResRequest,
+    PullTaskResResponse,
+    PushTaskInsRequest,
+    PushTaskInsResponse,
+)
+from flwr.proto.task_pb2 import TaskRes
+from flwr.server.state import State, StateFactory
+from flwr.server.state.task_notifier import task_res_key
+
+from .driver_servicer import DriverServicer
+
+T = TypeVar("T")
+
+
+class AsyncDriverServicer:
+    """Driver API servicer for a `grpc.aio` server.
+
+    Requests are handled like in `DriverServicer`, but in an event loop, such that
+    pull requests waiting for results do not occupy a thread. State access, which may
+    block, runs in `executor`.
+
+    Parameters
+    ----------
+    state_factory : StateFactory
+        The factory of the state shared with the Fleet API.
+    executor : Optional[Executor] (default: None)
+        The executor to access the state in. If `None`, the default executor of the
+        event loop is used.
+    """
+
+    def __init__(
+        self, state_factory: StateFactory, executor: Optional[Executor] = None
+    ) -> None:
+        self.state_factory = state_factory
+        self.executor = executor
+        self._servicer = DriverServicer(state_factory=state_factory)
+
+    async def GetNodes(
+        self, request: GetNodesRequest, context: grpc.aio.ServicerContext
+    ) -> GetNodesResponse:
+        """Get available nodes."""
+        return await self._run(partial(self._servicer.GetNodes, request, context))
+
+    async def CreateWorkload(
+        self, request: CreateWorkloadRequest, context: grpc.aio.ServicerContext
+    ) -> CreateWorkloadResponse:
+        """Create workload ID."""
+        return await self._run(partial(self._servicer.CreateWorkload, request, context))
+
+    async def PushTaskIns(
+        self, request: PushTaskInsRequest, context: grpc.aio.ServicerContext
+    ) -> PushTaskInsResponse:
+        """Push a set of TaskIns."""
+        return await self._run(partial(self._servicer.PushTaskIns, request, context))
+
+    async def PullTaskRes(
+        self, request: PullTaskResRequest, context: grpc.aio.ServicerContext
+    ) -> PullTaskResResponse:
+        """Pull a set of TaskRes."""
+        log(INFO, "AsyncDriverServicer.PullTaskRes")
+
+        # Convert each task_id str to UUID
+        task_ids: Set[UUID] = {UUID(task_id) for task_id in request.task_ids}
+
+        # Init state
+        state: State = self.state_factory.state()
+
+        # Register callback
+        def on_rpc_done(_: grpc.aio.ServicerContext) -> None:
+            log(
+                INFO, "AsyncDriverServicer.PullTaskRes callback: delete TaskIns/TaskRes"
+            )
+
+            if context.cancelled() or context.code() != grpc.StatusCode.OK:
+                return
+
+            # Delete delivered TaskIns and TaskRes
+            asyncio.ensure_future(
+                self._run(partial(state.delete_tasks, task_ids=task_ids))
+            )
+
+        context.add_done_callback(on_rpc_done)
+
+        # Read from state, waiting for results in the event loop if requested
+        async def fetch() -> List[TaskRes]:
+            return await self._run(
+                partial(state.get_task_res, task_ids=task_ids, limit=None)
+            )
+
+        timeout = min(request.timeout, PULL_MAX_TIMEOUT)
+        if state.task_notifier is None or timeout <= 0 or not task_ids:
+            task_res_list = await fetch()
+        else:
+            task_res_list = await state.task_notifier.async_wait_for(
+                keys=[task_res_key(str(task_id)) for task_id in task_ids],
+                fetch_fn=fetch,
+                timeout=timeout,
+            )
+
+        context.set_code(grpc.StatusCode.OK)
+        return PullTaskResResponse(task_res_list=task_res_list)
+
+    async def _run(self, fn: Callable[[], T]) -> T:
+        """Call `fn` in the executor."""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn)
@@ -21,6 +21,7 @@ from uuid import UUID
 
 import grpc
 
+from flwr.common.constant import PULL_MAX_TIMEOUT
 from flwr.common.logger import log
 from flwr.proto import driver_pb2_grpc
 from flwr.proto.driver_pb2 import (
@@ -117,8 +118,12 @@ class DriverServicer(driver_pb2_grpc.DriverServicer):
 
         context.add_callback(on_rpc_done)
 
-        # Read from state
-        task_res_list: List[TaskRes] = state.get_task_res(task_ids=task_ids, limit=None)
+        # Read from state, waiting for results if the driver asked to
+        task_res_list: List[TaskRes] = state.get_task_res_or_wait(
+            task_ids=task_ids,
+            limit=None,
+            timeout=min(request.timeout, PULL_MAX_TIMEOUT),
+        )
 
         context.set_code(grpc.StatusCode.OK)
         return PullTaskResResponse(task_res_list=task_res_list)
@@ -24,6 +24,13 @@ from typing import Callable, Iterator
 import grpc
 from iterators import TimeoutIterator
 
+from flwr.common import GRPC_MAX_MESSAGE_LENGTH
+from flwr.common.chunk import (
+    MAX_CHUNKED_MESSAGE_LENGTH,
+    chunk_messages,
+    dechunk_messages,
+    max_chunk_size,
+)
 from flwr.proto import transport_pb2_grpc
 from flwr.proto.transport_pb2 import ClientMessage, ServerMessage
 from flwr.server.client_manager import ClientManager
@@ -68,10 +75,15 @@ class FlowerServiceServicer(transport_pb2_grpc.FlowerServiceServicer):
         grpc_client_proxy_factory: Callable[
             [str, GrpcBridge], GrpcClientProxy
         ] = default_grpc_client_proxy_factory,
+        max_message_length: int = GRPC_MAX_MESSAGE_LENGTH,
+        max_chunked_message_length: int = MAX_CHUNKED_MESSAGE_LENGTH,
     ) -> None:
         self.client_manager: ClientManager = client_manager
         self.grpc_bridge_factory = grpc_bridge_factory
         self.client_proxy_factory = grpc_client_proxy_factory
+        self.chunk_size = max_chunk_size(max_message_length)
+        # Chunked client messages announcing a larger size are rejected
+        self.max_chunked_message_length = max_chunked_message_length
 
     def Join(  # pylint: disable=invalid-name
         self,
@@ -87,6 +99,8 @@ class FlowerServiceServicer(transport_pb2_grpc.FlowerServiceServicer):
         - Both `ServerMessage` and `ClientMessage` are message "wrappers"
           wrapping the actual message
         - The `Join` method is (pretty much) unaware of the protocol
+        - Messages exceeding the maximum message length are sent as a sequence
+          of `chunk` messages
         """
         peer: str = context.peer()
         bridge = self.grpc_bridge_factory()
@@ -96,7 +110,10 @@ class FlowerServiceServicer(transport_pb2_grpc.FlowerServiceServicer):
         if is_success:
             # Get iterators
             client_message_iterator = TimeoutIterator(
-                iterator=request_iterator, reset_on_next=True
+                iterator=dechunk_messages(
+                    request_iterator, ClientMessage, self.max_chunked_message_length
+                ),
+                reset_on_next=True,
             )
             ins_wrapper_iterator = bridge.ins_wrapper_iterator()
 
@@ -105,7 +122,11 @@ class FlowerServiceServicer(transport_pb2_grpc.FlowerServiceServicer):
                 try:
                     # Get ins_wrapper from bridge and yield server_message
                     ins_wrapper: InsWrapper = next(ins_wrapper_iterator)
-                    yield ins_wrapper.server_message
+                    yield from chunk_messages(
+                        [ins_wrapper.server_message],
+                        self.chunk_size,
+                        lambda chunk: ServerMessage(chunk=chunk),
+                    )
 
                     # Set current timeout, might be None
                     if ins_wrapper.timeout is not None:
@@ -136,3 +157,9 @@ class FlowerServiceServicer(transport_pb2_grpc.FlowerServiceServicer):
                     )
                 except StopIteration:
                     break
+                except ValueError as err:
+                    # Invalid or too large chunked client message
+                    context.abort(
+                        code=grpc.StatusCode.INVALID_ARGUMENT, details=str(err)
+                    )
+                    return
@@ -15,10 +15,11 @@
 """Provides class GrpcBridge."""
 
 
+from concurrent.futures import Future
 from dataclasses import dataclass
-from enum import Enum
-from threading import Condition
-from typing import Iterator, Optional
+from queue import SimpleQueue
+from threading import Lock
+from typing import Iterator, List, Optional, Tuple
 
 from flwr.proto.transport_pb2 import ClientMessage, ServerMessage
 
@@ -42,145 +43,96 @@ class GrpcBridgeClosed(Exception):
     """Error signaling that GrpcBridge is closed."""
 
 
-class Status(Enum):
-    """Status through which the bridge can transition."""
-
-    AWAITING_INS_WRAPPER = 1
-    INS_WRAPPER_AVAILABLE = 2
-    AWAITING_RES_WRAPPER = 3
-    RES_WRAPPER_AVAILABLE = 4
-    CLOSED = 5
-
-
 class GrpcBridge:
-    """GrpcBridge holding res_wrapper and ins_wrapper.
+    """GrpcBridge passing instructions to a client stream and results back.
 
-    For understanding this class it is recommended to understand how
-    the threading.Condition class works. See here:
-    - https://docs.python.org/3/library/threading.html#condition-objects
+    `request` queues an instruction and returns a future for its result, so callers
+    do not need a thread per client to wait. The stream handler takes one
+    instruction at a time from `ins_wrapper_iterator` and completes its future with
+    `set_res_wrapper` once the client has answered.
     """
 
     def __init__(self) -> None:
         """Init bridge."""
-        # Disable all unsubscriptable-object violations in __init__ method
-        # pylint: disable=unsubscriptable-object
-        self._cv = Condition()  # cv stands for condition variable
-        self._status = Status.AWAITING_INS_WRAPPER
-        self._ins_wrapper: Optional[InsWrapper] = None
-        self._res_wrapper: Optional[ResWrapper] = None
-
-    def _is_closed(self) -> bool:
-        """Return True if closed and False otherwise."""
-        return self._status == Status.CLOSED
+        self._lock = Lock()
+        self._closed = False
+        # `None` wakes up `ins_wrapper_iterator` when the bridge is closed
+        self._queue: "SimpleQueue[Optional[Tuple[InsWrapper, Future[ResWrapper]]]]"
+        self._queue = SimpleQueue()
+        self._current: "Optional[Future[ResWrapper]]" = None
 
     def _raise_if_closed(self) -> None:
-        if self._status == Status.CLOSED:
+        if self._closed:
             raise GrpcBridgeClosed()
 
-    def _transition(self, next_status: Status) -> None:
-        """Validate status transition and set next status.
-
-        The caller of the transition method will have to aquire conditional variable.
-        """
-        if next_status == Status.CLOSED:
-            self._status = next_status
-        elif (
-            self._status == Status.AWAITING_INS_WRAPPER
-            and next_status == Status.INS_WRAPPER_AVAILABLE
-            and self._ins_wrapper is not None
-            and self._res_wrapper is None
-        ):
-            self._status = next_status
-        elif (
-            self._status == Status.INS_WRAPPER_AVAILABLE
-            and next_status == Status.AWAITING_RES_WRAPPER
-            and self._ins_wrapper is None
-            and self._res_wrapper is None
-        ):
-            self._status = next_status
-        elif (
-            self._status == Status.AWAITING_RES_WRAPPER
-            and next_status == Status.RES_WRAPPER_AVAILABLE
-            and self._ins_wrapper is None
-            and self._res_wrapper is not None
-        ):
-            self._status = next_status
-        elif (
-            self._status == Status.RES_WRAPPER_AVAILABLE
-            and next_status == Status.AWAITING_INS_WRAPPER
-            and self._ins_wrapper is None
-            and self._res_wrapper is None
-        ):
-            self._status = next_status
-        else:
-            raise Exception(f"Invalid transition: {self._status} to {next_status}")
-
-        self._cv.notify_all()
-
     def close(self) -> None:
-        """Set bridge status to closed."""
-        with self._cv:
-            self._transition(Status.CLOSED)
-
-    def request(self, ins_wrapper: InsWrapper) -> ResWrapper:
-        """Set ins_wrapper and wait for res_wrapper."""
-        # Set ins_wrapper and transition to INS_WRAPPER_AVAILABLE
-        with self._cv:
-            self._raise_if_closed()
-
-            if self._status != Status.AWAITING_INS_WRAPPER:
-                raise Exception("This should not happen")
-
-            self._ins_wrapper = ins_wrapper  # Write
-            self._transition(Status.INS_WRAPPER_AVAILABLE)
-
-        # Read res_wrapper and transition to AWAITING_INS_WRAPPER
-        with self._cv:
-            self._cv.wait_for(
-                lambda: self._status in [Status.CLOSED, Status.RES_WRAPPER_AVAILABLE]
-            )
-
-            self._raise_if_closed()
-            res_wrapper = self._res_wrapper  # Read
-            self._res_wrapper = None  # Reset
-            self._transition(Status.AWAITING_INS_WRAPPER)
-
-        if res_wrapper is None:
-            raise Exception("ResWrapper can not be None")
-
-        return res_wrapper
+        """Close the bridge and fail all unanswered requests."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            futures: "List[Future[ResWrapper]]" = []
+            if self._current is not None:
+                futures.append(self._current)
+                self._current = None
+            while not self._queue.empty():
+                item = self._queue.get()
+                if item is not None:
+                    futures.append(item[1])
+            self._queue.put(None)
+
+        for future in futures:
+            _set_closed(future)
+
+    def request(self, ins_wrapper: InsWrapper) -> "Future[ResWrapper]":
+        """Queue ins_wrapper and return a future for the res_wrapper.
+
+        The future fails with `GrpcBridgeClosed` if the bridge is closed before the
+        client answers.
+        """
+        future: "Future[ResWrapper]" = Future()
+        with self._lock:
+            if not self._closed:
+                self._queue.put((ins_wrapper, future))
+                return future
+        _set_closed(future)
+        return future
 
     def ins_wrapper_iterator(self) -> Iterator[InsWrapper]:
         """Return iterator over ins_wrapper objects."""
-        while not self._is_closed():
-            with self._cv:
-                self._cv.wait_for(
-                    lambda: self._status
-                    in [Status.CLOSED, Status.INS_WRAPPER_AVAILABLE]
-                )
-
-                self._raise_if_closed()
-
-                ins_wrapper = self._ins_wrapper  # Read
-                self._ins_wrapper = None  # Reset
-
-                # Transition before yielding as after the yield the execution of this
-                # function is paused and will resume when next is called again.
-                # Also release condition variable by exiting the context
-                self._transition(Status.AWAITING_RES_WRAPPER)
-
-            if ins_wrapper is None:
-                raise Exception("InsWrapper can not be None")
+        while not self._closed:
+            item = self._queue.get()
+            with self._lock:
+                if item is None or self._closed:
+                    if item is not None:
+                        _set_closed(item[1])
+                    raise GrpcBridgeClosed()
+
+                ins_wrapper, future = item
+                if not future.set_running_or_notify_cancel():
+                    # The caller is no longer interested in the result
+                    continue
+                self._current = future
 
             yield ins_wrapper
 
     def set_res_wrapper(self, res_wrapper: ResWrapper) -> None:
-        """Set res_wrapper for consumption."""
-        with self._cv:
+        """Complete the pending request with res_wrapper."""
+        with self._lock:
             self._raise_if_closed()
 
-            if self._status != Status.AWAITING_RES_WRAPPER:
-                raise Exception("This should not happen")
+            future = self._current
+            self._current = None
+
+        if future is None:
+            raise Exception("This should not happen")
+
+        future.set_result(res_wrapper)
+
 
-            self._res_wrapper = res_wrapper  # Write
-            self._transition(Status.RES_WRAPPER_AVAILABLE)
+def _set_closed(future: "Future[ResWrapper]") -> None:
+    """Fail future with GrpcBridgeClosed unless it was cancelled."""
+    if future.cancelled():
+        return
+    if future.running() or future.set_running_or_notify_cancel():
+        future.set_exception(GrpcBridgeClosed())
@@ -19,7 +19,7 @@ import time
 from threading import Thread
 from typing import List, Union
 
-from flwr.proto.transport_pb2 import ClientMessage, ServerMessage
+from flwr.proto.transport_pb2 import ClientMessage, Reason, ServerMessage
 from flwr.server.fleet.grpc_bidi.grpc_bridge import (
     GrpcBridge,
     GrpcBridgeClosed,
@@ -40,7 +40,7 @@ def start_worker(
             try:
                 res_wrapper = bridge.request(
                     InsWrapper(server_message=ServerMessage(), timeout=None)
-                )
+                ).result()
             except GrpcBridgeClosed:
                 break
 
@@ -102,7 +102,7 @@ def test_workflow_close() -> None:
             bridge.set_res_wrapper(ResWrapper(client_message=ClientMessage()))
 
             # Close the bridge after the third client message is set.
-            # This might interrupt consumption of the message.
+            # The third message was delivered and is still received.
             if i == 2:
                 # As the bridge is closed while ins_wrapper_iterator is not
                 # waiting/blocking for next message it should raise StopIteration
@@ -120,7 +120,7 @@ def test_workflow_close() -> None:
     worker_thread.join(timeout=1)
 
     # Assert
-    assert len(client_messages_received) == 2
+    assert len(client_messages_received) == 3
     assert isinstance(raised_error, StopIteration)
 
 
@@ -173,3 +173,50 @@ def test_ins_wrapper_iterator_close_while_blocking() -> None:
     # Assert
     assert len(client_messages_received) == 2
     assert isinstance(raised_error, GrpcBridgeClosed)
+
+
+def test_request_does_not_block() -> None:
+    """Test that requests are queued and answered in order."""
+    # Prepare
+    bridge = GrpcBridge()
+    ins_wrapper_iterator = bridge.ins_wrapper_iterator()
+
+    # Execute
+    futures = [
+        bridge.request(InsWrapper(server_message=ServerMessage(), timeout=None))
+        for _ in range(2)
+    ]
+    pending = [not future.done() for future in futures]
+    client_messages = [
+        ClientMessage(disconnect_res=ClientMessage.DisconnectRes(reason=reason))
+        for reason in [Reason.RECONNECT, Reason.POWER_DISCONNECTED]
+    ]
+    for client_message in client_messages:
+        _ = next(ins_wrapper_iterator)
+        bridge.set_res_wrapper(ResWrapper(client_message=client_message))
+
+    # Assert
+    assert pending == [True, True]
+    assert [future.result().client_message for future in futures] == client_messages
+
+
+def test_close_fails_pending_requests() -> None:
+    """Test that closing the bridge fails all unanswered requests."""
+    # Prepare
+    bridge = GrpcBridge()
+    ins_wrapper_iterator = bridge.ins_wrapper_iterator()
+    futures = [
+        bridge.request(InsWrapper(server_message=ServerMessage(), timeout=None))
+        for _ in range(2)
+    ]
+    _ = next(ins_wrapper_iterator)
+
+    # Execute
+    bridge.close()
+    closed_future = bridge.request(
+        InsWrapper(server_message=ServerMessage(), timeout=None)
+    )
+
+    # Assert
+    for future in futures + [closed_future]:
+        assert isinstance(future.exception(timeout=1), GrpcBridgeClosed)
@@ -15,11 +15,14 @@
 """Flower ClientProxy implementation using gRPC bidirectional streaming."""
 
 
+from concurrent.futures import Future
 from typing import Optional
 
 from flwr import common
 from flwr.common import serde
+from flwr.common.future import map_future
 from flwr.proto.transport_pb2 import ClientMessage, ServerMessage
+from flwr.server.broadcast_cache import get_or_create
 from flwr.server.client_proxy import ClientProxy
 from flwr.server.fleet.grpc_bidi.grpc_bridge import GrpcBridge, InsWrapper, ResWrapper
 
@@ -47,7 +50,7 @@ class GrpcClientProxy(ClientProxy):
                 server_message=ServerMessage(get_properties_ins=get_properties_msg),
                 timeout=timeout,
             )
-        )
+        ).result()
         client_msg: ClientMessage = res_wrapper.client_message
         get_properties_res = serde.get_properties_res_from_proto(
             client_msg.get_properties_res
@@ -66,7 +69,7 @@ class GrpcClientProxy(ClientProxy):
                 server_message=ServerMessage(get_parameters_ins=get_parameters_msg),
                 timeout=timeout,
             )
-        )
+        ).result()
         client_msg: ClientMessage = res_wrapper.client_message
         get_parameters_res = serde.get_parameters_res_from_proto(
             client_msg.get_parameters_res
@@ -79,34 +82,59 @@ class GrpcClientProxy(ClientProxy):
         timeout: Optional[float],
     ) -> common.FitRes:
         """Refine the provided parameters using the locally held dataset."""
-        fit_ins_msg = serde.fit_ins_to_proto(ins)
+        return self.submit_fit(ins, timeout).result()
 
-        res_wrapper: ResWrapper = self.bridge.request(
+    def evaluate(
+        self,
+        ins: common.EvaluateIns,
+        timeout: Optional[float],
+    ) -> common.EvaluateRes:
+        """Evaluate the provided parameters using the locally held dataset."""
+        return self.submit_evaluate(ins, timeout).result()
+
+    def submit_fit(
+        self,
+        ins: common.FitIns,
+        timeout: Optional[float],
+    ) -> "Future[common.FitRes]":
+        """Send `fit` instructions and return a future for the result."""
+        server_message = get_or_create(
+            ins, lambda: ServerMessage(fit_ins=serde.fit_ins_to_proto(ins))
+        )
+        res_wrapper_future = self.bridge.request(
             ins_wrapper=InsWrapper(
-                server_message=ServerMessage(fit_ins=fit_ins_msg),
+                server_message=server_message,
                 timeout=timeout,
             )
         )
-        client_msg: ClientMessage = res_wrapper.client_message
-        fit_res = serde.fit_res_from_proto(client_msg.fit_res)
-        return fit_res
+        return map_future(
+            res_wrapper_future,
+            lambda res_wrapper: serde.fit_res_from_proto(
+                res_wrapper.client_message.fit_res
+            ),
+        )
 
-    def evaluate(
+    def submit_evaluate(
         self,
         ins: common.EvaluateIns,
         timeout: Optional[float],
-    ) -> common.EvaluateRes:
-        """Evaluate the provided parameters using the locally held dataset."""
-        evaluate_msg = serde.evaluate_ins_to_proto(ins)
-        res_wrapper: ResWrapper = self.bridge.request(
+    ) -> "Future[common.EvaluateRes]":
+        """Send `evaluate` instructions and return a future for the result."""
+        server_message = get_or_create(
+            ins, lambda: ServerMessage(evaluate_ins=serde.evaluate_ins_to_proto(ins))
+        )
+        res_wrapper_future = self.bridge.request(
             ins_wrapper=InsWrapper(
-                server_message=ServerMessage(evaluate_ins=evaluate_msg),
+                server_message=server_message,
                 timeout=timeout,
             )
         )
-        client_msg: ClientMessage = res_wrapper.client_message
-        evaluate_res = serde.evaluate_res_from_proto(client_msg.evaluate_res)
-        return evaluate_res
+        return map_future(
+            res_wrapper_future,
+            lambda res_wrapper: serde.evaluate_res_from_proto(
+                res_wrapper.client_message.evaluate_res
+            ),
+        )
 
     def reconnect(
         self,
@@ -114,13 +142,24 @@ class GrpcClientProxy(ClientProxy):
         timeout: Optional[float],
     ) -> common.DisconnectRes:
         """Disconnect and (optionally) reconnect later."""
+        return self.submit_reconnect(ins, timeout).result()
+
+    def submit_reconnect(
+        self,
+        ins: common.ReconnectIns,
+        timeout: Optional[float],
+    ) -> "Future[common.DisconnectRes]":
+        """Send `reconnect` instructions and return a future for the result."""
         reconnect_ins_msg = serde.reconnect_ins_to_proto(ins)
-        res_wrapper: ResWrapper = self.bridge.request(
+        res_wrapper_future = self.bridge.request(
             ins_wrapper=InsWrapper(
                 server_message=ServerMessage(reconnect_ins=reconnect_ins_msg),
                 timeout=timeout,
             )
         )
-        client_msg: ClientMessage = res_wrapper.client_message
-        disconnect = serde.disconnect_res_from_proto(client_msg.disconnect_res)
-        return disconnect
+        return map_future(
+            res_wrapper_future,
+            lambda res_wrapper: serde.disconnect_res_from_proto(
+                res_wrapper.client_message.disconnect_res
+            ),
+        )
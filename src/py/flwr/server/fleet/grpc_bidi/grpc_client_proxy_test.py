@@ -16,6 +16,7 @@
 
 
 import unittest
+from concurrent.futures import Future
 from unittest.mock import MagicMock
 
 import numpy as np
@@ -23,7 +24,7 @@ import numpy as np
 import flwr
 from flwr.common.typing import Config, GetParametersIns
 from flwr.proto.transport_pb2 import ClientMessage, Parameters, Scalar
-from flwr.server.fleet.grpc_bidi.grpc_bridge import ResWrapper
+from flwr.server.fleet.grpc_bidi.grpc_bridge import GrpcBridge, ResWrapper
 from flwr.server.fleet.grpc_bidi.grpc_client_proxy import GrpcClientProxy
 
 MESSAGE_PARAMETERS = Parameters(tensors=[], tensor_type="np")
@@ -42,6 +43,13 @@ RES_WRAPPER_FIT_RES = ResWrapper(client_message=MESSAGE_FIT_RES)
 RES_WRAPPER_PROPERTIES_RES = ResWrapper(client_message=MESSAGE_PROPERTIES_RES)
 
 
+def _done(res_wrapper: ResWrapper) -> "Future[ResWrapper]":
+    """Return a future which already holds res_wrapper."""
+    future: "Future[ResWrapper]" = Future()
+    future.set_result(res_wrapper)
+    return future
+
+
 class GrpcClientProxyTestCase(unittest.TestCase):
     """Tests for GrpcClientProxy."""
 
@@ -49,11 +57,13 @@ class GrpcClientProxyTestCase(unittest.TestCase):
         """Set up mocks for tests."""
         self.bridge_mock = MagicMock()
         # Set return_value for usually blocking get_client_message method
-        self.bridge_mock.request.return_value = RES_WRAPPER_FIT_RES
+        self.bridge_mock.request.side_effect = lambda ins_wrapper: _done(
+            RES_WRAPPER_FIT_RES
+        )
         # Set return_value for get_properties
         self.bridge_mock_get_proprieties = MagicMock()
-        self.bridge_mock_get_proprieties.request.return_value = (
-            RES_WRAPPER_PROPERTIES_RES
+        self.bridge_mock_get_proprieties.request.side_effect = (
+            lambda ins_wrapper: _done(RES_WRAPPER_PROPERTIES_RES)
         )
 
     def test_get_parameters(self) -> None:
@@ -91,6 +101,25 @@ class GrpcClientProxyTestCase(unittest.TestCase):
         assert flwr.common.parameters_to_ndarrays(fit_res.parameters) == []
         assert fit_res.num_examples == 10
 
+    def test_submit_fit(self) -> None:
+        """Test that submit_fit returns before the client answers."""
+        # Prepare
+        bridge = GrpcBridge()
+        client = GrpcClientProxy(cid="1", bridge=bridge)
+        parameters = flwr.common.ndarrays_to_parameters([np.ones((2, 2))])
+        ins: flwr.common.FitIns = flwr.common.FitIns(parameters, {})
+
+        # Execute
+        future = client.submit_fit(ins=ins, timeout=None)
+        pending = not future.done()
+        ins_wrapper = next(bridge.ins_wrapper_iterator())
+        bridge.set_res_wrapper(RES_WRAPPER_FIT_RES)
+
+        # Assert
+        assert pending
+        assert ins_wrapper.server_message.HasField("fit_ins")
+        assert future.result(timeout=1).num_examples == 10
+
     def test_evaluate(self) -> None:
         """Test the evaluate method of the client class.
 
@@ -15,10 +15,12 @@
 """Implements utility function to create a gRPC server."""
 
 
+import asyncio
 import concurrent.futures
 import sys
+import threading
 from logging import ERROR
-from typing import Any, Callable, Optional, Tuple, Union
+from typing import Any, Callable, Coroutine, List, Optional, Tuple, TypeVar, Union
 
 import grpc
 
@@ -26,8 +28,10 @@ from flwr.common import GRPC_MAX_MESSAGE_LENGTH
 from flwr.common.logger import log
 from flwr.proto.transport_pb2_grpc import add_FlowerServiceServicer_to_server
 from flwr.server.client_manager import ClientManager
+from flwr.server.driver.async_driver_servicer import AsyncDriverServicer
 from flwr.server.driver.driver_servicer import DriverServicer
 from flwr.server.fleet.grpc_bidi.flower_service_servicer import FlowerServiceServicer
+from flwr.server.fleet.grpc_rere.async_fleet_servicer import AsyncFleetServicer
 from flwr.server.fleet.grpc_rere.fleet_servicer import FleetServicer
 
 INVALID_CERTIFICATES_ERR_MSG = """
@@ -37,6 +41,8 @@ INVALID_CERTIFICATES_ERR_MSG = """
 
 AddServicerToServerFn = Callable[..., Any]
 
+T = TypeVar("T")
+
 
 def valid_certificates(certificates: Tuple[bytes, bytes, bytes]) -> bool:
     """Validate certificates tuple."""
@@ -130,7 +136,9 @@ def start_grpc_server(  # pylint: disable=too-many-arguments
     >>>     ),
     >>> )
     """
-    servicer = FlowerServiceServicer(client_manager)
+    servicer = FlowerServiceServicer(
+        client_manager, max_message_length=max_message_length
+    )
     add_servicer_to_server_fn = add_FlowerServiceServicer_to_server
 
     server = generic_create_grpc_server(
@@ -212,12 +220,159 @@ def generic_create_grpc_server(  # pylint: disable=too-many-arguments
     # Deconstruct tuple into servicer and function
     servicer, add_servicer_to_server_fn = servicer_and_add_fn
 
+    server = grpc.server(
+        concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrent_workers),
+        # Set the maximum number of concurrent RPCs this server will service before
+        # returning RESOURCE_EXHAUSTED status, or None to indicate no limit.
+        maximum_concurrent_rpcs=max_concurrent_workers,
+        options=_server_options(
+            max_concurrent_streams=max(100, max_concurrent_workers),
+            max_message_length=max_message_length,
+            keepalive_time_ms=keepalive_time_ms,
+        ),
+    )
+    add_servicer_to_server_fn(servicer, server)
+    _add_port(server, server_address, certificates)
+
+    return server
+
+
+def generic_create_async_grpc_server(
+    servicer_and_add_fn: Union[
+        Tuple[AsyncFleetServicer, AddServicerToServerFn],
+        Tuple[AsyncDriverServicer, AddServicerToServerFn],
+    ],
+    server_address: str,
+    max_concurrent_streams: int = 1000,
+    max_message_length: int = GRPC_MAX_MESSAGE_LENGTH,
+    keepalive_time_ms: int = 210000,
+    certificates: Optional[Tuple[bytes, bytes, bytes]] = None,
+    max_pending_requests: int = 100000,
+) -> grpc.Server:
+    """Create a `grpc.aio` server with a single servicer.
+
+    Unlike the server created by `generic_create_grpc_server`, the number of
+    concurrent RPCs is not limited by a thread pool, as they are handled in an event
+    loop. The returned server runs the event loop on a background thread and can be
+    used like a synchronous `grpc.Server`.
+
+    Parameters
+    ----------
+    servicer_and_add_fn : Tuple
+        A tuple holding an asyncio servicer implementation and a matching
+        add_Servicer_to_server function.
+    server_address : str
+        Server address in the form of HOST:PORT e.g. "[::]:8080"
+    max_concurrent_streams : int
+        Maximum number of concurrent RPCs on a single HTTP/2 connection.
+        (default: 1000)
+    max_message_length : int
+        Maximum message length that the server can send or receive.
+        Int valued in bytes. -1 means unlimited. (default: GRPC_MAX_MESSAGE_LENGTH)
+    keepalive_time_ms : int
+        See `generic_create_grpc_server`. (default: 210000)
+    certificates : Tuple[bytes, bytes, bytes] (default: None)
+        Tuple containing root certificate, server certificate, and private key to
+        start a secure SSL-enabled server.
+    max_pending_requests : int
+        Maximum number of incoming RPCs waiting to be handled before the server
+        starts to cancel them. (default: 100000)
+
+    Returns
+    -------
+    server : grpc.Server
+        A non-running instance of a gRPC server.
+    """
+    servicer, add_servicer_to_server_fn = servicer_and_add_fn
+    options = _server_options(
+        max_concurrent_streams=max_concurrent_streams,
+        max_message_length=max_message_length,
+        keepalive_time_ms=keepalive_time_ms,
+    )
+    # By default, gRPC cancels incoming RPCs once more than 1000 of them wait to be
+    # handled, e.g., when many nodes connect at once. The event loop accepts them at
+    # its own pace instead.
+    options += [
+        ("grpc.server.max_pending_requests", max_pending_requests),
+        ("grpc.server.max_pending_requests_hard_limit", max_pending_requests),
+    ]
+    server = AsyncGrpcServer(options=options)
+    add_servicer_to_server_fn(servicer, server)
+    _add_port(server, server_address, certificates)
+    return server
+
+
+class AsyncGrpcServer(grpc.Server):  # type: ignore[misc]
+    """A `grpc.aio` server running in an event loop on a background thread.
+
+    It implements the interface of `grpc.Server`, such that it can be started, stopped,
+    and waited for by synchronous code.
+    """
+
+    def __init__(self, options: List[Tuple[str, Any]]) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+        async def create() -> grpc.aio.Server:
+            return grpc.aio.server(options=options)
+
+        self._server = self._await(create())
+
+    def add_generic_rpc_handlers(self, generic_rpc_handlers: Any) -> None:
+        """Register generic RPC handlers before the server is started."""
+        self._server.add_generic_rpc_handlers(generic_rpc_handlers)
+
+    def add_insecure_port(self, address: str) -> int:
+        """Open an insecure port before the server is started."""
+        port: int = self._server.add_insecure_port(address)
+        return port
+
+    def add_secure_port(
+        self, address: str, server_credentials: grpc.ServerCredentials
+    ) -> int:
+        """Open a secure port before the server is started."""
+        port: int = self._server.add_secure_port(address, server_credentials)
+        return port
+
+    def start(self) -> None:
+        """Start the server."""
+        self._await(self._server.start())
+
+    def stop(self, grace: Optional[float]) -> threading.Event:
+        """Stop the server and its event loop after `grace` seconds."""
+        stopped = threading.Event()
+
+        async def stop() -> None:
+            await self._server.stop(grace)
+            stopped.set()
+            self._loop.stop()
+
+        asyncio.run_coroutine_threadsafe(stop(), self._loop)
+        return stopped
+
+    def wait_for_termination(self, timeout: Optional[float] = None) -> bool:
+        """Block until the server stops or `timeout` expires.
+
+        Returns True if `timeout` expired, False otherwise.
+        """
+        self._thread.join(timeout)
+        return self._thread.is_alive()
+
+    def _await(self, coro: Coroutine[Any, Any, T]) -> T:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+
+def _server_options(
+    max_concurrent_streams: int, max_message_length: int, keepalive_time_ms: int
+) -> List[Tuple[str, Any]]:
+    """Return the options shared by all Flower gRPC servers."""
     # Possible options:
     # https://github.com/grpc/grpc/blob/v1.43.x/include/grpc/impl/codegen/grpc_types.h
     options = [
         # Maximum number of concurrent incoming streams to allow on a http2
         # connection. Int valued.
-        ("grpc.max_concurrent_streams", max(100, max_concurrent_workers)),
+        ("grpc.max_concurrent_streams", max_concurrent_streams),
         # Maximum message length that the channel can send.
         # Int valued, bytes. -1 means unlimited.
         ("grpc.max_send_message_length", max_message_length),
@@ -238,16 +393,15 @@ def generic_create_grpc_server(  # pylint: disable=too-many-arguments
         # https://github.com/adap/flower/pull/2197
         ("grpc.keepalive_permit_without_calls", 0),
     ]
+    return options
 
-    server = grpc.server(
-        concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrent_workers),
-        # Set the maximum number of concurrent RPCs this server will service before
-        # returning RESOURCE_EXHAUSTED status, or None to indicate no limit.
-        maximum_concurrent_rpcs=max_concurrent_workers,
-        options=options,
-    )
-    add_servicer_to_server_fn(servicer, server)
 
+def _add_port(
+    server: grpc.Server,
+    server_address: str,
+    certificates: Optional[Tuple[bytes, bytes, bytes]],
+) -> None:
+    """Open an insecure port, or a secure one if certificates are given."""
     if certificates is not None:
         if not valid_certificates(certificates):
             sys.exit(1)
@@ -267,5 +421,3 @@ def generic_create_grpc_server(  # pylint: disable=too-many-arguments
         server.add_secure_port(server_address, server_credentials)
     else:
         server.add_insecure_port(server_address)
-
-    return server
@@ -74,14 +74,17 @@ def _worker(
     while not shared_memory_state["stop"]:
         log(DEBUG, "Worker for node %i checking state", client_proxy.node_id)
 
-        # Step 1: pull *Ins (next task) out of `state`
-        task_ins_list: List[TaskIns] = state.get_task_ins(
+        # Step 1: pull *Ins (next task) out of `state`, waiting up to 3s for one
+        start_time = time.monotonic()
+        task_ins_list: List[TaskIns] = state.get_task_ins_or_wait(
             node_id=client_proxy.node_id,
             limit=1,
+            timeout=3,
         )
         if not task_ins_list:
             log(DEBUG, "Worker for node %i: no task found", client_proxy.node_id)
-            time.sleep(3)
+            # Sleep the remainder if the state does not support waiting
+            time.sleep(max(0.0, 3 - (time.monotonic() - start_time)))
             continue
 
         task_ins = task_ins_list[0]
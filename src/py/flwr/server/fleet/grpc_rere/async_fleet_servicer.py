@@ -0,0 +1,195 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Fleet API gRPC request-response servicer (asyncio)."""
+
+
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from logging import INFO
+from typing import AsyncIterator, Callable, List, Optional, TypeVar
+
+import grpc
+
+from flwr.common import GRPC_MAX_MESSAGE_LENGTH
+from flwr.common.chunk import (
+    MAX_CHUNKED_MESSAGE_LENGTH,
+    ChunkBuffer,
+    max_chunk_size,
+    split_message,
+)
+from flwr.common.constant import PULL_MAX_TIMEOUT
+from flwr.common.logger import log
+from flwr.proto.fleet_pb2 import (
+    CreateNodeRequest,
+    CreateNodeResponse,
+    DeleteNodeRequest,
+    DeleteNodeResponse,
+    PullTaskInsRequest,
+    PullTaskInsResponse,
+    PushTaskResRequest,
+    PushTaskResResponse,
+)
+from flwr.proto.task_pb2 import TaskIns
+from flwr.proto.transport_pb2 import MessageChunk
+from flwr.server.fleet.message_handler import message_handler
+from flwr.server.state import State
+from flwr.server.state.task_notifier import task_ins_key
+
+T = TypeVar("T")
+
+
+class AsyncFleetServicer:
+    """Fleet API servicer for a `grpc.aio` server.
+
+    Requests are handled in an event loop, so idle connections and pull requests
+    waiting for a TaskIns do not occupy a thread. State access, which may block, runs
+    in `executor`.
+
+    Parameters
+    ----------
+    state : State
+        The state shared with the Driver API.
+    max_message_length : int (default: GRPC_MAX_MESSAGE_LENGTH)
+        The maximum length of gRPC messages. Larger responses are streamed in chunks.
+    max_chunked_message_length : int (default: MAX_CHUNKED_MESSAGE_LENGTH)
+        The maximum length of requests streamed in chunks. Larger requests are
+        rejected before a buffer is allocated for them.
+    executor : Optional[Executor] (default: None)
+        The executor to access the state in. If `None`, the default executor of the
+        event loop is used.
+    """
+
+    def __init__(
+        self,
+        state: State,
+        max_message_length: int = GRPC_MAX_MESSAGE_LENGTH,
+        executor: Optional[Executor] = None,
+        max_chunked_message_length: int = MAX_CHUNKED_MESSAGE_LENGTH,
+    ) -> None:
+        self.state = state
+        self.chunk_size = max_chunk_size(max_message_length)
+        self.max_chunked_message_length = max_chunked_message_length
+        self.executor = executor
+
+    async def CreateNode(
+        self, request: CreateNodeRequest, context: grpc.aio.ServicerContext
+    ) -> CreateNodeResponse:
+        """."""
+        log(INFO, "AsyncFleetServicer.CreateNode")
+        return await self._run(
+            partial(message_handler.create_node, request=request, state=self.state)
+        )
+
+    async def DeleteNode(
+        self, request: DeleteNodeRequest, context: grpc.aio.ServicerContext
+    ) -> DeleteNodeResponse:
+        """."""
+        log(INFO, "AsyncFleetServicer.DeleteNode")
+        return await self._run(
+            partial(message_handler.delete_node, request=request, state=self.state)
+        )
+
+    async def PullTaskIns(
+        self, request: PullTaskInsRequest, context: grpc.aio.ServicerContext
+    ) -> PullTaskInsResponse:
+        """Pull TaskIns."""
+        log(INFO, "AsyncFleetServicer.PullTaskIns")
+        return await self._pull_task_ins(request)
+
+    async def PushTaskRes(
+        self, request: PushTaskResRequest, context: grpc.aio.ServicerContext
+    ) -> PushTaskResResponse:
+        """Push TaskRes."""
+        log(INFO, "AsyncFleetServicer.PushTaskRes")
+        return await self._run(
+            partial(message_handler.push_task_res, request=request, state=self.state)
+        )
+
+    async def PullTaskInsStream(
+        self, request: PullTaskInsRequest, context: grpc.aio.ServicerContext
+    ) -> AsyncIterator[MessageChunk]:
+        """Pull TaskIns, streaming the response in chunks."""
+        log(INFO, "AsyncFleetServicer.PullTaskInsStream")
+        response = await self._pull_task_ins(request)
+        for chunk in split_message(response, self.chunk_size):
+            yield chunk
+
+    async def PushTaskResStream(
+        self,
+        request_iterator: AsyncIterator[MessageChunk],
+        context: grpc.aio.ServicerContext,
+    ) -> PushTaskResResponse:
+        """Push TaskRes, receiving the request in chunks."""
+        log(INFO, "AsyncFleetServicer.PushTaskResStream")
+        try:
+            buffer = await _join_chunks(
+                request_iterator, self.max_chunked_message_length
+            )
+        except ValueError as err:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(err))
+        request = PushTaskResRequest()
+        request.ParseFromString(buffer)
+        return await self._run(
+            partial(message_handler.push_task_res, request=request, state=self.state)
+        )
+
+    async def _pull_task_ins(self, request: PullTaskInsRequest) -> PullTaskInsResponse:
+        """Pull TaskIns, waiting for one in the event loop if requested."""
+        # Let the message handler return immediately
+        immediate_request = PullTaskInsRequest()
+        immediate_request.CopyFrom(request)
+        immediate_request.timeout = 0
+
+        async def fetch() -> List[TaskIns]:
+            response: PullTaskInsResponse = await self._run(
+                partial(
+                    message_handler.pull_task_ins,
+                    request=immediate_request,
+                    state=self.state,
+                )
+            )
+            return list(response.task_ins_list)
+
+        timeout = min(request.timeout, PULL_MAX_TIMEOUT)
+        notifier = self.state.task_notifier
+        if notifier is None or timeout <= 0:
+            return PullTaskInsResponse(task_ins_list=await fetch())
+        node = request.node  # pylint: disable=no-member
+        task_ins_list = await notifier.async_wait_for(
+            keys=[task_ins_key(None if node.anonymous else node.node_id)],
+            fetch_fn=fetch,
+            timeout=timeout,
+        )
+        return PullTaskInsResponse(task_ins_list=task_ins_list)
+
+    async def _run(self, fn: Callable[[], T]) -> T:
+        """Call `fn` in the executor."""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn)
+
+
+async def _join_chunks(
+    chunks: AsyncIterator[MessageChunk], max_total_size: int
+) -> bytearray:
+    """Reassemble a serialized message from chunks received one at a time."""
+    chunk_buffer: Optional[ChunkBuffer] = None
+    async for chunk in chunks:
+        if chunk_buffer is None:
+            chunk_buffer = ChunkBuffer(chunk, max_total_size)
+        else:
+            chunk_buffer.add(chunk)
+        if chunk_buffer.complete:
+            return chunk_buffer.buffer
+    raise ValueError("Message stream ended before the last chunk")
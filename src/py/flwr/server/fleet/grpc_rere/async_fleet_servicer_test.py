@@ -0,0 +1,72 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""AsyncFleetServicer tests."""
+
+
+import threading
+import time
+
+import grpc
+
+from flwr.proto.fleet_pb2 import CreateNodeRequest, PullTaskInsRequest
+from flwr.proto.fleet_pb2_grpc import FleetStub, add_FleetServicer_to_server
+from flwr.proto.node_pb2 import Node
+from flwr.server.fleet.grpc_bidi.grpc_server import generic_create_async_grpc_server
+from flwr.server.fleet.grpc_bidi.grpc_server_test import unused_tcp_port
+from flwr.server.state import InMemoryState
+from flwr.server.state.state_test import create_task_ins
+
+from .async_fleet_servicer import AsyncFleetServicer
+
+
+def test_integration_long_poll_pull_task_ins() -> None:
+    """Test that a waiting PullTaskIns returns once a TaskIns is stored."""
+    # Prepare
+    state = InMemoryState()
+    port = unused_tcp_port()
+    server = generic_create_async_grpc_server(
+        servicer_and_add_fn=(AsyncFleetServicer(state), add_FleetServicer_to_server),
+        server_address=f"127.0.0.1:{port}",
+    )
+    server.start()
+    channel = grpc.insecure_channel(f"127.0.0.1:{port}")
+    stub = FleetStub(channel)
+    node_id = stub.CreateNode(CreateNodeRequest()).node.node_id
+    workload_id = state.create_workload()
+
+    def store() -> None:
+        state.store_task_ins(
+            create_task_ins(
+                consumer_node_id=node_id, anonymous=False, workload_id=workload_id
+            )
+        )
+
+    # Execute
+    timer = threading.Timer(0.2, store)
+    timer.start()
+    start = time.monotonic()
+    response = stub.PullTaskIns(
+        PullTaskInsRequest(node=Node(node_id=node_id, anonymous=False), timeout=10)
+    )
+    elapsed = time.monotonic() - start
+    timer.join()
+    channel.close()
+    server.stop(None).wait(5)
+
+    # Assert
+    assert len(response.task_ins_list) == 1
+    assert response.task_ins_list[0].task.consumer.node_id == node_id
+    assert elapsed < 5
+    assert not server.wait_for_termination(5)
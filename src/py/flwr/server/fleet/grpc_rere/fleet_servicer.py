@@ -16,9 +16,17 @@
 
 
 from logging import INFO
+from typing import Iterator
 
 import grpc
 
+from flwr.common import GRPC_MAX_MESSAGE_LENGTH
+from flwr.common.chunk import (
+    MAX_CHUNKED_MESSAGE_LENGTH,
+    max_chunk_size,
+    parse_chunks,
+    split_message,
+)
 from flwr.common.logger import log
 from flwr.proto import fleet_pb2_grpc
 from flwr.proto.fleet_pb2 import (
@@ -31,6 +39,7 @@ from flwr.proto.fleet_pb2 import (
     PushTaskResRequest,
     PushTaskResResponse,
 )
+from flwr.proto.transport_pb2 import MessageChunk
 from flwr.server.fleet.message_handler import message_handler
 from flwr.server.state import State
 
@@ -38,8 +47,16 @@ from flwr.server.state import State
 class FleetServicer(fleet_pb2_grpc.FleetServicer):
     """Fleet API servicer."""
 
-    def __init__(self, state: State) -> None:
+    def __init__(
+        self,
+        state: State,
+        max_message_length: int = GRPC_MAX_MESSAGE_LENGTH,
+        max_chunked_message_length: int = MAX_CHUNKED_MESSAGE_LENGTH,
+    ) -> None:
         self.state = state
+        self.chunk_size = max_chunk_size(max_message_length)
+        # Chunked requests announcing a larger size are rejected
+        self.max_chunked_message_length = max_chunked_message_length
 
     def CreateNode(
         self, request: CreateNodeRequest, context: grpc.ServicerContext
@@ -80,3 +97,32 @@ class FleetServicer(fleet_pb2_grpc.FleetServicer):
             request=request,
             state=self.state,
         )
+
+    def PullTaskInsStream(
+        self, request: PullTaskInsRequest, context: grpc.ServicerContext
+    ) -> Iterator[MessageChunk]:
+        """Pull TaskIns, streaming the response in chunks."""
+        log(INFO, "FleetServicer.PullTaskInsStream")
+        response = message_handler.pull_task_ins(
+            request=request,
+            state=self.state,
+        )
+        yield from split_message(response, self.chunk_size)
+
+    def PushTaskResStream(
+        self, request_iterator: Iterator[MessageChunk], context: grpc.ServicerContext
+    ) -> PushTaskResResponse:
+        """Push TaskRes, receiving the request in chunks."""
+        log(INFO, "FleetServicer.PushTaskResStream")
+        try:
+            request = parse_chunks(
+                request_iterator,
+                PushTaskResRequest,
+                max_total_size=self.max_chunked_message_length,
+            )
+        except ValueError as err:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(err))
+        return message_handler.push_task_res(
+            request=request,
+            state=self.state,
+        )
@@ -18,6 +18,7 @@
 from typing import List, Optional
 from uuid import UUID
 
+from flwr.common.constant import PULL_MAX_TIMEOUT
 from flwr.proto.fleet_pb2 import (
     CreateNodeRequest,
     CreateNodeResponse,
@@ -30,7 +31,7 @@ from flwr.proto.fleet_pb2 import (
     Reconnect,
 )
 from flwr.proto.node_pb2 import Node
-from flwr.proto.task_pb2 import TaskIns, TaskRes
+from flwr.proto.task_pb2 import TaskIns
 from flwr.server.state import State
 
 
@@ -61,8 +62,12 @@ def pull_task_ins(request: PullTaskInsRequest, state: State) -> PullTaskInsRespo
     node = request.node  # pylint: disable=no-member
     node_id: Optional[int] = None if node.anonymous else node.node_id
 
-    # Retrieve TaskIns from State
-    task_ins_list: List[TaskIns] = state.get_task_ins(node_id=node_id, limit=1)
+    # Retrieve TaskIns from State, waiting for one if the client asked to
+    task_ins_list: List[TaskIns] = state.get_task_ins_or_wait(
+        node_id=node_id,
+        limit=max(1, request.max_tasks),
+        timeout=min(request.timeout, PULL_MAX_TIMEOUT),
+    )
 
     # Build response
     response = PullTaskInsResponse(
@@ -73,16 +78,15 @@ def pull_task_ins(request: PullTaskInsRequest, state: State) -> PullTaskInsRespo
 
 def push_task_res(request: PushTaskResRequest, state: State) -> PushTaskResResponse:
     """Push TaskRes handler."""
-    # pylint: disable=no-member
-    task_res: TaskRes = request.task_res_list[0]
-    # pylint: enable=no-member
-
-    # Store TaskRes in State
-    task_id: Optional[UUID] = state.store_task_res(task_res=task_res)
+    # Store all TaskRes in State
+    task_ids: List[Optional[UUID]] = [
+        state.store_task_res(task_res=task_res)
+        for task_res in request.task_res_list  # pylint: disable=no-member
+    ]
 
     # Build response
     response = PushTaskResResponse(
         reconnect=Reconnect(reconnect=5),
-        results={str(task_id): 0},
+        results={str(task_id): 0 for task_id in task_ids},
     )
     return response
@@ -17,6 +17,7 @@
 
 from unittest.mock import MagicMock
 
+from flwr.common.constant import PULL_MAX_TIMEOUT
 from flwr.proto.fleet_pb2 import (
     CreateNodeRequest,
     DeleteNodeRequest,
@@ -96,11 +97,41 @@ def test_pull_task_ins() -> None:
     state.create_node.assert_not_called()
     state.delete_node.assert_not_called()
     state.store_task_ins.assert_not_called()
-    state.get_task_ins.assert_called_once()
+    state.get_task_ins_or_wait.assert_called_once_with(node_id=1, limit=1, timeout=0)
     state.store_task_res.assert_not_called()
     state.get_task_res.assert_not_called()
 
 
+def test_pull_task_ins_timeout_clamped() -> None:
+    """Test that pull_task_ins waits at most `PULL_MAX_TIMEOUT` seconds."""
+    # Prepare
+    request = PullTaskInsRequest(
+        node=Node(node_id=1, anonymous=False), timeout=PULL_MAX_TIMEOUT + 1
+    )
+    state = MagicMock()
+
+    # Execute
+    pull_task_ins(request=request, state=state)
+
+    # Assert
+    state.get_task_ins_or_wait.assert_called_once_with(
+        node_id=1, limit=1, timeout=PULL_MAX_TIMEOUT
+    )
+
+
+def test_pull_task_ins_max_tasks() -> None:
+    """Test that pull_task_ins returns up to `max_tasks` TaskIns."""
+    # Prepare
+    request = PullTaskInsRequest(node=Node(node_id=1, anonymous=False), max_tasks=4)
+    state = MagicMock()
+
+    # Execute
+    pull_task_ins(request=request, state=state)
+
+    # Assert
+    state.get_task_ins_or_wait.assert_called_once_with(node_id=1, limit=4, timeout=0)
+
+
 def test_push_task_res() -> None:
     """Test push_task_res."""
     # Prepare
@@ -126,3 +157,20 @@ def test_push_task_res() -> None:
     state.get_task_ins.assert_not_called()
     state.store_task_res.assert_called_once()
     state.get_task_res.assert_not_called()
+
+
+def test_push_task_res_batch() -> None:
+    """Test that push_task_res stores all TaskRes of the request."""
+    # Prepare
+    request = PushTaskResRequest(
+        task_res_list=[TaskRes(task=Task(ancestry=["1"])), TaskRes(task=Task())]
+    )
+    state = MagicMock()
+    state.store_task_res.side_effect = ["id-1", "id-2"]
+
+    # Execute
+    response = push_task_res(request=request, state=state)
+
+    # Assert
+    assert state.store_task_res.call_count == 2
+    assert dict(response.results) == {"id-1": 0, "id-2": 0}
@@ -29,6 +29,7 @@ from flwr.server.state import State
 
 try:
     from starlette.applications import Starlette
+    from starlette.concurrency import run_in_threadpool
     from starlette.datastructures import Headers
     from starlette.exceptions import HTTPException
     from starlette.requests import Request
@@ -108,8 +109,9 @@ async def pull_task_ins(request: Request) -> Response:
     # Get state from app
     state: State = app.state.STATE_FACTORY.state()
 
-    # Handle message
-    pull_task_ins_response_proto = message_handler.pull_task_ins(
+    # Handle message in a worker thread, as it may wait for a TaskIns
+    pull_task_ins_response_proto = await run_in_threadpool(
+        message_handler.pull_task_ins,
         request=pull_task_ins_request_proto,
         state=state,
     )
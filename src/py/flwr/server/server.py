@@ -15,10 +15,24 @@
 """Flower server."""
 
 
+import asyncio
 import concurrent.futures
 import timeit
-from logging import DEBUG, INFO
-from typing import Dict, List, Optional, Tuple, Union
+from functools import partial
+from logging import DEBUG, INFO, WARNING
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from flwr.common import (
     Code,
@@ -31,8 +45,12 @@ from flwr.common import (
     ReconnectIns,
     Scalar,
 )
+from flwr.common.future import map_future
 from flwr.common.logger import log
+from flwr.common.parameter_file import save_parameters
 from flwr.common.typing import GetParametersIns
+from flwr.server.async_client_proxy import AsyncClientProxy
+from flwr.server.broadcast_cache import broadcast_cache
 from flwr.server.client_manager import ClientManager
 from flwr.server.client_proxy import ClientProxy
 from flwr.server.history import History
@@ -51,6 +69,16 @@ ReconnectResultsAndFailures = Tuple[
     List[Union[Tuple[ClientProxy, DisconnectRes], BaseException]],
 ]
 
+R = TypeVar("R")
+
+
+class LateClientError(Exception):
+    """A client did not return a result before its round finished."""
+
+    def __init__(self, client: ClientProxy) -> None:
+        super().__init__(f"Client {client.cid} was too late")
+        self.client = client
+
 
 class Server:
     """Flower server."""
@@ -60,18 +88,44 @@ class Server:
         *,
         client_manager: ClientManager,
         strategy: Optional[Strategy] = None,
+        checkpoint_dir: Optional[Union[str, Path]] = None,
+        checkpoint_keep: int = 2,
     ) -> None:
+        if checkpoint_keep < 1:
+            raise ValueError("`checkpoint_keep` must be at least 1.")
         self._client_manager: ClientManager = client_manager
         self.parameters: Parameters = Parameters(
             tensors=[], tensor_type="numpy.ndarray"
         )
         self.strategy: Strategy = strategy if strategy is not None else FedAvg()
         self.max_workers: Optional[int] = None
+        self.round_min_results: Optional[int] = None
+        self.round_deadline: Optional[float] = None
+        # If set, the global model of every round is written to this directory and
+        # mapped from there instead of being held in memory
+        self.checkpoint_dir: Optional[Path] = (
+            Path(checkpoint_dir) if checkpoint_dir is not None else None
+        )
+        # Number of checkpoints of the last rounds kept in `checkpoint_dir`, older
+        # ones are deleted
+        self.checkpoint_keep = checkpoint_keep
+        self._checkpoint_paths: List[Path] = []
 
     def set_max_workers(self, max_workers: Optional[int]) -> None:
         """Set the max_workers used by ThreadPoolExecutor."""
         self.max_workers = max_workers
 
+    def set_partial_rounds(
+        self, min_results: Optional[int] = None, deadline: Optional[float] = None
+    ) -> None:
+        """Finish rounds after `min_results` results or `deadline` seconds.
+
+        Clients which did not respond by then are reported to the strategy as
+        `LateClientError` failures and marked as slow in the client manager.
+        """
+        self.round_min_results = min_results
+        self.round_deadline = deadline
+
     def set_strategy(self, strategy: Strategy) -> None:
         """Replace server strategy."""
         self.strategy = strategy
@@ -87,7 +141,9 @@ class Server:
 
         # Initialize parameters
         log(INFO, "Initializing global parameters")
-        self.parameters = self._get_initial_parameters(timeout=timeout)
+        self.parameters = self._checkpoint(
+            0, self._get_initial_parameters(timeout=timeout)
+        )
         log(INFO, "Evaluating initial parameters")
         res = self.strategy.evaluate(0, parameters=self.parameters)
         if res is not None:
@@ -113,7 +169,7 @@ class Server:
             if res_fit is not None:
                 parameters_prime, fit_metrics, _ = res_fit  # fit_metrics_aggregated
                 if parameters_prime:
-                    self.parameters = parameters_prime
+                    self.parameters = self._checkpoint(current_round, parameters_prime)
                 history.add_metrics_distributed_fit(
                     server_round=current_round, metrics=fit_metrics
                 )
@@ -179,11 +235,9 @@ class Server:
         )
 
         # Collect `evaluate` results from all clients participating in this round
-        results, failures = evaluate_clients(
-            client_instructions,
-            max_workers=self.max_workers,
-            timeout=timeout,
-        )
+        with broadcast_cache(client_instructions):
+            results, failures = self._evaluate_clients(client_instructions, timeout)
+        self._track_slow_clients(results, failures)
         log(
             DEBUG,
             "evaluate_round %s received %s results and %s failures",
@@ -227,12 +281,17 @@ class Server:
             self._client_manager.num_available(),
         )
 
+        # Fold results into the aggregate as they arrive if the strategy supports it
+        accumulate_fn: Optional[Callable[[Tuple[ClientProxy, FitRes]], None]] = None
+        if self.strategy.begin_aggregate_fit(server_round):
+            accumulate_fn = partial(self.strategy.accumulate_fit, server_round)
+
         # Collect `fit` results from all clients participating in this round
-        results, failures = fit_clients(
-            client_instructions=client_instructions,
-            max_workers=self.max_workers,
-            timeout=timeout,
-        )
+        with broadcast_cache(client_instructions):
+            results, failures = self._fit_clients(
+                client_instructions, timeout, accumulate_fn
+            )
+        self._track_slow_clients(results, failures)
         log(
             DEBUG,
             "fit_round %s received %s results and %s failures",
@@ -242,10 +301,15 @@ class Server:
         )
 
         # Aggregate training results
-        aggregated_result: Tuple[
-            Optional[Parameters],
-            Dict[str, Scalar],
-        ] = self.strategy.aggregate_fit(server_round, results, failures)
+        aggregated_result: Tuple[Optional[Parameters], Dict[str, Scalar]]
+        if accumulate_fn is not None:
+            aggregated_result = self.strategy.finalize_aggregate_fit(
+                server_round, results, failures
+            )
+        else:
+            aggregated_result = self.strategy.aggregate_fit(
+                server_round, results, failures
+            )
 
         parameters_aggregated, metrics_aggregated = aggregated_result
         return parameters_aggregated, metrics_aggregated, (results, failures)
@@ -256,12 +320,80 @@ class Server:
         clients = [all_clients[k] for k in all_clients.keys()]
         instruction = ReconnectIns(seconds=None)
         client_instructions = [(client_proxy, instruction) for client_proxy in clients]
-        _ = reconnect_clients(
+        _ = self._reconnect_clients(client_instructions, timeout)
+
+    def _fit_clients(
+        self,
+        client_instructions: List[Tuple[ClientProxy, FitIns]],
+        timeout: Optional[float],
+        accumulate_fn: Optional[Callable[[Tuple[ClientProxy, FitRes]], None]],
+    ) -> FitResultsAndFailures:
+        """Send `fit` instructions to clients and collect their results."""
+        return fit_clients(
             client_instructions=client_instructions,
             max_workers=self.max_workers,
             timeout=timeout,
+            accumulate_fn=accumulate_fn,
+            min_results=self.round_min_results,
+            deadline=self.round_deadline,
+        )
+
+    def _evaluate_clients(
+        self,
+        client_instructions: List[Tuple[ClientProxy, EvaluateIns]],
+        timeout: Optional[float],
+    ) -> EvaluateResultsAndFailures:
+        """Send `evaluate` instructions to clients and collect their results."""
+        return evaluate_clients(
+            client_instructions,
+            max_workers=self.max_workers,
+            timeout=timeout,
+            min_results=self.round_min_results,
+            deadline=self.round_deadline,
         )
 
+    def _reconnect_clients(
+        self,
+        client_instructions: List[Tuple[ClientProxy, ReconnectIns]],
+        timeout: Optional[float],
+    ) -> ReconnectResultsAndFailures:
+        """Send `reconnect` instructions to clients and collect their results."""
+        return reconnect_clients(
+            client_instructions=client_instructions,
+            max_workers=self.max_workers,
+            timeout=timeout,
+        )
+
+    def _track_slow_clients(
+        self, results: List[Tuple[ClientProxy, Any]], failures: List[Any]
+    ) -> None:
+        """Mark clients as slow or timely depending on when they responded."""
+        for client, _ in results:
+            self._client_manager.mark_timely(client)
+        for failure in failures:
+            if isinstance(failure, LateClientError):
+                self._client_manager.mark_slow(failure.client)
+
+    def _checkpoint(self, server_round: int, parameters: Parameters) -> Parameters:
+        """Write the global model to `checkpoint_dir` and map it from there."""
+        if self.checkpoint_dir is None:
+            return parameters
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        path = self.checkpoint_dir / f"parameters_round_{server_round}.bin"
+        log(DEBUG, "Writing global parameters to %s", path)
+        parameters = save_parameters(parameters, path)
+        if path not in self._checkpoint_paths:
+            self._checkpoint_paths.append(path)
+        while len(self._checkpoint_paths) > self.checkpoint_keep:
+            old_path = self._checkpoint_paths.pop(0)
+            log(DEBUG, "Deleting global parameters %s", old_path)
+            try:
+                # Parameters still mapped from the file stay valid on POSIX systems
+                old_path.unlink()
+            except OSError as err:
+                log(WARNING, "Could not delete %s: %s", old_path, err)
+        return parameters
+
     def _get_initial_parameters(self, timeout: Optional[float]) -> Parameters:
         """Get initial parameters from one of the available clients."""
         # Server-side parameter initialization
@@ -281,6 +413,98 @@ class Server:
         return get_parameters_res.parameters
 
 
+class AsyncServer(Server):
+    """Flower server which communicates with clients in an asyncio event loop.
+
+    The instructions of a round are sent to all clients as coroutines in a single
+    event loop, which is reused across rounds. Client proxies which can send
+    instructions without blocking (e.g., gRPC and Driver API proxies) do not need a
+    thread per client. All other proxies are called on a thread pool of
+    `max_workers` threads, which is also reused across rounds.
+    """
+
+    def __init__(
+        self,
+        *,
+        client_manager: ClientManager,
+        strategy: Optional[Strategy] = None,
+        checkpoint_dir: Optional[Union[str, Path]] = None,
+        checkpoint_keep: int = 2,
+    ) -> None:
+        super().__init__(
+            client_manager=client_manager,
+            strategy=strategy,
+            checkpoint_dir=checkpoint_dir,
+            checkpoint_keep=checkpoint_keep,
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    def set_max_workers(self, max_workers: Optional[int]) -> None:
+        """Set the max_workers used by the thread pool for blocking proxies."""
+        super().set_max_workers(max_workers)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def close(self) -> None:
+        """Close the event loop and the thread pool."""
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _fit_clients(
+        self,
+        client_instructions: List[Tuple[ClientProxy, FitIns]],
+        timeout: Optional[float],
+        accumulate_fn: Optional[Callable[[Tuple[ClientProxy, FitRes]], None]],
+    ) -> FitResultsAndFailures:
+        return self._run(
+            fit_clients_async(
+                client_instructions,
+                timeout,
+                accumulate_fn,
+                min_results=self.round_min_results,
+                deadline=self.round_deadline,
+            )
+        )
+
+    def _evaluate_clients(
+        self,
+        client_instructions: List[Tuple[ClientProxy, EvaluateIns]],
+        timeout: Optional[float],
+    ) -> EvaluateResultsAndFailures:
+        return self._run(
+            evaluate_clients_async(
+                client_instructions,
+                timeout,
+                min_results=self.round_min_results,
+                deadline=self.round_deadline,
+            )
+        )
+
+    def _reconnect_clients(
+        self,
+        client_instructions: List[Tuple[ClientProxy, ReconnectIns]],
+        timeout: Optional[float],
+    ) -> ReconnectResultsAndFailures:
+        return self._run(reconnect_clients_async(client_instructions, timeout))
+
+    def _run(self, coro: Coroutine[Any, Any, R]) -> R:
+        """Run `coro` in the event loop of the server."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers
+            )
+            self._loop.set_default_executor(self._executor)
+        return self._loop.run_until_complete(coro)
+
+
 def reconnect_clients(
     client_instructions: List[Tuple[ClientProxy, ReconnectIns]],
     max_workers: Optional[int],
@@ -289,7 +513,12 @@ def reconnect_clients(
     """Instruct clients to disconnect and never reconnect."""
     with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
         submitted_fs = {
-            executor.submit(reconnect_client, client_proxy, ins, timeout)
+            _submit_to_client(
+                executor,
+                client_proxy,
+                submit_fn=partial(client_proxy.submit_reconnect, ins, timeout),
+                call_fn=partial(reconnect_client, client_proxy, ins, timeout),
+            )
             for client_proxy, ins in client_instructions
         }
         finished_fs, _ = concurrent.futures.wait(
@@ -323,32 +552,113 @@ def reconnect_client(
     return client, disconnect
 
 
-def fit_clients(
+def fit_clients(  # pylint: disable=too-many-arguments
     client_instructions: List[Tuple[ClientProxy, FitIns]],
     max_workers: Optional[int],
     timeout: Optional[float],
+    accumulate_fn: Optional[Callable[[Tuple[ClientProxy, FitRes]], None]] = None,
+    min_results: Optional[int] = None,
+    deadline: Optional[float] = None,
 ) -> FitResultsAndFailures:
-    """Refine parameters concurrently on all selected clients."""
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        submitted_fs = {
-            executor.submit(fit_client, client_proxy, ins, timeout)
-            for client_proxy, ins in client_instructions
-        }
-        finished_fs, _ = concurrent.futures.wait(
-            fs=submitted_fs,
-            timeout=None,  # Handled in the respective communication stack
-        )
-
-    # Gather results
+    """Refine parameters concurrently on all selected clients.
+
+    If `accumulate_fn` is provided, each successful result is passed to it as
+    soon as it is received (while other clients are still training), after
+    which the parameters of that result are released.
+
+    If `min_results` is provided, the round finishes as soon as that many
+    successful results were received. If `deadline` is provided, it finishes at
+    the latest `deadline` seconds after the instructions were sent. Clients
+    which did not respond by then are cancelled and reported as
+    `LateClientError` failures.
+    """
     results: List[Tuple[ClientProxy, FitRes]] = []
     failures: List[Union[Tuple[ClientProxy, FitRes], BaseException]] = []
-    for future in finished_fs:
-        _handle_finished_future_after_fit(
-            future=future, results=results, failures=failures
-        )
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    submitted_fs = {
+        _submit_to_client(
+            executor,
+            client_proxy,
+            submit_fn=partial(client_proxy.submit_fit, ins, timeout),
+            call_fn=partial(fit_client, client_proxy, ins, timeout),
+        ): client_proxy
+        for client_proxy, ins in client_instructions
+    }
+    finished_fs = set()
+    try:
+        # Timeout is handled in the respective communication stack
+        for future in concurrent.futures.as_completed(submitted_fs, deadline):
+            finished_fs.add(future)
+            num_results = len(results)
+            _handle_finished_future_after_fit(
+                future=future, results=results, failures=failures
+            )
+            if accumulate_fn is not None and len(results) > num_results:
+                _accumulate_fit_result(results[-1], accumulate_fn)
+            if min_results is not None and len(results) >= min_results:
+                break
+    except concurrent.futures.TimeoutError:
+        pass  # Deadline passed
+    failures.extend(_cancel_late_clients(submitted_fs, finished_fs))
+    # Do not wait for calls of late clients to return
+    executor.shutdown(wait=len(finished_fs) == len(submitted_fs))
     return results, failures
 
 
+def _accumulate_fit_result(
+    result: Tuple[ClientProxy, FitRes],
+    accumulate_fn: Callable[[Tuple[ClientProxy, FitRes]], None],
+) -> None:
+    """Pass a result to `accumulate_fn` and release its parameters."""
+    _, fit_res = result
+    accumulate_fn(result)
+    fit_res.parameters = Parameters(
+        tensors=[], tensor_type=fit_res.parameters.tensor_type
+    )
+
+
+def _submit_to_client(
+    executor: concurrent.futures.Executor,
+    client: ClientProxy,
+    submit_fn: Callable[[], "Optional[concurrent.futures.Future[R]]"],
+    call_fn: Callable[[], Tuple[ClientProxy, R]],
+) -> "concurrent.futures.Future[Tuple[ClientProxy, R]]":
+    """Send instructions to a client and return a future for its result.
+
+    Proxies which can wait for results without blocking (`submit_fn` returns a
+    future) do not occupy a thread of `executor`. For all others, `call_fn` is run
+    on `executor`.
+    """
+    future: "concurrent.futures.Future[Tuple[ClientProxy, R]]"
+    future = concurrent.futures.Future()
+    try:
+        res_future = submit_fn()
+    except Exception as ex:  # pylint: disable=broad-except
+        future.set_running_or_notify_cancel()
+        future.set_exception(ex)
+        return future
+    if res_future is None:
+        return executor.submit(call_fn)
+    return map_future(res_future, lambda res: (client, res))
+
+
+def _cancel_late_clients(
+    submitted_fs: Dict[Any, ClientProxy], finished_fs: Set[Any]
+) -> List[BaseException]:
+    """Cancel the unfinished futures and return a failure for each of them.
+
+    A call which is already running on a thread cannot be cancelled through its future,
+    so the client proxy is asked to stop waiting for the result as well.
+    """
+    failures: List[BaseException] = []
+    for future, client_proxy in submitted_fs.items():
+        if future not in finished_fs:
+            future.cancel()
+            client_proxy.cancel()
+            failures.append(LateClientError(client_proxy))
+    return failures
+
+
 def fit_client(
     client: ClientProxy, ins: FitIns, timeout: Optional[float]
 ) -> Tuple[ClientProxy, FitRes]:
@@ -358,7 +668,10 @@ def fit_client(
 
 
 def _handle_finished_future_after_fit(
-    future: concurrent.futures.Future,  # type: ignore
+    future: Union[
+        "concurrent.futures.Future[Tuple[ClientProxy, FitRes]]",
+        "asyncio.Future[Tuple[ClientProxy, FitRes]]",
+    ],
     results: List[Tuple[ClientProxy, FitRes]],
     failures: List[Union[Tuple[ClientProxy, FitRes], BaseException]],
 ) -> None:
@@ -386,25 +699,40 @@ def evaluate_clients(
     client_instructions: List[Tuple[ClientProxy, EvaluateIns]],
     max_workers: Optional[int],
     timeout: Optional[float],
+    min_results: Optional[int] = None,
+    deadline: Optional[float] = None,
 ) -> EvaluateResultsAndFailures:
-    """Evaluate parameters concurrently on all selected clients."""
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        submitted_fs = {
-            executor.submit(evaluate_client, client_proxy, ins, timeout)
-            for client_proxy, ins in client_instructions
-        }
-        finished_fs, _ = concurrent.futures.wait(
-            fs=submitted_fs,
-            timeout=None,  # Handled in the respective communication stack
-        )
+    """Evaluate parameters concurrently on all selected clients.
 
-    # Gather results
+    `min_results` and `deadline` finish the round early, like in `fit_clients`.
+    """
     results: List[Tuple[ClientProxy, EvaluateRes]] = []
     failures: List[Union[Tuple[ClientProxy, EvaluateRes], BaseException]] = []
-    for future in finished_fs:
-        _handle_finished_future_after_evaluate(
-            future=future, results=results, failures=failures
-        )
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    submitted_fs = {
+        _submit_to_client(
+            executor,
+            client_proxy,
+            submit_fn=partial(client_proxy.submit_evaluate, ins, timeout),
+            call_fn=partial(evaluate_client, client_proxy, ins, timeout),
+        ): client_proxy
+        for client_proxy, ins in client_instructions
+    }
+    finished_fs = set()
+    try:
+        # Timeout is handled in the respective communication stack
+        for future in concurrent.futures.as_completed(submitted_fs, deadline):
+            finished_fs.add(future)
+            _handle_finished_future_after_evaluate(
+                future=future, results=results, failures=failures
+            )
+            if min_results is not None and len(results) >= min_results:
+                break
+    except concurrent.futures.TimeoutError:
+        pass  # Deadline passed
+    failures.extend(_cancel_late_clients(submitted_fs, finished_fs))
+    # Do not wait for calls of late clients to return
+    executor.shutdown(wait=len(finished_fs) == len(submitted_fs))
     return results, failures
 
 
@@ -419,7 +747,10 @@ def evaluate_client(
 
 
 def _handle_finished_future_after_evaluate(
-    future: concurrent.futures.Future,  # type: ignore
+    future: Union[
+        "concurrent.futures.Future[Tuple[ClientProxy, EvaluateRes]]",
+        "asyncio.Future[Tuple[ClientProxy, EvaluateRes]]",
+    ],
     results: List[Tuple[ClientProxy, EvaluateRes]],
     failures: List[Union[Tuple[ClientProxy, EvaluateRes], BaseException]],
 ) -> None:
@@ -441,3 +772,144 @@ def _handle_finished_future_after_evaluate(
 
     # Not successful, client returned a result where the status code is not OK
     failures.append(result)
+
+
+async def reconnect_clients_async(
+    client_instructions: List[Tuple[ClientProxy, ReconnectIns]],
+    timeout: Optional[float],
+) -> ReconnectResultsAndFailures:
+    """Instruct clients to disconnect and never reconnect, in the event loop."""
+    if not client_instructions:
+        return [], []
+    finished_fs, _ = await asyncio.wait(
+        [
+            asyncio.ensure_future(_reconnect_client_async(client_proxy, ins, timeout))
+            for client_proxy, ins in client_instructions
+        ]
+    )
+
+    # Gather results
+    results: List[Tuple[ClientProxy, DisconnectRes]] = []
+    failures: List[Union[Tuple[ClientProxy, DisconnectRes], BaseException]] = []
+    for future in finished_fs:
+        failure = future.exception()
+        if failure is not None:
+            failures.append(failure)
+        else:
+            results.append(future.result())
+    return results, failures
+
+
+async def _reconnect_client_async(
+    client: ClientProxy, reconnect: ReconnectIns, timeout: Optional[float]
+) -> Tuple[ClientProxy, DisconnectRes]:
+    disconnect = await AsyncClientProxy(client).reconnect(reconnect, timeout=timeout)
+    return client, disconnect
+
+
+async def fit_clients_async(
+    client_instructions: List[Tuple[ClientProxy, FitIns]],
+    timeout: Optional[float],
+    accumulate_fn: Optional[Callable[[Tuple[ClientProxy, FitRes]], None]] = None,
+    min_results: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> FitResultsAndFailures:
+    """Refine parameters concurrently on all selected clients, in the event loop.
+
+    Like `fit_clients`, but waiting for results does not occupy a thread per client
+    if the client proxies support it (see `AsyncClientProxy`).
+    """
+    results: List[Tuple[ClientProxy, FitRes]] = []
+    failures: List[Union[Tuple[ClientProxy, FitRes], BaseException]] = []
+    submitted_fs = {
+        asyncio.ensure_future(_fit_client_async(client_proxy, ins, timeout)): (
+            client_proxy
+        )
+        for client_proxy, ins in client_instructions
+    }
+    finished_fs = set()
+    end_time = None if deadline is None else timeit.default_timer() + deadline
+    pending = set(submitted_fs)
+    while pending and not _partial_round_done(len(results), min_results, end_time):
+        done, pending = await asyncio.wait(
+            pending,
+            timeout=_remaining(end_time),
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        for future in done:
+            finished_fs.add(future)
+            num_results = len(results)
+            _handle_finished_future_after_fit(
+                future=future, results=results, failures=failures
+            )
+            if accumulate_fn is not None and len(results) > num_results:
+                _accumulate_fit_result(results[-1], accumulate_fn)
+    failures.extend(_cancel_late_clients(submitted_fs, finished_fs))
+    return results, failures
+
+
+async def _fit_client_async(
+    client: ClientProxy, ins: FitIns, timeout: Optional[float]
+) -> Tuple[ClientProxy, FitRes]:
+    fit_res = await AsyncClientProxy(client).fit(ins, timeout=timeout)
+    return client, fit_res
+
+
+async def evaluate_clients_async(
+    client_instructions: List[Tuple[ClientProxy, EvaluateIns]],
+    timeout: Optional[float],
+    min_results: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> EvaluateResultsAndFailures:
+    """Evaluate parameters concurrently on all selected clients, in the event loop.
+
+    Like `evaluate_clients`, but waiting for results does not occupy a thread per
+    client if the client proxies support it (see `AsyncClientProxy`).
+    """
+    results: List[Tuple[ClientProxy, EvaluateRes]] = []
+    failures: List[Union[Tuple[ClientProxy, EvaluateRes], BaseException]] = []
+    submitted_fs = {
+        asyncio.ensure_future(_evaluate_client_async(client_proxy, ins, timeout)): (
+            client_proxy
+        )
+        for client_proxy, ins in client_instructions
+    }
+    finished_fs = set()
+    end_time = None if deadline is None else timeit.default_timer() + deadline
+    pending = set(submitted_fs)
+    while pending and not _partial_round_done(len(results), min_results, end_time):
+        done, pending = await asyncio.wait(
+            pending,
+            timeout=_remaining(end_time),
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        for future in done:
+            finished_fs.add(future)
+            _handle_finished_future_after_evaluate(
+                future=future, results=results, failures=failures
+            )
+    failures.extend(_cancel_late_clients(submitted_fs, finished_fs))
+    return results, failures
+
+
+async def _evaluate_client_async(
+    client: ClientProxy, ins: EvaluateIns, timeout: Optional[float]
+) -> Tuple[ClientProxy, EvaluateRes]:
+    evaluate_res = await AsyncClientProxy(client).evaluate(ins, timeout=timeout)
+    return client, evaluate_res
+
+
+def _partial_round_done(
+    num_results: int, min_results: Optional[int], end_time: Optional[float]
+) -> bool:
+    """Return True if enough results were received or the deadline passed."""
+    if min_results is not None and num_results >= min_results:
+        return True
+    return end_time is not None and timeit.default_timer() >= end_time
+
+
+def _remaining(end_time: Optional[float]) -> Optional[float]:
+    """Return the seconds left until `end_time`, or None if there is none."""
+    if end_time is None:
+        return None
+    return max(end_time - timeit.default_timer(), 0.0)
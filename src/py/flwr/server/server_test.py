@@ -15,7 +15,10 @@
 """Flower server tests."""
 
 
-from typing import List, Optional
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
 
 import numpy as np
 
@@ -34,11 +37,15 @@ from flwr.common import (
     ReconnectIns,
     Status,
     ndarray_to_bytes,
+    ndarrays_to_parameters,
+    parameters_to_ndarrays,
 )
+from flwr.common.parameter_file import MappedTensors
 from flwr.server.client_manager import SimpleClientManager
+from flwr.server.strategy import FedAvg, Strategy
 
 from .client_proxy import ClientProxy
-from .server import Server, evaluate_clients, fit_clients
+from .server import AsyncServer, LateClientError, Server, evaluate_clients, fit_clients
 
 
 class SuccessClient(ClientProxy):
@@ -109,6 +116,43 @@ class FailingClient(ClientProxy):
         raise Exception()
 
 
+class SubmittingClient(SuccessClient):
+    """Test class whose results arrive without a thread waiting for them."""
+
+    def fit(self, ins: FitIns, timeout: Optional[float]) -> FitRes:
+        """Raise an Exception because this method is not expected to be called."""
+        raise Exception()
+
+    def submit_fit(self, ins: FitIns, timeout: Optional[float]) -> "Future[FitRes]":
+        """Return a future which is completed later on another thread."""
+        future: "Future[FitRes]" = Future()
+        fit_res = super().fit(ins, timeout)
+        threading.Timer(0.01, future.set_result, args=(fit_res,)).start()
+        return future
+
+
+class StragglingClient(SuccessClient):
+    """Test class whose results never arrive."""
+
+    def __init__(self, cid: str) -> None:
+        super().__init__(cid)
+        self.futures: List["Future[Any]"] = []
+
+    def submit_fit(self, ins: FitIns, timeout: Optional[float]) -> "Future[FitRes]":
+        """Return a future which is never completed."""
+        future: "Future[FitRes]" = Future()
+        self.futures.append(future)
+        return future
+
+    def submit_evaluate(
+        self, ins: EvaluateIns, timeout: Optional[float]
+    ) -> "Future[EvaluateRes]":
+        """Return a future which is never completed."""
+        future: "Future[EvaluateRes]" = Future()
+        self.futures.append(future)
+        return future
+
+
 def test_fit_clients() -> None:
     """Test fit_clients."""
     # Prepare
@@ -130,6 +174,285 @@ def test_fit_clients() -> None:
     assert results[0][1].num_examples == 1
 
 
+def test_fit_clients_submit() -> None:
+    """Test that fit_clients does not call fit on proxies supporting submit_fit."""
+    # Prepare
+    clients: List[ClientProxy] = [SubmittingClient(str(cid)) for cid in [0, 1]]
+    ins: FitIns = FitIns(Parameters(tensors=[], tensor_type=""), {})
+    client_instructions = [(c, ins) for c in clients]
+
+    # Execute
+    results, failures = fit_clients(client_instructions, 1, None)
+
+    # Assert
+    assert len(results) == 2
+    assert not failures
+    assert {client.cid for client, _ in results} == {"0", "1"}
+
+
+def test_fit_clients_accumulate() -> None:
+    """Test fit_clients with incremental aggregation."""
+    # Prepare
+    clients: List[ClientProxy] = [
+        FailingClient("0"),
+        SuccessClient("1"),
+        SuccessClient("2"),
+    ]
+    arr = np.array([[1, 2], [3, 4], [5, 6]])
+    arr_serialized = ndarray_to_bytes(arr)
+    ins: FitIns = FitIns(Parameters(tensors=[arr_serialized], tensor_type=""), {})
+    client_instructions = [(c, ins) for c in clients]
+    accumulated: List[int] = []
+
+    def accumulate_fn(result: Tuple[ClientProxy, FitRes]) -> None:
+        _, fit_res = result
+        accumulated.append(len(fit_res.parameters.tensors))
+
+    # Execute
+    results, failures = fit_clients(
+        client_instructions, None, None, accumulate_fn=accumulate_fn
+    )
+
+    # Assert
+    assert len(results) == 2
+    assert len(failures) == 1
+    assert accumulated == [1, 1]
+    assert all(not fit_res.parameters.tensors for _, fit_res in results)
+
+
+def test_fit_clients_min_results() -> None:
+    """Test that fit_clients finishes after `min_results` results."""
+    # Prepare
+    straggler = StragglingClient("2")
+    clients: List[ClientProxy] = [SuccessClient("0"), SuccessClient("1"), straggler]
+    ins: FitIns = FitIns(Parameters(tensors=[], tensor_type=""), {})
+    client_instructions = [(c, ins) for c in clients]
+
+    # Execute
+    results, failures = fit_clients(client_instructions, None, None, min_results=2)
+
+    # Assert
+    assert {client.cid for client, _ in results} == {"0", "1"}
+    assert len(failures) == 1
+    assert isinstance(failures[0], LateClientError)
+    assert failures[0].client is straggler
+    assert straggler.futures[0].cancelled()
+
+
+def test_evaluate_clients_deadline() -> None:
+    """Test that evaluate_clients finishes when the deadline passes."""
+    # Prepare
+    clients: List[ClientProxy] = [SuccessClient("0"), StragglingClient("1")]
+    ins = EvaluateIns(Parameters(tensors=[], tensor_type=""), {})
+    client_instructions = [(c, ins) for c in clients]
+
+    # Execute
+    results, failures = evaluate_clients(
+        client_instructions, max_workers=None, timeout=None, deadline=0.05
+    )
+
+    # Assert
+    assert [client.cid for client, _ in results] == ["0"]
+    assert len(failures) == 1
+    assert isinstance(failures[0], LateClientError)
+
+
+def test_fit_round_incremental_aggregation() -> None:
+    """Test that fit_round folds results into the aggregate as they arrive."""
+    # Prepare
+    client_manager = SimpleClientManager()
+    for cid in ["0", "1"]:
+        client_manager.register(SuccessClient(cid))
+    strategy = FedAvg(min_fit_clients=2, min_available_clients=2)
+    server = Server(client_manager=client_manager, strategy=strategy)
+    server.parameters = ndarrays_to_parameters([np.zeros((3, 2))])
+
+    # Execute
+    res_fit = server.fit_round(server_round=1, timeout=None)
+
+    # Assert
+    assert res_fit is not None
+    parameters_aggregated, _, (results, _) = res_fit
+    assert parameters_aggregated is not None
+    np.testing.assert_equal(
+        parameters_to_ndarrays(parameters_aggregated),
+        [np.array([[1, 2], [3, 4], [5, 6]])],
+    )
+    assert len(results) == 2
+
+
+def test_fit_round_default_incremental_aggregation() -> None:
+    """Test that strategies without incremental aggregation see all parameters."""
+
+    # Prepare
+    class BufferingFedAvg(FedAvg):
+        """FedAvg using the default incremental aggregation of `Strategy`."""
+
+        begin_aggregate_fit = Strategy.begin_aggregate_fit
+        accumulate_fit = Strategy.accumulate_fit
+        finalize_aggregate_fit = Strategy.finalize_aggregate_fit
+
+        def aggregate_fit(self, server_round, results, failures):  # type: ignore
+            """Record the parameters of all results."""
+            self.aggregated = [  # pylint: disable=attribute-defined-outside-init
+                parameters_to_ndarrays(fit_res.parameters) for _, fit_res in results
+            ]
+            return None, {}
+
+    client_manager = SimpleClientManager()
+    for cid in ["0", "1"]:
+        client_manager.register(SuccessClient(cid))
+    strategy = BufferingFedAvg(min_fit_clients=2, min_available_clients=2)
+    server = Server(client_manager=client_manager, strategy=strategy)
+    server.parameters = ndarrays_to_parameters([np.zeros((3, 2))])
+
+    # Execute
+    res_fit = server.fit_round(server_round=1, timeout=None)
+
+    # Assert
+    assert res_fit is not None
+    _, _, (results, _) = res_fit
+    assert len(results) == 2
+    assert all(not fit_res.parameters.tensors for _, fit_res in results)
+    np.testing.assert_equal(
+        strategy.aggregated, [[np.array([[1, 2], [3, 4], [5, 6]])]] * 2
+    )
+
+
+def test_async_server_rounds() -> None:
+    """Test that AsyncServer runs rounds with blocking and non-blocking proxies."""
+    # Prepare
+    client_manager = SimpleClientManager()
+    clients: List[ClientProxy] = [
+        SubmittingClient("0"),
+        SuccessClient("1"),
+        FailingClient("2"),
+    ]
+    for client in clients:
+        client_manager.register(client)
+    strategy = FedAvg(
+        min_fit_clients=3,
+        min_evaluate_clients=3,
+        min_available_clients=3,
+        accept_failures=True,
+    )
+    server = AsyncServer(client_manager=client_manager, strategy=strategy)
+    server.parameters = ndarrays_to_parameters([np.zeros((3, 2))])
+
+    # Execute
+    fit_rounds = [server.fit_round(server_round=rnd, timeout=None) for rnd in [1, 2]]
+    res_evaluate = server.evaluate_round(server_round=2, timeout=None)
+    server.disconnect_all_clients(timeout=None)
+    server.close()
+
+    # Assert
+    for res_fit in fit_rounds:
+        assert res_fit is not None
+        _, _, (results, failures) = res_fit
+        assert {client.cid for client, _ in results} == {"0", "1"}
+        assert len(failures) == 1
+    assert res_evaluate is not None
+    loss, _, (evaluate_results, _) = res_evaluate
+    assert loss == 1.0
+    assert len(evaluate_results) == 2
+
+
+def test_async_server_partial_rounds() -> None:
+    """Test that AsyncServer finishes rounds early and marks late clients."""
+    # Prepare
+    client_manager = SimpleClientManager()
+    straggler = StragglingClient("2")
+    clients: List[ClientProxy] = [SubmittingClient("0"), SuccessClient("1"), straggler]
+    for client in clients:
+        client_manager.register(client)
+    strategy = FedAvg(
+        min_fit_clients=3,
+        min_evaluate_clients=3,
+        min_available_clients=3,
+        accept_failures=True,
+    )
+    server = AsyncServer(client_manager=client_manager, strategy=strategy)
+    server.parameters = ndarrays_to_parameters([np.zeros((3, 2))])
+    server.set_partial_rounds(min_results=2, deadline=5.0)
+
+    # Execute
+    res_fit = server.fit_round(server_round=1, timeout=None)
+    server.set_partial_rounds(deadline=0.05)
+    res_evaluate = server.evaluate_round(server_round=1, timeout=None)
+    server.close()
+
+    # Assert
+    assert res_fit is not None and res_evaluate is not None
+    _, _, (results, failures) = res_fit
+    assert {client.cid for client, _ in results} == {"0", "1"}
+    assert [type(failure) for failure in failures] == [LateClientError]
+    _, _, (evaluate_results, evaluate_failures) = res_evaluate
+    assert len(evaluate_results) == 2
+    assert [type(failure) for failure in evaluate_failures] == [LateClientError]
+    assert all(future.cancelled() for future in straggler.futures)
+    assert client_manager.slow_cids == {"2"}
+
+
+def test_fit_checkpoint_dir(tmp_path: Path) -> None:
+    """Test that the global model is checkpointed and mapped every round."""
+    # Prepare
+    client_manager = SimpleClientManager()
+    client_manager.register(SuccessClient("0"))
+    strategy = FedAvg(
+        min_fit_clients=1,
+        min_available_clients=1,
+        fraction_evaluate=0.0,
+        initial_parameters=ndarrays_to_parameters([np.zeros((3, 2))]),
+    )
+    server = Server(
+        client_manager=client_manager, strategy=strategy, checkpoint_dir=tmp_path
+    )
+
+    # Execute
+    server.fit(num_rounds=2, timeout=None)
+
+    # Assert
+    # Only the checkpoints of the last two rounds are kept by default
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "parameters_round_1.bin",
+        "parameters_round_2.bin",
+    ]
+    assert isinstance(server.parameters.tensors, MappedTensors)
+    np.testing.assert_equal(
+        parameters_to_ndarrays(server.parameters),
+        [np.array([[1, 2], [3, 4], [5, 6]])],
+    )
+
+
+def test_fit_checkpoint_keep(tmp_path: Path) -> None:
+    """Test that only the last `checkpoint_keep` checkpoints are kept."""
+    # Prepare
+    client_manager = SimpleClientManager()
+    client_manager.register(SuccessClient("0"))
+    strategy = FedAvg(
+        min_fit_clients=1,
+        min_available_clients=1,
+        fraction_evaluate=0.0,
+        initial_parameters=ndarrays_to_parameters([np.zeros((3, 2))]),
+    )
+    server = Server(
+        client_manager=client_manager,
+        strategy=strategy,
+        checkpoint_dir=tmp_path,
+        checkpoint_keep=1,
+    )
+
+    # Execute
+    server.fit(num_rounds=3, timeout=None)
+
+    # Assert
+    assert [path.name for path in tmp_path.iterdir()] == ["parameters_round_3.bin"]
+    np.testing.assert_equal(
+        parameters_to_ndarrays(server.parameters),
+        [np.array([[1, 2], [3, 4], [5, 6]])],
+    )
+
+
 def test_eval_clients() -> None:
     """Test eval_clients."""
     # Prepare
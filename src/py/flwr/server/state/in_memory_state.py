@@ -16,9 +16,11 @@
 
 
 import os
+import threading
+from collections import deque
 from datetime import datetime, timedelta
 from logging import ERROR
-from typing import Dict, List, Optional, Set
+from typing import Deque, Dict, List, Optional, Set
 from uuid import UUID, uuid4
 
 from flwr.common import log, now
@@ -26,15 +28,28 @@ from flwr.proto.task_pb2 import TaskIns, TaskRes
 from flwr.server.state.state import State
 from flwr.server.utils import validate_task_ins_or_res
 
+from .task_notifier import TaskNotifier, task_ins_key, task_res_key
+
 
 class InMemoryState(State):
-    """In-memory State implementation."""
+    """In-memory State implementation.
+
+    Undelivered TaskIns are queued per consumer node and TaskRes are indexed by the
+    TaskIns they reply to, so that pulling and pushing tasks does not depend on the
+    total number of stored tasks.
+    """
 
     def __init__(self) -> None:
         self.node_ids: Set[int] = set()
         self.workload_ids: Set[int] = set()
         self.task_ins_store: Dict[UUID, TaskIns] = {}
         self.task_res_store: Dict[UUID, TaskRes] = {}
+        # Undelivered TaskIns by consumer `node_id` (None for anonymous consumers)
+        self.task_ins_queues: Dict[Optional[int], Deque[UUID]] = {}
+        # TaskRes by the `task_id` of the TaskIns they reply to
+        self.task_res_by_ancestor: Dict[str, List[UUID]] = {}
+        self.lock = threading.Lock()
+        self.task_notifier: TaskNotifier = TaskNotifier()
 
     def store_task_ins(self, task_ins: TaskIns) -> Optional[UUID]:
         """Store one TaskIns."""
@@ -57,7 +72,12 @@ class InMemoryState(State):
         task_ins.task_id = str(task_id)
         task_ins.task.created_at = created_at.isoformat()
         task_ins.task.ttl = ttl.isoformat()
-        self.task_ins_store[task_id] = task_ins
+        consumer = task_ins.task.consumer
+        key = None if consumer.anonymous else consumer.node_id
+        with self.lock:
+            self.task_ins_store[task_id] = task_ins
+            self.task_ins_queues.setdefault(key, deque()).append(task_id)
+        self.task_notifier.notify([task_ins_key(key)])
 
         # Return the new task_id
         return task_id
@@ -69,29 +89,21 @@ class InMemoryState(State):
         if limit is not None and limit < 1:
             raise AssertionError("`limit` must be >= 1")
 
-        # Find TaskIns for node_id that were not delivered yet
+        # Take TaskIns for node_id that were not delivered yet from its queue
         task_ins_list: List[TaskIns] = []
-        for _, task_ins in self.task_ins_store.items():
-            # pylint: disable=too-many-boolean-expressions
-            if (
-                node_id is not None  # Not anonymous
-                and task_ins.task.consumer.anonymous is False
-                and task_ins.task.consumer.node_id == node_id
-                and task_ins.task.delivered_at == ""
-            ) or (
-                node_id is None  # Anonymous
-                and task_ins.task.consumer.anonymous is True
-                and task_ins.task.consumer.node_id == 0
-                and task_ins.task.delivered_at == ""
-            ):
-                task_ins_list.append(task_ins)
-            if limit and len(task_ins_list) == limit:
-                break
-
-        # Mark all of them as delivered
-        delivered_at = now().isoformat()
-        for task_ins in task_ins_list:
-            task_ins.task.delivered_at = delivered_at
+        with self.lock:
+            queue = self.task_ins_queues.get(node_id)
+            while queue and (not limit or len(task_ins_list) < limit):
+                task_ins = self.task_ins_store.get(queue.popleft())
+                if task_ins is not None and task_ins.task.delivered_at == "":
+                    task_ins_list.append(task_ins)
+            if queue is not None and not queue:
+                del self.task_ins_queues[node_id]
+
+            # Mark all of them as delivered
+            delivered_at = now().isoformat()
+            for task_ins in task_ins_list:
+                task_ins.task.delivered_at = delivered_at
 
         # Return TaskIns
         return task_ins_list
@@ -118,7 +130,11 @@ class InMemoryState(State):
         task_res.task_id = str(task_id)
         task_res.task.created_at = created_at.isoformat()
         task_res.task.ttl = ttl.isoformat()
-        self.task_res_store[task_id] = task_res
+        with self.lock:
+            self.task_res_store[task_id] = task_res
+            ancestor_id = task_res.task.ancestry[0]
+            self.task_res_by_ancestor.setdefault(ancestor_id, []).append(task_id)
+        self.task_notifier.notify([task_res_key(ancestor_id)])
 
         # Return the new task_id
         return task_id
@@ -130,43 +146,52 @@ class InMemoryState(State):
 
         # Find TaskRes that were not delivered yet
         task_res_list: List[TaskRes] = []
-        for _, task_res in self.task_res_store.items():
-            if (
-                UUID(task_res.task.ancestry[0]) in task_ids
-                and task_res.task.delivered_at == ""
-            ):
-                task_res_list.append(task_res)
-            if limit and len(task_res_list) == limit:
-                break
-
-        # Mark all of them as delivered
-        delivered_at = now().isoformat()
-        for task_res in task_res_list:
-            task_res.task.delivered_at = delivered_at
+        with self.lock:
+            for task_ins_id in task_ids:
+                task_res_ids = self.task_res_by_ancestor.get(str(task_ins_id), [])
+                for task_res_id in task_res_ids:
+                    task_res = self.task_res_store[task_res_id]
+                    if task_res.task.delivered_at == "":
+                        task_res_list.append(task_res)
+                    if limit and len(task_res_list) == limit:
+                        break
+                if limit and len(task_res_list) == limit:
+                    break
+
+            # Mark all of them as delivered
+            delivered_at = now().isoformat()
+            for task_res in task_res_list:
+                task_res.task.delivered_at = delivered_at
 
         # Return TaskRes
         return task_res_list
 
     def delete_tasks(self, task_ids: Set[UUID]) -> None:
         """Delete all delivered TaskIns/TaskRes pairs."""
-        task_ins_to_be_deleted: Set[UUID] = set()
-        task_res_to_be_deleted: Set[UUID] = set()
-
-        for task_ins_id in task_ids:
-            # Find the task_id of the matching task_res
-            for task_res_id, task_res in self.task_res_store.items():
-                if UUID(task_res.task.ancestry[0]) != task_ins_id:
+        with self.lock:
+            for task_ins_id in task_ids:
+                # Find the task_ids of the matching delivered task_res
+                task_res_ids = self.task_res_by_ancestor.get(str(task_ins_id), [])
+                delivered = [
+                    task_res_id
+                    for task_res_id in task_res_ids
+                    if self.task_res_store[task_res_id].task.delivered_at != ""
+                ]
+                if not delivered:
                     continue
-                if task_res.task.delivered_at == "":
-                    continue
-
-                task_ins_to_be_deleted.add(task_ins_id)
-                task_res_to_be_deleted.add(task_res_id)
 
-        for task_id in task_ins_to_be_deleted:
-            del self.task_ins_store[task_id]
-        for task_id in task_res_to_be_deleted:
-            del self.task_res_store[task_id]
+                self.task_ins_store.pop(task_ins_id, None)
+                for task_res_id in delivered:
+                    del self.task_res_store[task_res_id]
+                remaining = [
+                    task_res_id
+                    for task_res_id in task_res_ids
+                    if task_res_id in self.task_res_store
+                ]
+                if remaining:
+                    self.task_res_by_ancestor[str(task_ins_id)] = remaining
+                else:
+                    del self.task_res_by_ancestor[str(task_ins_id)]
 
     def num_task_ins(self) -> int:
         """Calculate the number of task_ins in store.
@@ -187,17 +212,19 @@ class InMemoryState(State):
         # Sample a random int64 as node_id
         node_id: int = int.from_bytes(os.urandom(8), "little", signed=True)
 
-        if node_id not in self.node_ids:
-            self.node_ids.add(node_id)
-            return node_id
+        with self.lock:
+            if node_id not in self.node_ids:
+                self.node_ids.add(node_id)
+                return node_id
         log(ERROR, "Unexpected node registration failure.")
         return 0
 
     def delete_node(self, node_id: int) -> None:
         """Delete a client node."""
-        if node_id not in self.node_ids:
-            raise ValueError(f"Node {node_id} not found")
-        self.node_ids.remove(node_id)
+        with self.lock:
+            if node_id not in self.node_ids:
+                raise ValueError(f"Node {node_id} not found")
+            self.node_ids.remove(node_id)
 
     def get_nodes(self, workload_id: int) -> Set[int]:
         """Return all available client nodes.
@@ -207,17 +234,19 @@ class InMemoryState(State):
         If the provided `workload_id` does not exist or has no matching nodes,
         an empty `Set` MUST be returned.
         """
-        if workload_id not in self.workload_ids:
-            return set()
-        return self.node_ids
+        with self.lock:
+            if workload_id not in self.workload_ids:
+                return set()
+            return set(self.node_ids)
 
     def create_workload(self) -> int:
         """Create one workload."""
         # Sample a random int64 as workload_id
         workload_id: int = int.from_bytes(os.urandom(8), "little", signed=True)
 
-        if workload_id not in self.workload_ids:
-            self.workload_ids.add(workload_id)
-            return workload_id
+        with self.lock:
+            if workload_id not in self.workload_ids:
+                self.workload_ids.add(workload_id)
+                return workload_id
         log(ERROR, "Unexpected workload creation failure.")
         return 0
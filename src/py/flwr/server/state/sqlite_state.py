@@ -15,12 +15,15 @@
 """SQLite based implemenation of server state."""
 
 
+import hashlib
 import os
 import re
 import sqlite3
+import threading
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 from logging import DEBUG, ERROR
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
+from typing import Any, ContextManager, Dict, List, Optional, Set, Tuple, Union, cast
 from uuid import UUID, uuid4
 
 from flwr.common import log, now
@@ -30,6 +33,7 @@ from flwr.proto.transport_pb2 import ClientMessage, ServerMessage
 from flwr.server.utils.validator import validate_task_ins_or_res
 
 from .state import State
+from .task_notifier import TaskNotifier, task_ins_key, task_res_key
 
 SQL_CREATE_TABLE_NODE = """
 CREATE TABLE IF NOT EXISTS node(
@@ -82,11 +86,108 @@ CREATE TABLE IF NOT EXISTS task_res(
 );
 """
 
+SQL_CREATE_INDEX_TASK_INS_CONSUMER = """
+CREATE INDEX IF NOT EXISTS idx_task_ins_consumer
+ON task_ins(consumer_anonymous, consumer_node_id, delivered_at);
+"""
+
+SQL_CREATE_INDEX_TASK_INS_WORKLOAD = """
+CREATE INDEX IF NOT EXISTS idx_task_ins_workload ON task_ins(workload_id);
+"""
+
+SQL_CREATE_INDEX_TASK_RES_ANCESTRY = """
+CREATE INDEX IF NOT EXISTS idx_task_res_ancestry ON task_res(ancestry, delivered_at);
+"""
+
+SQL_CREATE_INDEX_TASK_RES_WORKLOAD = """
+CREATE INDEX IF NOT EXISTS idx_task_res_workload ON task_res(workload_id);
+"""
+
+# Message payloads are stored in table `blob`. TaskIns payloads are stored once per
+# distinct content, keyed by their SHA-256 digest, TaskRes payloads are keyed by a
+# random ID. The `legacy_*_message` columns of tasks hold the keys.
+SQL_CREATE_TABLE_BLOB = """
+CREATE TABLE IF NOT EXISTS blob(
+    digest                  TEXT PRIMARY KEY,
+    data                    BLOB NOT NULL
+);
+"""
+
+SQL_MIGRATE_TASK_INS_TO_BLOB = [
+    """
+    INSERT OR IGNORE INTO blob
+    SELECT sha256(legacy_server_message), legacy_server_message
+    FROM task_ins
+    WHERE legacy_server_message IS NOT NULL;
+    """,
+    """
+    UPDATE task_ins
+    SET legacy_server_message = sha256(legacy_server_message)
+    WHERE legacy_server_message IS NOT NULL;
+    """,
+]
+
+SQL_MIGRATE_TASK_RES_TO_BLOB = [
+    """
+    INSERT OR IGNORE INTO blob
+    SELECT sha256(legacy_client_message), legacy_client_message
+    FROM task_res
+    WHERE legacy_client_message IS NOT NULL;
+    """,
+    """
+    UPDATE task_res
+    SET legacy_client_message = sha256(legacy_client_message)
+    WHERE legacy_client_message IS NOT NULL;
+    """,
+]
+
+SQL_CREATE_INDEX_TASK_INS_BLOB = """
+CREATE INDEX IF NOT EXISTS idx_task_ins_blob ON task_ins(legacy_server_message);
+"""
+
+SQL_CREATE_INDEX_TASK_RES_BLOB = """
+CREATE INDEX IF NOT EXISTS idx_task_res_blob ON task_res(legacy_client_message);
+"""
+
+# Schema migrations, applied in order. The number of applied migrations is stored
+# as `user_version` of the database. Append new migrations, never modify them.
+SQL_MIGRATIONS: List[List[str]] = [
+    [
+        SQL_CREATE_TABLE_WORKLOAD,
+        SQL_CREATE_TABLE_TASK_INS,
+        SQL_CREATE_TABLE_TASK_RES,
+        SQL_CREATE_TABLE_NODE,
+    ],
+    [
+        SQL_CREATE_INDEX_TASK_INS_CONSUMER,
+        SQL_CREATE_INDEX_TASK_INS_WORKLOAD,
+        SQL_CREATE_INDEX_TASK_RES_ANCESTRY,
+        SQL_CREATE_INDEX_TASK_RES_WORKLOAD,
+    ],
+    [
+        SQL_CREATE_TABLE_BLOB,
+        *SQL_MIGRATE_TASK_INS_TO_BLOB,
+        *SQL_MIGRATE_TASK_RES_TO_BLOB,
+        SQL_CREATE_INDEX_TASK_INS_BLOB,
+        SQL_CREATE_INDEX_TASK_RES_BLOB,
+    ],
+]
+
 DictOrTuple = Union[Tuple[Any], Dict[str, Any]]
 
 
 class SqliteState(State):
-    """SQLite-based state implementation."""
+    """SQLite-based state implementation.
+
+    Each thread uses its own connection, which is opened on first use and kept open for
+    the lifetime of the state, so one instance can be shared by all threads of a
+    process. File-based databases use write-ahead logging, such that readers do not
+    block writers.
+
+    Readers waiting for tasks are notified when tasks are stored through this instance.
+    Tasks stored by other processes sharing the database file are picked up by checking
+    for them once per second.
+    """
 
     def __init__(
         self,
@@ -98,34 +199,101 @@ class SqliteState(State):
         ----------
         database : (path-like object)
             The path to the database file to be opened. Pass ":memory:" to open
-            a connection to a database that is in RAM, instead of on disk.
+            a connection to a database that is in RAM, instead of on disk. An
+            in-memory database is shared by all threads using a single connection,
+            which is used by one thread at a time.
         """
         self.database_path = database_path
-        self.conn: Optional[sqlite3.Connection] = None
+        self.log_queries = False
+        self._initialized = False
+        self._local = threading.local()
+        self._shared_conn: Optional[sqlite3.Connection] = None
+        # Serializes statements and transactions on the shared connection
+        self._shared_conn_lock = threading.Lock()
+        # The last TaskIns payload stored and its digest
+        self._last_task_ins_blob: Optional[Tuple[bytes, str]] = None
+        self.task_notifier: TaskNotifier = TaskNotifier(
+            poll_interval=None if database_path == ":memory:" else 1.0
+        )
+
+    @property
+    def conn(self) -> Optional[sqlite3.Connection]:
+        """Return the connection of the current thread.
+
+        Returns None if the state is not initialized.
+        """
+        if not self._initialized:
+            return None
+        if self._shared_conn is not None:
+            return self._shared_conn
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    def _lock(self) -> ContextManager[Any]:
+        """Return a context manager to hold while using the connection.
+
+        Statements and transactions of different threads must not interleave on the
+        connection shared by all threads, while connections of threads are independent.
+        """
+        if self._shared_conn is not None:
+            return self._shared_conn_lock
+        return nullcontext()
 
     def initialize(self, log_queries: bool = False) -> List[Tuple[str]]:
-        """Create tables if they don't exist yet.
+        """Create tables and indexes if they don't exist yet.
 
         Parameters
         ----------
         log_queries : bool
             Log each query which is executed.
         """
-        self.conn = sqlite3.connect(self.database_path)
-        self.conn.execute("PRAGMA foreign_keys = ON;")
-        self.conn.row_factory = dict_factory
-        if log_queries:
-            self.conn.set_trace_callback(lambda query: log(DEBUG, query))
-        cur = self.conn.cursor()
-
-        # Create each table if not exists queries
-        cur.execute(SQL_CREATE_TABLE_WORKLOAD)
-        cur.execute(SQL_CREATE_TABLE_TASK_INS)
-        cur.execute(SQL_CREATE_TABLE_TASK_RES)
-        cur.execute(SQL_CREATE_TABLE_NODE)
-        res = cur.execute("SELECT name FROM sqlite_schema;")
-
-        return res.fetchall()
+        self.log_queries = log_queries
+        conn = self._connect()
+        if self.database_path == ":memory:":
+            self._shared_conn = conn
+        else:
+            self._local.conn = conn
+        self._initialized = True
+
+        with self._lock():
+            # Apply pending migrations in a single transaction
+            version: int = conn.execute("PRAGMA user_version;").fetchone()[
+                "user_version"
+            ]
+            if version < len(SQL_MIGRATIONS):
+                with conn:
+                    conn.execute("BEGIN IMMEDIATE;")
+                    # Re-read the version, another process might have migrated
+                    # meanwhile
+                    version = conn.execute("PRAGMA user_version;").fetchone()[
+                        "user_version"
+                    ]
+                    for statements in SQL_MIGRATIONS[version:]:
+                        for statement in statements:
+                            conn.execute(statement)
+                    conn.execute(f"PRAGMA user_version = {len(SQL_MIGRATIONS)};")
+            res = conn.execute("SELECT name FROM sqlite_schema;")
+
+            return res.fetchall()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a connection to the database."""
+        if self.database_path == ":memory:":
+            conn = sqlite3.connect(self.database_path, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(self.database_path)
+            conn.execute("PRAGMA journal_mode = WAL;")
+            # Safe in WAL mode: a power loss can only roll back recent transactions
+            conn.execute("PRAGMA synchronous = NORMAL;")
+        conn.execute("PRAGMA foreign_keys = ON;")
+        conn.create_function("sha256", 1, blob_digest, deterministic=True)
+        conn.row_factory = dict_factory
+        if self.log_queries:
+            conn.set_trace_callback(lambda query: log(DEBUG, query))
+        return conn
 
     def query(
         self,
@@ -143,7 +311,7 @@ class SqliteState(State):
         query = re.sub(r"\s+", " ", query)
 
         try:
-            with self.conn:
+            with self._lock(), self.conn:
                 if (
                     len(data) > 0
                     and isinstance(data, (tuple, list))
@@ -162,6 +330,87 @@ class SqliteState(State):
 
         return result
 
+    def _insert_task(
+        self, table: str, task_dict: Dict[str, Any], message_key: str
+    ) -> None:
+        """Insert a task, storing its message payload in the blob store.
+
+        Tasks with identical payloads (e.g., the same global model sent to many nodes)
+        reference a single copy of the payload.
+        """
+        if self.conn is None:
+            raise Exception("State is not initialized.")
+
+        payload: Optional[bytes] = task_dict[message_key]
+        digest = None if payload is None else self._blob_key(table, payload)
+        data = {**task_dict, message_key: digest}
+        columns = ", ".join([f":{key}" for key in data])
+        query = f"INSERT INTO {table} VALUES({columns});"
+
+        with self._lock(), self.conn:
+            # Take the write lock first, so the payload cannot be garbage collected
+            # between the check and the insertion of the task
+            self.conn.execute("BEGIN IMMEDIATE;")
+            if (
+                digest is not None
+                and self.conn.execute(
+                    "SELECT 1 FROM blob WHERE digest = ?;", (digest,)
+                ).fetchone()
+                is None
+            ):
+                self.conn.execute("INSERT INTO blob VALUES(?, ?);", (digest, payload))
+            self.conn.execute(query, data)
+
+    def _blob_key(self, table: str, payload: bytes) -> str:
+        """Return the key to store a message payload under in the blob store.
+
+        TaskIns payloads are keyed by their digest, so that the same global model sent
+        to many nodes is stored once. Consecutive TaskIns usually carry the same
+        payload, which is hashed only once: comparing it with the previous payload is
+        much cheaper than hashing it again. TaskRes payloads are unique to the node
+        returning them and are keyed by a random ID instead of being hashed.
+        """
+        if table != "task_ins":
+            return uuid4().hex
+        last_blob = self._last_task_ins_blob
+        if last_blob is not None and last_blob[0] == payload:
+            return last_blob[1]
+        digest = blob_digest(payload)
+        self._last_task_ins_blob = (payload, digest)
+        return digest
+
+    def _deliver_tasks(
+        self, query: str, data: Dict[str, Any], message_key: str
+    ) -> List[Dict[str, Any]]:
+        """Mark tasks as delivered and return them with their message payloads.
+
+        The payloads are read in the same transaction as the update, so they cannot be
+        garbage collected by `delete_tasks` in between. Each distinct payload is read
+        only once.
+        """
+        if self.conn is None:
+            raise Exception("State is not initialized.")
+
+        query = re.sub(r"\s+", " ", query)
+        with self._lock(), self.conn:
+            rows: List[Dict[str, Any]] = self.conn.execute(query, data).fetchall()
+            digests = list({row[message_key] for row in rows} - {None})
+            if not digests:
+                return rows
+            placeholders = ",".join([f":id_{i}" for i in range(len(digests))])
+            blob_query = (
+                f"SELECT digest, data FROM blob WHERE digest IN ({placeholders});"
+            )
+            blob_data = {f"id_{index}": digest for index, digest in enumerate(digests)}
+            payloads = {
+                row["digest"]: row["data"]
+                for row in self.conn.execute(blob_query, blob_data).fetchall()
+            }
+        for row in rows:
+            if row[message_key] is not None:
+                row[message_key] = payloads[row[message_key]]
+        return rows
+
     def store_task_ins(self, task_ins: TaskIns) -> Optional[UUID]:
         """Store one TaskIns.
 
@@ -194,18 +443,20 @@ class SqliteState(State):
         task_ins.task_id = str(task_id)
         task_ins.task.created_at = created_at.isoformat()
         task_ins.task.ttl = ttl.isoformat()
-        data = (task_ins_to_dict(task_ins),)
-        columns = ", ".join([f":{key}" for key in data[0]])
-        query = f"INSERT INTO task_ins VALUES({columns});"
+        data = task_ins_to_dict(task_ins)
 
         # Only invalid workload_id can trigger IntegrityError.
         # This may need to be changed in the future version with more integrity checks.
         try:
-            self.query(query, data)
+            self._insert_task("task_ins", data, "legacy_server_message")
         except sqlite3.IntegrityError:
             log(ERROR, "`workload` is invalid")
             return None
 
+        consumer = task_ins.task.consumer
+        self.task_notifier.notify(
+            [task_ins_key(None if consumer.anonymous else consumer.node_id)]
+        )
         return task_id
 
     def get_task_ins(
@@ -292,7 +543,7 @@ class SqliteState(State):
                 data[f"id_{index}"] = str(task_id)
 
             # Run query
-            rows = self.query(query, data)
+            rows = self._deliver_tasks(query, data, "legacy_server_message")
 
         result = [dict_to_task_ins(row) for row in rows]
 
@@ -329,18 +580,17 @@ class SqliteState(State):
         task_res.task_id = str(task_id)
         task_res.task.created_at = created_at.isoformat()
         task_res.task.ttl = ttl.isoformat()
-        data = (task_res_to_dict(task_res),)
-        columns = ", ".join([f":{key}" for key in data[0]])
-        query = f"INSERT INTO task_res VALUES({columns});"
+        data = task_res_to_dict(task_res)
 
         # Only invalid workload_id can trigger IntegrityError.
         # This may need to be changed in the future version with more integrity checks.
         try:
-            self.query(query, data)
+            self._insert_task("task_res", data, "legacy_client_message")
         except sqlite3.IntegrityError:
             log(ERROR, "`workload` is invalid")
             return None
 
+        self.task_notifier.notify([task_res_key(task_res.task.ancestry[0])])
         return task_id
 
     def get_task_res(self, task_ids: Set[UUID], limit: Optional[int]) -> List[TaskRes]:
@@ -404,7 +654,7 @@ class SqliteState(State):
                 data[f"id_{index}"] = str(task_id)
 
             # Run query
-            rows = self.query(query, data)
+            rows = self._deliver_tasks(query, data, "legacy_client_message")
 
         result = [dict_to_task_res(row) for row in rows]
         return result
@@ -458,12 +708,24 @@ class SqliteState(State):
             AND delivered_at != '';
         """
 
+        # 3. Query: Delete payloads no longer referenced by any task
+        query_3 = """
+            DELETE FROM blob
+            WHERE NOT EXISTS (
+                SELECT 1 FROM task_ins WHERE legacy_server_message = blob.digest
+            )
+            AND NOT EXISTS (
+                SELECT 1 FROM task_res WHERE legacy_client_message = blob.digest
+            );
+        """
+
         if self.conn is None:
             raise Exception("State not intitialized")
 
-        with self.conn:
+        with self._lock(), self.conn:
             self.conn.execute(query_1, data)
             self.conn.execute(query_2, data)
+            self.conn.execute(query_3)
 
         return None
 
@@ -520,6 +782,11 @@ class SqliteState(State):
         return 0
 
 
+def blob_digest(payload: bytes) -> str:
+    """Return the key of a payload in the blob store."""
+    return hashlib.sha256(payload).hexdigest()
+
+
 def dict_factory(
     cursor: sqlite3.Cursor,
     row: sqlite3.Row,
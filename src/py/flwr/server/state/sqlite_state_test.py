@@ -15,10 +15,17 @@
 """Test for utility functions."""
 # pylint: disable=no-self-use, invalid-name, disable=R0904
 
+import tempfile
 import unittest
 
-from flwr.server.state.sqlite_state import task_ins_to_dict
-from flwr.server.state.state_test import create_task_ins
+from flwr.proto.transport_pb2 import ClientMessage, ServerMessage
+from flwr.server.state.sqlite_state import (
+    SQL_MIGRATIONS,
+    SqliteState,
+    blob_digest,
+    task_ins_to_dict,
+)
+from flwr.server.state.state_test import create_task_ins, create_task_res
 
 
 class SqliteStateTest(unittest.TestCase):
@@ -52,5 +59,112 @@ class SqliteStateTest(unittest.TestCase):
             assert key in result
 
 
+class SqliteStateBlobTest(unittest.TestCase):
+    """Test storing message payloads in the blob store."""
+
+    def setUp(self) -> None:
+        """Create an in-memory SqliteState."""
+        self.state = SqliteState(":memory:")
+        self.state.initialize()
+
+    def num_blobs(self) -> int:
+        """Return the number of payloads in the blob store."""
+        return int(self.state.query("SELECT count(*) AS num FROM blob;")[0]["num"])
+
+    def test_identical_payloads_are_stored_once(self) -> None:
+        """Check that tasks with the same message share one payload."""
+        # Prepare
+        workload_id = self.state.create_workload()
+        server_message = ServerMessage(
+            fit_ins=ServerMessage.FitIns(config={}),
+        )
+        for node_id in range(1, 4):
+            task_ins = create_task_ins(
+                consumer_node_id=node_id, anonymous=False, workload_id=workload_id
+            )
+            task_ins.task.legacy_server_message.CopyFrom(server_message)
+            self.state.store_task_ins(task_ins)
+
+        # Execute
+        task_ins_list = self.state.get_task_ins(node_id=2, limit=None)
+
+        # Assert
+        assert self.num_blobs() == 1
+        assert (
+            self.state.query("SELECT legacy_server_message FROM task_ins;")
+            == [
+                {
+                    "legacy_server_message": blob_digest(
+                        server_message.SerializeToString()
+                    )
+                }
+            ]
+            * 3
+        )
+        assert len(task_ins_list) == 1
+        assert task_ins_list[0].task.legacy_server_message == server_message
+
+    def test_delete_tasks_collects_payloads(self) -> None:
+        """Check that payloads are deleted with the last task referencing them."""
+        # Prepare
+        workload_id = self.state.create_workload()
+        task_ins = create_task_ins(
+            consumer_node_id=1, anonymous=False, workload_id=workload_id
+        )
+        task_id = self.state.store_task_ins(task_ins)
+        assert task_id is not None
+        self.state.get_task_ins(node_id=1, limit=None)
+        task_res = create_task_res(
+            producer_node_id=1,
+            anonymous=False,
+            ancestry=[str(task_id)],
+            workload_id=workload_id,
+        )
+        task_res.task.legacy_client_message.CopyFrom(
+            ClientMessage(fit_res=ClientMessage.FitRes(num_examples=1))
+        )
+        self.state.store_task_res(task_res)
+        task_res_list = self.state.get_task_res(task_ids={task_id}, limit=None)
+        assert self.num_blobs() == 2
+
+        # Execute
+        self.state.delete_tasks(task_ids={task_id})
+
+        # Assert
+        assert task_res_list[0].task.legacy_client_message.fit_res.num_examples == 1
+        assert self.num_blobs() == 0
+
+    def test_migrate_inline_payloads(self) -> None:
+        """Check that payloads stored in task rows are moved to the blob store."""
+        # Prepare
+        # pylint: disable-next=consider-using-with,attribute-defined-outside-init
+        self.tmp_file = tempfile.NamedTemporaryFile()
+        state = SqliteState(self.tmp_file.name)
+        state.initialize()
+        state.query("DROP TABLE blob;")
+        state.query("PRAGMA user_version = 2;")
+        workload_id = state.create_workload()
+        task_ins = create_task_ins(
+            consumer_node_id=1, anonymous=False, workload_id=workload_id
+        )
+        task_ins.task_id = "0"
+        data = task_ins_to_dict(task_ins)
+        columns = ", ".join([f":{key}" for key in data])
+        state.query(f"INSERT INTO task_ins VALUES({columns});", data)
+
+        # Execute
+        state.initialize()
+        task_ins_list = state.get_task_ins(node_id=1, limit=None)
+
+        # Assert
+        assert state.query("PRAGMA user_version;") == [
+            {"user_version": len(SQL_MIGRATIONS)}
+        ]
+        assert state.query("SELECT count(*) AS num FROM blob;") == [{"num": 1}]
+        assert task_ins_list[0].task.legacy_server_message == (
+            task_ins.task.legacy_server_message
+        )
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
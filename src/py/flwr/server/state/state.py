@@ -21,10 +21,15 @@ from uuid import UUID
 
 from flwr.proto.task_pb2 import TaskIns, TaskRes
 
+from .task_notifier import TaskNotifier, task_ins_key, task_res_key
+
 
 class State(abc.ABC):
     """Abstract State."""
 
+    # Implementations that notify it when tasks are stored allow readers to wait
+    task_notifier: Optional[TaskNotifier] = None
+
     @abc.abstractmethod
     def store_task_ins(self, task_ins: TaskIns) -> Optional[UUID]:
         """Store one TaskIns.
@@ -75,6 +80,23 @@ class State(abc.ABC):
         `limit` is set, it has to be greater zero.
         """
 
+    def get_task_ins_or_wait(
+        self, node_id: Optional[int], limit: Optional[int], timeout: float
+    ) -> List[TaskIns]:
+        """Get TaskIns like `get_task_ins`, waiting up to `timeout` seconds for one.
+
+        If no TaskIns is available, this blocks until one is stored for `node_id` or
+        `timeout` expires, instead of letting the caller poll. It returns immediately
+        if `timeout` is not positive or the state does not support waiting.
+        """
+        if self.task_notifier is None or timeout <= 0:
+            return self.get_task_ins(node_id=node_id, limit=limit)
+        return self.task_notifier.wait_for(
+            keys=[task_ins_key(node_id)],
+            fetch_fn=lambda: self.get_task_ins(node_id=node_id, limit=limit),
+            timeout=timeout,
+        )
+
     @abc.abstractmethod
     def store_task_res(self, task_res: TaskRes) -> Optional[UUID]:
         """Store one TaskRes.
@@ -113,6 +135,24 @@ class State(abc.ABC):
         available. If `limit` is set, it has to be greater zero.
         """
 
+    def get_task_res_or_wait(
+        self, task_ids: Set[UUID], limit: Optional[int], timeout: float
+    ) -> List[TaskRes]:
+        """Get TaskRes like `get_task_res`, waiting up to `timeout` seconds for one.
+
+        If no TaskRes is available, this blocks until a TaskRes for one of `task_ids`
+        is stored or `timeout` expires, instead of letting the caller poll. It returns
+        immediately if `timeout` is not positive or the state does not support
+        waiting.
+        """
+        if self.task_notifier is None or timeout <= 0 or not task_ids:
+            return self.get_task_res(task_ids=task_ids, limit=limit)
+        return self.task_notifier.wait_for(
+            keys=[task_res_key(str(task_id)) for task_id in task_ids],
+            fetch_fn=lambda: self.get_task_res(task_ids=task_ids, limit=limit),
+            timeout=timeout,
+        )
+
     @abc.abstractmethod
     def num_task_ins(self) -> int:
         """Calculate the number of task_ins in store.
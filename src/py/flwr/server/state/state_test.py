@@ -16,16 +16,20 @@
 # pylint: disable=no-self-use, invalid-name, disable=R0904
 
 import tempfile
+import threading
+import time
 import unittest
 from abc import abstractmethod
 from datetime import datetime, timezone
 from typing import List
+from unittest.mock import patch
 from uuid import uuid4
 
 from flwr.proto.node_pb2 import Node
 from flwr.proto.task_pb2 import Task, TaskIns, TaskRes
 from flwr.proto.transport_pb2 import ClientMessage, ServerMessage
-from flwr.server.state import InMemoryState, SqliteState, State
+from flwr.server.state import InMemoryState, SqliteState, State, StateFactory
+from flwr.server.state.sqlite_state import SQL_MIGRATIONS, blob_digest
 
 
 class StateTest(unittest.TestCase):
@@ -269,6 +273,154 @@ class StateTest(unittest.TestCase):
         # Assert
         assert len(task_ins_list) == 0
 
+    def test_get_task_ins_limit_keeps_remaining(self) -> None:
+        """Test that TaskIns beyond `limit` are delivered by the next call."""
+        # Prepare
+        state: State = self.state_factory()
+        workload_id = state.create_workload()
+        task_ids = [
+            state.store_task_ins(
+                create_task_ins(
+                    consumer_node_id=1, anonymous=False, workload_id=workload_id
+                )
+            )
+            for _ in range(3)
+        ]
+        state.store_task_ins(
+            create_task_ins(
+                consumer_node_id=2, anonymous=False, workload_id=workload_id
+            )
+        )
+
+        # Execute
+        first = state.get_task_ins(node_id=1, limit=2)
+        second = state.get_task_ins(node_id=1, limit=2)
+        third = state.get_task_ins(node_id=1, limit=None)
+
+        # Assert
+        assert len(first) == 2
+        assert len(second) == 1
+        assert not third
+        assert {task_ins.task_id for task_ins in first + second} == {
+            str(task_id) for task_id in task_ids
+        }
+
+    def test_get_task_res_only_for_task_ids(self) -> None:
+        """Test that only TaskRes replying to the given TaskIns are returned."""
+        # Prepare
+        state: State = self.state_factory()
+        workload_id = state.create_workload()
+        task_ids = [
+            state.store_task_ins(
+                create_task_ins(
+                    consumer_node_id=1, anonymous=False, workload_id=workload_id
+                )
+            )
+            for _ in range(2)
+        ]
+        for task_id in task_ids:
+            state.store_task_res(
+                create_task_res(
+                    producer_node_id=1,
+                    anonymous=False,
+                    ancestry=[str(task_id)],
+                    workload_id=workload_id,
+                )
+            )
+        assert task_ids[0] is not None
+
+        # Execute
+        task_res_list = state.get_task_res(task_ids={task_ids[0]}, limit=None)
+        task_res_list_again = state.get_task_res(task_ids={task_ids[0]}, limit=None)
+
+        # Assert
+        assert len(task_res_list) == 1
+        assert task_res_list[0].task.ancestry == [str(task_ids[0])]
+        assert not task_res_list_again
+
+    def test_get_task_ins_or_wait_wakes_up_on_store(self) -> None:
+        """Test that a waiting reader receives a TaskIns stored meanwhile."""
+        # Prepare
+        state: State = self.state_factory()
+        workload_id = state.create_workload()
+        timer = threading.Timer(
+            0.1,
+            state.store_task_ins,
+            args=[
+                create_task_ins(
+                    consumer_node_id=1, anonymous=False, workload_id=workload_id
+                )
+            ],
+        )
+
+        # Execute
+        start_time = time.monotonic()
+        timer.start()
+        task_ins_list = state.get_task_ins_or_wait(node_id=1, limit=1, timeout=10)
+        elapsed = time.monotonic() - start_time
+        timer.join()
+
+        # Assert
+        assert len(task_ins_list) == 1
+        assert elapsed < 5
+
+    def test_get_task_ins_or_wait_timeout(self) -> None:
+        """Test that waiting ends after the timeout if no TaskIns is stored."""
+        # Prepare
+        state: State = self.state_factory()
+        workload_id = state.create_workload()
+        state.store_task_ins(
+            create_task_ins(
+                consumer_node_id=2, anonymous=False, workload_id=workload_id
+            )
+        )
+
+        # Execute
+        start_time = time.monotonic()
+        task_ins_list = state.get_task_ins_or_wait(node_id=1, limit=1, timeout=0.1)
+        elapsed = time.monotonic() - start_time
+
+        # Assert
+        assert not task_ins_list
+        assert elapsed >= 0.1
+
+    def test_get_task_res_or_wait_wakes_up_on_store(self) -> None:
+        """Test that a waiting reader receives a TaskRes stored meanwhile."""
+        # Prepare
+        state: State = self.state_factory()
+        workload_id = state.create_workload()
+        task_id = state.store_task_ins(
+            create_task_ins(
+                consumer_node_id=1, anonymous=False, workload_id=workload_id
+            )
+        )
+        assert task_id is not None
+        timer = threading.Timer(
+            0.1,
+            state.store_task_res,
+            args=[
+                create_task_res(
+                    producer_node_id=1,
+                    anonymous=False,
+                    ancestry=[str(task_id)],
+                    workload_id=workload_id,
+                )
+            ],
+        )
+
+        # Execute
+        start_time = time.monotonic()
+        timer.start()
+        task_res_list = state.get_task_res_or_wait(
+            task_ids={task_id}, limit=None, timeout=10
+        )
+        elapsed = time.monotonic() - start_time
+        timer.join()
+
+        # Assert
+        assert len(task_res_list) == 1
+        assert elapsed < 5
+
     def test_get_task_ins_limit_throws_for_limit_zero(self) -> None:
         """Fail call with limit=0."""
         # Prepare
@@ -474,6 +626,33 @@ class InMemoryStateTest(StateTest):
         """Return InMemoryState."""
         return InMemoryState()
 
+    def test_concurrent_create_and_delete_nodes(self) -> None:
+        """Test that threads can create, list and delete nodes concurrently."""
+        # Prepare
+        state = self.state_factory()
+        workload_id = state.create_workload()
+        errors: List[Exception] = []
+
+        def create_and_delete_nodes() -> None:
+            for _ in range(200):
+                try:
+                    node_id = state.create_node()
+                    state.get_nodes(workload_id)
+                    state.delete_node(node_id)
+                except Exception as ex:  # pylint: disable=broad-except
+                    errors.append(ex)
+
+        # Execute
+        threads = [threading.Thread(target=create_and_delete_nodes) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert not errors
+        assert state.get_nodes(workload_id) == set()
+
 
 class SqliteInMemoryStateTest(StateTest, unittest.TestCase):
     """Test SqliteState implemenation with in-memory database."""
@@ -495,7 +674,85 @@ class SqliteInMemoryStateTest(StateTest, unittest.TestCase):
         result = state.query("SELECT name FROM sqlite_schema;")
 
         # Assert
-        assert len(result) == 8
+        assert len(result) == 16
+
+    def test_shared_connection_concurrent_queries(self) -> None:
+        """Test that threads can use the shared connection concurrently."""
+        # Prepare
+        state = self.state_factory()
+        workload_id = state.create_workload()
+        errors: List[Exception] = []
+
+        def create_and_delete_nodes() -> None:
+            for _ in range(200):
+                try:
+                    node_id = state.create_node()
+                    state.get_nodes(workload_id)
+                    state.delete_node(node_id)
+                except Exception as ex:  # pylint: disable=broad-except
+                    errors.append(ex)
+
+        # Execute
+        threads = [threading.Thread(target=create_and_delete_nodes) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert not errors
+        assert state.get_nodes(workload_id) == set()
+
+    def test_shared_connection_concurrent_tasks(self) -> None:
+        """Test that threads can store and get tasks concurrently."""
+        # Prepare
+        state = self.state_factory()
+        workload_id = state.create_workload()
+        errors: List[Exception] = []
+
+        def store_and_get_task_ins() -> None:
+            for _ in range(200):
+                try:
+                    task_ins = create_task_ins(
+                        consumer_node_id=0, anonymous=True, workload_id=workload_id
+                    )
+                    assert state.store_task_ins(task_ins) is not None
+                    state.get_task_ins(node_id=None, limit=None)
+                except Exception as ex:  # pylint: disable=broad-except
+                    errors.append(ex)
+
+        # Execute
+        threads = [threading.Thread(target=store_and_get_task_ins) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert not errors
+        assert state.num_task_ins() == 1600
+        assert state.get_task_ins(node_id=None, limit=None) == []
+
+    def test_task_ins_payload_hashed_once(self) -> None:
+        """Test that TaskIns with the same payload hash and store it once."""
+        # Prepare
+        state = self.state_factory()
+        workload_id = state.create_workload()
+
+        # Execute
+        with patch(
+            "flwr.server.state.sqlite_state.blob_digest", wraps=blob_digest
+        ) as digest_mock:
+            for _ in range(3):
+                task_ins = create_task_ins(
+                    consumer_node_id=0, anonymous=True, workload_id=workload_id
+                )
+                state.store_task_ins(task_ins)
+
+        # Assert
+        assert digest_mock.call_count == 1
+        assert state.query("SELECT count(*) AS num FROM blob;")[0]["num"] == 1
+        assert len(state.get_task_ins(node_id=None, limit=None)) == 3
 
 
 class SqliteFileBasedTest(StateTest, unittest.TestCase):
@@ -520,7 +777,65 @@ class SqliteFileBasedTest(StateTest, unittest.TestCase):
         result = state.query("SELECT name FROM sqlite_schema;")
 
         # Assert
-        assert len(result) == 8
+        assert len(result) == 16
+
+    def test_initialize_configures_database(self) -> None:
+        """Test that WAL mode is enabled and migrations are only applied once."""
+        # Prepare
+        state = self.state_factory()
+        workload_id = state.create_workload()
+
+        # Execute
+        state_reopened = SqliteState(database_path=self.tmp_file.name)
+        state_reopened.initialize()
+
+        # Assert
+        assert state_reopened.query("PRAGMA journal_mode;") == [{"journal_mode": "wal"}]
+        assert state_reopened.query("PRAGMA user_version;") == [
+            {"user_version": len(SQL_MIGRATIONS)}
+        ]
+        assert state_reopened.get_nodes(workload_id) == set()
+        assert state_reopened.query("SELECT * FROM workload;") == [
+            {"workload_id": workload_id}
+        ]
+
+    def test_connection_per_thread(self) -> None:
+        """Test that one state can be used from multiple threads."""
+        # Prepare
+        state = self.state_factory()
+        workload_id = state.create_workload()
+        task_ins = create_task_ins(
+            consumer_node_id=0, anonymous=True, workload_id=workload_id
+        )
+        connections = []
+
+        def store() -> None:
+            connections.append(state.conn)
+            state.store_task_ins(task_ins)
+
+        # Execute
+        thread = threading.Thread(target=store)
+        thread.start()
+        thread.join()
+
+        # Assert
+        assert connections[0] is not None
+        assert connections[0] is not state.conn
+        assert state.num_task_ins() == 1
+
+    def test_state_factory_reuses_state(self) -> None:
+        """Test that StateFactory creates SqliteState only once."""
+        # Prepare
+        # pylint: disable-next=consider-using-with,attribute-defined-outside-init
+        self.tmp_file = tempfile.NamedTemporaryFile()
+        state_factory = StateFactory(self.tmp_file.name)
+
+        # Execute
+        state = state_factory.state()
+
+        # Assert
+        assert isinstance(state, SqliteState)
+        assert state_factory.state() is state
 
 
 if __name__ == "__main__":
@@ -0,0 +1,186 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Notify waiting readers when tasks are stored."""
+
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+
+# Maximum number of threads blocked waiting for tasks at the same time. Servers which
+# handle requests on a thread pool (e.g., 1000 threads for gRPC, 40 for REST) would
+# otherwise run out of threads with many idle nodes.
+MAX_WAITING_THREADS = 32
+
+
+def task_ins_key(node_id: Optional[int]) -> Hashable:
+    """Return the key notified when a TaskIns for `node_id` is stored."""
+    return ("task_ins", node_id)
+
+
+def task_res_key(ancestor: str) -> Hashable:
+    """Return the key notified when a TaskRes with `ancestor` is stored."""
+    return ("task_res", ancestor)
+
+
+class AsyncEvent:
+    """An `asyncio.Event` that can be set from any thread."""
+
+    def __init__(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+
+    def set(self) -> None:
+        """Set the event in the event loop it was created in."""
+        self._loop.call_soon_threadsafe(self._event.set)
+
+    def clear(self) -> None:
+        """Reset the event."""
+        self._event.clear()
+
+    async def wait(self, timeout: float) -> None:
+        """Wait until the event is set or `timeout` expires."""
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+class TaskNotifier:
+    """Wake up readers waiting for tasks instead of letting them poll.
+
+    Readers subscribe to one or more keys and are woken up as soon as a writer notifies
+    one of them. Notifications only reach readers in the same process. If tasks can be
+    stored by other processes (e.g., by another server sharing a database file), a
+    `poll_interval` makes waiting readers check for new tasks periodically in addition.
+
+    Parameters
+    ----------
+    poll_interval : Optional[float] (default: None)
+        Maximum number of seconds a reader waits before checking for tasks again.
+        If `None`, readers only check again when notified.
+    max_waiting_threads : int (default: MAX_WAITING_THREADS)
+        Maximum number of threads waiting in `wait_for` at the same time. Further
+        readers return immediately, as if their timeout was 0. Readers waiting in
+        `async_wait_for` do not block a thread and are not limited.
+    """
+
+    def __init__(
+        self,
+        poll_interval: Optional[float] = None,
+        max_waiting_threads: int = MAX_WAITING_THREADS,
+    ) -> None:
+        self.poll_interval = poll_interval
+        self._waiting_threads = threading.BoundedSemaphore(max_waiting_threads)
+        self._lock = threading.Lock()
+        self._events: Dict[Hashable, List[Union[threading.Event, AsyncEvent]]] = {}
+
+    @contextmanager
+    def subscribe(
+        self, keys: Iterable[Hashable], event: Union[threading.Event, AsyncEvent]
+    ) -> Iterator[None]:
+        """Set `event` whenever one of `keys` is notified within the context."""
+        keys = list(keys)
+        with self._lock:
+            for key in keys:
+                self._events.setdefault(key, []).append(event)
+        try:
+            yield
+        finally:
+            with self._lock:
+                for key in keys:
+                    events = self._events[key]
+                    events.remove(event)
+                    if not events:
+                        del self._events[key]
+
+    def notify(self, keys: Iterable[Hashable]) -> None:
+        """Wake up all readers subscribed to one of `keys`."""
+        with self._lock:
+            events = [event for key in keys for event in self._events.get(key, [])]
+        for event in events:
+            event.set()
+
+    def wait_for(
+        self,
+        keys: Iterable[Hashable],
+        fetch_fn: Callable[[], List[T]],
+        timeout: float,
+    ) -> List[T]:
+        """Call `fetch_fn` until it returns a non-empty list or `timeout` expires.
+
+        `fetch_fn` is called again whenever one of `keys` is notified, and the result
+        of the last call is returned. If `max_waiting_threads` threads are waiting
+        already, `fetch_fn` is called once without waiting.
+        """
+        if not self._waiting_threads.acquire(blocking=False):
+            return fetch_fn()
+        try:
+            deadline = time.monotonic() + timeout
+            event = threading.Event()
+            with self.subscribe(keys, event):
+                while True:
+                    # Clear before fetching, so notifications during the fetch are
+                    # kept
+                    event.clear()
+                    result = fetch_fn()
+                    remaining = deadline - time.monotonic()
+                    if result or remaining <= 0:
+                        return result
+                    if self.poll_interval is not None:
+                        remaining = min(remaining, self.poll_interval)
+                    event.wait(remaining)
+        finally:
+            self._waiting_threads.release()
+
+    async def async_wait_for(
+        self,
+        keys: Iterable[Hashable],
+        fetch_fn: Callable[[], Awaitable[List[T]]],
+        timeout: float,
+    ) -> List[T]:
+        """Await `fetch_fn` until it returns a non-empty list or `timeout` expires.
+
+        Like `wait_for`, but waiting does not block a thread, so it can be used in an
+        event loop.
+        """
+        deadline = time.monotonic() + timeout
+        event = AsyncEvent()
+        with self.subscribe(keys, event):
+            while True:
+                # Clear before fetching, so notifications during the fetch are kept
+                event.clear()
+                result = await fetch_fn()
+                remaining = deadline - time.monotonic()
+                if result or remaining <= 0:
+                    return result
+                if self.poll_interval is not None:
+                    remaining = min(remaining, self.poll_interval)
+                await event.wait(remaining)
@@ -0,0 +1,135 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""TaskNotifier tests."""
+
+
+import asyncio
+import threading
+import time
+from typing import List
+
+from .task_notifier import TaskNotifier
+
+
+def test_wait_for_returns_available_result() -> None:
+    """Test that available results are returned without waiting."""
+    # Prepare
+    notifier = TaskNotifier()
+
+    # Execute
+    result = notifier.wait_for(keys=["a"], fetch_fn=lambda: [1], timeout=10)
+
+    # Assert
+    assert result == [1]
+
+
+def test_wait_for_fetches_again_when_notified() -> None:
+    """Test that notifying a subscribed key wakes up the reader."""
+    # Prepare
+    notifier = TaskNotifier()
+    results: List[List[int]] = [[], [1]]
+    calls: List[int] = []
+
+    def fetch() -> List[int]:
+        calls.append(1)
+        return results[len(calls) - 1]
+
+    def notify() -> None:
+        notifier.notify(["b"])  # Not subscribed, must not wake up the reader
+        notifier.notify(["a"])
+
+    # Execute
+    timer = threading.Timer(0.05, notify)
+    timer.start()
+    result = notifier.wait_for(keys=["a"], fetch_fn=fetch, timeout=10)
+    timer.join()
+
+    # Assert
+    assert result == [1]
+    assert len(calls) == 2
+    # pylint: disable-next=protected-access
+    assert not notifier._events
+
+
+def test_wait_for_poll_interval() -> None:
+    """Test that readers check again after `poll_interval` without notification."""
+    # Prepare
+    notifier = TaskNotifier(poll_interval=0.01)
+    calls: List[int] = []
+
+    def fetch() -> List[int]:
+        calls.append(1)
+        return [1] if len(calls) == 3 else []
+
+    # Execute
+    result = notifier.wait_for(keys=["a"], fetch_fn=fetch, timeout=10)
+
+    # Assert
+    assert result == [1]
+    assert len(calls) == 3
+
+
+def test_wait_for_max_waiting_threads() -> None:
+    """Test that readers beyond `max_waiting_threads` return without waiting."""
+    # Prepare
+    notifier = TaskNotifier(max_waiting_threads=1)
+    available: List[int] = []
+    waiting = threading.Thread(
+        target=notifier.wait_for,
+        kwargs={"keys": ["a"], "fetch_fn": available.copy, "timeout": 10},
+    )
+    waiting.start()
+    while not notifier._events:  # pylint: disable=protected-access
+        time.sleep(0.01)
+
+    # Execute
+    start = time.monotonic()
+    result = notifier.wait_for(keys=["b"], fetch_fn=list, timeout=10)
+    elapsed = time.monotonic() - start
+    available.append(1)
+    notifier.notify(["a"])
+    waiting.join()
+
+    # Assert
+    assert result == []
+    assert elapsed < 1
+
+
+def test_async_wait_for_fetches_again_when_notified() -> None:
+    """Test that notifying from another thread wakes up an asyncio reader."""
+    # Prepare
+    notifier = TaskNotifier()
+    results: List[List[int]] = [[], [1]]
+    calls: List[int] = []
+
+    async def fetch() -> List[int]:
+        calls.append(1)
+        return results[len(calls) - 1]
+
+    async def wait() -> List[int]:
+        timer = threading.Timer(0.05, notifier.notify, args=(["a"],))
+        timer.start()
+        result = await notifier.async_wait_for(keys=["a"], fetch_fn=fetch, timeout=10)
+        timer.join()
+        return result
+
+    # Execute
+    result = asyncio.run(wait())
+
+    # Assert
+    assert result == [1]
+    assert len(calls) == 2
+    # pylint: disable-next=protected-access
+    assert not notifier._events
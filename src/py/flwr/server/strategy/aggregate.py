@@ -15,56 +15,235 @@
 """Aggregation functions for strategy implementations."""
 # mypy: disallow_untyped_calls=False
 
-from functools import reduce
-from typing import Any, Callable, List, Tuple
+import concurrent.futures
+from typing import Any, Callable, List, Optional, Tuple
 
 import numpy as np
+from numpy.typing import DTypeLike
 
 from flwr.common import NDArray, NDArrays
 
+# Number of elements per layer processed at once by the in-place kernels
+AGGREGATION_CHUNK_SIZE = 1 << 20
+
+
+def aggregate(
+    results: List[Tuple[NDArrays, int]],
+    dtype: Optional[DTypeLike] = None,
+    max_workers: Optional[int] = None,
+) -> NDArrays:
+    """Compute weighted average.
+
+    Each layer is accumulated in place into a single preallocated buffer, without
+    creating scaled copies of the client models. Layers are processed in chunks of
+    `AGGREGATION_CHUNK_SIZE` elements, which bounds the size of temporary arrays and
+    allows chunks to be aggregated concurrently.
+
+    Parameters
+    ----------
+    results : List[Tuple[NDArrays, int]]
+        Weights and number of examples for each client.
+    dtype : Optional[DTypeLike] (default: None)
+        Data type used for the accumulation buffers (e.g., `np.float64` to reduce
+        rounding errors when aggregating many float32 models). The returned layers
+        keep the data type they would have without this option. If `None`, layers
+        are accumulated in their own (floating point) data type.
+    max_workers : Optional[int] (default: None)
+        Number of threads used to aggregate chunks concurrently. NumPy releases
+        the GIL while processing large arrays. If `None`, chunks are aggregated
+        sequentially in the calling thread.
+
+    Returns
+    -------
+    weights_prime : NDArrays
+        The weighted average of the client weights.
+    """
+    if not results:
+        return []
 
-def aggregate(results: List[Tuple[NDArrays, int]]) -> NDArrays:
-    """Compute weighted average."""
     # Calculate the total number of examples used during training
     num_examples_total = sum([num_examples for _, num_examples in results])
 
-    # Create a list of weights, each multiplied by the related number of examples
-    weighted_weights = [
-        [layer * num_examples for layer in weights] for weights, num_examples in results
+    # Preallocate one accumulation buffer per layer
+    weights_prime: NDArrays = [
+        np.empty(layer.shape, dtype=_accumulation_dtype(layer, dtype))
+        for layer in results[0][0]
     ]
 
-    # Compute average weights of each layer
-    weights_prime: NDArrays = [
-        reduce(np.add, layer_updates) / num_examples_total
-        for layer_updates in zip(*weighted_weights)
+    # Flatten all layers once (a view for contiguous layers)
+    flat_results = [
+        ([layer.reshape(-1) for layer in weights], num_examples)
+        for weights, num_examples in results
+    ]
+
+    def _aggregate_chunk(layer_idx: int, chunk: slice) -> None:
+        layer_sum = weights_prime[layer_idx].reshape(-1)[chunk]
+        (first_weights, first_num_examples), *other_results = flat_results
+        np.multiply(
+            first_weights[layer_idx][chunk],
+            first_num_examples,
+            out=layer_sum,
+            dtype=layer_sum.dtype,
+        )
+        scratch = np.empty_like(layer_sum)
+        for weights, num_examples in other_results:
+            np.multiply(
+                weights[layer_idx][chunk],
+                num_examples,
+                out=scratch,
+                dtype=layer_sum.dtype,
+            )
+            np.add(layer_sum, scratch, out=layer_sum)
+        np.divide(layer_sum, num_examples_total, out=layer_sum)
+
+    _run_chunked(_aggregate_chunk, weights_prime, AGGREGATION_CHUNK_SIZE, max_workers)
+    return [
+        layer_sum.astype(np.result_type(layer.dtype, 1.0), copy=False)
+        for layer_sum, layer in zip(weights_prime, results[0][0])
+    ]
+
+
+def accumulate_weighted_sum(
+    weighted_sum: Optional[NDArrays],
+    weights: NDArrays,
+    num_examples: int,
+    dtype: Optional[DTypeLike] = None,
+) -> NDArrays:
+    """Add weights multiplied by the number of examples to a running sum.
+
+    The first call (with `weighted_sum=None`) allocates the running sum, all subsequent
+    calls update it in place. Temporary arrays are bounded by `AGGREGATION_CHUNK_SIZE`
+    elements per layer.
+    """
+    if weighted_sum is None:
+        return [
+            np.multiply(layer, num_examples, dtype=_accumulation_dtype(layer, dtype))
+            for layer in weights
+        ]
+    for layer_sum, layer in zip(weighted_sum, weights):
+        flat_sum = layer_sum.reshape(-1)
+        flat_layer = layer.reshape(-1)
+        for chunk in _chunks(flat_sum.size, AGGREGATION_CHUNK_SIZE):
+            flat_sum[chunk] += np.multiply(
+                flat_layer[chunk], num_examples, dtype=flat_sum.dtype
+            )
+    return weighted_sum
+
+
+def _accumulation_dtype(layer: NDArray, dtype: Optional[DTypeLike]) -> np.dtype[Any]:
+    if dtype is not None:
+        return np.dtype(dtype)
+    return np.result_type(layer.dtype, 1.0)
+
+
+def _chunks(size: int, chunk_size: Optional[int]) -> List[slice]:
+    if chunk_size is None:
+        return [slice(0, size)]
+    return [
+        slice(start, min(start + chunk_size, size))
+        for start in range(0, size, chunk_size)
     ]
-    return weights_prime
 
 
-def aggregate_median(results: List[Tuple[NDArrays, int]]) -> NDArrays:
-    """Compute median."""
+def _run_chunked(
+    fn: Callable[[int, slice], None],
+    layers: NDArrays,
+    chunk_size: Optional[int],
+    max_workers: Optional[int],
+) -> None:
+    """Call `fn(layer_idx, chunk)` for all chunks of all layers."""
+    tasks = [
+        (layer_idx, chunk)
+        for layer_idx, layer in enumerate(layers)
+        for chunk in _chunks(layer.size, chunk_size)
+    ]
+    if max_workers is None or max_workers <= 1 or len(tasks) <= 1:
+        for layer_idx, chunk in tasks:
+            fn(layer_idx, chunk)
+        return
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Iterate over the results to re-raise exceptions in the calling thread
+        for _ in executor.map(lambda task: fn(*task), tasks):
+            pass
+
+
+def _aggregate_coordinate_wise(
+    weights: List[NDArrays],
+    reduce_fn: Callable[[NDArray, int, slice], NDArray],
+    max_memory_bytes: Optional[int],
+    max_workers: Optional[int],
+) -> NDArrays:
+    """Reduce the weights of all clients coordinate by coordinate.
+
+    For each layer, `reduce_fn(block, layer_idx, chunk)` receives a block of shape
+    `(num_clients, chunk_size)` holding the `chunk` of the flattened layer of every
+    client and returns the reduced values for that chunk. The block is a scratch
+    array that can be modified in place. If `max_memory_bytes` is set, the chunks
+    are sized so that a single block does not exceed it (per worker thread),
+    otherwise each layer is reduced as a whole.
+    """
+    flat_weights = [[layer.reshape(-1) for layer in w] for w in weights]
+    aggregated: NDArrays = [
+        np.empty(
+            layer.shape,
+            dtype=np.result_type(*[w[layer_idx].dtype for w in weights], 1.0),
+        )
+        for layer_idx, layer in enumerate(weights[0])
+    ]
+
+    chunk_size: Optional[int] = None
+    if max_memory_bytes is not None:
+        itemsize = max(layer.dtype.itemsize for w in weights for layer in w)
+        chunk_size = max(1, max_memory_bytes // (len(weights) * itemsize))
+
+    def _aggregate_chunk(layer_idx: int, chunk: slice) -> None:
+        block = np.stack([flat[layer_idx][chunk] for flat in flat_weights])
+        aggregated[layer_idx].reshape(-1)[chunk] = reduce_fn(block, layer_idx, chunk)
+
+    _run_chunked(_aggregate_chunk, aggregated, chunk_size, max_workers)
+    return aggregated
+
+
+def aggregate_median(
+    results: List[Tuple[NDArrays, int]],
+    max_memory_bytes: Optional[int] = None,
+    max_workers: Optional[int] = None,
+) -> NDArrays:
+    """Compute median.
+
+    If `max_memory_bytes` is set, the coordinate-wise median is computed over blocks
+    of columns such that the stacked client weights of a block do not exceed it.
+    Blocks are processed on `max_workers` threads if set.
+    """
     # Create a list of weights and ignore the number of examples
     weights = [weights for weights, _ in results]
 
     # Compute median weight of each layer
-    median_w: NDArrays = [
-        np.median(np.asarray(layer), axis=0) for layer in zip(*weights)
-    ]
-    return median_w
+    def _median(block: NDArray, _layer_idx: int, _chunk: slice) -> NDArray:
+        median: NDArray = np.median(block, axis=0, overwrite_input=True)
+        return median
+
+    return _aggregate_coordinate_wise(weights, _median, max_memory_bytes, max_workers)
 
 
 def aggregate_krum(
-    results: List[Tuple[NDArrays, int]], num_malicious: int, to_keep: int
+    results: List[Tuple[NDArrays, int]],
+    num_malicious: int,
+    to_keep: int,
+    distance_matrix: Optional[NDArray] = None,
 ) -> NDArrays:
     """Choose one parameter vector according to the Krum function.
 
-    If to_keep is not None, then MultiKrum is applied.
+    If to_keep is not None, then MultiKrum is applied. A precomputed matrix of
+    squared distances between the weights in `results` can be passed as
+    `distance_matrix` to avoid recomputing it.
     """
     # Create a list of weights and ignore the number of examples
     weights = [weights for weights, _ in results]
 
     # Compute distances between vectors
-    distance_matrix = _compute_distances(weights)
+    if distance_matrix is None:
+        distance_matrix = _compute_distances(weights)
 
     # For each client, take the n-f-2 closest parameters vectors
     num_closest = max(1, len(weights) - num_malicious - 2)
@@ -96,6 +275,8 @@ def aggregate_bulyan(
     results: List[Tuple[NDArrays, int]],
     num_malicious: int,
     aggregation_rule: Callable,  # type: ignore
+    max_memory_bytes: Optional[int] = None,
+    max_workers: Optional[int] = None,
     **aggregation_rule_kwargs: Any,
 ) -> NDArrays:
     """Perform Bulyan aggregation.
@@ -108,6 +289,11 @@ def aggregate_bulyan(
         The maximum number of malicious clients.
     aggregation_rule: Callable
         Byzantine resilient aggregation rule used as the first step of the Bulyan
+    max_memory_bytes: Optional[int] (default: None)
+        Maximum size of the stacked weights processed at once (per worker thread)
+        when computing the coordinate-wise median and closest weights.
+    max_workers: Optional[int] (default: None)
+        Number of threads used to compute coordinate-wise statistics.
     aggregation_rule_kwargs: Any
         The arguments to the aggregation rule.
 
@@ -134,7 +320,14 @@ def aggregate_bulyan(
     theta = len(results) - 2 * num_malicious
     beta = theta - 2 * num_malicious
 
+    # Compute the distances once and shrink the matrix as models are selected
+    distance_matrix: Optional[NDArray] = None
+    if aggregation_rule is aggregate_krum:
+        distance_matrix = _compute_distances([weights for weights, _ in results])
+
     for _ in range(theta):
+        if distance_matrix is not None:
+            aggregation_rule_kwargs["distance_matrix"] = distance_matrix
         best_model = aggregation_rule(
             results=results, num_malicious=num_malicious, **aggregation_rule_kwargs
         )
@@ -162,14 +355,24 @@ def aggregate_bulyan(
 
         # remove idx from tracker and weights_results
         results.pop(best_idx)
+        if distance_matrix is not None:
+            distance_matrix = np.delete(
+                np.delete(distance_matrix, best_idx, axis=0), best_idx, axis=1
+            )
 
     # Compute median parameter vector across selected_models_set
-    median_vect = aggregate_median(selected_models_set)
+    median_vect = aggregate_median(
+        selected_models_set, max_memory_bytes=max_memory_bytes, max_workers=max_workers
+    )
 
     # Take the averaged beta parameters of the closest distance to the median
     # (coordinate-wise)
     parameters_aggregated = _aggregate_n_closest_weights(
-        median_vect, selected_models_set, beta_closest=beta
+        median_vect,
+        selected_models_set,
+        beta_closest=beta,
+        max_memory_bytes=max_memory_bytes,
+        max_workers=max_workers,
     )
     return parameters_aggregated
 
@@ -204,21 +407,40 @@ def _compute_distances(weights: List[NDArrays]) -> NDArray:
 
     Input: weights - list of weights vectors
     Output: distances - matrix distance_matrix of squared distances between the vectors
+
+    The squared distances are derived from the Gram matrix of the flattened weights
+    (`||a - b||^2 = ||a||^2 + ||b||^2 - 2 a.b`), which is accumulated over column
+    blocks of at most `AGGREGATION_CHUNK_SIZE` elements in total. This avoids
+    stacking all flattened weights and computing pairwise differences.
     """
-    flat_w = np.array([np.concatenate(p, axis=None).ravel() for p in weights])
-    distance_matrix = np.zeros((len(weights), len(weights)))
-    for i, _ in enumerate(flat_w):
-        for j, _ in enumerate(flat_w):
-            delta = flat_w[i] - flat_w[j]
-            norm = np.linalg.norm(delta)
-            distance_matrix[i, j] = norm**2
+    num_weights = len(weights)
+    gram = np.zeros((num_weights, num_weights))
+    columns_per_block = max(1, AGGREGATION_CHUNK_SIZE // max(1, num_weights))
+    for layer_idx, layer in enumerate(weights[0] if weights else []):
+        flat_layers = [w[layer_idx].reshape(-1) for w in weights]
+        for start in range(0, layer.size, columns_per_block):
+            block = np.stack(
+                [
+                    flat[start : start + columns_per_block]  # noqa: E203
+                    for flat in flat_layers
+                ]
+            ).astype(np.float64, copy=False)
+            gram += block @ block.T
+
+    squared_norms = np.diag(gram)
+    distance_matrix: NDArray = (
+        squared_norms[:, np.newaxis] + squared_norms[np.newaxis, :] - 2 * gram
+    )
+    # Remove negative values caused by rounding errors
+    np.maximum(distance_matrix, 0.0, out=distance_matrix)
+    np.fill_diagonal(distance_matrix, 0.0)
     return distance_matrix
 
 
 def _trim_mean(array: NDArray, proportiontocut: float) -> NDArray:
     """Compute trimmed mean along axis=0.
 
-    It is based on the scipy implementation.
+    It is based on the scipy implementation. The array is partitioned in place.
 
     https://docs.scipy.org/doc/scipy/reference/generated/
     scipy.stats.trim_mean.html.
@@ -230,27 +452,35 @@ def _trim_mean(array: NDArray, proportiontocut: float) -> NDArray:
     if lowercut > uppercut:
         raise ValueError("Proportion too big.")
 
-    atmp = np.partition(array, (lowercut, uppercut - 1), axis)
+    array.partition((lowercut, uppercut - 1), axis)
 
-    slice_list = [slice(None)] * atmp.ndim
+    slice_list = [slice(None)] * array.ndim
     slice_list[axis] = slice(lowercut, uppercut)
-    result: NDArray = np.mean(atmp[tuple(slice_list)], axis=axis)
+    result: NDArray = np.mean(array[tuple(slice_list)], axis=axis)
     return result
 
 
 def aggregate_trimmed_avg(
-    results: List[Tuple[NDArrays, int]], proportiontocut: float
+    results: List[Tuple[NDArrays, int]],
+    proportiontocut: float,
+    max_memory_bytes: Optional[int] = None,
+    max_workers: Optional[int] = None,
 ) -> NDArrays:
-    """Compute trimmed average."""
+    """Compute trimmed average.
+
+    If `max_memory_bytes` is set, the coordinate-wise trimmed mean is computed over
+    blocks of columns such that the stacked client weights of a block do not exceed
+    it. Blocks are processed on `max_workers` threads if set.
+    """
     # Create a list of weights and ignore the number of examples
     weights = [weights for weights, _ in results]
 
-    trimmed_w: NDArrays = [
-        _trim_mean(np.asarray(layer), proportiontocut=proportiontocut)
-        for layer in zip(*weights)
-    ]
+    def _trimmed_mean(block: NDArray, _layer_idx: int, _chunk: slice) -> NDArray:
+        return _trim_mean(block, proportiontocut=proportiontocut)
 
-    return trimmed_w
+    return _aggregate_coordinate_wise(
+        weights, _trimmed_mean, max_memory_bytes, max_workers
+    )
 
 
 def _check_weights_equality(weights1: NDArrays, weights2: NDArrays) -> bool:
@@ -294,7 +524,11 @@ def _find_reference_weights(
 
 
 def _aggregate_n_closest_weights(
-    reference_weights: NDArrays, results: List[Tuple[NDArrays, int]], beta_closest: int
+    reference_weights: NDArrays,
+    results: List[Tuple[NDArrays, int]],
+    beta_closest: int,
+    max_memory_bytes: Optional[int] = None,
+    max_workers: Optional[int] = None,
 ) -> NDArrays:
     """Calculate element-wise mean of the `N` closest values.
 
@@ -310,6 +544,10 @@ def _aggregate_n_closest_weights(
         The weights from models
     beta_closest: int
         The number of the closest distance weights that will be averaged
+    max_memory_bytes: Optional[int] (default: None)
+        Maximum size of the stacked weights processed at once (per worker thread)
+    max_workers: Optional[int] (default: None)
+        Number of threads used to process blocks of weights concurrently
 
     Returns
     -------
@@ -318,15 +556,10 @@ def _aggregate_n_closest_weights(
          reference weights
     """
     list_of_weights = [weights for weights, num_examples in results]
-    aggregated_weights = []
-
-    for layer_id, layer_weights in enumerate(reference_weights):
-        other_weights_layer_list = []
-        for other_w in list_of_weights:
-            other_weights_layer = other_w[layer_id]
-            other_weights_layer_list.append(other_weights_layer)
-        other_weights_layer_np = np.array(other_weights_layer_list)
-        diff_np = np.abs(layer_weights - other_weights_layer_np)
+    flat_reference_weights = [layer.reshape(-1) for layer in reference_weights]
+
+    def _mean_of_closest(block: NDArray, layer_idx: int, chunk: slice) -> NDArray:
+        diff_np = np.abs(flat_reference_weights[layer_idx][chunk] - block)
         # Create indices of the smallest differences
         # We do not need the exact order but just the beta closest weights
         # therefore np.argpartition is used instead of np.argsort
@@ -334,7 +567,11 @@ def _aggregate_n_closest_weights(
         # Take the weights (coordinate-wise) corresponding to the beta of the
         # closest distances
         beta_closest_weights = np.take_along_axis(
-            other_weights_layer_np, indices=indices, axis=0
-        )[:beta_closest]
-        aggregated_weights.append(np.mean(beta_closest_weights, axis=0))
-    return aggregated_weights
+            block, indices=indices[:beta_closest], axis=0
+        )
+        mean: NDArray = np.mean(beta_closest_weights, axis=0)
+        return mean
+
+    return _aggregate_coordinate_wise(
+        list_of_weights, _mean_of_closest, max_memory_bytes, max_workers
+    )
@@ -15,19 +15,51 @@
 """Aggregation function tests."""
 
 
+import tracemalloc
 from typing import List, Tuple
+from unittest.mock import patch
 
 import numpy as np
 
+from flwr.common import NDArrays
+
 from .aggregate import (
     _aggregate_n_closest_weights,
     _check_weights_equality,
+    _compute_distances,
     _find_reference_weights,
+    accumulate_weighted_sum,
     aggregate,
+    aggregate_bulyan,
+    aggregate_krum,
+    aggregate_median,
+    aggregate_trimmed_avg,
     weighted_loss_avg,
 )
 
 
+def _random_results(
+    num_clients: int, shape: Tuple[int, ...]
+) -> List[Tuple[NDArrays, int]]:
+    rng = np.random.default_rng(seed=42)
+    return [
+        (
+            [rng.random(shape, dtype=np.float32), rng.random(3, dtype=np.float32)],
+            int(rng.integers(1, 100)),
+        )
+        for _ in range(num_clients)
+    ]
+
+
+def _reference_aggregate(results: List[Tuple[NDArrays, int]]) -> NDArrays:
+    num_examples_total = sum(num_examples for _, num_examples in results)
+    return [
+        np.sum([weights[idx] * num_examples for weights, num_examples in results], 0)
+        / num_examples_total
+        for idx in range(len(results[0][0]))
+    ]
+
+
 def test_aggregate() -> None:
     """Test aggregate function."""
     # Prepare
@@ -46,6 +78,167 @@ def test_aggregate() -> None:
     np.testing.assert_equal(expected, actual)
 
 
+def test_aggregate_chunked_with_thread_pool() -> None:
+    """Test that chunked and concurrent aggregation give the same result."""
+    # Prepare
+    results = _random_results(num_clients=5, shape=(7, 11))
+    expected = _reference_aggregate(results)
+
+    # Execute
+    with patch("flwr.server.strategy.aggregate.AGGREGATION_CHUNK_SIZE", 10):
+        actual = aggregate(results, max_workers=4)
+
+    # Assert
+    for expected_layer, actual_layer in zip(expected, actual):
+        assert actual_layer.dtype == np.float32
+        np.testing.assert_allclose(actual_layer, expected_layer, rtol=1e-6)
+
+
+def test_aggregate_accumulation_dtype() -> None:
+    """Test that the accumulation dtype does not change the output dtype."""
+    # Prepare
+    results = _random_results(num_clients=3, shape=(4, 4))
+    expected = _reference_aggregate(results)
+
+    # Execute
+    actual = aggregate(results, dtype=np.float64)
+
+    # Assert
+    for expected_layer, actual_layer in zip(expected, actual):
+        assert actual_layer.dtype == np.float32
+        np.testing.assert_allclose(actual_layer, expected_layer, rtol=1e-6)
+
+
+def test_aggregate_peak_memory() -> None:
+    """Test that aggregation does not allocate scaled copies of client models."""
+    # Prepare
+    num_clients = 20
+    results = _random_results(num_clients=num_clients, shape=(512, 512))
+    model_size = sum(layer.nbytes for layer in results[0][0])
+
+    # Execute
+    tracemalloc.start()
+    aggregate(results)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Assert: one output buffer plus one scratch chunk
+    assert peak < 2.5 * model_size
+
+
+def test_accumulate_weighted_sum() -> None:
+    """Test that the running weighted sum matches `aggregate`."""
+    # Prepare
+    results = _random_results(num_clients=4, shape=(5, 3))
+    expected = aggregate(results)
+
+    # Execute
+    weighted_sum = None
+    with patch("flwr.server.strategy.aggregate.AGGREGATION_CHUNK_SIZE", 4):
+        for weights, num_examples in results:
+            weighted_sum = accumulate_weighted_sum(weighted_sum, weights, num_examples)
+    assert weighted_sum is not None
+    num_examples_total = sum(num_examples for _, num_examples in results)
+    actual = [layer / num_examples_total for layer in weighted_sum]
+
+    # Assert
+    for expected_layer, actual_layer in zip(expected, actual):
+        np.testing.assert_allclose(actual_layer, expected_layer, rtol=1e-6)
+
+
+def test_compute_distances() -> None:
+    """Test that the Gram-based distances match pairwise norms."""
+    # Prepare
+    results = _random_results(num_clients=6, shape=(9, 5))
+    weights = [weights for weights, _ in results]
+    flat_w = [np.concatenate([layer.ravel() for layer in w]) for w in weights]
+    expected = np.array(
+        [
+            [np.linalg.norm(a.astype(np.float64) - b) ** 2 for b in flat_w]
+            for a in flat_w
+        ]
+    )
+
+    # Execute
+    with patch("flwr.server.strategy.aggregate.AGGREGATION_CHUNK_SIZE", 12):
+        actual = _compute_distances(weights)
+
+    # Assert
+    np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-9)
+    np.testing.assert_equal(np.diag(actual), np.zeros(6))
+
+
+def test_aggregate_bulyan_computes_distances_once() -> None:
+    """Test that Bulyan reuses the distance matrix across Krum iterations."""
+    # Prepare
+    results = _random_results(num_clients=7, shape=(3, 3))
+
+    # Execute
+    with patch(
+        "flwr.server.strategy.aggregate._compute_distances",
+        wraps=_compute_distances,
+    ) as compute_distances:
+        aggregate_bulyan(
+            results=list(results),
+            num_malicious=1,
+            aggregation_rule=aggregate_krum,
+            to_keep=0,
+        )
+
+    # Assert
+    assert compute_distances.call_count == 1
+
+
+def test_aggregate_median_chunked() -> None:
+    """Test that the memory-bounded median matches NumPy."""
+    # Prepare
+    results = _random_results(num_clients=7, shape=(13, 5))
+    expected = [
+        np.median(np.asarray(layer), axis=0)
+        for layer in zip(*[weights for weights, _ in results])
+    ]
+
+    # Execute
+    actual = aggregate_median(results, max_memory_bytes=7 * 4 * 10, max_workers=3)
+
+    # Assert
+    for expected_layer, actual_layer in zip(expected, actual):
+        assert actual_layer.shape == expected_layer.shape
+        np.testing.assert_equal(actual_layer, expected_layer)
+
+
+def test_aggregate_trimmed_avg_chunked() -> None:
+    """Test that the memory-bounded trimmed mean matches the unbounded one."""
+    # Prepare
+    results = _random_results(num_clients=10, shape=(6, 7))
+    expected = aggregate_trimmed_avg(results, proportiontocut=0.2)
+
+    # Execute
+    actual = aggregate_trimmed_avg(
+        results, proportiontocut=0.2, max_memory_bytes=10 * 4 * 8, max_workers=2
+    )
+
+    # Assert
+    for expected_layer, actual_layer in zip(expected, actual):
+        np.testing.assert_allclose(actual_layer, expected_layer, rtol=1e-6)
+
+
+def test_aggregate_median_peak_memory() -> None:
+    """Test that `max_memory_bytes` bounds the memory used by the median."""
+    # Prepare
+    results = _random_results(num_clients=20, shape=(256, 256))
+    model_size = sum(layer.nbytes for layer in results[0][0])
+
+    # Execute
+    tracemalloc.start()
+    aggregate_median(results, max_memory_bytes=model_size // 4)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Assert: one (float64) output buffer plus one block
+    assert peak < 2 * model_size + model_size // 4 + 2**16
+
+
 def test_weighted_loss_avg_single_value() -> None:
     """Test weighted loss averaging."""
     # Prepare
@@ -41,6 +41,8 @@ from .fedavg import FedAvg
 class Bulyan(FedAvg):
     """Bulyan strategy implementation."""
 
+    _supports_fit_delta = False
+
     # pylint: disable=too-many-arguments,too-many-instance-attributes,line-too-long, too-many-locals
     def __init__(
         self,
@@ -63,7 +65,9 @@ class Bulyan(FedAvg):
         initial_parameters: Optional[Parameters] = None,
         fit_metrics_aggregation_fn: Optional[MetricsAggregationFn] = None,
         evaluate_metrics_aggregation_fn: Optional[MetricsAggregationFn] = None,
+        fit_tensor_type: Optional[str] = None,
         first_aggregation_rule: Callable = aggregate_krum,  # type: ignore
+        max_aggregation_memory_bytes: Optional[int] = None,
         **aggregation_rule_kwargs: Any,
     ) -> None:
         """Bulyan strategy.
@@ -96,6 +100,9 @@ class Bulyan(FedAvg):
             Initial global model parameters.
         first_aggregation_rule: Callable
             Byzantine resilient aggregation rule that is used as the first step of the Bulyan (e.g., Krum)
+        max_aggregation_memory_bytes : Optional[int]
+            Maximum size of the stacked client weights that are processed at once
+            when computing coordinate-wise statistics. Defaults to None (no limit).
         **aggregation_rule_kwargs: Any
             arguments to the first_aggregation rule
         """
@@ -112,9 +119,11 @@ class Bulyan(FedAvg):
             initial_parameters=initial_parameters,
             fit_metrics_aggregation_fn=fit_metrics_aggregation_fn,
             evaluate_metrics_aggregation_fn=evaluate_metrics_aggregation_fn,
+            fit_tensor_type=fit_tensor_type,
         )
         self.num_malicious_clients = num_malicious_clients
         self.first_aggregation_rule = first_aggregation_rule
+        self.max_aggregation_memory_bytes = max_aggregation_memory_bytes
         self.aggregation_rule_kwargs = aggregation_rule_kwargs
 
     def __repr__(self) -> str:
@@ -147,6 +156,7 @@ class Bulyan(FedAvg):
                 weights_results,
                 self.num_malicious_clients,
                 self.first_aggregation_rule,
+                max_memory_bytes=self.max_aggregation_memory_bytes,
                 **self.aggregation_rule_kwargs,
             )
         )
@@ -120,3 +120,18 @@ class DPFedAvgAdaptive(DPFedAvgFixed):
         new_global_model = super().aggregate_fit(server_round, results, failures)
         self._update_clip_norm(results)
         return new_global_model
+
+    def finalize_aggregate_fit(
+        self,
+        server_round: int,
+        results: List[Tuple[ClientProxy, FitRes]],
+        failures: List[Union[Tuple[ClientProxy, FitRes], BaseException]],
+    ) -> Tuple[Optional[Parameters], Dict[str, Scalar]]:
+        """Complete incremental aggregation and update clip norms."""
+        if failures:
+            return None, {}
+        new_global_model = super().finalize_aggregate_fit(
+            server_round, results, failures
+        )
+        self._update_clip_norm(results)
+        return new_global_model
@@ -65,6 +65,16 @@ class DPFedAvgFixed(Strategy):
             self.noise_multiplier * self.clip_norm / (self.num_sampled_clients ** (0.5))
         )
 
+    def _noise_fit_res(self, fit_res: FitRes) -> None:
+        # Forcing unweighted aggregation, as in https://arxiv.org/abs/1905.03871.
+        fit_res.num_examples = 1
+        fit_res.parameters = ndarrays_to_parameters(
+            add_gaussian_noise(
+                parameters_to_ndarrays(fit_res.parameters),
+                self._calc_client_noise_stddev(),
+            )
+        )
+
     def initialize_parameters(
         self, client_manager: ClientManager
     ) -> Optional[Parameters]:
@@ -147,18 +157,33 @@ class DPFedAvgFixed(Strategy):
         """Aggregate training results using unweighted aggregation."""
         if failures:
             return None, {}
-        # Forcing unweighted aggregation, as in https://arxiv.org/abs/1905.03871.
         for _, fit_res in results:
-            fit_res.num_examples = 1
-            fit_res.parameters = ndarrays_to_parameters(
-                add_gaussian_noise(
-                    parameters_to_ndarrays(fit_res.parameters),
-                    self._calc_client_noise_stddev(),
-                )
-            )
+            self._noise_fit_res(fit_res)
 
         return self.strategy.aggregate_fit(server_round, results, failures)
 
+    def begin_aggregate_fit(self, server_round: int) -> bool:
+        """Prepare incremental aggregation using the given strategy."""
+        return self.strategy.begin_aggregate_fit(server_round)
+
+    def accumulate_fit(
+        self, server_round: int, result: Tuple[ClientProxy, FitRes]
+    ) -> None:
+        """Add noise to a single training result and pass it to the strategy."""
+        self._noise_fit_res(result[1])
+        self.strategy.accumulate_fit(server_round, result)
+
+    def finalize_aggregate_fit(
+        self,
+        server_round: int,
+        results: List[Tuple[ClientProxy, FitRes]],
+        failures: List[Union[Tuple[ClientProxy, FitRes], BaseException]],
+    ) -> Tuple[Optional[Parameters], Dict[str, Scalar]]:
+        """Complete incremental aggregation using the given strategy."""
+        if failures:
+            return None, {}
+        return self.strategy.finalize_aggregate_fit(server_round, results, failures)
+
     def aggregate_evaluate(
         self,
         server_round: int,
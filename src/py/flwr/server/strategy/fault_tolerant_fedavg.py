@@ -38,6 +38,8 @@ from .fedavg import FedAvg
 class FaultTolerantFedAvg(FedAvg):
     """Configurable fault-tolerant FedAvg strategy implementation."""
 
+    _supports_fit_delta = False
+
     # pylint: disable=too-many-arguments,too-many-instance-attributes
     def __init__(
         self,
@@ -60,6 +62,7 @@ class FaultTolerantFedAvg(FedAvg):
         initial_parameters: Optional[Parameters] = None,
         fit_metrics_aggregation_fn: Optional[MetricsAggregationFn] = None,
         evaluate_metrics_aggregation_fn: Optional[MetricsAggregationFn] = None,
+        fit_tensor_type: Optional[str] = None,
     ) -> None:
         super().__init__(
             fraction_fit=fraction_fit,
@@ -74,6 +77,7 @@ class FaultTolerantFedAvg(FedAvg):
             initial_parameters=initial_parameters,
             fit_metrics_aggregation_fn=fit_metrics_aggregation_fn,
             evaluate_metrics_aggregation_fn=evaluate_metrics_aggregation_fn,
+            fit_tensor_type=fit_tensor_type,
         )
         self.completion_rate_fit = min_completion_rate_fit
         self.completion_rate_evaluate = min_completion_rate_evaluate
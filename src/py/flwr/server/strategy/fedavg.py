@@ -33,11 +33,13 @@ from flwr.common import (
     ndarrays_to_parameters,
     parameters_to_ndarrays,
 )
+from flwr.common.delta import delta_config, is_delta
 from flwr.common.logger import log
+from flwr.common.parameter import TENSOR_TYPE_CONFIG_KEY, TENSOR_TYPE_SPARSE
 from flwr.server.client_manager import ClientManager
 from flwr.server.client_proxy import ClientProxy
 
-from .aggregate import aggregate, weighted_loss_avg
+from .aggregate import accumulate_weighted_sum, weighted_loss_avg
 from .strategy import Strategy
 
 WARNING_MIN_AVAILABLE_CLIENTS_TOO_LOW = """
@@ -51,6 +53,9 @@ than or equal to the values of `min_fit_clients` and `min_evaluate_clients`.
 class FedAvg(Strategy):
     """Configurable FedAvg strategy implementation."""
 
+    # Whether `aggregate_fit` can apply the updates requested with `fit_delta`
+    _supports_fit_delta = True
+
     # pylint: disable=too-many-arguments,too-many-instance-attributes, line-too-long
     def __init__(
         self,
@@ -72,6 +77,10 @@ class FedAvg(Strategy):
         initial_parameters: Optional[Parameters] = None,
         fit_metrics_aggregation_fn: Optional[MetricsAggregationFn] = None,
         evaluate_metrics_aggregation_fn: Optional[MetricsAggregationFn] = None,
+        fit_tensor_type: Optional[str] = None,
+        fit_delta: bool = False,
+        fit_delta_top_k: Optional[float] = None,
+        fit_delta_threshold: Optional[float] = None,
     ) -> None:
         """Federated Averaging strategy.
 
@@ -107,6 +116,21 @@ class FedAvg(Strategy):
             Metrics aggregation function, optional.
         evaluate_metrics_aggregation_fn : Optional[MetricsAggregationFn]
             Metrics aggregation function, optional.
+        fit_tensor_type : Optional[str]
+            Tensor type (e.g., `numpy.ndarray.compact+fp16+zstd`) requested from
+            clients for the parameters they return from `fit`. Clients that do not
+            support it may ignore the request. Defaults to None.
+        fit_delta : bool
+            Whether to request clients to return the update to the parameters they
+            received instead of the updated parameters. Defaults to False.
+        fit_delta_top_k : Optional[float]
+            Fraction of the values of each layer of the update clients return,
+            choosing the values with the largest magnitude. Only used if
+            `fit_delta` is True. Defaults to None.
+        fit_delta_threshold : Optional[float]
+            Only values of the update with a magnitude of at least
+            `fit_delta_threshold` are returned. Only used if `fit_delta` is True
+            and `fit_delta_top_k` is None. Defaults to None.
         """
         super().__init__()
 
@@ -128,6 +152,16 @@ class FedAvg(Strategy):
         self.initial_parameters = initial_parameters
         self.fit_metrics_aggregation_fn = fit_metrics_aggregation_fn
         self.evaluate_metrics_aggregation_fn = evaluate_metrics_aggregation_fn
+        self.fit_tensor_type = fit_tensor_type
+        self.fit_delta = fit_delta
+        self.fit_delta_top_k = fit_delta_top_k
+        self.fit_delta_threshold = fit_delta_threshold
+        self._weighted_sum: Optional[NDArrays] = None
+        self._num_examples_total: int = 0
+        # Parameters sent to clients, needed to apply their updates
+        self._fit_parameters: Optional[Parameters] = None
+        self._num_examples_delta: int = 0
+        self._check_fit_delta()
 
     def __repr__(self) -> str:
         """Compute a string representation of the strategy."""
@@ -166,6 +200,14 @@ class FedAvg(Strategy):
         loss, metrics = eval_res
         return loss, metrics
 
+    def _check_fit_delta(self) -> None:
+        """Raise a `ValueError` if `fit_delta` is unsupported or misconfigured."""
+        if self.fit_delta and not self._supports_fit_delta:
+            raise ValueError(f"{type(self).__name__} does not support `fit_delta`.")
+        top_k = self.fit_delta_top_k
+        if top_k is not None and not 0.0 < top_k <= 1.0:
+            raise ValueError("`fit_delta_top_k` must be in (0, 1].")
+
     def configure_fit(
         self, server_round: int, parameters: Parameters, client_manager: ClientManager
     ) -> List[Tuple[ClientProxy, FitIns]]:
@@ -174,6 +216,21 @@ class FedAvg(Strategy):
         if self.on_fit_config_fn is not None:
             # Custom fit config function provided
             config = self.on_fit_config_fn(server_round)
+        self._check_fit_delta()
+        tensor_type = self.fit_tensor_type
+        if self.fit_delta:
+            config = {
+                **config,
+                **delta_config(self.fit_delta_top_k, self.fit_delta_threshold),
+            }
+            self._fit_parameters = parameters
+            sparse = self.fit_delta_top_k is not None or (
+                self.fit_delta_threshold is not None
+            )
+            if tensor_type is None and sparse:
+                tensor_type = TENSOR_TYPE_SPARSE
+        if tensor_type is not None:
+            config = {**config, TENSOR_TYPE_CONFIG_KEY: tensor_type}
         fit_ins = FitIns(parameters, config)
 
         # Sample clients
@@ -226,12 +283,69 @@ class FedAvg(Strategy):
         if not self.accept_failures and failures:
             return None, {}
 
-        # Convert results
-        weights_results = [
-            (parameters_to_ndarrays(fit_res.parameters), fit_res.num_examples)
-            for _, fit_res in results
-        ]
-        parameters_aggregated = ndarrays_to_parameters(aggregate(weights_results))
+        self.begin_aggregate_fit(server_round)
+        for result in results:
+            self.accumulate_fit(server_round, result)
+        return self.finalize_aggregate_fit(server_round, results, failures)
+
+    def begin_aggregate_fit(self, server_round: int) -> bool:
+        """Reset the running weighted average of fit results."""
+        self._weighted_sum = None
+        self._num_examples_total = 0
+        self._num_examples_delta = 0
+        # Subclasses overriding `aggregate_fit` need all results at once
+        return type(self).aggregate_fit is FedAvg.aggregate_fit
+
+    def accumulate_fit(
+        self, server_round: int, result: Tuple[ClientProxy, FitRes]
+    ) -> None:
+        """Add a single fit result to the running weighted average.
+
+        Updates (see `fit_delta`) are accumulated as they are, the parameters they
+        are relative to are added once in `finalize_aggregate_fit`.
+        """
+        _, fit_res = result
+        self._weighted_sum = accumulate_weighted_sum(
+            self._weighted_sum,
+            parameters_to_ndarrays(fit_res.parameters),
+            fit_res.num_examples,
+        )
+        self._num_examples_total += fit_res.num_examples
+        if is_delta(fit_res.parameters):
+            self._num_examples_delta += fit_res.num_examples
+
+    def finalize_aggregate_fit(
+        self,
+        server_round: int,
+        results: List[Tuple[ClientProxy, FitRes]],
+        failures: List[Union[Tuple[ClientProxy, FitRes], BaseException]],
+    ) -> Tuple[Optional[Parameters], Dict[str, Scalar]]:
+        """Compute the weighted average of all accumulated fit results."""
+        weighted_sum = self._weighted_sum
+        fit_parameters = self._fit_parameters
+        # Don't keep the running sum and the previous parameters in memory
+        self._weighted_sum = None
+        self._fit_parameters = None
+        if not results or weighted_sum is None:
+            return None, {}
+        # Do not aggregate if there are failures and failures are not accepted
+        if not self.accept_failures and failures:
+            return None, {}
+
+        # Sum_k n_k * (w + delta_k) = sum_k n_k * delta_k + (sum_k n_k) * w
+        if self._num_examples_delta > 0:
+            if fit_parameters is None:
+                log(WARNING, "Received updates but no parameters to apply them to")
+                return None, {}
+            weighted_sum = accumulate_weighted_sum(
+                weighted_sum,
+                parameters_to_ndarrays(fit_parameters),
+                self._num_examples_delta,
+            )
+
+        for layer_sum in weighted_sum:
+            layer_sum /= self._num_examples_total
+        parameters_aggregated = ndarrays_to_parameters(weighted_sum)
 
         # Aggregate custom metrics if aggregation fn was provided
         metrics_aggregated = {}
@@ -15,7 +15,33 @@
 """FedAvg tests."""
 
 
+from typing import List, Tuple
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from flwr.common import (
+    Code,
+    FitRes,
+    Status,
+    ndarrays_to_parameters,
+    parameters_to_ndarrays,
+)
+from flwr.server.client_proxy import ClientProxy
+
+from .bulyan import Bulyan
+from .fault_tolerant_fedavg import FaultTolerantFedAvg
+from .fedadagrad import FedAdagrad
+from .fedadam import FedAdam
 from .fedavg import FedAvg
+from .fedavgm import FedAvgM
+from .fedmedian import FedMedian
+from .fedprox import FedProx
+from .fedtrimmedavg import FedTrimmedAvg
+from .fedyogi import FedYogi
+from .krum import Krum
+from .qfedavg import QFedAvg
 
 
 def test_fedavg_num_fit_clients_20_available() -> None:
@@ -120,3 +146,245 @@ def test_fedavg_num_evaluation_clients_minimum() -> None:
 
     # Assert
     assert expected == actual
+
+
+def _fit_results() -> List[Tuple[ClientProxy, FitRes]]:
+    return [
+        (
+            MagicMock(),
+            FitRes(
+                status=Status(code=Code.OK, message="Success"),
+                parameters=ndarrays_to_parameters(
+                    [np.full((2, 3), value, dtype=np.float32), np.array([value])]
+                ),
+                num_examples=num_examples,
+                metrics={},
+            ),
+        )
+        for value, num_examples in [(1.0, 1), (4.0, 2)]
+    ]
+
+
+def test_fedavg_incremental_aggregation_equals_aggregate_fit() -> None:
+    """Test that incremental aggregation matches `aggregate_fit`."""
+    # Prepare
+    strategy = FedAvg()
+    expected, _ = strategy.aggregate_fit(1, _fit_results(), [])
+    results = _fit_results()
+
+    # Execute
+    incremental = strategy.begin_aggregate_fit(1)
+    for result in results:
+        strategy.accumulate_fit(1, result)
+    actual, _ = strategy.finalize_aggregate_fit(1, results, [])
+
+    # Assert
+    assert incremental
+    assert expected is not None and actual is not None
+    assert actual.tensors == expected.tensors
+
+
+def test_fedavg_incremental_aggregation_weighted_average() -> None:
+    """Test that accumulated results are averaged by number of examples."""
+    # Prepare
+    strategy = FedAvg()
+    results = _fit_results()
+
+    # Execute
+    strategy.begin_aggregate_fit(1)
+    for result in results:
+        strategy.accumulate_fit(1, result)
+    actual, _ = strategy.finalize_aggregate_fit(1, results, [])
+
+    # Assert
+    assert actual is not None
+    layer_0, layer_1 = parameters_to_ndarrays(actual)
+    assert layer_0.dtype == np.float32
+    np.testing.assert_allclose(layer_0, np.full((2, 3), 3.0))
+    np.testing.assert_allclose(layer_1, np.array([3.0]))
+
+
+def test_fedavg_incremental_aggregation_no_failures_accepted() -> None:
+    """Test that accumulated results are discarded on failures."""
+    # Prepare
+    strategy = FedAvg(accept_failures=False)
+    results = _fit_results()
+
+    # Execute
+    strategy.begin_aggregate_fit(1)
+    for result in results:
+        strategy.accumulate_fit(1, result)
+    actual, _ = strategy.finalize_aggregate_fit(1, results, [Exception()])
+
+    # Assert
+    assert actual is None
+
+
+def test_fedavg_subclass_with_custom_aggregate_fit_is_not_incremental() -> None:
+    """Test that overriding `aggregate_fit` disables incremental aggregation."""
+
+    # Prepare
+    class CustomFedAvg(FedAvg):
+        """FedAvg with custom aggregation."""
+
+        def aggregate_fit(self, server_round, results, failures):  # type: ignore
+            """Aggregate using the parent implementation."""
+            return super().aggregate_fit(server_round, results, failures)
+
+    # Execute & Assert
+    assert FedAvgM().begin_aggregate_fit(1)
+    assert not CustomFedAvg().begin_aggregate_fit(1)
+
+
+def test_fedavg_configure_fit_requests_tensor_type() -> None:
+    """Test that `fit_tensor_type` is sent to clients in the fit config."""
+    # Prepare
+    strategy = FedAvg(
+        on_fit_config_fn=lambda _: {"epochs": 1},
+        fit_tensor_type="numpy.ndarray.compact+fp16",
+    )
+    client_manager = MagicMock()
+    client_manager.num_available.return_value = 2
+    client_manager.sample.return_value = [MagicMock(), MagicMock()]
+
+    # Execute
+    instructions = strategy.configure_fit(
+        1, ndarrays_to_parameters([np.ones(2)]), client_manager
+    )
+
+    # Assert
+    for _, fit_ins in instructions:
+        assert fit_ins.config == {
+            "epochs": 1,
+            "tensor_type": "numpy.ndarray.compact+fp16",
+        }
+
+
+def test_fedavg_subclasses_request_tensor_type() -> None:
+    """Test that strategies derived from FedAvg send `fit_tensor_type`."""
+    # Prepare
+    initial_parameters = ndarrays_to_parameters([np.ones(2)])
+    tensor_type = "numpy.ndarray.compact+fp16"
+    strategies: List[FedAvg] = [
+        Bulyan(fit_tensor_type=tensor_type),
+        FaultTolerantFedAvg(fit_tensor_type=tensor_type),
+        FedAdagrad(initial_parameters=initial_parameters, fit_tensor_type=tensor_type),
+        FedAdam(initial_parameters=initial_parameters, fit_tensor_type=tensor_type),
+        FedAvgM(fit_tensor_type=tensor_type),
+        FedMedian(fit_tensor_type=tensor_type),
+        FedProx(proximal_mu=0.1, fit_tensor_type=tensor_type),
+        FedTrimmedAvg(fit_tensor_type=tensor_type),
+        FedYogi(initial_parameters=initial_parameters, fit_tensor_type=tensor_type),
+        Krum(fit_tensor_type=tensor_type),
+        QFedAvg(fit_tensor_type=tensor_type),
+    ]
+    client_manager = MagicMock()
+    client_manager.num_available.return_value = 2
+    client_manager.sample.return_value = [MagicMock(), MagicMock()]
+
+    for strategy in strategies:
+        # Execute
+        instructions = strategy.configure_fit(1, initial_parameters, client_manager)
+
+        # Assert
+        for _, fit_ins in instructions:
+            assert fit_ins.config["tensor_type"] == tensor_type
+
+
+def test_fedavg_aggregates_updates() -> None:
+    """Test that updates and full parameters can be aggregated together."""
+    # Prepare
+    strategy = FedAvg(fit_delta=True, fit_delta_top_k=1.0)
+    current = ndarrays_to_parameters([np.array([1.0, 2.0])])
+    client_manager = MagicMock()
+    client_manager.num_available.return_value = 2
+    client_manager.sample.return_value = [MagicMock(), MagicMock()]
+    instructions = strategy.configure_fit(1, current, client_manager)
+    update = FitRes(
+        status=Status(code=Code.OK, message="Success"),
+        parameters=ndarrays_to_parameters(
+            [np.array([2.0, 0.0])], tensor_type="numpy.ndarray.sparse+delta"
+        ),
+        num_examples=1,
+        metrics={},
+    )
+    full = FitRes(
+        status=Status(code=Code.OK, message="Success"),
+        parameters=ndarrays_to_parameters([np.array([0.0, 5.0])]),
+        num_examples=3,
+        metrics={},
+    )
+
+    # Execute
+    parameters, _ = strategy.aggregate_fit(
+        1, [(MagicMock(), update), (MagicMock(), full)], []
+    )
+
+    # Assert
+    assert instructions[0][1].config == {
+        "delta": True,
+        "delta_top_k": 1.0,
+        "tensor_type": "numpy.ndarray.sparse",
+    }
+    assert parameters is not None
+    np.testing.assert_allclose(parameters_to_ndarrays(parameters)[0], [0.75, 4.25])
+
+
+def test_fedavg_rejects_invalid_fit_delta_top_k() -> None:
+    """Test that an invalid `fit_delta_top_k` is rejected on construction."""
+    with pytest.raises(ValueError):
+        FedAvg(fit_delta=True, fit_delta_top_k=1.5)
+
+
+def test_fedavg_subclasses_forward_fit_delta() -> None:
+    """Test that FedOpt and FedAvgM based strategies request updates."""
+    # Prepare
+    initial_parameters = ndarrays_to_parameters([np.ones(2)])
+    strategies: List[FedAvg] = [
+        FedAdagrad(
+            initial_parameters=initial_parameters, fit_delta=True, fit_delta_top_k=0.5
+        ),
+        FedAdam(
+            initial_parameters=initial_parameters, fit_delta=True, fit_delta_top_k=0.5
+        ),
+        FedAvgM(fit_delta=True, fit_delta_top_k=0.5),
+        FedYogi(
+            initial_parameters=initial_parameters, fit_delta=True, fit_delta_top_k=0.5
+        ),
+    ]
+    client_manager = MagicMock()
+    client_manager.num_available.return_value = 2
+    client_manager.sample.return_value = [MagicMock(), MagicMock()]
+
+    for strategy in strategies:
+        # Execute
+        instructions = strategy.configure_fit(1, initial_parameters, client_manager)
+
+        # Assert
+        for _, fit_ins in instructions:
+            assert fit_ins.config == {
+                "delta": True,
+                "delta_top_k": 0.5,
+                "tensor_type": "numpy.ndarray.sparse",
+            }
+
+
+def test_strategies_without_fit_delta_support_raise() -> None:
+    """Test that strategies which cannot apply updates reject `fit_delta`."""
+    # Prepare
+    parameters = ndarrays_to_parameters([np.ones(2)])
+    strategies: List[FedAvg] = [
+        Bulyan(),
+        FaultTolerantFedAvg(),
+        FedMedian(),
+        FedTrimmedAvg(),
+        Krum(),
+        QFedAvg(),
+    ]
+
+    for strategy in strategies:
+        strategy.fit_delta = True
+
+        # Execute & Assert
+        with pytest.raises(ValueError):
+            strategy.configure_fit(1, parameters, MagicMock())
@@ -18,7 +18,6 @@ Paper: arxiv.org/pdf/1909.06335.pdf
 """
 
 
-from logging import WARNING
 from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from flwr.common import (
@@ -30,11 +29,9 @@ from flwr.common import (
     ndarrays_to_parameters,
     parameters_to_ndarrays,
 )
-from flwr.common.logger import log
 from flwr.server.client_manager import ClientManager
 from flwr.server.client_proxy import ClientProxy
 
-from .aggregate import aggregate
 from .fedavg import FedAvg
 
 
@@ -62,6 +59,10 @@ class FedAvgM(FedAvg):
         initial_parameters: Optional[Parameters] = None,
         fit_metrics_aggregation_fn: Optional[MetricsAggregationFn] = None,
         evaluate_metrics_aggregation_fn: Optional[MetricsAggregationFn] = None,
+        fit_tensor_type: Optional[str] = None,
+        fit_delta: bool = False,
+        fit_delta_top_k: Optional[float] = None,
+        fit_delta_threshold: Optional[float] = None,
         server_learning_rate: float = 1.0,
         server_momentum: float = 0.0,
     ) -> None:
@@ -91,6 +92,17 @@ class FedAvgM(FedAvg):
             Whether or not accept rounds containing failures. Defaults to True.
         initial_parameters : Parameters, optional
             Initial global model parameters.
+        fit_delta : bool
+            Whether to request clients to return the update to the parameters they
+            received instead of the updated parameters. Defaults to False.
+        fit_delta_top_k : Optional[float]
+            Fraction of the values of each layer of the update clients return,
+            choosing the values with the largest magnitude. Only used if
+            `fit_delta` is True. Defaults to None.
+        fit_delta_threshold : Optional[float]
+            Only values of the update with a magnitude of at least
+            `fit_delta_threshold` are returned. Only used if `fit_delta` is True
+            and `fit_delta_top_k` is None. Defaults to None.
         server_learning_rate: float
             Server-side learning rate used in server-side optimization.
             Defaults to 1.0.
@@ -110,6 +122,10 @@ class FedAvgM(FedAvg):
             initial_parameters=initial_parameters,
             fit_metrics_aggregation_fn=fit_metrics_aggregation_fn,
             evaluate_metrics_aggregation_fn=evaluate_metrics_aggregation_fn,
+            fit_tensor_type=fit_tensor_type,
+            fit_delta=fit_delta,
+            fit_delta_top_k=fit_delta_top_k,
+            fit_delta_threshold=fit_delta_threshold,
         )
         self.server_learning_rate = server_learning_rate
         self.server_momentum = server_momentum
@@ -129,72 +145,58 @@ class FedAvgM(FedAvg):
         """Initialize global model parameters."""
         return self.initial_parameters
 
-    def aggregate_fit(
+    def finalize_aggregate_fit(
         self,
         server_round: int,
         results: List[Tuple[ClientProxy, FitRes]],
         failures: List[Union[Tuple[ClientProxy, FitRes], BaseException]],
     ) -> Tuple[Optional[Parameters], Dict[str, Scalar]]:
-        """Aggregate fit results using weighted average."""
-        if not results:
-            return None, {}
-        # Do not aggregate if there are failures and failures are not accepted
-        if not self.accept_failures and failures:
+        """Apply server-side momentum to the weighted average of fit results."""
+        (
+            fedavg_parameters_aggregated,
+            metrics_aggregated,
+        ) = super().finalize_aggregate_fit(
+            server_round=server_round, results=results, failures=failures
+        )
+        if fedavg_parameters_aggregated is None:
             return None, {}
-        # Convert results
-        weights_results = [
-            (parameters_to_ndarrays(fit_res.parameters), fit_res.num_examples)
-            for _, fit_res in results
-        ]
+        if not self.server_opt:
+            return fedavg_parameters_aggregated, metrics_aggregated
 
-        fedavg_result = aggregate(weights_results)
+        fedavg_result = parameters_to_ndarrays(fedavg_parameters_aggregated)
         # following convention described in
         # https://pytorch.org/docs/stable/generated/torch.optim.SGD.html
-        if self.server_opt:
-            # You need to initialize the model
-            assert (
-                self.initial_parameters is not None
-            ), "When using server-side optimization, model needs to be initialized."
-            initial_weights = parameters_to_ndarrays(self.initial_parameters)
-
-            # remember that updates are the opposite of gradients
-            pseudo_gradient: NDArrays = [
-                x - y
-                for x, y in zip(
-                    parameters_to_ndarrays(self.initial_parameters), fedavg_result
-                )
-            ]
-            if self.server_momentum > 0.0:
-                if server_round > 1:
-                    assert (
-                        self.momentum_vector
-                    ), "Momentum should have been created on round 1."
-                    self.momentum_vector = [
-                        self.server_momentum * x + y
-                        for x, y in zip(self.momentum_vector, pseudo_gradient)
-                    ]
-                else:
-                    self.momentum_vector = pseudo_gradient
-
-                # No nesterov for now
-                pseudo_gradient = self.momentum_vector
-
-            # SGD
-            fedavg_result = [
-                x - self.server_learning_rate * y
-                for x, y in zip(initial_weights, pseudo_gradient)
-            ]
-            # Update current weights
-            self.initial_parameters = ndarrays_to_parameters(fedavg_result)
-
-        parameters_aggregated = ndarrays_to_parameters(fedavg_result)
-
-        # Aggregate custom metrics if aggregation fn was provided
-        metrics_aggregated = {}
-        if self.fit_metrics_aggregation_fn:
-            fit_metrics = [(res.num_examples, res.metrics) for _, res in results]
-            metrics_aggregated = self.fit_metrics_aggregation_fn(fit_metrics)
-        elif server_round == 1:  # Only log this warning once
-            log(WARNING, "No fit_metrics_aggregation_fn provided")
+        # You need to initialize the model
+        assert (
+            self.initial_parameters is not None
+        ), "When using server-side optimization, model needs to be initialized."
+        initial_weights = parameters_to_ndarrays(self.initial_parameters)
+
+        # remember that updates are the opposite of gradients
+        pseudo_gradient: NDArrays = [
+            x - y for x, y in zip(initial_weights, fedavg_result)
+        ]
+        if self.server_momentum > 0.0:
+            if server_round > 1:
+                assert (
+                    self.momentum_vector
+                ), "Momentum should have been created on round 1."
+                self.momentum_vector = [
+                    self.server_momentum * x + y
+                    for x, y in zip(self.momentum_vector, pseudo_gradient)
+                ]
+            else:
+                self.momentum_vector = pseudo_gradient
+
+            # No nesterov for now
+            pseudo_gradient = self.momentum_vector
+
+        # SGD
+        fedavg_result = [
+            x - self.server_learning_rate * y
+            for x, y in zip(initial_weights, pseudo_gradient)
+        ]
+        # Update current weights
+        self.initial_parameters = ndarrays_to_parameters(fedavg_result)
 
-        return parameters_aggregated, metrics_aggregated
+        return self.initial_parameters, metrics_aggregated
@@ -19,7 +19,7 @@ Paper: arxiv.org/pdf/1803.01498v1.pdf
 
 
 from logging import WARNING
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from flwr.common import (
     FitRes,
@@ -38,6 +38,30 @@ from .fedavg import FedAvg
 class FedMedian(FedAvg):
     """Configurable FedAvg with Momentum strategy implementation."""
 
+    _supports_fit_delta = False
+
+    def __init__(
+        self,
+        *,
+        max_aggregation_memory_bytes: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Federated Median strategy.
+
+        Implementation based on https://arxiv.org/pdf/1803.01498v1.pdf
+
+        Parameters
+        ----------
+        max_aggregation_memory_bytes : Optional[int]
+            Maximum size of the stacked client weights that are processed at once
+            during aggregation. Large layers are aggregated in blocks of columns
+            that fit into this budget. Defaults to None (no limit).
+        **kwargs : Any
+            Keyword arguments passed on to `FedAvg`.
+        """
+        super().__init__(**kwargs)
+        self.max_aggregation_memory_bytes = max_aggregation_memory_bytes
+
     def __repr__(self) -> str:
         """Compute a string representation of the strategy."""
         rep = f"FedMedian(accept_failures={self.accept_failures})"
@@ -62,7 +86,9 @@ class FedMedian(FedAvg):
             for _, fit_res in results
         ]
         parameters_aggregated = ndarrays_to_parameters(
-            aggregate_median(weights_results)
+            aggregate_median(
+                weights_results, max_memory_bytes=self.max_aggregation_memory_bytes
+            )
         )
 
         # Aggregate custom metrics if aggregation fn was provided
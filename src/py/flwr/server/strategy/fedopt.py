@@ -55,6 +55,10 @@ class FedOpt(FedAvg):
         initial_parameters: Parameters,
         fit_metrics_aggregation_fn: Optional[MetricsAggregationFn] = None,
         evaluate_metrics_aggregation_fn: Optional[MetricsAggregationFn] = None,
+        fit_tensor_type: Optional[str] = None,
+        fit_delta: bool = False,
+        fit_delta_top_k: Optional[float] = None,
+        fit_delta_threshold: Optional[float] = None,
         eta: float = 1e-1,
         eta_l: float = 1e-1,
         beta_1: float = 0.0,
@@ -91,6 +95,21 @@ class FedOpt(FedAvg):
             Metrics aggregation function, optional.
         evaluate_metrics_aggregation_fn: Optional[MetricsAggregationFn]
             Metrics aggregation function, optional.
+        fit_tensor_type : Optional[str]
+            Tensor type (e.g., `numpy.ndarray.compact+fp16+zstd`) requested from
+            clients for the parameters they return from `fit`. Clients that do not
+            support it may ignore the request. Defaults to None.
+        fit_delta : bool
+            Whether to request clients to return the update to the parameters they
+            received instead of the updated parameters. Defaults to False.
+        fit_delta_top_k : Optional[float]
+            Fraction of the values of each layer of the update clients return,
+            choosing the values with the largest magnitude. Only used if
+            `fit_delta` is True. Defaults to None.
+        fit_delta_threshold : Optional[float]
+            Only values of the update with a magnitude of at least
+            `fit_delta_threshold` are returned. Only used if `fit_delta` is True
+            and `fit_delta_top_k` is None. Defaults to None.
         eta : float, optional
             Server-side learning rate. Defaults to 1e-1.
         eta_l : float, optional
@@ -115,6 +134,10 @@ class FedOpt(FedAvg):
             initial_parameters=initial_parameters,
             fit_metrics_aggregation_fn=fit_metrics_aggregation_fn,
             evaluate_metrics_aggregation_fn=evaluate_metrics_aggregation_fn,
+            fit_tensor_type=fit_tensor_type,
+            fit_delta=fit_delta,
+            fit_delta_top_k=fit_delta_top_k,
+            fit_delta_threshold=fit_delta_threshold,
         )
         self.current_weights = parameters_to_ndarrays(initial_parameters)
         self.eta = eta
@@ -51,6 +51,7 @@ class FedProx(FedAvg):
         initial_parameters: Optional[Parameters] = None,
         fit_metrics_aggregation_fn: Optional[MetricsAggregationFn] = None,
         evaluate_metrics_aggregation_fn: Optional[MetricsAggregationFn] = None,
+        fit_tensor_type: Optional[str] = None,
         proximal_mu: float,
     ) -> None:
         r"""Federated Optimization strategy.
@@ -119,6 +120,10 @@ class FedProx(FedAvg):
             Metrics aggregation function, optional.
         evaluate_metrics_aggregation_fn : Optional[MetricsAggregationFn]
             Metrics aggregation function, optional.
+        fit_tensor_type : Optional[str]
+            Tensor type (e.g., `numpy.ndarray.compact+fp16+zstd`) requested from
+            clients for the parameters they return from `fit`. Clients that do not
+            support it may ignore the request. Defaults to None.
         proximal_mu : float
             The weight of the proximal term used in the optimization. 0.0 makes
             this strategy equivalent to FedAvg, and the higher the coefficient, the more
@@ -138,6 +143,7 @@ class FedProx(FedAvg):
             initial_parameters=initial_parameters,
             fit_metrics_aggregation_fn=fit_metrics_aggregation_fn,
             evaluate_metrics_aggregation_fn=evaluate_metrics_aggregation_fn,
+            fit_tensor_type=fit_tensor_type,
         )
         self.proximal_mu = proximal_mu
 
@@ -41,6 +41,8 @@ class FedTrimmedAvg(FedAvg):
     Paper: https://arxiv.org/abs/1803.01498
     """
 
+    _supports_fit_delta = False
+
     # pylint: disable=too-many-arguments,too-many-instance-attributes, line-too-long
     def __init__(
         self,
@@ -62,7 +64,9 @@ class FedTrimmedAvg(FedAvg):
         initial_parameters: Optional[Parameters] = None,
         fit_metrics_aggregation_fn: Optional[MetricsAggregationFn] = None,
         evaluate_metrics_aggregation_fn: Optional[MetricsAggregationFn] = None,
+        fit_tensor_type: Optional[str] = None,
         beta: float = 0.2,
+        max_aggregation_memory_bytes: Optional[int] = None,
     ) -> None:
         """Federated Averaging with Trimmed Mean [Dong Yin, et al., 2021].
 
@@ -90,6 +94,10 @@ class FedTrimmedAvg(FedAvg):
             Initial global model parameters.
         beta : float, optional
             Fraction to cut off of both tails of the distribution. Defaults to 0.2.
+        max_aggregation_memory_bytes : Optional[int]
+            Maximum size of the stacked client weights that are processed at once
+            during aggregation. Large layers are aggregated in blocks of columns
+            that fit into this budget. Defaults to None (no limit).
         """
         super().__init__(
             fraction_fit=fraction_fit,
@@ -104,8 +112,10 @@ class FedTrimmedAvg(FedAvg):
             initial_parameters=initial_parameters,
             fit_metrics_aggregation_fn=fit_metrics_aggregation_fn,
             evaluate_metrics_aggregation_fn=evaluate_metrics_aggregation_fn,
+            fit_tensor_type=fit_tensor_type,
         )
         self.beta = beta
+        self.max_aggregation_memory_bytes = max_aggregation_memory_bytes
 
     def __repr__(self) -> str:
         """Compute a string representation of the strategy."""
@@ -131,7 +141,11 @@ class FedTrimmedAvg(FedAvg):
             for _, fit_res in results
         ]
         parameters_aggregated = ndarrays_to_parameters(
-            aggregate_trimmed_avg(weights_results, self.beta)
+            aggregate_trimmed_avg(
+                weights_results,
+                self.beta,
+                max_memory_bytes=self.max_aggregation_memory_bytes,
+            )
         )
 
         # Aggregate custom metrics if aggregation fn was provided
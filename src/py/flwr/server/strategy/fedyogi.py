@@ -65,6 +65,10 @@ class FedYogi(FedOpt):
         initial_parameters: Parameters,
         fit_metrics_aggregation_fn: Optional[MetricsAggregationFn] = None,
         evaluate_metrics_aggregation_fn: Optional[MetricsAggregationFn] = None,
+        fit_tensor_type: Optional[str] = None,
+        fit_delta: bool = False,
+        fit_delta_top_k: Optional[float] = None,
+        fit_delta_threshold: Optional[float] = None,
         eta: float = 1e-2,
         eta_l: float = 0.0316,
         beta_1: float = 0.9,
@@ -101,6 +105,21 @@ class FedYogi(FedOpt):
             Metrics aggregation function, optional.
         evaluate_metrics_aggregation_fn: Optional[MetricsAggregationFn]
             Metrics aggregation function, optional.
+        fit_tensor_type : Optional[str]
+            Tensor type (e.g., `numpy.ndarray.compact+fp16+zstd`) requested from
+            clients for the parameters they return from `fit`. Clients that do not
+            support it may ignore the request. Defaults to None.
+        fit_delta : bool
+            Whether to request clients to return the update to the parameters they
+            received instead of the updated parameters. Defaults to False.
+        fit_delta_top_k : Optional[float]
+            Fraction of the values of each layer of the update clients return,
+            choosing the values with the largest magnitude. Only used if
+            `fit_delta` is True. Defaults to None.
+        fit_delta_threshold : Optional[float]
+            Only values of the update with a magnitude of at least
+            `fit_delta_threshold` are returned. Only used if `fit_delta` is True
+            and `fit_delta_top_k` is None. Defaults to None.
         eta : float, optional
             Server-side learning rate. Defaults to 1e-1.
         eta_l : float, optional
@@ -126,6 +145,10 @@ class FedYogi(FedOpt):
             initial_parameters=initial_parameters,
             fit_metrics_aggregation_fn=fit_metrics_aggregation_fn,
             evaluate_metrics_aggregation_fn=evaluate_metrics_aggregation_fn,
+            fit_tensor_type=fit_tensor_type,
+            fit_delta=fit_delta,
+            fit_delta_top_k=fit_delta_top_k,
+            fit_delta_threshold=fit_delta_threshold,
             eta=eta,
             eta_l=eta_l,
             beta_1=beta_1,
@@ -138,14 +161,17 @@ class FedYogi(FedOpt):
         rep = f"FedYogi(accept_failures={self.accept_failures})"
         return rep
 
-    def aggregate_fit(
+    def finalize_aggregate_fit(
         self,
         server_round: int,
         results: List[Tuple[ClientProxy, FitRes]],
         failures: List[Union[Tuple[ClientProxy, FitRes], BaseException]],
     ) -> Tuple[Optional[Parameters], Dict[str, Scalar]]:
-        """Aggregate fit results using weighted average."""
-        fedavg_parameters_aggregated, metrics_aggregated = super().aggregate_fit(
+        """Apply the server-side optimizer to the weighted average of fit results."""
+        (
+            fedavg_parameters_aggregated,
+            metrics_aggregated,
+        ) = super().finalize_aggregate_fit(
             server_round=server_round, results=results, failures=failures
         )
         if fedavg_parameters_aggregated is None:
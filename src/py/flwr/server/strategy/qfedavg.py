@@ -36,6 +36,7 @@ from flwr.common import (
     parameters_to_ndarrays,
 )
 from flwr.common.logger import log
+from flwr.common.parameter import TENSOR_TYPE_CONFIG_KEY
 from flwr.server.client_manager import ClientManager
 from flwr.server.client_proxy import ClientProxy
 
@@ -47,6 +48,8 @@ from .fedavg import FedAvg
 class QFedAvg(FedAvg):
     """Configurable QFedAvg strategy implementation."""
 
+    _supports_fit_delta = False
+
     # pylint: disable=too-many-arguments,too-many-instance-attributes
     def __init__(
         self,
@@ -70,6 +73,7 @@ class QFedAvg(FedAvg):
         initial_parameters: Optional[Parameters] = None,
         fit_metrics_aggregation_fn: Optional[MetricsAggregationFn] = None,
         evaluate_metrics_aggregation_fn: Optional[MetricsAggregationFn] = None,
+        fit_tensor_type: Optional[str] = None,
     ) -> None:
         super().__init__(
             fraction_fit=fraction_fit,
@@ -84,6 +88,7 @@ class QFedAvg(FedAvg):
             initial_parameters=initial_parameters,
             fit_metrics_aggregation_fn=fit_metrics_aggregation_fn,
             evaluate_metrics_aggregation_fn=evaluate_metrics_aggregation_fn,
+            fit_tensor_type=fit_tensor_type,
         )
         self.learning_rate = qffl_learning_rate
         self.q_param = q_param
@@ -109,6 +114,7 @@ class QFedAvg(FedAvg):
         self, server_round: int, parameters: Parameters, client_manager: ClientManager
     ) -> List[Tuple[ClientProxy, FitIns]]:
         """Configure the next round of training."""
+        self._check_fit_delta()
         weights = parameters_to_ndarrays(parameters)
         self.pre_weights = weights
         parameters = ndarrays_to_parameters(weights)
@@ -116,6 +122,8 @@ class QFedAvg(FedAvg):
         if self.on_fit_config_fn is not None:
             # Custom fit config function provided
             config = self.on_fit_config_fn(server_round)
+        if self.fit_tensor_type is not None:
+            config = {**config, TENSOR_TYPE_CONFIG_KEY: self.fit_tensor_type}
         fit_ins = FitIns(parameters, config)
 
         # Sample clients
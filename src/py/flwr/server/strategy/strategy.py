@@ -16,6 +16,7 @@
 
 
 from abc import ABC, abstractmethod
+from dataclasses import replace
 from typing import Dict, List, Optional, Tuple, Union
 
 from flwr.common import EvaluateIns, EvaluateRes, FitIns, FitRes, Parameters, Scalar
@@ -183,3 +184,81 @@ class Strategy(ABC):
             The evaluation result, usually a Tuple containing loss and a
             dictionary containing task-specific metrics (e.g., accuracy).
         """
+
+    def begin_aggregate_fit(self, server_round: int) -> bool:
+        """Prepare the incremental aggregation of training results.
+
+        Strategies that can fold training results into a running aggregate one
+        at a time (instead of waiting for all results of a round) return `True`.
+        The server will then call `accumulate_fit` for each successful result as
+        soon as it is received, and `finalize_aggregate_fit` once all clients
+        have either returned a result or failed. Strategies that return `False`
+        are aggregated using `aggregate_fit`.
+
+        The default implementation buffers results in `accumulate_fit` and passes
+        them to `aggregate_fit` in `finalize_aggregate_fit`, so strategies which
+        only implement `aggregate_fit` keep working unchanged.
+
+        Parameters
+        ----------
+        server_round : int
+            The current round of federated learning.
+
+        Returns
+        -------
+        incremental : bool
+            Whether or not the strategy supports incremental aggregation.
+        """
+        # pylint: disable-next=attribute-defined-outside-init
+        self._buffered_fit_results: List[Tuple[ClientProxy, FitRes]] = []
+        return True
+
+    def accumulate_fit(
+        self, server_round: int, result: Tuple[ClientProxy, FitRes]
+    ) -> None:
+        """Fold a single training result into the running aggregate.
+
+        The server releases the `Parameters` of a result once it has been
+        accumulated. The default implementation keeps a copy of the result
+        which still references them until `finalize_aggregate_fit`.
+
+        Parameters
+        ----------
+        server_round : int
+            The current round of federated learning.
+        result : Tuple[ClientProxy, FitRes]
+            A successful update from one of the previously selected clients.
+        """
+        client, fit_res = result
+        self._buffered_fit_results.append((client, replace(fit_res)))
+
+    def finalize_aggregate_fit(
+        self,
+        server_round: int,
+        results: List[Tuple[ClientProxy, FitRes]],
+        failures: List[Union[Tuple[ClientProxy, FitRes], BaseException]],
+    ) -> Tuple[Optional[Parameters], Dict[str, Scalar]]:
+        """Complete the incremental aggregation of training results.
+
+        Parameters
+        ----------
+        server_round : int
+            The current round of federated learning.
+        results : List[Tuple[ClientProxy, FitRes]]
+            Successful updates that have been passed to `accumulate_fit`. Their
+            `FitRes.parameters` have already been released, but all other fields
+            (e.g., `num_examples` and `metrics`) are still available.
+        failures : List[Union[Tuple[ClientProxy, FitRes], BaseException]]
+            Exceptions that occurred while the server was waiting for client
+            updates.
+
+        Returns
+        -------
+        parameters : Tuple[Optional[Parameters], Dict[str, Scalar]]
+            The new global model parameters (or `None`) and aggregated metrics,
+            with the same semantics as the return value of `aggregate_fit`.
+        """
+        buffered_results = self._buffered_fit_results
+        # pylint: disable-next=attribute-defined-outside-init
+        self._buffered_fit_results = []
+        return self.aggregate_fit(server_round, buffered_results, failures)
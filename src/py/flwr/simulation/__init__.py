@@ -17,6 +17,8 @@
 
 import importlib
 
+from flwr.simulation.ray_transport.client_cache import cached
+
 is_ray_installed = importlib.util.find_spec("ray") is not None
 
 if is_ray_installed:
@@ -35,5 +37,6 @@ To install the necessary dependencies, install `flwr` with the `simulation` extr
 
 
 __all__ = [
+    "cached",
     "start_simulation",
 ]
@@ -26,6 +26,7 @@ import ray
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 
 from flwr.client import ClientFn
+from flwr.client.workload_state_store import WorkloadStateStore
 from flwr.common import EventType, event
 from flwr.common.logger import log
 from flwr.server import Server
@@ -85,6 +86,8 @@ def start_simulation(
     actor_type: Type[VirtualClientEngineActor] = DefaultActor,
     actor_kwargs: Optional[Dict[str, Any]] = None,
     actor_scheduling: Union[str, NodeAffinitySchedulingStrategy] = "DEFAULT",
+    state_store: Optional[WorkloadStateStore] = None,
+    actor_max_batch_size: int = 1,
 ) -> History:
     """Start a Ray-based Flower simulation server.
 
@@ -116,8 +119,10 @@ def start_simulation(
         An implementation of the abstract base class `flwr.server.Server`. If no
         instance is provided, then `start_server` will create one.
     config: ServerConfig (default: None).
-        Currently supported values are `num_rounds` (int, default: 1) and
-        `round_timeout` in seconds (float, default: None).
+        Currently supported values are `num_rounds` (int, default: 1),
+        `round_timeout` in seconds (float, default: None), `round_min_results`
+        (int, default: None), and `round_deadline` in seconds (float, default:
+        None).
     strategy : Optional[flwr.server.Strategy] (default: None)
         An implementation of the abstract base class `flwr.server.Strategy`. If
         no strategy is provided, then `start_server` will use
@@ -145,7 +150,9 @@ def start_simulation(
 
     actor_kwargs: Optional[Dict[str, Any]] (default: None)
         If you want to create your own Actor classes, you might need to pass
-        some input argument. You can use this dictionary for such purpose.
+        some input argument. You can use this dictionary for such purpose. The
+        `DefaultActor` accepts `cache_max_clients` and `cache_max_bytes` to
+        configure the cache of resources declared with `flwr.simulation.cached`.
 
     actor_scheduling: Optional[Union[str, NodeAffinitySchedulingStrategy]]
         (default: "DEFAULT")
@@ -156,6 +163,18 @@ def start_simulation(
         is an advanced feature. For all details, please refer to the Ray documentation:
         https://docs.ray.io/en/latest/ray-core/scheduling/index.html
 
+    state_store: Optional[WorkloadStateStore] (default: None)
+        A store keeping the `WorkloadState` of each virtual client between rounds,
+        keyed by `cid`, e.g., `InMemoryWorkloadStateStore` or
+        `DiskWorkloadStateStore`. States are sent to the actors and back with each
+        job. If `None`, each job starts with an empty state.
+
+    actor_max_batch_size: int (default: 1)
+        The maximum number of queued client jobs sent to an actor at once. Values
+        greater than 1 amortize the Ray scheduling overhead when there are many
+        short jobs (e.g., small models or datasets). The batch size adapts to the
+        measured job duration, so long jobs are still sent one at a time.
+
     Returns
     -------
     hist : flwr.server.history.History
@@ -260,6 +279,7 @@ def start_simulation(
     pool = VirtualClientEngineActorPool(
         create_actor_fn=create_actor_fn,
         client_resources=client_resources,
+        max_batch_size=actor_max_batch_size,
     )
 
     f_stop = threading.Event()
@@ -298,6 +318,7 @@ def start_simulation(
             client_fn=client_fn,
             cid=cid,
             actor_pool=pool,
+            state_store=state_store,
         )
         initialized_server.client_manager().register(client=client_proxy)
 
@@ -309,6 +330,9 @@ def start_simulation(
             server=initialized_server,
             config=initialized_config,
         )
+        cache_stats = pool.cache_stats()
+        if cache_stats.get("hits", 0) or cache_stats.get("misses", 0):
+            log(INFO, "Flower VCE: Client cache statistics: %s", cache_stats)
     except Exception as ex:
         log(ERROR, ex)
         log(ERROR, traceback.format_exc())
@@ -0,0 +1,100 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for the simulation entry point."""
+
+
+import sys
+import time
+import traceback
+from typing import Dict, List, Tuple
+
+import numpy as np
+import ray
+
+from flwr.client import Client, NumPyClient
+from flwr.common import Metrics, NDArrays, Scalar
+from flwr.server import ServerConfig
+from flwr.server.strategy import FedAvg
+from flwr.simulation import start_simulation
+
+
+class LateClient(NumPyClient):
+    """A NumPyClient of which client "0" is late in the first round."""
+
+    def __init__(self, cid: str) -> None:
+        self.cid = cid
+
+    def get_parameters(self, config: Dict[str, Scalar]) -> NDArrays:
+        """Return the initial parameters."""
+        return [np.zeros(2)]
+
+    def fit(
+        self, parameters: NDArrays, config: Dict[str, Scalar]
+    ) -> Tuple[NDArrays, int, Dict[str, Scalar]]:
+        """Return the received parameters, late for client "0" in round 1."""
+        if self.cid == "0" and config["server_round"] == 1:
+            time.sleep(3)
+        return parameters, 1, {}
+
+
+def client_fn(cid: str) -> Client:
+    """Return a LateClient converted to Client type."""
+    return LateClient(cid).to_client()
+
+
+def count_results(metrics: List[Tuple[int, Metrics]]) -> Metrics:
+    """Return the number of results received in a round."""
+    return {"num_results": len(metrics)}
+
+
+def test_round_deadline_samples_late_client_again() -> None:
+    """Test that late clients are cancelled without blocking later rounds."""
+    # Prepare
+    strategy = FedAvg(
+        fraction_evaluate=0.0,
+        min_fit_clients=2,
+        min_available_clients=2,
+        on_fit_config_fn=lambda server_round: {"server_round": server_round},
+        fit_metrics_aggregation_fn=count_results,
+    )
+
+    # Execute
+    hist = start_simulation(
+        client_fn=client_fn,
+        num_clients=2,
+        config=ServerConfig(num_rounds=2, round_deadline=1.0),
+        strategy=strategy,
+        ray_init_args={"num_cpus": 2, "include_dashboard": False},
+    )
+    # The threads waiting for late clients have to return, otherwise the
+    # interpreter hangs on exit
+    deadline = time.monotonic() + 5
+    while _waiting_for_results() and time.monotonic() < deadline:
+        time.sleep(0.1)
+    ray.shutdown()
+
+    # Assert
+    # The job of client "0" from round 1 is still running in round 2
+    assert hist.metrics_distributed_fit["num_results"] == [(1, 1), (2, 2)]
+    assert not _waiting_for_results()
+
+
+def _waiting_for_results() -> bool:
+    """Return whether a thread is waiting for the result of a client."""
+    return any(
+        frame.f_code.co_name == "get_client_result"
+        for stack in sys._current_frames().values()  # pylint: disable=protected-access
+        for frame, _ in traceback.walk_stack(stack)
+    )
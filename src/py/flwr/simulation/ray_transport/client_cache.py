@@ -0,0 +1,144 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Cache for client resources inside Virtual Client Engine actors."""
+
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_current_cache: Optional["ClientCache"] = None
+
+
+class ClientCache:
+    """Keep client resources of recently used clients in memory.
+
+    Resources are cached per client (`cid`), and the least recently used clients are
+    evicted with all of their resources once more than `max_clients` clients are
+    cached, or once the resources declared with a size exceed `max_bytes`.
+
+    Parameters
+    ----------
+    max_clients : int (default: 8)
+        The maximum number of clients whose resources are cached. If 0, nothing is
+        cached.
+    max_bytes : Optional[int] (default: None)
+        The maximum total size in bytes of cached resources. Only resources whose size
+        is passed to `cached` count towards it. If `None`, there is no limit.
+    """
+
+    def __init__(self, max_clients: int = 8, max_bytes: Optional[int] = None):
+        self.max_clients = max_clients
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.RLock()
+        # cid -> resource key -> (resource, size in bytes)
+        self._clients: "OrderedDict[str, Dict[str, Tuple[Any, int]]]" = OrderedDict()
+        self._num_bytes = 0
+
+    def get_or_create(
+        self, cid: str, key: str, create_fn: Callable[[], T], nbytes: int = 0
+    ) -> T:
+        """Return the resource `key` of client `cid`, creating it on a cache miss."""
+        with self._lock:
+            resources = self._clients.get(cid)
+            if resources is not None and key in resources:
+                self.hits += 1
+                self._clients.move_to_end(cid)
+                value: T = resources[key][0]
+                return value
+            self.misses += 1
+        value = create_fn()
+        if self.max_clients > 0 and (
+            self.max_bytes is None or nbytes <= self.max_bytes
+        ):
+            with self._lock:
+                resources = self._clients.setdefault(cid, {})
+                self._clients.move_to_end(cid)
+                _, old_nbytes = resources.get(key, (None, 0))
+                resources[key] = (value, nbytes)
+                self._num_bytes += nbytes - old_nbytes
+                self._evict()
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of hits, misses, and evictions, and the cache size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "clients": len(self._clients),
+                "bytes": self._num_bytes,
+            }
+
+    def _evict(self) -> None:
+        """Evict least recently used clients until the limits are met."""
+        while len(self._clients) > self.max_clients or (
+            self.max_bytes is not None and self._num_bytes > self.max_bytes
+        ):
+            _, resources = self._clients.popitem(last=False)
+            self._num_bytes -= sum(nbytes for _, nbytes in resources.values())
+            self.evictions += 1
+
+    @contextmanager
+    def activate(self) -> Iterator[None]:
+        """Make `cached` use this cache within the context."""
+        global _current_cache  # pylint: disable=global-statement
+        previous = _current_cache
+        _current_cache = self
+        try:
+            yield
+        finally:
+            _current_cache = previous
+
+
+def cached(cid: str, key: str, create_fn: Callable[[], T], nbytes: int = 0) -> T:
+    """Return a client resource, cached by the actor running the client.
+
+    Use this in `client_fn` to declare resources which can be reused when the same
+    client runs on the same actor again, e.g., its dataset partition, DataLoaders or
+    model. Outside of a Virtual Client Engine actor, `create_fn` is called every time.
+    Cached resources are shared between calls, so a client should not rely on them
+    being in their initial state (e.g., load the global parameters into a cached
+    model before training).
+
+    Parameters
+    ----------
+    cid : str
+        The ID of the client owning the resource.
+    key : str
+        The name of the resource, unique per client.
+    create_fn : Callable[[], T]
+        A function creating the resource on a cache miss.
+    nbytes : int (default: 0)
+        The (approximate) size of the resource, counted towards the memory budget of
+        the cache.
+
+    Examples
+    --------
+    >>> def client_fn(cid: str):
+    >>>     trainloader = cached(cid, "trainloader", lambda: load_partition(cid))
+    >>>     return FlowerClient(trainloader).to_client()
+    """
+    cache = _current_cache
+    if cache is None:
+        return create_fn()
+    return cache.get_or_create(cid, key, create_fn, nbytes)
@@ -0,0 +1,90 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for the client cache of Virtual Client Engine actors."""
+
+
+from typing import List
+
+from .client_cache import ClientCache, cached
+
+
+def test_cached_without_cache() -> None:
+    """Test that resources are created every time outside of an actor."""
+    # Prepare
+    created: List[str] = []
+
+    # Execute
+    for _ in range(2):
+        cached("0", "data", lambda: created.append("0"))
+
+    # Assert
+    assert created == ["0", "0"]
+
+
+def test_cached_hits_and_misses() -> None:
+    """Test that resources are created once per client and key."""
+    # Prepare
+    cache = ClientCache(max_clients=2)
+
+    # Execute
+    with cache.activate():
+        first = cached("0", "model", object)
+        second = cached("0", "model", object)
+        cached("0", "data", object)
+
+    # Assert
+    assert first is second
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 2,
+        "evictions": 0,
+        "clients": 1,
+        "bytes": 0,
+    }
+
+
+def test_evict_least_recently_used_client() -> None:
+    """Test that all resources of the least recently used client are evicted."""
+    # Prepare
+    cache = ClientCache(max_clients=2)
+    for cid in ["0", "1"]:
+        cache.get_or_create(cid, "data", object)
+    cache.get_or_create("0", "data", object)  # Client "1" is now least recent
+
+    # Execute
+    cache.get_or_create("2", "data", object)
+
+    # Assert
+    assert cache.stats()["evictions"] == 1
+    cache.get_or_create("0", "data", object)
+    assert cache.stats()["hits"] == 2
+    cache.get_or_create("1", "data", object)
+    assert cache.stats()["misses"] == 4
+
+
+def test_evict_over_memory_budget() -> None:
+    """Test that clients are evicted once the memory budget is exceeded."""
+    # Prepare
+    cache = ClientCache(max_clients=10, max_bytes=100)
+
+    # Execute
+    cache.get_or_create("0", "data", object, nbytes=60)
+    cache.get_or_create("1", "data", object, nbytes=60)
+    cache.get_or_create("2", "data", object, nbytes=200)  # Too large to cache
+
+    # Assert
+    assert cache.stats()["clients"] == 1
+    assert cache.stats()["bytes"] == 60
+    assert cache.stats()["evictions"] == 1
@@ -15,9 +15,12 @@
 """Ray-based Flower Actor and ActorPool implementation."""
 
 
+import concurrent.futures
 import threading
+import time
 import traceback
 from abc import ABC
+from contextlib import nullcontext
 from logging import ERROR, WARNING
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 
@@ -29,6 +32,7 @@ from flwr import common
 from flwr.client import Client, ClientFn
 from flwr.client.workload_state import WorkloadState
 from flwr.common.logger import log
+from flwr.simulation.ray_transport.client_cache import ClientCache
 from flwr.simulation.ray_transport.utils import check_clientfn_returns_client
 
 # All possible returns by a client
@@ -37,6 +41,19 @@ ClientRes = Union[
 ]
 # A function to be executed by a client to obtain some results
 JobFn = Callable[[Client], ClientRes]
+# A job as submitted to the pool: (client_fn, job_fn, cid, state)
+Job = Tuple[ClientFn, JobFn, str, WorkloadState]
+
+# The status of a job of a client: a reference to the remote job, the
+# position of the result in a batch, and a future completed once the result is ready
+JobEntry = Dict[
+    str,
+    Union["concurrent.futures.Future[None]", Optional[int], "Optional[ObjectRef[Any]]"],
+]
+
+# Maximum number of seconds the dispatcher waits for running jobs before it checks
+# for newly submitted ones
+DISPATCH_INTERVAL = 0.05
 
 
 class ClientException(Exception):
@@ -49,7 +66,28 @@ class ClientException(Exception):
 
 
 class VirtualClientEngineActor(ABC):
-    """Abstract base class for VirtualClientEngine Actors."""
+    """Abstract base class for VirtualClientEngine Actors.
+
+    Parameters
+    ----------
+    cache_max_clients : int (default: 8)
+        The maximum number of clients whose resources the actor caches (see
+        `flwr.simulation.cached`).
+    cache_max_bytes : Optional[int] (default: None)
+        The maximum total size of the resources the actor caches.
+    """
+
+    def __init__(
+        self, cache_max_clients: int = 8, cache_max_bytes: Optional[int] = None
+    ) -> None:
+        self.client_cache = ClientCache(
+            max_clients=cache_max_clients, max_bytes=cache_max_bytes
+        )
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Return the statistics of the client cache of this actor."""
+        cache: Optional[ClientCache] = getattr(self, "client_cache", None)
+        return {} if cache is None else cache.stats()
 
     def terminate(self) -> None:
         """Manually terminate Actor object."""
@@ -67,16 +105,17 @@ class VirtualClientEngineActor(ABC):
         # Execute tasks and return result
         # return also cid which is needed to ensure results
         # from the pool are correctly assigned to each ClientProxy
+        cache: Optional[ClientCache] = getattr(self, "client_cache", None)
         try:
-            # Instantiate client (check 'Client' type is returned)
-            client = check_clientfn_returns_client(client_fn(cid))
-            # Inject state
-            client.set_state(state)
-            # Run client job
-            job_results = job_fn(client)
+            with nullcontext() if cache is None else cache.activate():
+                # Instantiate client (check 'Client' type is returned)
+                client = check_clientfn_returns_client(client_fn(cid))
+                # Inject state
+                client.set_state(state)
+                # Run client job
+                job_results = job_fn(client)
             # Retrieve state (potentially updated)
             updated_state = client.get_state()
-            print(f"Actor finishing ({cid}) !!!: {updated_state = }")
         except Exception as ex:
             client_trace = traceback.format_exc()
             message = (
@@ -92,6 +131,23 @@ class VirtualClientEngineActor(ABC):
 
         return cid, job_results, updated_state
 
+    def run_batch(
+        self, jobs: List[Job]
+    ) -> List[Union[Tuple[str, ClientRes, WorkloadState], ClientException]]:
+        """Run several client workloads one after the other.
+
+        A failing workload does not affect the others. Its `ClientException` is
+        returned in place of its result.
+        """
+        results: List[Union[Tuple[str, ClientRes, WorkloadState], ClientException]]
+        results = []
+        for client_fn, job_fn, cid, state in jobs:
+            try:
+                results.append(self.run(client_fn, job_fn, cid, state))
+            except ClientException as ex:
+                results.append(ex)
+        return results
+
 
 @ray.remote
 class DefaultActor(VirtualClientEngineActor):
@@ -101,10 +157,22 @@ class DefaultActor(VirtualClientEngineActor):
     ----------
     on_actor_init_fn: Optional[Callable[[], None]] (default: None)
         A function to execute upon actor initialization.
+    cache_max_clients : int (default: 8)
+        The maximum number of clients whose resources the actor caches (see
+        `flwr.simulation.cached`).
+    cache_max_bytes : Optional[int] (default: None)
+        The maximum total size of the resources the actor caches.
     """
 
-    def __init__(self, on_actor_init_fn: Optional[Callable[[], None]] = None) -> None:
-        super().__init__()
+    def __init__(
+        self,
+        on_actor_init_fn: Optional[Callable[[], None]] = None,
+        cache_max_clients: int = 8,
+        cache_max_bytes: Optional[int] = None,
+    ) -> None:
+        super().__init__(
+            cache_max_clients=cache_max_clients, cache_max_bytes=cache_max_bytes
+        )
         if on_actor_init_fn:
             on_actor_init_fn()
 
@@ -186,16 +254,34 @@ class VirtualClientEngineActorPool(ActorPool):
         This argument should not be used. It's only needed for serialization purposes
         (see the `__reduce__` method). Each time it is executed, we want to retain
         the same list of actors.
+
+    max_batch_size: int (default: 1)
+        The maximum number of queued jobs sent to an actor in a single call, which
+        amortizes the overhead of Ray tasks for short jobs. The batch size adapts to
+        the measured duration of jobs, such that a batch takes about
+        `batch_duration` seconds. Batched jobs are run with
+        `VirtualClientEngineActor.run_batch` instead of the function passed to
+        `submit_client_job`.
+
+    batch_duration: float (default: 0.1)
+        The targeted duration of a batch of jobs in seconds.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         create_actor_fn: Callable[[], Type[VirtualClientEngineActor]],
         client_resources: Dict[str, Union[int, float]],
         actor_list: Optional[List[Type[VirtualClientEngineActor]]] = None,
+        max_batch_size: int = 1,
+        batch_duration: float = 0.1,
     ):
         self.client_resources = client_resources
         self.create_actor_fn = create_actor_fn
+        self.max_batch_size = max_batch_size
+        self.batch_duration = batch_duration
+        self.batch_size = 1
+        # Exponential moving average of the time per job in seconds
+        self._job_duration: Optional[float] = None
 
         if actor_list is None:
             # Figure out how many actors can be created given the cluster resources
@@ -211,13 +297,19 @@ class VirtualClientEngineActorPool(ActorPool):
 
         # A dict that maps cid to another dict containing: a reference to the remote job
         # and its status (i.e. whether it is ready or not)
-        self._cid_to_future: Dict[
-            str, Dict[str, Union[bool, Optional[ObjectRef[Any]]]]
-        ] = {}
+        self._cid_to_future: Dict[str, JobEntry] = {}
+        # The entries of the clients whose jobs are run by each remote job
+        self._future_to_entries: Dict[Any, List[JobEntry]] = {}
+        self._submit_times: Dict[Any, float] = {}
+        # Batches whose results are not fetched (or cancelled) by all of their clients
+        self._batches: Dict[Any, _Batch] = {}
         self.actor_to_remove: Set[str] = set()  # a set
+        # The actor that ran the last job of each client, whose cache is warm
+        self._cid_to_actor_id: Dict[str, str] = {}
         self.num_actors = len(actors)
 
         self.lock = threading.RLock()
+        self._dispatcher: Optional[threading.Thread] = None
 
     def __reduce__(self):  # type: ignore
         """Make this class serializable (needed due to lock)."""
@@ -225,6 +317,8 @@ class VirtualClientEngineActorPool(ActorPool):
             self.create_actor_fn,
             self.client_resources,
             self._idle_actors,  # Pass existing actors to avoid killing/re-creating
+            self.max_batch_size,
+            self.batch_duration,
         )
 
     def add_actors_to_pool(self, num_actors: int) -> None:
@@ -247,15 +341,101 @@ class VirtualClientEngineActorPool(ActorPool):
         check if this actor was flagged to be removed from the pool
         """
         client_fn, job_fn, cid, state = value
-        actor = self._idle_actors.pop()
+        actor = self._pop_idle_actor(cid)
         if self._check_and_remove_actor_from_pool(actor):
+            self._cid_to_actor_id[cid] = _actor_id(actor)
             future = fn(actor, client_fn, job_fn, cid, state)
             future_key = tuple(future) if isinstance(future, List) else future
             self._future_to_actor[future_key] = (self._next_task_index, actor, cid)
             self._next_task_index += 1
+            self._submit_times[future_key] = time.monotonic()
 
             # Update with future
             self._cid_to_future[cid]["future"] = future_key
+            self._future_to_entries[future_key] = [self._cid_to_future[cid]]
+
+    def _pop_idle_actor(self, cid: str) -> VirtualClientEngineActor:
+        """Take the idle actor that last ran client `cid`.
+
+        If that actor is busy, take the actor that has been idle the longest, which
+        spreads clients across the caches of all actors.
+        """
+        actor_id = self._cid_to_actor_id.get(cid)
+        for idx, actor in enumerate(self._idle_actors):
+            if _actor_id(actor) == actor_id:
+                return self._idle_actors.pop(idx)  # type: ignore
+        return self._idle_actors.pop(0)  # type: ignore
+
+    def _return_actor(self, actor: VirtualClientEngineActor) -> None:
+        """Make an actor idle and run a pending job on it.
+
+        Pending jobs of clients which last ran on this actor are preferred.
+        """
+        self._idle_actors.append(actor)
+        if not self._pending_submits:
+            return
+        actor_id = _actor_id(actor)
+        if self.batch_size == 1:
+            self.submit(*self._pending_submits.pop(self._next_pending(actor_id)))
+            return
+        jobs: List[Job] = []
+        while self._pending_submits and len(jobs) < self.batch_size:
+            _, job = self._pending_submits.pop(self._next_pending(actor_id))
+            jobs.append(job)
+        self._submit_batch(jobs)
+
+    def _next_pending(self, actor_id: str) -> int:
+        """Return the index of the next pending job to run on an actor."""
+        return next(
+            (
+                idx
+                for idx, (_, (_, _, cid, _)) in enumerate(self._pending_submits)
+                if self._cid_to_actor_id.get(cid) == actor_id
+            ),
+            0,
+        )
+
+    def _submit_batch(self, jobs: List[Job]) -> None:
+        """Take idle actor and assign it several client workloads."""
+        cids = tuple(cid for _, _, cid, _ in jobs)
+        actor = self._pop_idle_actor(cids[0])
+        if self._check_and_remove_actor_from_pool(actor):
+            for cid in cids:
+                self._cid_to_actor_id[cid] = _actor_id(actor)
+            future = actor.run_batch.remote(jobs)  # type: ignore
+            self._future_to_actor[future] = (self._next_task_index, actor, cids)
+            self._next_task_index += 1
+            self._submit_times[future] = time.monotonic()
+
+            # Update with future and the position of each result in the batch
+            for index, cid in enumerate(cids):
+                self._cid_to_future[cid]["future"] = future
+                self._cid_to_future[cid]["index"] = index
+            self._future_to_entries[future] = [self._cid_to_future[cid] for cid in cids]
+            self._batches[future] = _Batch(len(cids))
+
+    def _update_batch_size(self, elapsed: float, num_jobs: int) -> None:
+        """Adapt the batch size to the measured duration of jobs."""
+        job_duration = elapsed / num_jobs
+        if self._job_duration is None:
+            self._job_duration = job_duration
+        else:
+            self._job_duration = 0.8 * self._job_duration + 0.2 * job_duration
+        if self._job_duration > 0:
+            batch_size = int(self.batch_duration / self._job_duration)
+            self.batch_size = max(1, min(self.max_batch_size, batch_size))
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Return the statistics of the client caches of all actors, summed up."""
+        with self.lock:
+            actors = list(self._idle_actors) + [
+                actor for _, actor, _ in self._future_to_actor.values()
+            ]
+        totals: Dict[str, int] = {}
+        for stats in ray.get([actor.cache_stats.remote() for actor in actors]):
+            for key, value in stats.items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
 
     def submit_client_job(
         self, actor_fn: Any, job: Tuple[ClientFn, JobFn, str, WorkloadState]
@@ -275,40 +455,128 @@ class VirtualClientEngineActorPool(ActorPool):
             else:
                 # No actors are available, append to list of jobs to run later
                 self._pending_submits.append((actor_fn, job))
+            self._start_dispatcher()
+
+    def _start_dispatcher(self) -> None:
+        """Start the thread dispatching finished jobs unless it is running."""
+        if self._dispatcher is None:
+            self._dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+            self._dispatcher.start()
+
+    def _dispatch(self) -> None:
+        """Wait for running jobs and flag the results of finished ones as ready.
+
+        All finished jobs are handled at once, so each wakeup of the dispatcher can hand
+        out several results, and clients only wait for their own result. The dispatcher
+        stops once no jobs are running, such that it does not keep the pool (and its
+        actors) alive, and is started again by the next submitted job. It also stops
+        once Ray was shut down, as waiting would initialize Ray again.
+        """
+        while True:
+            with self.lock:
+                if not self._future_to_actor or not ray.is_initialized():
+                    self._dispatcher = None
+                    return
+                futures = list(self._future_to_actor)
+            try:
+                ready, not_ready = ray.wait(
+                    futures, num_returns=1, timeout=DISPATCH_INTERVAL
+                )
+                if ready and not_ready:
+                    # Collect all other jobs which have finished by now
+                    more_ready, _ = ray.wait(
+                        not_ready, num_returns=len(not_ready), timeout=0
+                    )
+                    ready.extend(more_ready)
+            except Exception as ex:  # pylint: disable=broad-except
+                # E.g., Ray was shut down. Let clients fail instead of waiting forever
+                log(ERROR, ex)
+                with self.lock:
+                    self._fail_running_jobs(ex)
+                    self._dispatcher = None
+                return
+            with self.lock:
+                for future in ready:
+                    self._process_finished_future(future)
+
+    def _fail_running_jobs(self, ex: Exception) -> None:
+        """Fail the results of all running and pending jobs."""
+        with self.lock:
+            for cid_to_future in self._cid_to_future.values():
+                ready = cid_to_future["ready"]
+                if isinstance(ready, concurrent.futures.Future) and not ready.done():
+                    ready.set_exception(ex)
 
-    def _flag_future_as_ready(self, cid: str) -> None:
-        """Flag future for VirtualClient with cid=cid as ready."""
-        self._cid_to_future[cid]["ready"] = True
+    def _flag_future_as_ready(self, entry: JobEntry) -> None:
+        """Flag the future of a job as ready, unless the job was cancelled."""
+        ready: "concurrent.futures.Future[None]" = entry["ready"]  # type: ignore
+        if not ready.done():
+            ready.set_result(None)
 
     def _reset_cid_to_future_dict(self, cid: str) -> None:
-        """Reset cid:future mapping info."""
-        if cid not in self._cid_to_future:
-            self._cid_to_future[cid] = {}
-
-        self._cid_to_future[cid]["future"] = None
-        self._cid_to_future[cid]["ready"] = False
-
-    def _is_future_ready(self, cid: str) -> bool:
-        """Return status of future associated to the given client id (cid)."""
-        if cid not in self._cid_to_future:
-            # With the current ClientProxy<-->ActorPool interaction
-            # we should never be hitting this condition.
-            log(WARNING, "This shouldn't be happening")
-            return False
+        """Reset cid:future mapping info.
 
-        return self._cid_to_future[cid]["ready"]  # type: ignore
+        A new entry is created, such that a job of the same client which is still
+        running keeps its own entry.
+        """
+        self._cid_to_future[cid] = {
+            "future": None,
+            "index": None,
+            "ready": concurrent.futures.Future(),
+        }
+
+    def cancel_client_job(self, cid: str) -> None:
+        """Cancel the latest job of a client, e.g., because it is too late.
+
+        A job which did not start yet is removed from the queue. Ray cannot cancel a
+        job which is running on an actor, so such a job runs to completion (and then
+        returns its actor to the pool), but its result is discarded. Waiting for the
+        result of a cancelled job raises `concurrent.futures.CancelledError`.
+        """
+        with self.lock:
+            entry = self._cid_to_future.get(cid)
+            if entry is not None:
+                self._cancel_job(cid, entry)
 
-    def _fetch_future_result(self, cid: str) -> Tuple[ClientRes, WorkloadState]:
+    def _cancel_job(self, cid: str, entry: JobEntry) -> bool:
+        """Cancel a job unless its result is ready, and return whether it was."""
+        with self.lock:
+            ready: "concurrent.futures.Future[None]" = entry["ready"]  # type: ignore
+            if not ready.cancel():
+                return False
+            if entry["future"] is None:
+                if self._cid_to_future.get(cid) is entry:
+                    # The job is still queued
+                    self._pending_submits = [
+                        (fn, job) for fn, job in self._pending_submits if job[2] != cid
+                    ]
+            elif entry["index"] is not None:
+                # Nobody will fetch this result of the batch
+                self._release_batch_result(entry["future"])  # type: ignore
+            entry["future"] = None
+            return True
+
+    def _fetch_future_result(
+        self, cid: str, entry: JobEntry
+    ) -> Tuple[ClientRes, WorkloadState]:
         """Fetch result and updated state for a VirtualClient from Object Store.
 
         The job submitted by the ClientProxy interfacing with client with cid=cid is
         ready. Here we fetch it from the object store and return.
         """
         try:
-            future: ObjectRef[Any] = self._cid_to_future[cid]["future"]  # type: ignore
-            res_cid, res, updated_state = ray.get(
-                future
-            )  # type: (str, ClientRes, WorkloadState)
+            future: ObjectRef[Any] = entry["future"]  # type: ignore
+            index: Optional[int] = entry["index"]  # type: ignore
+            if index is None:
+                res_cid, res, updated_state = ray.get(
+                    future
+                )  # type: (str, ClientRes, WorkloadState)
+            else:
+                result = self._fetch_batch_result(future, index)
+                if isinstance(result, ClientException):
+                    entry["future"] = None
+                    raise result
+                res_cid, res, updated_state = result
         except ray.exceptions.RayActorError as ex:
             log(ERROR, ex)
             if hasattr(ex, "actor_id"):
@@ -322,11 +590,34 @@ class VirtualClientEngineActorPool(ActorPool):
             ERROR, "The VirtualClient %s got result from client %s", cid, res_cid
         )
 
-        # Reset mapping
-        self._reset_cid_to_future_dict(cid)
+        # Release the reference to the result
+        entry["future"] = None
 
         return res, updated_state
 
+    def _fetch_batch_result(self, future: "ObjectRef[Any]", index: int) -> Any:
+        """Fetch the results of a batch once and return the one at `index`."""
+        with self.lock:
+            batch = self._batches[future]
+        try:
+            # Only the clients of this batch wait while its results are deserialized
+            with batch.lock:
+                if batch.results is None:
+                    batch.results = ray.get(future)
+                result = batch.results[index]
+                batch.results[index] = None
+        finally:
+            self._release_batch_result(future)
+        return result
+
+    def _release_batch_result(self, future: "ObjectRef[Any]") -> None:
+        """Release the batch once all of its clients fetched or cancelled a result."""
+        with self.lock:
+            batch = self._batches[future]
+            batch.num_unreleased -= 1
+            if batch.num_unreleased == 0:
+                del self._batches[future]
+
     def _flag_actor_for_removal(self, actor_id_hex: str) -> None:
         """Flag actor that should be removed from pool."""
         with self.lock:
@@ -341,9 +632,7 @@ class VirtualClientEngineActorPool(ActorPool):
         Remove the actor if so.
         """
         with self.lock:
-            actor_id = (
-                actor._actor_id.hex()  # type: ignore # pylint: disable=protected-access
-            )
+            actor_id = _actor_id(actor)
 
             if actor_id in self.actor_to_remove:
                 # The actor should be removed
@@ -380,49 +669,59 @@ class VirtualClientEngineActorPool(ActorPool):
 
         return True
 
-    def process_unordered_future(self, timeout: Optional[float] = None) -> None:
-        """Similar to parent's get_next_unordered() but without final ray.get()."""
-        if not self.has_next():  # type: ignore
-            raise StopIteration("No more results to get")
-
-        # Block until one result is ready
-        res, _ = ray.wait(list(self._future_to_actor), num_returns=1, timeout=timeout)
-
-        if res:
-            [future] = res
-        else:
-            raise TimeoutError("Timed out waiting for result")
-
-        with self.lock:
-            # Get actor that completed a job
-            _, actor, cid = self._future_to_actor.pop(future, (None, None, -1))
-            if actor is not None:
-                # Still space in queue? (no if a node in the cluster died)
-                if self._check_actor_fits_in_pool():
-                    if self._check_and_remove_actor_from_pool(actor):
-                        self._return_actor(actor)  # type: ignore
-                    # Flag future as ready so ClientProxy with cid
-                    # can break from the while loop (in `get_client_result()`)
-                    # and fetch its result
-                    self._flag_future_as_ready(cid)
-                else:
-                    # The actor doesn't fit in the pool anymore.
-                    # Manually terminate the actor
-                    actor.terminate.remote()
+    def _process_finished_future(self, future: "ObjectRef[Any]") -> None:
+        """Return the actor of a finished job (or batch of jobs) to the pool."""
+        # Get actor that completed a job (or a batch of jobs)
+        _, actor, cid = self._future_to_actor.pop(future, (None, None, -1))
+        cids = cid if isinstance(cid, tuple) else (cid,)
+        submit_time = self._submit_times.pop(future, None)
+        if submit_time is not None:
+            self._update_batch_size(time.monotonic() - submit_time, len(cids))
+        if actor is not None:
+            # Still space in queue? (no if a node in the cluster died)
+            if self._check_actor_fits_in_pool():
+                if self._check_and_remove_actor_from_pool(actor):
+                    self._return_actor(actor)
+            else:
+                # The actor doesn't fit in the pool anymore.
+                # Manually terminate the actor
+                actor.terminate.remote()
+            # Flag future as ready so ClientProxy with cid
+            # can stop waiting (in `get_client_result()`) and fetch its result
+            for entry in self._future_to_entries.pop(future, []):
+                self._flag_future_as_ready(entry)
 
     def get_client_result(
         self, cid: str, timeout: Optional[float]
     ) -> Tuple[ClientRes, WorkloadState]:
         """Get result from VirtualClient with specific cid."""
-        # Loop until all jobs submitted to the pool are completed. Break early
-        # if the result for the ClientProxy calling this method is ready
-        while self.has_next() and not self._is_future_ready(cid):  # type: ignore
-            try:
-                self.process_unordered_future(timeout=timeout)
-            except StopIteration:
-                # There are no pending jobs in the pool
-                break
+        # Wait until the dispatcher flags the result of this client as ready
+        with self.lock:
+            entry = self._cid_to_future[cid]
+        ready: "concurrent.futures.Future[None]" = entry["ready"]  # type: ignore
+        try:
+            ready.result(timeout=timeout)
+        except concurrent.futures.TimeoutError as ex:
+            # Cancel the job, such that its result is not kept around. If the result
+            # got ready in the meantime, fetch it instead
+            if self._cancel_job(cid, entry):
+                raise TimeoutError("Timed out waiting for result") from ex
 
         # Fetch result belonging to the VirtualClient calling this method
         # Return both result from tasks and (potentially) updated workload state
-        return self._fetch_future_result(cid)
+        return self._fetch_future_result(cid, entry)
+
+
+class _Batch:
+    """The results of a batch of jobs, shared by the clients of the batch."""
+
+    def __init__(self, num_jobs: int) -> None:
+        self.lock = threading.Lock()
+        self.results: Optional[List[Any]] = None
+        # Number of clients which did not fetch (or cancel) their result yet
+        self.num_unreleased = num_jobs
+
+
+def _actor_id(actor: Any) -> str:
+    """Return the ID of an actor handle."""
+    return str(actor._actor_id.hex())  # pylint: disable=protected-access
@@ -16,9 +16,11 @@
 
 
 import traceback
+from concurrent.futures import CancelledError, Future
 from logging import ERROR
-from typing import Dict, Optional, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TypeVar, Union, cast
 
+import numpy as np
 import ray
 
 from flwr import common
@@ -30,7 +32,10 @@ from flwr.client.client import (
     maybe_call_get_properties,
 )
 from flwr.client.workload_state import WorkloadState
+from flwr.client.workload_state_store import WorkloadStateStore
 from flwr.common.logger import log
+from flwr.common.typing import NDArray
+from flwr.server.broadcast_cache import get_or_create
 from flwr.server.client_proxy import ClientProxy
 from flwr.simulation.ray_transport.ray_actor import (
     ClientRes,
@@ -38,6 +43,8 @@ from flwr.simulation.ray_transport.ray_actor import (
     VirtualClientEngineActorPool,
 )
 
+BroadcastIns = TypeVar("BroadcastIns", common.FitIns, common.EvaluateIns)
+
 
 class RayClientProxy(ClientProxy):
     """Flower client proxy which delegates work using Ray."""
@@ -85,7 +92,7 @@ class RayClientProxy(ClientProxy):
         """Train model parameters on the locally held dataset."""
         future_fit_res = launch_and_fit.options(  # type: ignore
             **self.resources,
-        ).remote(self.client_fn, self.cid, ins)
+        ).remote(self.client_fn, self.cid, _put_ins(ins))
         try:
             res = ray.get(future_fit_res, timeout=timeout)
         except Exception as ex:
@@ -102,7 +109,7 @@ class RayClientProxy(ClientProxy):
         """Evaluate model parameters on the locally held dataset."""
         future_evaluate_res = launch_and_evaluate.options(  # type: ignore
             **self.resources,
-        ).remote(self.client_fn, self.cid, ins)
+        ).remote(self.client_fn, self.cid, _put_ins(ins))
         try:
             res = ray.get(future_evaluate_res, timeout=timeout)
         except Exception as ex:
@@ -119,25 +126,68 @@ class RayClientProxy(ClientProxy):
         """Disconnect and (optionally) reconnect later."""
         return common.DisconnectRes(reason="")  # Nothing to do here (yet)
 
+    def submit_fit(
+        self, ins: common.FitIns, timeout: Optional[float]
+    ) -> "Optional[Future[common.FitRes]]":
+        """Launch training and return a future for the result.
+
+        Ray futures cannot time out, so with a `timeout` this returns `None` and
+        `fit` has to be called instead.
+        """
+        if timeout is not None:
+            return None
+        future_fit_res = launch_and_fit.options(  # type: ignore
+            **self.resources,
+        ).remote(self.client_fn, self.cid, _put_ins(ins))
+        return cast("Future[common.FitRes]", future_fit_res.future())
+
+    def submit_evaluate(
+        self, ins: common.EvaluateIns, timeout: Optional[float]
+    ) -> "Optional[Future[common.EvaluateRes]]":
+        """Launch evaluation and return a future for the result.
+
+        Ray futures cannot time out, so with a `timeout` this returns `None` and
+        `evaluate` has to be called instead.
+        """
+        if timeout is not None:
+            return None
+        future_evaluate_res = launch_and_evaluate.options(  # type: ignore
+            **self.resources,
+        ).remote(self.client_fn, self.cid, _put_ins(ins))
+        return cast("Future[common.EvaluateRes]", future_evaluate_res.future())
+
 
 class RayActorClientProxy(ClientProxy):
     """Flower client proxy which delegates work using Ray."""
 
     def __init__(
-        self, client_fn: ClientFn, cid: str, actor_pool: VirtualClientEngineActorPool
+        self,
+        client_fn: ClientFn,
+        cid: str,
+        actor_pool: VirtualClientEngineActorPool,
+        state_store: Optional[WorkloadStateStore] = None,
     ):
         super().__init__(cid)
         self.client_fn = client_fn
         self.actor_pool = actor_pool
+        self.state_store = state_store
 
     def _submit_job(self, job_fn: JobFn, timeout: Optional[float]) -> ClientRes:
+        state = (
+            WorkloadState(state={})
+            if self.state_store is None
+            else self.state_store.get(self.cid)
+        )
         try:
             self.actor_pool.submit_client_job(
                 lambda a, c_fn, j_fn, cid, state: a.run.remote(c_fn, j_fn, cid, state),
-                (self.client_fn, job_fn, self.cid, WorkloadState(state={})),
+                (self.client_fn, job_fn, self.cid, state),
             )
-            res, _ = self.actor_pool.get_client_result(self.cid, timeout)
+            res, updated_state = self.actor_pool.get_client_result(self.cid, timeout)
 
+        except CancelledError:
+            # The job was cancelled with `cancel()`
+            raise
         except Exception as ex:
             if self.actor_pool.num_actors == 0:
                 # At this point we want to stop the simulation.
@@ -147,8 +197,14 @@ class RayActorClientProxy(ClientProxy):
             log(ERROR, ex)
             raise ex
 
+        if self.state_store is not None:
+            self.state_store.put(self.cid, updated_state)
         return res
 
+    def cancel(self) -> None:
+        """Cancel the job of this client, e.g., because it did not finish in time."""
+        self.actor_pool.cancel_client_job(self.cid)
+
     def get_properties(
         self, ins: common.GetPropertiesIns, timeout: Optional[float]
     ) -> common.GetPropertiesRes:
@@ -187,11 +243,12 @@ class RayActorClientProxy(ClientProxy):
 
     def fit(self, ins: common.FitIns, timeout: Optional[float]) -> common.FitRes:
         """Train model parameters on the locally held dataset."""
+        ins_ref = _put_ins(ins)
 
         def fit(client: Client) -> common.FitRes:
             return maybe_call_fit(
                 client=client,
-                fit_ins=ins,
+                fit_ins=ray.get(ins_ref),
             )
 
         res = self._submit_job(fit, timeout)
@@ -205,11 +262,12 @@ class RayActorClientProxy(ClientProxy):
         self, ins: common.EvaluateIns, timeout: Optional[float]
     ) -> common.EvaluateRes:
         """Evaluate model parameters on the locally held dataset."""
+        ins_ref = _put_ins(ins)
 
         def evaluate(client: Client) -> common.EvaluateRes:
             return maybe_call_evaluate(
                 client=client,
-                evaluate_ins=ins,
+                evaluate_ins=ray.get(ins_ref),
             )
 
         res = self._submit_job(evaluate, timeout)
@@ -278,3 +336,45 @@ def _create_client(client_fn: ClientFn, cid: str) -> Client:
     """Create a client instance."""
     # Materialize client
     return client_fn(cid)
+
+
+class _SharedTensors(List[Union[bytes, memoryview]]):
+    """Tensors read from the Ray object store without copying them.
+
+    When pickled, the tensors are wrapped in NumPy arrays, which Ray stores out-of-band
+    in its shared-memory object store. When unpickled, the tensors are read-only memory
+    views of the object store.
+    """
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the tensors as NumPy arrays of bytes."""
+        return (
+            _SharedTensors.from_arrays,
+            ([np.frombuffer(tensor, dtype=np.uint8) for tensor in self],),
+        )
+
+    @staticmethod
+    def from_arrays(arrays: Iterable[NDArray]) -> "_SharedTensors":
+        """Create tensors viewing the buffers of `arrays`."""
+        return _SharedTensors(array.data for array in arrays)
+
+
+def _put_ins(ins: BroadcastIns) -> "ray.ObjectRef[BroadcastIns]":
+    """Put instructions into the Ray object store.
+
+    Instructions broadcast to several clients in a round (see
+    `flwr.server.broadcast_cache`) are put once per round and shared by all of them.
+    """
+
+    def put() -> "ray.ObjectRef[BroadcastIns]":
+        # `Parameters.tensors` is typed as `bytes`, any buffer works in its place
+        parameters = common.Parameters(
+            tensors=cast(List[bytes], _SharedTensors(ins.parameters.tensors)),
+            tensor_type=ins.parameters.tensor_type,
+        )
+        ins_ref: "ray.ObjectRef[BroadcastIns]" = ray.put(
+            type(ins)(parameters=parameters, config=ins.config)
+        )
+        return ins_ref
+
+    return get_or_create(ins, put)
@@ -15,23 +15,44 @@
 """Flower simulation tests."""
 
 
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
 from math import pi
 from random import shuffle
-from typing import List, Tuple, Type, cast
+from typing import Dict, List, Tuple, Type, cast
 
+import numpy as np
+import pytest
 import ray
 
 from flwr.client import Client, NumPyClient
 from flwr.client.workload_state import WorkloadState
-from flwr.common import Code, GetPropertiesRes, Status
+from flwr.client.workload_state_store import InMemoryWorkloadStateStore
+from flwr.common import (
+    Code,
+    FitIns,
+    GetPropertiesRes,
+    NDArrays,
+    Scalar,
+    Status,
+    ndarrays_to_parameters,
+    parameters_to_ndarrays,
+)
+from flwr.server.broadcast_cache import broadcast_cache
+from flwr.simulation.ray_transport.client_cache import cached
 from flwr.simulation.ray_transport.ray_actor import (
+    ClientException,
     ClientRes,
     DefaultActor,
     JobFn,
     VirtualClientEngineActor,
     VirtualClientEngineActorPool,
 )
-from flwr.simulation.ray_transport.ray_client_proxy import RayActorClientProxy
+from flwr.simulation.ray_transport.ray_client_proxy import (
+    RayActorClientProxy,
+    RayClientProxy,
+    _put_ins,
+)
 
 
 class DummyClient(NumPyClient):
@@ -41,6 +62,16 @@ class DummyClient(NumPyClient):
         self.cid = int(cid)
 
 
+class SharedTensorsClient(NumPyClient):
+    """A NumPyClient which checks that it received tensors without copies."""
+
+    def fit(
+        self, parameters: NDArrays, config: Dict[str, Scalar]
+    ) -> Tuple[NDArrays, int, Dict[str, Scalar]]:
+        """Return the received parameters incremented by one."""
+        return [array + 1 for array in parameters], 1, {}
+
+
 def get_dummy_client(cid: str) -> Client:
     """Return a DummyClient converted to Client type."""
     return DummyClient(cid).to_client()
@@ -158,3 +189,276 @@ def test_cid_consistency_without_proxies() -> None:
         assert int(cid) * pi == res.properties["result"]
 
     ray.shutdown()
+
+
+def test_put_ins_once_per_round() -> None:
+    """Test that instructions broadcast in a round are put into Ray once."""
+    # Prepare
+    ray.init(include_dashboard=False)
+    ins = FitIns(ndarrays_to_parameters([np.arange(6.0).reshape(2, 3)]), {})
+    client_instructions = [
+        (RayClientProxy(get_dummy_client, str(cid), resources={}), ins)
+        for cid in range(2)
+    ]
+
+    # Execute
+    with broadcast_cache(client_instructions):
+        refs = [_put_ins(ins_) for _, ins_ in client_instructions]
+    shared_ins = ray.get(refs[0])
+    ray.shutdown()
+
+    # Assert
+    assert refs[0] is refs[1]
+    assert all(memoryview(tensor).readonly for tensor in shared_ins.parameters.tensors)
+    np.testing.assert_equal(
+        parameters_to_ndarrays(shared_ins.parameters),
+        parameters_to_ndarrays(ins.parameters),
+    )
+
+
+def test_fit_shared_parameters() -> None:
+    """Test that actors train on parameters read from the object store."""
+    # Prepare
+    proxies, _ = prep()
+    proxies = proxies[:3]
+    for proxy in proxies:
+        proxy.client_fn = lambda cid: SharedTensorsClient().to_client()
+    ins = FitIns(ndarrays_to_parameters([np.zeros((2, 3))]), {})
+
+    # Execute
+    with broadcast_cache([(proxy, ins) for proxy in proxies]):
+        results = [proxy.fit(ins, timeout=None) for proxy in proxies]
+    ray.shutdown()
+
+    # Assert
+    for fit_res in results:
+        np.testing.assert_equal(
+            parameters_to_ndarrays(fit_res.parameters), [np.ones((2, 3))]
+        )
+
+
+def test_state_store() -> None:
+    """Test that client states are kept between jobs."""
+    # Prepare
+    proxies, _ = prep()
+    proxies = proxies[:2]
+    store = InMemoryWorkloadStateStore()
+    for proxy in proxies:
+        proxy.state_store = store
+
+    def count_job(client: Client) -> ClientRes:
+        state = client.get_state()
+        state.state["count"] = str(int(state.state.get("count", "0")) + 1)
+        return GetPropertiesRes(status=Status(Code.OK, message=""), properties={})
+
+    # Execute
+    for _ in range(3):
+        for proxy in proxies:
+            proxy._submit_job(  # pylint: disable=protected-access
+                job_fn=count_job, timeout=None
+            )
+    ray.shutdown()
+
+    # Assert
+    assert [store.get(proxy.cid).state for proxy in proxies] == [{"count": "3"}] * 2
+
+
+def test_route_clients_to_warm_actors() -> None:
+    """Test that clients run on the actor which cached their resources."""
+    # Prepare
+    client_resources = {"num_cpus": 1, "num_gpus": 0.0}
+    ray.init(num_cpus=2, include_dashboard=False)
+    pool = VirtualClientEngineActorPool(
+        create_actor_fn=lambda: DefaultActor.options(  # type: ignore
+            **client_resources
+        ).remote(cache_max_clients=1),
+        client_resources=client_resources,
+    )
+
+    def client_fn(cid: str) -> Client:
+        return cached(cid, "client", lambda: get_dummy_client(cid))
+
+    proxies = {
+        cid: RayActorClientProxy(client_fn=client_fn, cid=cid, actor_pool=pool)
+        for cid in ["0", "1"]
+    }
+
+    # Execute
+    for cid in ["0", "1", "1", "0"]:
+        proxies[cid]._submit_job(  # pylint: disable=protected-access
+            job_fn=job_fn(cid), timeout=None
+        )
+    stats = pool.cache_stats()
+    ray.shutdown()
+
+    # Assert
+    assert pool.num_actors == 2
+    assert stats["misses"] == 2
+    assert stats["hits"] == 2
+
+
+def failing_job(client: Client) -> ClientRes:  # pragma: no cover
+    """Raise an Exception to simulate a failing client job."""
+    raise ValueError()
+
+
+def test_batched_jobs() -> None:
+    """Test that queued jobs are sent in batches and results reach their client."""
+    # Prepare
+    client_resources = {"num_cpus": 1, "num_gpus": 0.0}
+    ray.init(num_cpus=1, include_dashboard=False)
+    pool = VirtualClientEngineActorPool(
+        create_actor_fn=lambda: DefaultActor.options(  # type: ignore
+            **client_resources
+        ).remote(),
+        client_resources=client_resources,
+        max_batch_size=16,
+    )
+    cids = [str(cid) for cid in range(100)]
+
+    # Execute
+    for cid in cids:
+        pool.submit_client_job(
+            lambda a, c_fn, j_fn, cid_, state: a.run.remote(c_fn, j_fn, cid_, state),
+            (
+                get_dummy_client,
+                failing_job if cid == "50" else job_fn(cid),
+                cid,
+                WorkloadState(state={}),
+            ),
+        )
+    results: Dict[str, Scalar] = {}
+    shuffle(cids)
+    for cid in cids:
+        if cid == "50":
+            with pytest.raises(ClientException):
+                pool.get_client_result(cid, timeout=None)
+            continue
+        res, _ = pool.get_client_result(cid, timeout=None)
+        results[cid] = cast(GetPropertiesRes, res).properties["result"]
+    batch_size = pool.batch_size
+    ray.shutdown()
+
+    # Assert
+    assert batch_size > 1
+    assert results == {cid: int(cid) * pi for cid in cids if cid != "50"}
+
+
+def test_cid_consistency_concurrent_proxies() -> None:
+    """Test that proxies waiting concurrently each receive their own result."""
+    proxies, _ = prep()
+
+    def get_result(prox: RayActorClientProxy) -> Tuple[str, Scalar]:
+        res = prox._submit_job(  # pylint: disable=protected-access
+            job_fn=job_fn(prox.cid), timeout=None
+        )
+        return prox.cid, cast(GetPropertiesRes, res).properties["result"]
+
+    # Execute
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        results = dict(executor.map(get_result, proxies))
+    ray.shutdown()
+
+    # Assert
+    assert results == {prox.cid: int(prox.cid) * pi for prox in proxies}
+
+
+def slow_job(client: Client) -> ClientRes:  # pragma: no cover
+    """Take longer than the timeout of the test using it."""
+    time.sleep(2)
+    return job_fn("1")(client)
+
+
+def test_get_client_result_timeout() -> None:
+    """Test that waiting for a result times out while its job is running."""
+    # Prepare
+    client_resources = {"num_cpus": 1, "num_gpus": 0.0}
+    ray.init(num_cpus=1, include_dashboard=False)
+    pool = VirtualClientEngineActorPool(
+        create_actor_fn=lambda: DefaultActor.options(  # type: ignore
+            **client_resources
+        ).remote(),
+        client_resources=client_resources,
+    )
+    pool.submit_client_job(
+        lambda a, c_fn, j_fn, cid_, state: a.run.remote(c_fn, j_fn, cid_, state),
+        (get_dummy_client, slow_job, "1", WorkloadState(state={})),
+    )
+
+    # Execute & Assert
+    with pytest.raises(TimeoutError):
+        pool.get_client_result("1", timeout=0.1)
+    ray.shutdown()
+
+
+def test_cancel_client_job() -> None:
+    """Test that cancelled jobs are dequeued and stop their waiting clients."""
+    # Prepare
+    client_resources = {"num_cpus": 1, "num_gpus": 0.0}
+    ray.init(num_cpus=1, include_dashboard=False)
+    pool = VirtualClientEngineActorPool(
+        create_actor_fn=lambda: DefaultActor.options(  # type: ignore
+            **client_resources
+        ).remote(),
+        client_resources=client_resources,
+    )
+    for cid, job in [("1", slow_job), ("2", job_fn("2"))]:
+        pool.submit_client_job(
+            lambda a, c_fn, j_fn, cid_, state: a.run.remote(c_fn, j_fn, cid_, state),
+            (get_dummy_client, job, cid, WorkloadState(state={})),
+        )
+
+    # Execute
+    pool.cancel_client_job("1")
+    pool.cancel_client_job("2")
+    num_pending = len(pool._pending_submits)  # pylint: disable=protected-access
+
+    # Assert
+    for cid in ["1", "2"]:
+        with pytest.raises(CancelledError):
+            pool.get_client_result(cid, timeout=None)
+    ray.shutdown()
+    assert num_pending == 0
+
+
+def sleep_job_fn(seconds: float) -> JobFn:  # pragma: no cover
+    """Construct a job which sleeps before returning a result."""
+
+    def sleep_job(client: Client) -> ClientRes:
+        time.sleep(seconds)
+        return job_fn("1")(client)
+
+    return sleep_job
+
+
+def test_batch_released_after_timeout() -> None:
+    """Test that batches are released when a client of the batch times out."""
+    # Prepare
+    client_resources = {"num_cpus": 1, "num_gpus": 0.0}
+    ray.init(num_cpus=1, include_dashboard=False)
+    pool = VirtualClientEngineActorPool(
+        create_actor_fn=lambda: DefaultActor.options(  # type: ignore
+            **client_resources
+        ).remote(),
+        client_resources=client_resources,
+        max_batch_size=16,
+        batch_duration=10.0,
+    )
+    # Job "1" keeps the actor busy, such that the other jobs are sent as a batch
+    jobs = [("1", sleep_job_fn(0.5)), ("2", slow_job), ("3", job_fn("3"))]
+    for cid, job in jobs:
+        pool.submit_client_job(
+            lambda a, c_fn, j_fn, cid_, state: a.run.remote(c_fn, j_fn, cid_, state),
+            (get_dummy_client, job, cid, WorkloadState(state={})),
+        )
+
+    # Execute
+    pool.get_client_result("1", timeout=None)
+    with pytest.raises(TimeoutError):
+        pool.get_client_result("2", timeout=0.1)
+    pool.get_client_result("3", timeout=None)
+    num_batches = len(pool._batches)  # pylint: disable=protected-access
+    ray.shutdown()
+
+    # Assert
+    assert num_batches == 0
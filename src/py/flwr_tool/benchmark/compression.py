@@ -0,0 +1,82 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmark bytes on the wire versus encode/decode time of compression codecs.
+
+Example:
+    python -m flwr_tool.benchmark.compression
+"""
+
+
+import timeit
+from functools import partial
+from typing import List
+
+from flwr.common.parameter import ndarrays_to_parameters, parameters_to_ndarrays
+
+from .parameter import MODELS, synthetic_ndarrays
+
+TENSOR_TYPES: List[str] = [
+    "numpy.ndarray.compact",
+    "numpy.ndarray.compact+zlib",
+    "numpy.ndarray.compact+zstd",
+    "numpy.ndarray.compact+lz4",
+    "numpy.ndarray.compact+fp16",
+    "numpy.ndarray.compact+bf16",
+    "numpy.ndarray.compact+fp16+zstd",
+    "numpy.ndarray.compact+int8",
+    "numpy.ndarray.compact+int8+zstd",
+]
+
+
+def main(repeat: int = 3) -> None:
+    """Print size on the wire and encode/decode time for all tensor types."""
+    row = "{:<12}{:<34}{:>10}{:>8}{:>12}{:>12}"
+    print(row.format("model", "tensor_type", "MB", "ratio", "encode s", "decode s"))
+    name, num_parameters, num_tensors = MODELS[0]
+    ndarrays = synthetic_ndarrays(num_parameters, num_tensors)
+    num_bytes = sum(ndarray.nbytes for ndarray in ndarrays)
+    for tensor_type in TENSOR_TYPES:
+        try:
+            parameters = ndarrays_to_parameters(ndarrays, tensor_type=tensor_type)
+        except ImportError:
+            print(row.format(name, tensor_type, "-", "-", "-", "-"))
+            continue
+        wire_bytes = sum(len(tensor) for tensor in parameters.tensors)
+        encode = min(
+            timeit.repeat(
+                partial(ndarrays_to_parameters, ndarrays, tensor_type=tensor_type),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        decode = min(
+            timeit.repeat(
+                partial(parameters_to_ndarrays, parameters), number=1, repeat=repeat
+            )
+        )
+        print(
+            row.format(
+                name,
+                tensor_type,
+                f"{wire_bytes / 1e6:.1f}",
+                f"{num_bytes / wire_bytes:.2f}",
+                f"{encode:.3f}",
+                f"{decode:.3f}",
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Load test the Fleet API (gRPC-rere) with many simulated nodes.
+
+Starts `flower-fleet-api` in a subprocess and connects simulated nodes to it. Each
+node creates itself and then long-polls PullTaskIns until the end of the test. The
+nodes are coroutines sharing `grpc.aio` channels, so a single process can simulate
+tens of thousands of them.
+
+Example:
+    python -m flwr_tool.benchmark.fleet --num-nodes 10000
+    python -m flwr_tool.benchmark.fleet --num-nodes 10000 --grpc-aio
+"""
+
+
+import argparse
+import asyncio
+import socket
+import subprocess
+import sys
+import time
+import timeit
+from collections import Counter
+from contextlib import closing
+from typing import Dict, List, Tuple
+
+import grpc
+import numpy as np
+
+from flwr.proto.fleet_pb2 import CreateNodeRequest, PullTaskInsRequest
+from flwr.proto.fleet_pb2_grpc import FleetStub
+
+NODES_PER_CHANNEL = 500
+PULL_TIMEOUT = 5.0
+DURATION = 30.0
+STARTUP_TIMEOUT = 30.0
+
+
+class Stats:
+    """Counters shared by all simulated nodes."""
+
+    def __init__(self) -> None:
+        self.polling = 0
+        self.max_polling = 0
+        self.pulls = 0
+        self.errors: Counter[str] = Counter()
+        self.create_latencies: List[float] = []
+        self.pull_latencies: List[float] = []
+
+
+def unused_tcp_port() -> int:
+    """Return an unused port."""
+    with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as sock:
+        sock.bind(("", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+def start_fleet_api(address: str, grpc_aio: bool) -> "subprocess.Popen[bytes]":
+    """Start `flower-fleet-api` with an in-memory state in a subprocess."""
+    args = [
+        sys.executable,
+        "-c",
+        "from flwr.server.app import run_fleet_api; run_fleet_api()",
+        "--insecure",
+        "--grpc-rere",
+        "--grpc-rere-fleet-api-address",
+        address,
+    ]
+    if grpc_aio:
+        args.append("--grpc-aio")
+    return subprocess.Popen(  # pylint: disable=consider-using-with
+        args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+
+async def wait_until_ready(address: str) -> None:
+    """Wait until the Fleet API accepts connections."""
+    async with grpc.aio.insecure_channel(address) as channel:
+        await asyncio.wait_for(channel.channel_ready(), STARTUP_TIMEOUT)
+
+
+async def simulate_node(
+    stub: FleetStub, stats: Stats, deadline: float, pull_timeout: float
+) -> None:
+    """Create a node and long-poll PullTaskIns until `deadline`."""
+    try:
+        start = timeit.default_timer()
+        response = await stub.CreateNode(CreateNodeRequest())
+        stats.create_latencies.append((timeit.default_timer() - start) * 1e3)
+    except grpc.aio.AioRpcError as err:
+        stats.errors[f"CreateNode {err.code().name}"] += 1
+        return
+
+    request = PullTaskInsRequest(node=response.node, timeout=pull_timeout)
+    while time.monotonic() < deadline:
+        stats.polling += 1
+        stats.max_polling = max(stats.max_polling, stats.polling)
+        start = timeit.default_timer()
+        try:
+            await stub.PullTaskIns(request, timeout=pull_timeout + 30)
+            stats.pull_latencies.append((timeit.default_timer() - start) * 1e3)
+            stats.pulls += 1
+        except grpc.aio.AioRpcError as err:
+            stats.errors[f"PullTaskIns {err.code().name}"] += 1
+            # Back off like a client would after a failed request
+            await asyncio.sleep(pull_timeout)
+        finally:
+            stats.polling -= 1
+
+
+async def run(
+    address: str,
+    num_nodes: int,
+    nodes_per_channel: int,
+    pull_timeout: float,
+    duration: float,
+) -> Stats:
+    """Simulate `num_nodes` nodes for `duration` seconds."""
+    stats = Stats()
+    # Give each channel its own connection instead of sharing one subchannel
+    channels = [
+        grpc.aio.insecure_channel(
+            address, options=[("grpc.use_local_subchannel_pool", 1)]
+        )
+        for _ in range(-(-num_nodes // nodes_per_channel))
+    ]
+    deadline = time.monotonic() + duration
+    await asyncio.gather(
+        *[
+            simulate_node(
+                FleetStub(channels[idx // nodes_per_channel]),
+                stats,
+                deadline,
+                pull_timeout,
+            )
+            for idx in range(num_nodes)
+        ]
+    )
+    for channel in channels:
+        await channel.close()
+    return stats
+
+
+def summarize(latencies: List[float]) -> Tuple[float, float]:
+    """Return the median and 99th percentile of latencies."""
+    if not latencies:
+        return float("nan"), float("nan")
+    return float(np.percentile(latencies, 50)), float(np.percentile(latencies, 99))
+
+
+def report(stats: Stats) -> Dict[str, str]:
+    """Format the results of a load test."""
+    create_p50, create_p99 = summarize(stats.create_latencies)
+    pull_p50, pull_p99 = summarize(stats.pull_latencies)
+    return {
+        "nodes created": str(len(stats.create_latencies)),
+        "max concurrent long-polls": str(stats.max_polling),
+        "completed pulls": str(stats.pulls),
+        "CreateNode p50/p99 ms": f"{create_p50:.1f} / {create_p99:.1f}",
+        "PullTaskIns p50/p99 ms": f"{pull_p50:.1f} / {pull_p99:.1f}",
+        "errors": ", ".join(f"{k}: {v}" for k, v in stats.errors.items()) or "none",
+    }
+
+
+def main() -> None:
+    """Run a load test against a fresh Fleet API."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num-nodes", type=int, default=10_000)
+    parser.add_argument("--nodes-per-channel", type=int, default=NODES_PER_CHANNEL)
+    parser.add_argument("--pull-timeout", type=float, default=PULL_TIMEOUT)
+    parser.add_argument("--duration", type=float, default=DURATION)
+    parser.add_argument(
+        "--grpc-aio",
+        action="store_true",
+        help="Start the Fleet API with the `grpc.aio` server",
+    )
+    args = parser.parse_args()
+
+    address = f"127.0.0.1:{unused_tcp_port()}"
+    server = start_fleet_api(address, args.grpc_aio)
+    try:
+        asyncio.run(wait_until_ready(address))
+        stats = asyncio.run(
+            run(
+                address,
+                args.num_nodes,
+                args.nodes_per_channel,
+                args.pull_timeout,
+                args.duration,
+            )
+        )
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"server: {'grpc.aio' if args.grpc_aio else 'grpc (thread pool)'}")
+    for key, value in report(stats).items():
+        print(f"{key:<28}{value}")
+
+
+if __name__ == "__main__":
+    main()
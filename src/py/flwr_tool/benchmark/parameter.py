@@ -0,0 +1,80 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmark (de-)serialization of model parameters.
+
+Example:
+    python -m flwr_tool.benchmark.parameter
+"""
+
+
+import timeit
+from functools import partial
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from flwr.common import NDArrays
+from flwr.common.parameter import (
+    TENSOR_TYPE_COMPACT,
+    TENSOR_TYPE_NUMPY,
+    ndarrays_to_parameters,
+    parameters_to_ndarrays,
+)
+
+# Number of parameters and number of tensors of common model architectures
+MODELS: List[Tuple[str, int, int]] = [
+    ("ResNet-50", 25_557_032, 161),
+    ("BERT-base", 109_482_240, 199),
+]
+
+
+def synthetic_ndarrays(num_parameters: int, num_tensors: int) -> NDArrays:
+    """Create float32 tensors with the given total number of parameters."""
+    rng = np.random.default_rng(seed=0)
+    sizes = np.full(num_tensors, num_parameters // num_tensors)
+    sizes[0] += num_parameters - int(sizes.sum())
+    return [rng.random(size, dtype=np.float32) for size in sizes]
+
+
+def throughput(fn: Callable[[], object], num_bytes: int, repeat: int) -> float:
+    """Return the best throughput of `fn` in MB/s."""
+    best = min(timeit.repeat(fn, number=1, repeat=repeat))
+    return num_bytes / best / 1e6
+
+
+def main(repeat: int = 3) -> None:
+    """Print serialization and deserialization throughput for all tensor types."""
+    row = "{:<12}{:<24}{:>16}{:>18}"
+    print(row.format("model", "tensor_type", "serialize MB/s", "deserialize MB/s"))
+    for name, num_parameters, num_tensors in MODELS:
+        ndarrays = synthetic_ndarrays(num_parameters, num_tensors)
+        num_bytes = sum(ndarray.nbytes for ndarray in ndarrays)
+        for tensor_type in [TENSOR_TYPE_NUMPY, TENSOR_TYPE_COMPACT]:
+            parameters = ndarrays_to_parameters(ndarrays, tensor_type=tensor_type)
+            serialize = throughput(
+                partial(ndarrays_to_parameters, ndarrays, tensor_type=tensor_type),
+                num_bytes,
+                repeat,
+            )
+            deserialize = throughput(
+                partial(parameters_to_ndarrays, parameters), num_bytes, repeat
+            )
+            print(
+                row.format(name, tensor_type, f"{serialize:.0f}", f"{deserialize:.0f}")
+            )
+
+
+if __name__ == "__main__":
+    main()
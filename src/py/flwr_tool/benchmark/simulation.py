@@ -0,0 +1,111 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Measure the throughput of the Virtual Client Engine for short client jobs.
+
+Runs rounds of `fit` on many virtual clients whose training takes (almost) no time,
+such that the overhead of scheduling client jobs on Ray actors dominates. Reports
+the number of clients per second for each actor batch size.
+
+Example:
+    python -m flwr_tool.benchmark.simulation --num-clients 2000 --batch-sizes 1 32
+"""
+
+
+import argparse
+import timeit
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+import ray
+
+from flwr.client import Client, NumPyClient
+from flwr.common import FitIns, NDArrays, Scalar, ndarrays_to_parameters
+from flwr.server.server import fit_clients
+from flwr.simulation.ray_transport.ray_actor import (
+    DefaultActor,
+    VirtualClientEngineActorPool,
+)
+from flwr.simulation.ray_transport.ray_client_proxy import RayActorClientProxy
+
+NUM_CLIENTS = 2000
+NUM_ROUNDS = 3
+NUM_ACTORS = 2
+MAX_WORKERS = 64
+
+
+class TinyClient(NumPyClient):
+    """A client whose training takes almost no time."""
+
+    def fit(
+        self, parameters: NDArrays, config: Dict[str, Scalar]
+    ) -> Tuple[NDArrays, int, Dict[str, Scalar]]:
+        """Return the received parameters."""
+        return parameters, 1, {}
+
+
+def client_fn(cid: str) -> Client:  # pylint: disable=unused-argument
+    """Create a TinyClient."""
+    return TinyClient().to_client()
+
+
+def run(num_clients: int, num_rounds: int, max_batch_size: int) -> List[float]:
+    """Return the clients per second of each round."""
+    client_resources: Dict[str, Union[int, float]] = {"num_cpus": 1}
+    pool = VirtualClientEngineActorPool(
+        create_actor_fn=lambda: DefaultActor.options(  # type: ignore
+            **client_resources
+        ).remote(),
+        client_resources=client_resources,
+        max_batch_size=max_batch_size,
+    )
+    ins = FitIns(ndarrays_to_parameters([np.zeros(10)]), {})
+    client_instructions = [
+        (RayActorClientProxy(client_fn=client_fn, cid=str(cid), actor_pool=pool), ins)
+        for cid in range(num_clients)
+    ]
+    throughputs = []
+    for _ in range(num_rounds):
+        start = timeit.default_timer()
+        results, failures = fit_clients(
+            client_instructions,  # type: ignore
+            max_workers=MAX_WORKERS,
+            timeout=None,
+        )
+        elapsed = timeit.default_timer() - start
+        if failures:
+            raise RuntimeError(f"{len(failures)} clients failed: {failures[0]!r}")
+        throughputs.append(len(results) / elapsed)
+    return throughputs
+
+
+def main() -> None:
+    """Run the benchmark for each batch size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num-clients", type=int, default=NUM_CLIENTS)
+    parser.add_argument("--num-rounds", type=int, default=NUM_ROUNDS)
+    parser.add_argument("--num-actors", type=int, default=NUM_ACTORS)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 32])
+    args = parser.parse_args()
+
+    ray.init(num_cpus=args.num_actors, include_dashboard=False)
+    print(f"{'max batch size':<16}clients/s per round")
+    for max_batch_size in args.batch_sizes:
+        throughputs = run(args.num_clients, args.num_rounds, max_batch_size)
+        print(f"{max_batch_size:<16}" + "  ".join(f"{t:8.1f}" for t in throughputs))
+    ray.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+# Copyright 2023 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmark the latency of PullTaskIns and PushTaskRes on a populated state.
+
+Example:
+    python -m flwr_tool.benchmark.state
+"""
+
+
+import os
+import tempfile
+import timeit
+from functools import partial
+from typing import Callable, Dict, List, Tuple, TypeVar
+
+import numpy as np
+
+from flwr.proto.node_pb2 import Node
+from flwr.proto.task_pb2 import Task, TaskIns, TaskRes
+from flwr.proto.transport_pb2 import ClientMessage, ServerMessage
+from flwr.server.state import InMemoryState, SqliteState, State
+
+# Number of nodes and number of tasks
+SCALES: List[Tuple[int, int]] = [(1_000, 10_000), (10_000, 100_000)]
+NUM_SAMPLES = 1_000
+
+T = TypeVar("T")
+
+
+def sqlite_state(directory: str) -> State:
+    """Create a file-based SqliteState."""
+    state = SqliteState(os.path.join(directory, "state.db"))
+    state.initialize()
+    return state
+
+
+def in_memory_state(_: str) -> State:
+    """Create an InMemoryState."""
+    return InMemoryState()
+
+
+STATES: List[Tuple[str, Callable[[str], State]]] = [
+    ("SqliteState", sqlite_state),
+    ("InMemoryState", in_memory_state),
+]
+
+
+def populate(state: State, num_nodes: int, num_tasks: int) -> Tuple[int, List[int]]:
+    """Create nodes and distribute TaskIns among them round-robin."""
+    workload_id = state.create_workload()
+    node_ids = [state.create_node() for _ in range(num_nodes)]
+    for idx in range(num_tasks):
+        task_ins = TaskIns(
+            workload_id=workload_id,
+            task=Task(
+                producer=Node(node_id=0, anonymous=True),
+                consumer=Node(node_id=node_ids[idx % num_nodes], anonymous=False),
+                legacy_server_message=ServerMessage(
+                    reconnect_ins=ServerMessage.ReconnectIns()
+                ),
+            ),
+        )
+        state.store_task_ins(task_ins)
+    return workload_id, node_ids
+
+
+def measure(fn: Callable[[], T]) -> Tuple[float, T]:
+    """Call `fn` once and return its latency in milliseconds and its result."""
+    start = timeit.default_timer()
+    result = fn()
+    return (timeit.default_timer() - start) * 1e3, result
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    """Return the mean, median, and 99th percentile of latencies."""
+    return {
+        "mean": float(np.mean(latencies)),
+        "p50": float(np.percentile(latencies, 50)),
+        "p99": float(np.percentile(latencies, 99)),
+    }
+
+
+def run(
+    state: State, num_nodes: int, num_tasks: int, num_samples: int
+) -> Dict[str, Dict[str, float]]:
+    """Pull one TaskIns for sampled nodes and push a TaskRes for each of them."""
+    workload_id, node_ids = populate(state, num_nodes, num_tasks)
+    rng = np.random.default_rng(seed=0)
+    pull_latencies: List[float] = []
+    push_latencies: List[float] = []
+    for idx in rng.choice(num_nodes, size=num_samples, replace=False):
+        node_id = node_ids[idx]
+        latency, pulled = measure(partial(state.get_task_ins, node_id, limit=1))
+        pull_latencies.append(latency)
+        task_res = TaskRes(
+            workload_id=workload_id,
+            task=Task(
+                producer=Node(node_id=node_id, anonymous=False),
+                consumer=Node(node_id=0, anonymous=True),
+                ancestry=[pulled[0].task_id],
+                legacy_client_message=ClientMessage(
+                    disconnect_res=ClientMessage.DisconnectRes()
+                ),
+            ),
+        )
+        latency, _ = measure(partial(state.store_task_res, task_res))
+        push_latencies.append(latency)
+    return {
+        "PullTaskIns": summarize(pull_latencies),
+        "PushTaskRes": summarize(push_latencies),
+    }
+
+
+def main(num_samples: int = NUM_SAMPLES) -> None:
+    """Print PullTaskIns and PushTaskRes latencies for all state implementations."""
+    row = "{:<16}{:>8}{:>8}  {:<14}{:>10}{:>10}{:>10}"
+    print(
+        row.format(
+            "state", "nodes", "tasks", "operation", "mean ms", "p50 ms", "p99 ms"
+        )
+    )
+    for name, state_fn in STATES:
+        for num_nodes, num_tasks in SCALES:
+            with tempfile.TemporaryDirectory() as directory:
+                results = run(state_fn(directory), num_nodes, num_tasks, num_samples)
+            for operation, stats in results.items():
+                print(
+                    row.format(
+                        name,
+                        num_nodes,
+                        num_tasks,
+                        operation,
+                        f"{stats['mean']:.3f}",
+                        f"{stats['p50']:.3f}",
+                        f"{stats['p99']:.3f}",
+                    )
+                )
+
+
+if __name__ == "__main__":
+    main()